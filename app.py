@@ -1,8 +1,14 @@
+import os
+
 from flask import Flask, render_template, request, jsonify
-from solver import MetodoGrafico, MetodoSimplex, convertir_restricciones_relacionales, MetodoDosFases # Importamos las clases y funciones
+from solver import MetodoGrafico, MetodoGrafico3D, MetodoSimplex, convertir_restricciones_relacionales, MetodoDosFases, MetodoDualSimplex, resolver_lote, SesionGrafica, SESIONES # Importamos las clases y funciones
 
 app = Flask(__name__)
 
+# Tope de tiempo por pedido (segundos): el cliente puede pedir menos, nunca más.
+# Con --threads, un pedido sin tope ocuparía un hilo para siempre.
+LIMITE_TIEMPO_MAXIMO = float(os.environ.get('LIMITE_TIEMPO_SEGUNDOS', '20'))
+
 @app.route('/')
 def home():
     # Muestra la pagina web (index.html)
@@ -27,34 +33,106 @@ def calcular():
         operadores.append(r['op'])
         
     # Llamamos a TU lógica
-    solver = MetodoGrafico(c, A, b, operadores, objetivo)
-    resultado = solver.resolver()
+    # "modo": 'semiplanos' arma la región en O(m log m), ya ordenada, y detecta no acotado
+    # "quitar_redundantes": false enumera también los cortes de filas que no tocan la región
+    # "enteros": true agrega "entero", el mejor punto con x e y enteras (ver puntos_enteros)
+    try:
+        solver = MetodoGrafico(c, A, b, operadores, objetivo, presolve=data.get('presolve', True),
+                               detalle=data.get('detalle', 'full'), modo=data.get('modo', 'vertices'),
+                               quitar_redundantes=data.get('quitar_redundantes', True),
+                               enteros=data.get('enteros', False))
+        resultado = solver.resolver()
+    except ValueError as e:
+        return jsonify({"status": "error", "explicacion": str(e)}), 400
     
     return jsonify(resultado) # Enviamos la respuesta a Javascript
 
+@app.route('/calcular-3d', methods=['POST'])
+def calcular_3d():
+    """
+    Método gráfico con 3 variables: mismo JSON que Simplex (z_coefs y coefs con 3 valores).
+    "enumeracion": 'auto', 'doble_descripcion' o 'ternas'. La respuesta trae "grafica" con
+    la malla del poliedro para un mesh3d de Plotly.
+    """
+    data = request.json
+    c, A, b, operadores = _leer_problema_n_variables(data)
+    try:
+        solver = MetodoGrafico3D(c, A, b, operadores, data.get('objetivo', 'max'),
+                                 detalle=data.get('detalle', 'full'), enumeracion=data.get('enumeracion', 'auto'))
+    except ValueError as e:
+        return jsonify({"status": "error", "explicacion": str(e)}), 400
+    resultado = solver.resolver()
+
+    return jsonify(resultado)
+
+def _leer_problema_n_variables(data):
+    """
+    Extrae c, A, b y operadores del JSON de Simplex / Dos Fases.
+    Formato normal: cada restricción trae 'coefs', 'val' y 'op'.
+    Formato disperso: 'matriz' = {"formato": "coo", "filas", "columnas", "valores", "forma"}
+    (o "csr"/"csc" con "indptr", "indices", "datos") y cada restricción solo trae 'val' y 'op'.
+    """
+    c = [float(x) for x in data['z_coefs']]  # Lista de coeficientes
+    restricciones = data['restricciones']
+    b = [float(r['val']) for r in restricciones]
+    operadores = [r['op'] for r in restricciones]
+    if 'matriz' in data:
+        A = data['matriz']  # El solver decide si la trabaja dispersa o densa
+    else:
+        # Cada restricción tiene coeficientes para todas las variables
+        A = [[float(x) for x in r['coefs']] for r in restricciones]
+    return c, A, b, operadores
+
+def _control_resolucion(data):
+    """
+    'max_iteraciones' y 'limite_tiempo' (segundos) del pedido; el tiempo se acota a
+    LIMITE_TIEMPO_MAXIMO. Al cumplirse, la respuesta trae status 'iteration_limit' o
+    'time_limit' con la mejor base encontrada.
+    """
+    limite_tiempo = data.get('limite_tiempo')
+    if limite_tiempo is not None:
+        try:
+            limite_tiempo = float(limite_tiempo)
+        except (TypeError, ValueError):
+            raise ValueError(f"limite_tiempo debe ser un número de segundos > 0 (se recibió {limite_tiempo!r})")
+    if limite_tiempo is None or limite_tiempo > LIMITE_TIEMPO_MAXIMO:
+        limite_tiempo = LIMITE_TIEMPO_MAXIMO
+    return {'max_iteraciones': data.get('max_iteraciones'), 'limite_tiempo': limite_tiempo}
+
 @app.route('/calcular-simplex', methods=['POST'])
 def calcular_simplex():
     data = request.json # Recibe los datos de Javascript
     
     # Extraemos los datos del JSON
     # El frontend puede enviar múltiples variables
-    c = [float(x) for x in data['z_coefs']]  # Lista de coeficientes
+    c, A, b, operadores = _leer_problema_n_variables(data)
     objetivo = data['objetivo']
-    
-    restricciones = data['restricciones']
-    A = []
-    b = []
-    operadores = []
-    
-    for r in restricciones:
-        # Cada restricción tiene coeficientes para todas las variables
-        A.append([float(x) for x in r['coefs']])
-        b.append(float(r['val']))
-        operadores.append(r['op'])
         
-    # Llamamos al método Simplex
-    solver = MetodoSimplex(c, A, b, operadores, objetivo)
-    resultado = solver.resolver()
+    # Llamamos al método Simplex ('tabla' o 'revisado'; si no se indica, según la densidad de A)
+    # "precio" elige la regla de la variable entrante (por defecto Dantzig) y "degeneracion"
+    # el manejo de pivotes degenerados ('lexicografico' por defecto, 'perturbacion' o 'ninguno')
+    # "base_inicial" (p. ej. 'variables_basicas' de una corrida anterior) arranca en caliente
+    # "limites": [inferior, superior] por variable, sin agregar filas (null = 0 / sin límite)
+    # "presolve": false desactiva la reducción previa del problema (activa por defecto)
+    # "escalado": false desactiva el escalado de filas/columnas de A (activo por defecto)
+    # "detalle": 'full' (por defecto), 'summary' (sin iteraciones ni tablas) o 'none' (sin pasos)
+    # "retencion": qué tablas devolver, p. ej. {"primeras": 5, "ultimas": 5} o {"cada": 10}
+    # "formato_pasos": 'eventos' manda los pasos de cada iteración como [código, números...]
+    # "max_iteraciones" / "limite_tiempo": cortes con la mejor base encontrada (ver _control_resolucion)
+    # Una opción inválida (detalle, precio, retencion, límites...) responde 400, no 500
+    modo = data.get('modo')
+    try:
+        solver = MetodoSimplex(c, A, b, operadores, objetivo, modo=modo, precio=data.get('precio'),
+                               degeneracion=data.get('degeneracion', 'lexicografico'),
+                               base_inicial=data.get('base_inicial'), limites=data.get('limites'),
+                               presolve=data.get('presolve', True), escalado=data.get('escalado', True),
+                               detalle=data.get('detalle', 'full'),
+                               retencion=data.get('retencion'),
+                               formato_pasos=data.get('formato_pasos', 'texto'),
+                               **_control_resolucion(data))
+        resultado = solver.resolver()
+    except ValueError as e:
+        return jsonify({"status": "error", "explicacion": str(e)}), 400
     
     return jsonify(resultado) # Enviamos la respuesta a Javascript
 
@@ -64,25 +142,154 @@ def calcular_dos_fases():
     data = request.json
     
     # Extraemos los datos del JSON (mismo formato que Simplex)
-    c = [float(x) for x in data['z_coefs']]
+    c, A, b, operadores = _leer_problema_n_variables(data)
     objetivo = data['objetivo']
     
-    restricciones = data['restricciones']
-    A = []
-    b = []
-    operadores = []
+    # Llamamos al método de Dos Fases
+    try:
+        solver = MetodoDosFases(c, A, b, operadores, objetivo, modo=data.get('modo'),
+                                precio=data.get('precio'),
+                                degeneracion=data.get('degeneracion', 'lexicografico'),
+                                base_inicial=data.get('base_inicial'), limites=data.get('limites'),
+                                presolve=data.get('presolve', True), escalado=data.get('escalado', True),
+                                detalle=data.get('detalle', 'full'),
+                                retencion=data.get('retencion'),
+                                formato_pasos=data.get('formato_pasos', 'texto'),
+                                **_control_resolucion(data))
+        resultado = solver.resolver()
+    except ValueError as e:
+        return jsonify({"status": "error", "explicacion": str(e)}), 400
     
-    for r in restricciones:
-        A.append([float(x) for x in r['coefs']])
-        b.append(float(r['val']))
-        operadores.append(r['op'])
+    return jsonify(resultado)
+
+@app.route('/calcular-dual-simplex', methods=['POST'])
+def calcular_dual_simplex():
+    """Endpoint para resolver con el Simplex Dual (base de holguras, sin artificiales)."""
+    data = request.json
     
-    # Llamamos al método de Dos Fases
-    solver = MetodoDosFases(c, A, b, operadores, objetivo)
-    resultado = solver.resolver()
+    # Mismo formato que Simplex / Dos Fases
+    c, A, b, operadores = _leer_problema_n_variables(data)
+    objetivo = data['objetivo']
     
+    try:
+        solver = MetodoDualSimplex(c, A, b, operadores, objetivo, escalado=data.get('escalado', True),
+                                   detalle=data.get('detalle', 'full'),
+                                   retencion=data.get('retencion'),
+                                   formato_pasos=data.get('formato_pasos', 'texto'),
+                                   **_control_resolucion(data))
+        resultado = solver.resolver()
+    except ValueError as e:
+        return jsonify({"status": "error", "explicacion": str(e)}), 400
+    
+    return jsonify(resultado)
+
+@app.route('/calcular-lote', methods=['POST'])
+def calcular_lote():
+    """
+    Muchos problemas en un pedido: {"problemas": [...]} con el formato de Simplex por problema
+    (objetivo, z_coefs, restricciones). Se resuelven juntos con tablas apiladas (ver
+    resolucion_lote) y vuelve {"resultados": [...]} en el mismo orden, sin pasos ni tablas.
+    Un problema mal formado trae status 'error' y no afecta al resto.
+    """
+    data = request.json
+    problemas = data['problemas']
+    resultados = [None] * len(problemas)
+    validos, posiciones = [], []
+    for posicion, problema in enumerate(problemas):
+        try:
+            c, A, b, operadores = _leer_problema_n_variables(problema)
+        except (KeyError, TypeError, ValueError) as e:
+            resultados[posicion] = {"status": "error", "explicacion": f"Datos inválidos: {e}"}
+            continue
+        validos.append({'c': c, 'A': A, 'b': b, 'operadores': operadores, 'objetivo': problema.get('objetivo', 'max')})
+        posiciones.append(posicion)
+    # "max_iteraciones" es por problema; "limite_tiempo" vale para todo el lote
+    try:
+        resueltos = resolver_lote(validos, **_control_resolucion(data))
+    except ValueError as e:
+        return jsonify({"status": "error", "explicacion": str(e)}), 400
+    for posicion, resultado in zip(posiciones, resueltos):
+        resultados[posicion] = resultado
+
+    return jsonify({"resultados": resultados})
+
+def _respuesta_sesion(sesion_id, sesion, data):
+    """Resultado del problema de la sesión con el objetivo del pedido (o el último usado)."""
+    c, objetivo, detalle, enteros = _opciones_sesion(sesion, data)
+    resultado = sesion.resultado(c, objetivo, detalle, enteros)
+    resultado['sesion'] = sesion_id
     return jsonify(resultado)
 
+def _opciones_sesion(sesion, data):
+    """c, objetivo, detalle y enteros del pedido; ValueError si no sirven, antes de editar la sesión."""
+    c = [float(data['z_x']), float(data['z_y'])] if 'z_x' in data and 'z_y' in data else None
+    return (c, *sesion.validar_opciones(data.get('objetivo'), data.get('detalle')), data.get('enteros'))
+
+def _sesion_vencida():
+    return jsonify({
+        "status": "error",
+        "explicacion": "La sesión no existe o venció; se crea otra con POST /sesion-grafica."
+    }), 404
+
+@app.route('/sesion-grafica', methods=['POST'])
+def crear_sesion_grafica():
+    """
+    Mismo JSON que /calcular; deja las restricciones en el servidor y devuelve el resultado
+    con "sesion": el id para /sesion-grafica/<id>/agregar y /eliminar, que editan la región
+    sin armarla de nuevo (ver sesion_grafica).
+    """
+    data = request.json
+    A, b, operadores = [], [], []
+    try:
+        for r in data['restricciones']:
+            A.append([float(r['x']), float(r['y'])])
+            b.append(float(r['val']))
+            operadores.append(r['op'])
+        sesion = SesionGrafica(A, b, operadores)
+        _opciones_sesion(sesion, data)
+    except ValueError as e:
+        return jsonify({"status": "error", "explicacion": str(e)}), 400
+    sesion_id = SESIONES.crear(sesion)
+    with sesion.lock:
+        return _respuesta_sesion(sesion_id, sesion, data)
+
+@app.route('/sesion-grafica/<sesion_id>/agregar', methods=['POST'])
+def agregar_sesion_grafica(sesion_id):
+    """{"restriccion": {"x", "y", "op", "val"}} y, si cambió, z_x/z_y/objetivo."""
+    sesion = SESIONES.obtener(sesion_id)
+    if sesion is None:
+        return _sesion_vencida()
+    data = request.json
+    r = data['restriccion']
+    with sesion.lock:
+        # Todo se valida antes de agregar: un pedido inválido no cambia la sesión
+        try:
+            _opciones_sesion(sesion, data)
+            sesion.agregar([float(r['x']), float(r['y'])], float(r['val']), r['op'])
+        except ValueError as e:
+            return jsonify({"status": "error", "explicacion": str(e)}), 400
+        return _respuesta_sesion(sesion_id, sesion, data)
+
+@app.route('/sesion-grafica/<sesion_id>/eliminar', methods=['POST'])
+def eliminar_sesion_grafica(sesion_id):
+    """{"indice": i} quita la restricción R(i+1), como el botón de la tabla."""
+    sesion = SESIONES.obtener(sesion_id)
+    if sesion is None:
+        return _sesion_vencida()
+    data = request.json
+    with sesion.lock:
+        try:
+            _opciones_sesion(sesion, data)
+            sesion.eliminar(int(data['indice']))
+        except (IndexError, ValueError) as e:
+            return jsonify({"status": "error", "explicacion": str(e)}), 400
+        return _respuesta_sesion(sesion_id, sesion, data)
+
+@app.route('/sesion-grafica/<sesion_id>', methods=['DELETE'])
+def borrar_sesion_grafica(sesion_id):
+    SESIONES.borrar(sesion_id)
+    return jsonify({"status": "success"})
+
 @app.route('/convertir-restricciones', methods=['POST'])
 def convertir_restricciones():
     """Endpoint para convertir restricciones en forma natural a formato estándar."""
@@ -0,0 +1,72 @@
+"""
+Caché de regiones factibles del método gráfico.
+
+En la interfaz se cambia mucho la función objetivo (z_x, z_y) sin tocar las restricciones,
+y la región (presolve, cortes, verificación, vértices, datos de la gráfica) depende solo de
+A, b, operadores y de las opciones que cambian cómo se arma. MetodoGrafico guarda aquí lo
+que calculó con una clave que resume todo eso: si la clave ya está, solo se evalúa Z en los
+k vértices guardados (O(k)).
+
+Se guardan como mucho TAMANO_CACHE regiones; al llenarse sale la usada hace más tiempo (LRU).
+Las entradas se tratan como de solo lectura: quien las usa copia lo que va a devolver.
+"""
+
+import hashlib
+from collections import OrderedDict
+from threading import Lock
+
+import numpy as np
+
+TAMANO_CACHE = 128
+
+
+def clave_restricciones(A, b, operadores, *opciones):
+    """Hash de las restricciones (valores y forma) y de las opciones que cambian la región."""
+    A = np.ascontiguousarray(A, dtype=float)
+    b = np.ascontiguousarray(b, dtype=float).ravel()
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr((A.shape, tuple(operadores), opciones)).encode())
+    h.update(A.tobytes())
+    h.update(b.tobytes())
+    return h.hexdigest()
+
+
+class CacheRegiones:
+    """Diccionario LRU con tamaño máximo; seguro entre hilos (Flask atiende en paralelo)."""
+
+    def __init__(self, tamano=TAMANO_CACHE):
+        self.tamano = tamano
+        self._entradas = OrderedDict()
+        self._lock = Lock()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def obtener(self, clave):
+        """La entrada guardada (y la marca como recién usada), o None."""
+        with self._lock:
+            entrada = self._entradas.get(clave)
+            if entrada is None:
+                self.fallos += 1
+                return None
+            self._entradas.move_to_end(clave)
+            self.aciertos += 1
+            return entrada
+
+    def guardar(self, clave, entrada):
+        with self._lock:
+            self._entradas[clave] = entrada
+            self._entradas.move_to_end(clave)
+            while len(self._entradas) > self.tamano:
+                self._entradas.popitem(last=False)
+
+    def limpiar(self):
+        with self._lock:
+            self._entradas.clear()
+            self.aciertos = self.fallos = 0
+
+    def __len__(self):
+        return len(self._entradas)
+
+
+# La que usa MetodoGrafico (una por proceso)
+CACHE_REGIONES = CacheRegiones()
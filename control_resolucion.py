@@ -0,0 +1,105 @@
+"""
+Control de la resolución: límite de iteraciones, tiempo límite y cancelación.
+
+Los bucles de pivoteo tenían solo un tope por tamaño (limite_iteraciones) y al llegar a él
+devolvían la tabla como si fuera óptima. Ahora cada método tiene un ControlResolucion que
+los bucles consultan antes de cada pivoteo (parar()):
+  - max_iteraciones: pivoteos en total (todas las fases y motores), además del tope por tamaño;
+  - limite_tiempo: segundos desde que empieza resolver();
+  - cancelacion: un TokenCancelacion que otro hilo puede activar.
+Si alguno se cumple, el método corta y devuelve la mejor base encontrada (la actual) con
+status 'iteration_limit', 'time_limit' o 'cancelled' y "factible" indicando si esa base ya
+cumple las restricciones (ver resultado_interrumpido).
+"""
+
+import threading
+import time
+
+ESTADOS_PARADA = ('iteration_limit', 'time_limit', 'cancelled')
+TIPOS_PARADA = {
+    'iteration_limit': "Límite de Iteraciones",
+    'time_limit': "Límite de Tiempo",
+    'cancelled': "Resolución Cancelada",
+}
+
+
+class TokenCancelacion:
+    """Cancelación cooperativa: cancelar() desde cualquier hilo; el método corta en el próximo pivoteo."""
+
+    def __init__(self):
+        self._evento = threading.Event()
+
+    def cancelar(self):
+        self._evento.set()
+
+    @property
+    def cancelado(self):
+        return self._evento.is_set()
+
+
+class ControlResolucion:
+    def __init__(self, max_iteraciones=None, limite_tiempo=None, cancelacion=None):
+        """ValueError si max_iteraciones no es un entero ≥ 0 o limite_tiempo no es > 0."""
+        if max_iteraciones is not None and (isinstance(max_iteraciones, bool) or
+                                            int(max_iteraciones) != max_iteraciones or max_iteraciones < 0):
+            raise ValueError(f"max_iteraciones debe ser un entero ≥ 0 (se recibió {max_iteraciones!r})")
+        if limite_tiempo is not None and not float(limite_tiempo) > 0:
+            raise ValueError(f"limite_tiempo debe ser un número de segundos > 0 (se recibió {limite_tiempo!r})")
+        self.max_iteraciones = int(max_iteraciones) if max_iteraciones is not None else None
+        self.limite_tiempo = float(limite_tiempo) if limite_tiempo is not None else None
+        self.cancelacion = cancelacion
+        self.iteraciones = 0
+        self.fin = None
+
+    def iniciar(self):
+        """Al empezar resolver(): pone en cero el contador y arranca el reloj."""
+        self.iteraciones = 0
+        self.fin = time.monotonic() + self.limite_tiempo if self.limite_tiempo is not None else None
+
+    def parar(self):
+        """Antes de cada pivoteo: None para seguir (y lo cuenta) o el estado con el que se corta."""
+        if self.cancelacion is not None and self.cancelacion.cancelado:
+            return 'cancelled'
+        if self.fin is not None and time.monotonic() >= self.fin:
+            return 'time_limit'
+        if self.max_iteraciones is not None and self.iteraciones >= self.max_iteraciones:
+            return 'iteration_limit'
+        self.iteraciones += 1
+        return None
+
+    def mensaje(self, estado):
+        """Línea para los pasos cuando se corta."""
+        if estado == 'cancelled':
+            return "⏹ Resolución cancelada: se devuelve la base actual."
+        if estado == 'time_limit':
+            return f"⏹ Se agotó el tiempo límite ({self.limite_tiempo:g} s): se devuelve la base actual."
+        return f"⏹ Se alcanzó el límite de iteraciones ({self.iteraciones}): se devuelve la base actual."
+
+
+def resultado_interrumpido(estado, iteraciones, factible, pasos, tablas, **datos):
+    """
+    Resultado de una resolución cortada por `estado` (de ESTADOS_PARADA). `datos` trae lo
+    que haya de la mejor base: solucion, z_actual (el Z de esa base, no el óptimo) y
+    variables_basicas. Con factible=False la base todavía no cumple las restricciones.
+    """
+    motivo = {
+        'iteration_limit': f"Se alcanzó el límite de iteraciones ({iteraciones}) sin llegar al óptimo.",
+        'time_limit': f"Se agotó el tiempo límite tras {iteraciones} iteraciones sin llegar al óptimo.",
+        'cancelled': f"La resolución se canceló tras {iteraciones} iteraciones.",
+    }[estado]
+    if "solucion" not in datos:
+        detalle_base = ""
+    elif factible:
+        detalle_base = " La solución es la de la última base: factible, pero no necesariamente óptima."
+    else:
+        detalle_base = " La última base todavía no es factible (no cumple todas las restricciones)."
+    return {
+        "status": estado,
+        "tipo_solucion": TIPOS_PARADA[estado],
+        "explicacion": motivo + detalle_base,
+        "iteraciones": int(iteraciones),
+        "factible": bool(factible),
+        **datos,
+        "pasos": pasos,
+        "tablas": tablas,
+    }
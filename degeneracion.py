@@ -0,0 +1,120 @@
+"""
+Manejo de la degeneración durante las iteraciones del Simplex.
+
+Un pivote es degenerado cuando el ratio mínimo es 0: la base cambia pero el punto (y Z)
+no. Varios seguidos son un "estancamiento" y, en el peor caso, un ciclo. Antes solo se
+detectaba la degeneración al final; aquí se actúa durante las iteraciones:
+
+  - 'lexicografico' (por defecto): los empates en el ratio mínimo se rompen comparando
+    las filas de B⁻¹ (columnas de la base inicial) divididas por α_iq. Con esta regla
+    el Simplex no cicla.
+  - 'perturbacion': se suma al RHS un ε_i pequeño y distinto en cada fila (acotado y
+    reproducible), con lo que casi no quedan empates. Al terminar se recalcula el RHS
+    original como B⁻¹b, sin perder la base encontrada.
+  - En cualquier modo, tras `umbral_bland` pivotes degenerados seguidos se pasa a la
+    regla de Bland (menor índice entrante y saliente) hasta el siguiente pivote con paso > 0.
+
+`pivotes_degenerados` y `cambios_a_bland` se devuelven en el resultado de cada método.
+"""
+
+import numpy as np
+
+
+MODOS_DEGENERACION = ('ninguno', 'lexicografico', 'perturbacion')
+
+
+class ControlDegeneracion:
+    """Estado del manejo de degeneración durante una corrida (una fase) del Simplex."""
+
+    def __init__(self, modo='lexicografico', umbral_bland=10, epsilon=1e-7, tol=1e-9):
+        modo = (modo or 'ninguno').lower()
+        if modo not in MODOS_DEGENERACION:
+            raise ValueError(f"Modo de degeneración desconocido: {modo}. "
+                             f"Opciones: {', '.join(MODOS_DEGENERACION)}")
+        self.modo = modo
+        self.umbral_bland = umbral_bland
+        self.epsilon = epsilon
+        self.tol = tol
+        self.pivotes_degenerados = 0
+        self.cambios_a_bland = 0
+        self._seguidos = 0
+        self.en_bland = False
+
+    # ---- Perturbación del RHS ----
+
+    def perturbacion(self, rhs):
+        """ε_i ∈ [ε, 2ε]·(1 + |b_i|), con semilla fija para que las corridas sean reproducibles."""
+        rng = np.random.default_rng(0)
+        return self.epsilon * (1.0 + np.abs(rhs)) * (1.0 + rng.random(len(rhs)))
+
+    def perturbar_tabla(self, tabla, base_inicial):
+        """Guarda el RHS original (y la fila 0 en la base inicial) y perturba las restricciones."""
+        if self.modo != 'perturbacion':
+            return
+        self._rhs_original = tabla[:, -1].copy()
+        self._fila0_base = tabla[0, base_inicial].copy()
+        tabla[1:, -1] += self.perturbacion(tabla[1:, -1])
+
+    def restaurar_tabla(self, tabla, base_inicial):
+        """
+        Quita la perturbación. La tabla actual es E·T_inicial con E = [[1, yᵀ], [0, B⁻¹]], y en
+        las columnas de la base inicial T_inicial tiene la identidad, así que B⁻¹ e y se leen
+        directamente de la tabla: RHS = B⁻¹b y Z = z₀ + yᵀb con los valores originales.
+        """
+        if self.modo != 'perturbacion':
+            return
+        B_inv = tabla[1:, base_inicial]
+        y = tabla[0, base_inicial] - self._fila0_base
+        b = self._rhs_original[1:]
+        tabla[1:, -1] = B_inv @ b
+        tabla[0, -1] = self._rhs_original[0] + y @ b
+        # Restos de redondeo del orden de ε → 0
+        casi_cero = np.abs(tabla[1:, -1]) < max(self.tol, 10 * self.epsilon)
+        tabla[1:, -1][casi_cero] = 0.0
+
+    # ---- Selección de variables ----
+
+    def elegir_entrante(self, d, regla, contexto=None):
+        """Con Bland activo: la de menor índice que mejora. Si no, la regla de precio."""
+        if self.en_bland:
+            candidatos = np.flatnonzero(d < -self.tol)
+            return int(candidatos[0]) if candidatos.size else None
+        return regla.elegir(d, contexto)
+
+    def elegir_saliente(self, ratios, fila, alfa, columna_base_inicial, indices_basicas):
+        """
+        `fila` es el argmin de `ratios` (o -1 si no acotado). Si hay empate en el mínimo:
+        Bland → menor índice de variable básica; lexicográfico → comparar columnas de
+        B⁻¹·B₀ (columna_base_inicial(k)) divididas por α; si no, se deja el primero.
+        """
+        if fila < 0:
+            return fila
+        minimo = ratios[fila]
+        empatadas = np.flatnonzero(ratios <= minimo + self.tol * (1.0 + abs(minimo)))
+        if empatadas.size == 1:
+            return fila
+        if self.en_bland:
+            return int(min(empatadas, key=lambda i: indices_basicas[i]))
+        if self.modo != 'lexicografico':
+            return fila
+        k = 0
+        while empatadas.size > 1 and k < len(alfa):
+            valores = columna_base_inicial(k)[empatadas] / alfa[empatadas]
+            menor = valores.min()
+            empatadas = empatadas[valores <= menor + self.tol]
+            k += 1
+        return int(empatadas[0])
+
+    def registrar_pivote(self, paso):
+        """Cuenta el pivote; activa o desactiva Bland. Devuelve True si fue degenerado."""
+        if paso > self.tol:
+            self._seguidos = 0
+            self.en_bland = False
+            return False
+        self.pivotes_degenerados += 1
+        self._seguidos += 1
+        if not self.en_bland and self.umbral_bland and self._seguidos >= self.umbral_bland:
+            self.en_bland = True
+            self.cambios_a_bland += 1
+        return True
+
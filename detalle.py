@@ -0,0 +1,22 @@
+"""
+Nivel de detalle del registro de pasos y tablas de los métodos.
+
+  - 'full' (por defecto): todo lo que se ve en la interfaz; explicación de cada iteración
+    (entrante, ratios, saliente, pivoteo) y una foto de la tabla en cada una.
+  - 'summary': planteo, forma estándar, reducciones y resultado; sin el detalle de cada
+    iteración ni tablas.
+  - 'none': sin pasos ni tablas, y sin armar ningún texto. Para los clientes de la API que
+    solo quieren z_optimo y solucion: en problemas grandes el registro cuesta más que el
+    álgebra.
+"""
+
+NIVELES_DETALLE = ('none', 'summary', 'full')
+
+
+def validar_detalle(detalle):
+    """Devuelve el nivel ('full' si es None) o lanza ValueError si no es válido."""
+    if detalle is None:
+        return 'full'
+    if detalle not in NIVELES_DETALLE:
+        raise ValueError(f"detalle debe ser uno de {', '.join(NIVELES_DETALLE)} (se recibió {detalle!r})")
+    return detalle
@@ -0,0 +1,196 @@
+"""
+Escalado de la matriz antes de resolver (media geométrica + equilibrado).
+
+Cuando los coeficientes van de 1e-3 a 1e6, las tolerancias fijas (1e-9) y la M = 10000 de
+Big M dejan de tener sentido: aparecen pivotes diminutos, iteraciones de más y, a veces,
+una artificial que "no sale" porque M ya no es grande frente a Z. Antes de resolver se
+cambia el problema por uno equivalente con coeficientes cerca de 1:
+
+    A' = R·A·S    b' = R·b    c' = S·c / σ    x = S·x'
+
+  - R (filas) y S (columnas) son diagonales. Se calculan alternando filas y columnas:
+    cada una se divide por la media geométrica de su mayor y menor |a_ij| (√(máx·mín)),
+    hasta que el rango máx|a| / mín|a| deja de mejorar.
+  - Después se equilibra: cada fila y luego cada columna queda con máx|a_ij| = 1.
+  - σ lleva el mayor |c'_j| a 1 (si pasa del umbral), así la M de Big M vuelve a ser
+    grande frente a Z.
+  - Todos los factores se redondean a potencias de 2: multiplicar por ellos no agrega
+    error de redondeo, y al desescalar se recupera exactamente el mismo problema.
+
+Las restricciones no cambian de sentido (R > 0), así que los operadores quedan igual. Al
+terminar, la solución se desescala (x = S·x') y Z se recalcula con los costos originales.
+Solo se escala si el rango de coeficientes de A o el mayor costo superan `umbral` (por
+defecto 100): en los ejercicios de clase las tablas siguen mostrando los números del enunciado.
+"""
+
+import numpy as np
+
+from matriz_dispersa import MatrizDispersa
+
+UMBRAL = 1e2   # rango de A o mayor costo a partir del cual se escala
+
+
+class Escalado:
+    """Factores de fila y columna para A, y el desescalado de la solución."""
+
+    def __init__(self, A, c, umbral=UMBRAL, max_pasadas=20, tol=1e-9):
+        self.c = np.array(c, dtype=float)
+        if isinstance(A, MatrizDispersa):
+            m, n = A.shape
+            self.fila_t = A.indices.copy()
+            self.col_t = np.repeat(np.arange(n), np.diff(A.indptr))
+            self.val_t = A.datos.copy()
+        else:
+            A = np.asarray(A, dtype=float)
+            m, n = A.shape
+            self.fila_t, self.col_t = np.nonzero(A)
+            self.val_t = A[self.fila_t, self.col_t]
+        no_nulos = np.abs(self.val_t) > tol
+        self.fila_t, self.col_t, self.val_t = self.fila_t[no_nulos], self.col_t[no_nulos], self.val_t[no_nulos]
+        self.m, self.n = m, n
+        self.umbral = umbral
+        self.max_pasadas = max_pasadas
+        self.filas = np.ones(m)        # R
+        self.columnas = np.ones(n)     # S
+        self.sigma = 1.0               # escala del objetivo
+        self.pasadas = 0
+        self.rango_antes = self.rango_despues = self._rango(np.zeros(m), np.zeros(n))
+        self.aplicado = False
+
+    # ---- Utilidades (en logaritmos: log|a'_ij| = log|a_ij| + log r_i + log s_j) ----
+
+    def _log_escalados(self, log_r, log_s):
+        return np.log2(np.abs(self.val_t)) + log_r[self.fila_t] + log_s[self.col_t]
+
+    def _rango(self, log_r, log_s):
+        """máx|a'| / mín|a'| sobre los coeficientes no nulos (1 si A no tiene ninguno)."""
+        if self.val_t.size == 0:
+            return 1.0
+        v = self._log_escalados(log_r, log_s)
+        return float(2.0 ** (v.max() - v.min()))
+
+    def _extremos(self, indices, valores, tamano):
+        """Máximo y mínimo de `valores` agrupados por `indices` (±inf donde no hay entradas)."""
+        maximo = np.full(tamano, -np.inf)
+        minimo = np.full(tamano, np.inf)
+        np.maximum.at(maximo, indices, valores)
+        np.minimum.at(minimo, indices, valores)
+        return maximo, minimo
+
+    # ---- Cálculo de factores ----
+
+    def calcular(self):
+        """
+        Calcula R, S y σ. Las filas y columnas se escalan si el rango de A supera el umbral
+        (y el escalado lo mejora); Z, si su mayor costo supera el umbral. Devuelve True si
+        se escala algo.
+        """
+        if self.rango_antes > self.umbral:
+            self._calcular_filas_columnas()
+        costos = np.abs(self.c * self.columnas).max(initial=0.0)
+        if costos > self.umbral:
+            self.sigma = float(2.0 ** np.round(np.log2(costos)))
+        self.aplicado = self.rango_despues < self.rango_antes or self.sigma != 1.0
+        return self.aplicado
+
+    def _calcular_filas_columnas(self):
+        log_r, log_s = np.zeros(self.m), np.zeros(self.n)
+        rango = self.rango_antes
+        for pasada in range(1, self.max_pasadas + 1):
+            # Media geométrica por filas y luego por columnas
+            maximo, minimo = self._extremos(self.fila_t, self._log_escalados(log_r, log_s), self.m)
+            con_datos = np.isfinite(maximo)
+            log_r[con_datos] -= (maximo[con_datos] + minimo[con_datos]) / 2
+            maximo, minimo = self._extremos(self.col_t, self._log_escalados(log_r, log_s), self.n)
+            con_datos = np.isfinite(maximo)
+            log_s[con_datos] -= (maximo[con_datos] + minimo[con_datos]) / 2
+            self.pasadas = pasada
+            nuevo = self._rango(log_r, log_s)
+            if nuevo > 0.9 * rango:
+                break
+            rango = nuevo
+
+        # Equilibrado: máx|a_ij| = 1 en cada fila y después en cada columna
+        maximo, _ = self._extremos(self.fila_t, self._log_escalados(log_r, log_s), self.m)
+        log_r[np.isfinite(maximo)] -= maximo[np.isfinite(maximo)]
+        maximo, _ = self._extremos(self.col_t, self._log_escalados(log_r, log_s), self.n)
+        log_s[np.isfinite(maximo)] -= maximo[np.isfinite(maximo)]
+
+        # Potencias de 2: escalar y desescalar no agrega error de redondeo
+        log_r, log_s = np.round(log_r), np.round(log_s)
+        rango_despues = self._rango(log_r, log_s)
+        if rango_despues < self.rango_antes:
+            self.filas, self.columnas = 2.0 ** log_r, 2.0 ** log_s
+            self.rango_despues = rango_despues
+
+    # ---- Problema escalado y vuelta atrás ----
+
+    def escalar_matriz(self, A):
+        if isinstance(A, MatrizDispersa):
+            return MatrizDispersa(A.indptr, A.indices,
+                                  A.datos * self.filas[A.indices] * self.columnas[A._columna_de_entrada], A.shape)
+        return np.asarray(A, dtype=float) * self.filas[:, None] * self.columnas[None, :]
+
+    def escalar(self, A, b, c):
+        """(A', b', c') del problema escalado."""
+        return (self.escalar_matriz(A), np.asarray(b, dtype=float) * self.filas,
+                np.asarray(c, dtype=float) * self.columnas / self.sigma)
+
+    def escalar_limites(self, inferiores, superiores):
+        """l' = l / s, u' = u / s (∞ sigue siendo ∞)."""
+        return inferiores / self.columnas, superiores / self.columnas
+
+    def desescalar(self, solucion_escalada):
+        """x = S·x'."""
+        return np.asarray(solucion_escalada, dtype=float) * self.columnas
+
+    def desescalar_duales(self, duales_escalados):
+        """Precios sombra del problema original: y = σ·R·y'."""
+        return np.asarray(duales_escalados, dtype=float) * self.filas * self.sigma
+
+    def resumen(self):
+        return {
+            "aplicado": self.aplicado,
+            "rango_antes": self.rango_antes,
+            "rango_despues": self.rango_despues,
+            "mejora": self.rango_antes / self.rango_despues,
+            "pasadas": self.pasadas,
+            "escala_objetivo": self.sigma,
+        }
+
+    def completar_resultado(self, resultado):
+        """Lleva el resultado del problema escalado al original."""
+        if self.aplicado and "solucion" in resultado:   # óptima o la base actual de un corte
+            x = self.desescalar(resultado["solucion"])
+            resultado["solucion"] = [float(v) for v in x]
+            resultado["z_optimo" if resultado.get("status") == "optimal" else "z_actual"] = float(self.c @ x)
+        resultado["escalado"] = self.resumen()
+        return resultado
+
+
+def escalar_metodo(metodo):
+    """
+    Escala el problema de un método n-variables (Simplex, Dos Fases, Simplex Dual) en el
+    lugar y registra el cambio en los pasos. Devuelve el Escalado (para desescalar).
+    """
+    escalado = Escalado(metodo.A, metodo.c)
+    if metodo.con_pasos:
+        metodo.registrar_paso("=== ESCALADO ===")
+    if not escalado.calcular():
+        if metodo.con_pasos:
+            metodo.registrar_paso(f"  Rango de coeficientes máx|a|/mín|a| = {escalado.rango_antes:.4g}: "
+                                  f"no hace falta escalar.")
+        return escalado
+    metodo.A, metodo.b, metodo.c = escalado.escalar(metodo.A, metodo.b, metodo.c)
+    if getattr(metodo, 'superiores', None) is not None:
+        metodo.inferiores, metodo.superiores = escalado.escalar_limites(metodo.inferiores, metodo.superiores)
+    if escalado.rango_despues < escalado.rango_antes and metodo.con_pasos:
+        metodo.registrar_paso(f"  Rango de coeficientes máx|a|/mín|a|: {escalado.rango_antes:.4g} → "
+                              f"{escalado.rango_despues:.4g} ({escalado.pasadas} pasadas de media geométrica "
+                              f"+ equilibrado, factores potencias de 2)")
+        metodo.registrar_paso(f"  Cambio de variable x_j = s_j·x'_j con s = "
+                              + ", ".join(f"{s:g}" for s in escalado.columnas[:10])
+                              + (", ..." if escalado.n > 10 else ""))
+    if escalado.sigma != 1.0 and metodo.con_pasos:
+        metodo.registrar_paso(f"  Z se divide por {escalado.sigma:g} para que la M de Big M siga siendo grande frente a los costos")
+    return escalado
@@ -0,0 +1,212 @@
+"""
+Pasos de cada iteración como eventos: un código y campos numéricos, el texto recién al final.
+
+En el bucle de pivoteo cada iteración armaba decenas de frases ("📌 VARIABLE ENTRANTE…",
+"Restamos … × Fila[…]") que se mandaban tal cual. Ahora los métodos anotan en `pasos`
+listas cortas [código, campos...] (las variables van como índice de columna) y las líneas
+sueltas del planteo siguen siendo texto. Al armar la respuesta:
+  - formato_pasos='texto' (por defecto): renderizar_pasos() las convierte en las mismas
+    frases de siempre;
+  - formato_pasos='eventos': se mandan así y las muestra static/js/main.js (renderizarPasos),
+    con una respuesta mucho más chica.
+
+Eventos (en JS, el mismo catálogo):
+  col  [nombres]                       nombres de las columnas para los eventos que siguen
+  base [columnas]                      base inicial (el renderizador la actualiza en cada 'piv')
+  it   [iteración]                     encabezado de iteración (Simplex y Simplex Dual)
+  itf  [fase, iteración]               encabezado de iteración de Dos Fases
+  ent  [col, coef. en Z, es_max]       variable entrante con la explicación y el cálculo de ratios
+  rat  [rhs, columna entrante]         ratios por fila (rhs / coef. donde coef. > 1e-9)
+  sal  [fila]                          variable saliente (la básica de esa fila, con su ratio)
+  piv  []                              pivoteo: elemento y restas por fila, de la columna de 'rat'
+  res  [Z anterior, Z nuevo]           resultado de la iteración y nueva base
+  e / s [col]                          entrante / saliente (forma corta de Dos Fases)
+  w / z [valor]                        nuevo valor de W / Z (Dos Fases)
+  dsal [saliente, rhs]                 Simplex Dual: fila que sale
+  drat [entrante, ratio, cols, ratios] Simplex Dual: ratios duales y entrante
+  dpiv [elemento, Z]                   Simplex Dual: pivote
+  rlim [it, col, superior, límite]     Simplex Revisado: cambio de límite
+  rpiv [it, entra, d, sale, arriba, ratio]  Simplex Revisado: pivote primal
+  rdual [it, sale, valor, entra, ratio]     Simplex Revisado: pivote dual
+"""
+
+FORMATOS_PASOS = ('texto', 'eventos')
+
+
+def validar_formato_pasos(formato):
+    """Devuelve el formato ('texto' si es None) o lanza ValueError si no es válido."""
+    if formato is None:
+        return 'texto'
+    if formato not in FORMATOS_PASOS:
+        raise ValueError(f"formato_pasos debe ser uno de {', '.join(FORMATOS_PASOS)} (se recibió {formato!r})")
+    return formato
+
+
+TOL_RATIO = 1e-9   # igual que NucleoPivoteo: solo filas con coef. > tol tienen ratio
+
+
+def _ratio(valor):
+    return "∞" if valor is None else f"{valor:.4f}"
+
+
+class _Renderizador:
+    """Estado entre eventos: nombres de columnas, base actual y la iteración en curso."""
+
+    def __init__(self):
+        self.nombres = None
+        self.base = []
+        self.entrante = self.saliente = ""
+        self.col_entrante, self.coef_z = None, 0.0
+        self.rhs, self.columna, self.fila = [], [], None
+
+    def nombre(self, j):
+        if j < 0:
+            return "Z"
+        return self.nombres[j] if self.nombres else f"col{j + 1}"
+
+    def lineas(self, evento):
+        codigo, campos = evento[0], evento[1:]
+        return getattr(self, f"_{codigo}")(*campos)
+
+    def _col(self, nombres):
+        self.nombres = nombres
+        return []
+
+    def _base(self, columnas):
+        self.base = list(columnas)
+        return []
+
+    def _ratio_fila(self, i):
+        coef = self.columna[i]
+        return self.rhs[i] / coef if coef > TOL_RATIO else None
+
+    def _it(self, iteracion):
+        return [f"\n--- ITERACIÓN {iteracion} ---"]
+
+    def _itf(self, fase, iteracion):
+        return [f"\n--- FASE {fase} - ITERACIÓN {iteracion} ---"]
+
+    def _ent(self, col, coef, es_max):
+        self.col_entrante, self.coef_z = col, coef
+        n = self.nombre(col)
+        lineas = [f"\n📌 VARIABLE ENTRANTE: {n}",
+                  f"   Razón: El coeficiente en la fila Z es {coef:.4f}, que es {'negativo' if coef < 0 else 'positivo'}."]
+        if es_max:
+            lineas.append(f"   En maximización, valores negativos en la fila Z indican que aumentar {n} mejorará el valor de Z.")
+        else:
+            lineas.append(f"   En minimización, valores positivos en la fila Z indican que aumentar {n} reducirá el valor de Z.")
+        return lineas + [
+            "\n📊 CÁLCULO DE RATIOS (para determinar variable saliente):",
+            f"   Ratio = Valor en columna 'Solución' ÷ Valor en columna '{n}'",
+            f"   Solo se calculan ratios para filas donde el coeficiente de {n} es positivo.",
+        ]
+
+    def _rat(self, rhs, columna):
+        self.rhs, self.columna = rhs, columna
+        lineas = []
+        for i, basica in enumerate(self.base):
+            ratio = self._ratio_fila(i)
+            if ratio is None:
+                lineas.append(f"   {self.nombre(basica)}: No se calcula (coeficiente ≤ 0 o muy pequeño)")
+            else:
+                lineas.append(f"   {self.nombre(basica)}: {rhs[i]:.4f} ÷ {columna[i]:.4f} = {ratio:.4f}")
+        return lineas
+
+    def _sal(self, fila):
+        self.fila = fila
+        self.entrante, self.saliente = self.nombre(self.col_entrante), self.nombre(self.base[fila])
+        ratio, s = self._ratio_fila(fila), self.saliente
+        lineas = [f"\n📌 VARIABLE SALIENTE: {s}", f"   Razón: Tiene el ratio mínimo ({_ratio(ratio)})."]
+        if ratio is not None:
+            lineas.append(f"   El ratio mínimo asegura que al hacer {self.entrante} = {_ratio(ratio)}, "
+                          f"la variable {s} se vuelve cero (sale de la base).")
+        return lineas
+
+    def _piv(self):
+        e, elemento = self.entrante, self.columna[self.fila]
+        lineas = [
+            "\n🔄 OPERACIONES DE PIVOTEO:",
+            f"   Elemento Pivote: {elemento:.4f} (intersección de fila {self.saliente} y columna {e})",
+            f"   Paso 1: Normalizar la fila pivote (dividir toda la fila por {elemento:.4f})",
+            f"           Esto hace que el elemento pivote sea 1 y {e} entre a la base con coeficiente 1.",
+            f"   Paso 2: Eliminación gaussiana (hacer cero la columna {e} en todas las demás filas)",
+            f"           Para cada fila i ≠ fila pivote: Fila[i] = Fila[i] - (coeficiente en columna {e}) × Fila[pivote]",
+        ]
+        # Fila Z y filas de restricción con coeficiente no nulo en la columna entrante
+        filas = [("Z", self.coef_z)] + [(self.nombre(b), c) for i, (b, c) in enumerate(zip(self.base, self.columna))
+                                        if i != self.fila]
+        lineas += [f"           - Fila {nombre}: Restamos {coef:.4f} × Fila[{self.saliente}]"
+                   for nombre, coef in filas if abs(coef) > TOL_RATIO]
+        self.base[self.fila] = self.col_entrante
+        return lineas
+
+    def _res(self, z_anterior, z_nuevo):
+        ratio, base = self._ratio_fila(self.fila), self.base
+        lineas = ["\n✅ RESULTADO DE LA ITERACIÓN:",
+                  f"   Valor anterior de Z: {z_anterior:.4f}",
+                  f"   Nuevo valor de Z: {z_nuevo:.4f}"]
+        if ratio is not None:
+            mejora = z_nuevo - z_anterior
+            lineas.append(f"   Mejora en Z: {mejora:+.4f} "
+                          f"({'aumento' if mejora > 0 else 'disminución' if mejora < 0 else 'sin cambio'})")
+        lineas.append(f"   Nueva base: {', '.join(self.nombre(j) for j in base)}")
+        if ratio is not None:
+            lineas.append(f"   {self.entrante} ahora es básica (valor = {_ratio(ratio)}), "
+                          f"{self.saliente} sale de la base (valor = 0)")
+        else:
+            lineas.append(f"   {self.entrante} ahora es básica, {self.saliente} sale de la base (valor = 0)")
+        return lineas
+
+    def _e(self, col):
+        return [f"📌 VARIABLE ENTRANTE: {self.nombre(col)}"]
+
+    def _s(self, col):
+        return [f"📌 VARIABLE SALIENTE: {self.nombre(col)}"]
+
+    def _w(self, valor):
+        return [f"Nuevo valor de W: {valor:.6f}"]
+
+    def _z(self, valor):
+        return [f"Nuevo valor de Z: {valor:.4f}"]
+
+    def _dsal(self, saliente, rhs):
+        return [f"📌 VARIABLE SALIENTE: {self.nombre(saliente)} (RHS más negativo = {rhs:.4f})"]
+
+    def _drat(self, entrante, ratio, columnas, ratios):
+        return (["📊 RATIOS DUALES |Z_j ÷ a_rj| (solo a_rj < 0):"]
+                + [f"   {self.nombre(j)}: {r:.4f}" for j, r in zip(columnas, ratios)]
+                + [f"📌 VARIABLE ENTRANTE: {self.nombre(entrante)} (ratio dual mínimo = {ratio:.4f})"])
+
+    def _dpiv(self, elemento, z):
+        return [f"🔄 Pivote {elemento:.4f}; nuevo valor de Z: {z:.4f}"]
+
+    def _rlim(self, iteracion, col, superior, limite):
+        return [f"Iteración {iteracion}: {self.nombre(col)} pasa a su límite "
+                f"{'superior' if superior else 'inferior'} ({limite:.4f}) sin cambiar la base"]
+
+    def _rpiv(self, iteracion, entra, d, sale, arriba, ratio):
+        return [f"Iteración {iteracion}: entra {self.nombre(entra)} (d = {d:.4f}), "
+                f"sale {self.nombre(sale)}{' a su límite superior' if arriba else ''} (ratio = {ratio:.4f})"]
+
+    def _rdual(self, iteracion, sale, valor, entra, ratio):
+        return [f"Iteración dual {iteracion}: sale {self.nombre(sale)} (valor = {valor:.4f}), "
+                f"entra {self.nombre(entra)} (ratio dual = {ratio:.4f})"]
+
+
+def renderizar_pasos(pasos):
+    """Pasos mezclados (texto y eventos) → solo texto, con las mismas frases de siempre."""
+    renderizador = _Renderizador()
+    texto = []
+    for paso in pasos:
+        if isinstance(paso, str):
+            texto.append(paso)
+        else:
+            texto.extend(renderizador.lineas(paso))
+    return texto
+
+
+def completar_pasos(resultado, formato):
+    """En la frontera de la respuesta: con formato 'texto' los eventos pasan a frases."""
+    if formato == 'texto' and resultado.get("pasos"):
+        resultado["pasos"] = renderizar_pasos(resultado["pasos"])
+    return resultado
@@ -0,0 +1,194 @@
+"""
+Historial de tablas para la vista paso a paso, sin una copia de la tabla por iteración.
+
+Antes cada iteración guardaba la tabla completa (memoria O(iteraciones·m·n)) y al final
+se volvía a convertir toda la lista. Ahora se guarda la tabla inicial y la secuencia de
+pivoteos (fila, columna); la tabla de cualquier iteración se reconstruye repitiendo esos
+pivoteos con el mismo NucleoPivoteo, así que sale idéntica (bit a bit) a la del método.
+
+  - anclar(tabla): nueva tabla base. Al empezar y cada vez que la tabla cambia por algo que
+    no es un pivoteo (perturbación del RHS, fila artificial del Simplex Dual, Fase 2).
+  - pivotear(fila, col, tabla): anota el pivoteo que se acaba de hacer sobre `tabla`.
+    Cada `cada` pivoteos se guarda una copia (punto de control), así tabla(k) no repite
+    todo desde la base.
+  - serializar(): las tablas para el JSON en una sola pasada hacia adelante, con una única
+    tabla de trabajo. Es el único lugar donde se pasa a listas de Python.
+
+Almacenamiento compacto: pivoteos y puntos de control van en bloques NumPy contiguos
+(BloqueCreciente, capacidad que se duplica al llenarse), no en listas de objetos. Los puntos
+de control tienen un máximo por tabla base: al llenarse se descarta uno de cada dos y se
+duplica el intervalo, así la memoria queda acotada aunque la resolución sea larga.
+
+Retención (qué iteraciones se devuelven): todas por defecto, o las que cumplan alguna de
+`primeras` (las N primeras), `ultimas` (las N últimas, en un anillo) y `cada` (una de cada k).
+"""
+
+from collections import deque
+
+import numpy as np
+
+from nucleo_pivoteo import NucleoPivoteo
+
+PUNTOS_CONTROL = 50       # pivoteos entre copias guardadas (0 = solo la tabla base)
+MAX_PUNTOS_CONTROL = 16   # copias como máximo por tabla base
+CLAVES_RETENCION = ('primeras', 'ultimas', 'cada')
+
+
+def validar_retencion(retencion):
+    """None / {} → todas; si no, dict con enteros ≥ 1 en primeras/ultimas/cada. ValueError si no."""
+    if not retencion:
+        return {}
+    if not isinstance(retencion, dict):
+        raise ValueError("retencion debe ser un objeto con primeras, ultimas y/o cada")
+    desconocidas = set(retencion) - set(CLAVES_RETENCION)
+    if desconocidas:
+        raise ValueError(f"retencion: claves no válidas {sorted(desconocidas)} "
+                         f"(se aceptan {', '.join(CLAVES_RETENCION)})")
+    normalizada = {}
+    for clave, valor in retencion.items():
+        if valor is None:
+            continue
+        if isinstance(valor, bool) or int(valor) != valor or valor < 1:
+            raise ValueError(f"retencion.{clave} debe ser un entero ≥ 1 (se recibió {valor!r})")
+        normalizada[clave] = int(valor)
+    return normalizada
+
+
+class BloqueCreciente:
+    """Arreglo contiguo de elementos de forma fija; la capacidad se duplica al llenarse."""
+
+    def __init__(self, forma, dtype=float, capacidad=4):
+        self.datos = np.empty((capacidad,) + tuple(forma), dtype=dtype)
+        self.n = 0
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, k):
+        return self.datos[:self.n][k]
+
+    def agregar(self, elemento):
+        if self.n == len(self.datos):
+            nuevos = np.empty((2 * len(self.datos),) + self.datos.shape[1:], dtype=self.datos.dtype)
+            nuevos[:self.n] = self.datos[:self.n]
+            self.datos = nuevos
+        self.datos[self.n] = elemento
+        self.n += 1
+
+    def conservar(self, indices):
+        """Deja solo los elementos en `indices` (en ese orden), sin cambiar la capacidad."""
+        quedan = self.datos[indices].copy()
+        self.datos[:len(quedan)] = quedan
+        self.n = len(quedan)
+
+
+class _Segmento:
+    """Una tabla base, los pivoteos hechos sobre ella y sus puntos de control."""
+
+    def __init__(self, tabla, cada):
+        self.base = np.array(tabla, dtype=float)
+        self.pivotes = BloqueCreciente((2,), dtype=np.int64)
+        self.cada = cada
+        self.controles = BloqueCreciente(self.base.shape)  # tablas tras k·cada pivoteos
+        self.posiciones = BloqueCreciente((), dtype=np.int64)
+
+    def pivotear(self, fila, col, tabla):
+        self.pivotes.agregar((fila, col))
+        hechos = len(self.pivotes)
+        if not self.cada or hechos % self.cada:
+            return
+        if len(self.controles) == MAX_PUNTOS_CONTROL:
+            # Lleno: uno de cada dos y el doble de intervalo
+            impares = np.arange(1, len(self.controles), 2)
+            self.controles.conservar(impares)
+            self.posiciones.conservar(impares)
+            self.cada *= 2
+            if hechos % self.cada:
+                return
+        self.controles.agregar(tabla)
+        self.posiciones.agregar(hechos)
+
+    def tabla_hasta(self, hechos, tabla=None, desde=0):
+        """
+        Tabla tras `hechos` pivoteos. Si se da `tabla` (ya con `desde` pivoteos) se avanza
+        sobre ella; si hay un punto de control más adelante, se salta a él.
+        """
+        k = int(np.searchsorted(self.posiciones[:], hechos, side='right')) - 1
+        if tabla is None or (k >= 0 and self.posiciones[k] > desde):
+            if k >= 0:
+                tabla, desde = self.controles[k].copy(), int(self.posiciones[k])
+            else:
+                tabla, desde = self.base.copy(), 0
+        nucleo = NucleoPivoteo(tabla)
+        for fila, col in self.pivotes[desde:hechos]:
+            nucleo.pivotear(tabla, fila, col)
+        return tabla
+
+
+class HistorialTablas:
+    """Tablas base + pivoteos; cada entrada retenida es (número, segmento, pivoteos hechos, datos)."""
+
+    def __init__(self, cada=PUNTOS_CONTROL, retencion=None):
+        self.cada = cada
+        self.retencion = validar_retencion(retencion)
+        self.segmentos = []
+        self.registradas = 0
+        self.entradas = []   # retenidas por 'primeras' o 'cada' (o todas, sin retención)
+        ultimas = self.retencion.get('ultimas')
+        self.recientes = deque(maxlen=ultimas) if ultimas else None   # anillo de 'ultimas'
+
+    def __len__(self):
+        return len(self._retenidas())
+
+    def anclar(self, tabla):
+        """Empieza un segmento nuevo con una copia de `tabla`."""
+        self.segmentos.append(_Segmento(tabla, self.cada))
+
+    def pivotear(self, fila, col, tabla):
+        """Anota el pivoteo (fila incluye la fila 0) ya aplicado a `tabla`."""
+        self.segmentos[-1].pivotear(fila, col, tabla)
+
+    def registrar(self, datos):
+        """
+        La tabla actual (base del último segmento + pivoteos anotados) con sus datos. Los
+        arreglos NumPy de `datos` (ratios) se guardan tal cual y se convierten al serializar.
+        """
+        numero = self.registradas
+        self.registradas += 1
+        entrada = (numero, len(self.segmentos) - 1, len(self.segmentos[-1].pivotes), datos)
+        primeras, cada = self.retencion.get('primeras'), self.retencion.get('cada')
+        if not self.retencion or (primeras and numero < primeras) or (cada and numero % cada == 0):
+            self.entradas.append(entrada)
+        elif self.recientes is not None:
+            self.recientes.append(entrada)
+
+    def _retenidas(self):
+        if not self.recientes:
+            return self.entradas
+        # El anillo solo tiene las no retenidas por otra regla; de ellas, las de las N últimas
+        desde = self.registradas - self.retencion['ultimas']
+        return sorted(self.entradas + [e for e in self.recientes if e[0] >= desde], key=lambda e: e[0])
+
+    def tabla(self, k):
+        """Reconstruye la tabla de la k-ésima entrada retenida desde el último punto de control."""
+        _, s, hechos, _ = self._retenidas()[k]
+        return self.segmentos[s].tabla_hasta(hechos)
+
+    def serializar(self, convertir):
+        """
+        Lista de dicts para el JSON: los datos de cada entrada retenida con "tabla" =
+        convertir(tabla) y los arreglos NumPy también pasados por `convertir`. Una sola
+        pasada hacia adelante sobre la misma tabla de trabajo.
+        """
+        resultado = []
+        actual, desde, tabla = None, 0, None
+        for _, s, hechos, datos in self._retenidas():
+            if s != actual:
+                actual, desde, tabla = s, 0, None
+            tabla = self.segmentos[s].tabla_hasta(hechos, tabla, desde)
+            desde = hechos
+            fila = {clave: convertir(valor) if isinstance(valor, np.ndarray) else valor
+                    for clave, valor in datos.items()}
+            fila["tabla"] = convertir(tabla)
+            resultado.append(fila)
+        return resultado
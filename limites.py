@@ -0,0 +1,61 @@
+"""
+Límites por variable (l_j ≤ x_j ≤ u_j) sin agregar filas.
+
+Antes un límite como `x1 <= 30` se escribía como restricción: una fila más en la tabla y
+una holgura más. Con `limites=` en MetodoSimplex / MetodoDosFases:
+  - el límite inferior se resuelve con un cambio de variable x_j = l_j + x'_j
+    (b ← b − A·l; las filas que quedan con b < 0 se multiplican por -1 y cambian ≤ ↔ ≥),
+  - el límite superior lo maneja el Simplex Revisado con la prueba de ratio acotada:
+    una variable no básica puede estar en 0 o en u_j, y si la entrante llega a su propio
+    límite antes que cualquier básica, solo "cambia de límite" (sin pivote ni refactorizar).
+
+Formato de `limites`: una lista con un par [inferior, superior] por variable; None en el
+superior significa sin límite (∞) y None en el inferior significa 0.
+"""
+
+import numpy as np
+
+from matriz_dispersa import MatrizDispersa
+
+
+def normalizar_limites(limites, num_vars):
+    """Devuelve (inferiores, superiores) como arrays; lanza ValueError si no son válidos."""
+    if len(limites) != num_vars:
+        raise ValueError(f"Se dieron límites para {len(limites)} variables, pero el problema tiene {num_vars}")
+    inferiores = np.zeros(num_vars)
+    superiores = np.full(num_vars, np.inf)
+    for j, par in enumerate(limites):
+        inferior, superior = (par if par is not None else (None, None))
+        if inferior is not None:
+            inferiores[j] = float(inferior)
+        if superior is not None:
+            superiores[j] = float(superior)
+        if not np.isfinite(inferiores[j]):
+            raise ValueError(f"El límite inferior de x{j+1} debe ser finito")
+        if superiores[j] < inferiores[j]:
+            raise ValueError(f"x{j+1}: el límite superior ({superiores[j]}) es menor que el inferior ({inferiores[j]})")
+    return inferiores, superiores
+
+
+def desplazar_limites_inferiores(A, b, operadores, inferiores):
+    """
+    Cambio de variable x = l + x' (x' ≥ 0): b ← b − A·l. Las filas con b < 0 se multiplican
+    por -1 para que la base de holguras/artificiales siga siendo factible.
+    Devuelve (A, b, operadores, filas invertidas).
+    """
+    if isinstance(A, MatrizDispersa):
+        b = b - A.matvec(inferiores)
+    else:
+        b = b - A @ inferiores
+    invertidas = np.flatnonzero(b < 0)
+    if invertidas.size == 0:
+        return A, b, list(operadores), []
+    signo = np.ones(len(b))
+    signo[invertidas] = -1.0
+    if isinstance(A, MatrizDispersa):
+        A = MatrizDispersa(A.indptr, A.indices, A.datos * signo[A.indices], A.shape)
+    else:
+        A = A * signo[:, None]
+    opuesto = {'<=': '>=', '>=': '<=', '=': '='}
+    operadores = [opuesto[op] if s < 0 else op for op, s in zip(operadores, signo)]
+    return A, b * signo, operadores, [int(i) for i in invertidas]
@@ -0,0 +1,171 @@
+"""
+Matriz dispersa (formato CSC) para las restricciones de los métodos de n variables.
+
+En modelos grandes casi todos los coeficientes de A son cero, y además la forma estándar
+añade una columna de holgura/exceso/artificial por fila con un único 1 o -1. Guardar todo
+eso en una matriz densa desperdicia memoria y operaciones. Aquí se guarda solo lo no nulo
+por columnas (CSC), que es justo lo que necesita el Simplex Revisado:
+  - una columna a_j (columna entrante),
+  - el producto Aᵀ·y (fila de precios),
+  - las columnas de la base (para refactorizar).
+
+Se acepta como entrada:
+  - listas / arrays densos,
+  - matrices de scipy.sparse (cualquier formato con .tocoo()), sin importar scipy aquí,
+  - un dict tipo JSON: {"formato": "coo", "filas", "columnas", "valores", "forma"}
+    o {"formato": "csr"|"csc", "indptr", "indices", "datos", "forma"}.
+"""
+
+import numpy as np
+
+
+# Por debajo de esta densidad (no nulos / total) conviene trabajar en disperso
+UMBRAL_DENSIDAD = 0.1
+# Matrices pequeñas siempre en denso: el formato disperso no compensa
+TAMANO_MINIMO_DISPERSO = 10000
+
+
+class MatrizDispersa:
+    """Matriz m×n en formato CSC: indptr (n+1), indices de fila y valores por columna."""
+
+    def __init__(self, indptr, indices, datos, forma):
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.datos = np.asarray(datos, dtype=float)
+        self.shape = (int(forma[0]), int(forma[1]))
+        # Columna de cada entrada no nula (para Aᵀ·y con bincount)
+        self._columna_de_entrada = np.repeat(np.arange(self.shape[1]), np.diff(self.indptr))
+
+    # ---- Construcción ----
+
+    @classmethod
+    def desde_triplete(cls, filas, columnas, valores, forma):
+        """COO → CSC. Las entradas repetidas (misma fila y columna) se suman."""
+        filas = np.asarray(filas, dtype=np.int64)
+        columnas = np.asarray(columnas, dtype=np.int64)
+        valores = np.asarray(valores, dtype=float)
+        m, n = int(forma[0]), int(forma[1])
+        if filas.size and (filas.min() < 0 or filas.max() >= m or columnas.min() < 0 or columnas.max() >= n):
+            raise ValueError(f"Hay índices fuera de la forma {m}×{n} de la matriz dispersa")
+        # Ordenar por (columna, fila) y sumar duplicados
+        clave = columnas * m + filas
+        orden = np.argsort(clave, kind='stable')
+        clave, valores = clave[orden], valores[orden]
+        unicas, inicio = np.unique(clave, return_index=True)
+        valores = np.add.reduceat(valores, inicio) if valores.size else valores
+        no_nulos = valores != 0
+        unicas, valores = unicas[no_nulos], valores[no_nulos]
+        cols, fils = np.divmod(unicas, m) if m else (unicas, unicas)
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(cols, minlength=n), out=indptr[1:])
+        return cls(indptr, fils, valores, (m, n))
+
+    @classmethod
+    def desde_densa(cls, A):
+        A = np.asarray(A, dtype=float)
+        filas, columnas = np.nonzero(A)
+        return cls.desde_triplete(filas, columnas, A[filas, columnas], A.shape)
+
+    @classmethod
+    def desde_json(cls, d):
+        """Dict del endpoint: formato 'coo' (filas/columnas/valores) o 'csr'/'csc' (indptr/indices/datos)."""
+        formato = d.get('formato', 'coo').lower()
+        forma = d['forma']
+        if formato == 'coo':
+            return cls.desde_triplete(d['filas'], d['columnas'], d['valores'], forma)
+        if formato in ('csr', 'csc'):
+            indptr = np.asarray(d['indptr'], dtype=np.int64)
+            indices = np.asarray(d['indices'], dtype=np.int64)
+            datos = d['datos'] if 'datos' in d else d['data']
+            externos = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+            if formato == 'csr':
+                return cls.desde_triplete(externos, indices, datos, forma)
+            return cls.desde_triplete(indices, externos, datos, forma)
+        raise ValueError(f"Formato de matriz dispersa no soportado: {formato}")
+
+    # ---- Propiedades ----
+
+    @property
+    def nnz(self):
+        return int(self.datos.size)
+
+    @property
+    def densidad(self):
+        total = self.shape[0] * self.shape[1]
+        return self.nnz / total if total else 0.0
+
+    # ---- Operaciones que usa el Simplex ----
+
+    def columna(self, j):
+        """Columna j como vector denso de largo m."""
+        col = np.zeros(self.shape[0])
+        ini, fin = self.indptr[j], self.indptr[j + 1]
+        col[self.indices[ini:fin]] = self.datos[ini:fin]
+        return col
+
+    def columnas(self, cols):
+        """Submatriz densa m×len(cols) (por ejemplo, la matriz base B)."""
+        B = np.zeros((self.shape[0], len(cols)))
+        for k, j in enumerate(cols):
+            ini, fin = self.indptr[j], self.indptr[j + 1]
+            B[self.indices[ini:fin], k] = self.datos[ini:fin]
+        return B
+
+    def matvec(self, x):
+        """A·x."""
+        x = np.asarray(x, dtype=float)
+        return np.bincount(self.indices, weights=self.datos * x[self._columna_de_entrada],
+                           minlength=self.shape[0])
+
+    def rmatvec(self, y):
+        """Aᵀ·y (fila de precios del Simplex Revisado)."""
+        y = np.asarray(y, dtype=float)
+        return np.bincount(self._columna_de_entrada, weights=self.datos * y[self.indices],
+                           minlength=self.shape[1])
+
+    def agregar_columnas(self, filas, valores):
+        """
+        Devuelve una nueva matriz [A | E] donde E tiene una columna por (fila, valor):
+        justo la forma de las holguras, excesos y artificiales de la forma estándar.
+        """
+        filas = np.asarray(filas, dtype=np.int64)
+        valores = np.asarray(valores, dtype=float)
+        k = filas.size
+        indptr = np.concatenate([self.indptr, self.indptr[-1] + np.arange(1, k + 1)])
+        return MatrizDispersa(indptr, np.concatenate([self.indices, filas]),
+                              np.concatenate([self.datos, valores]), (self.shape[0], self.shape[1] + k))
+
+    def toarray(self):
+        A = np.zeros(self.shape)
+        A[self.indices, self._columna_de_entrada] = self.datos
+        return A
+
+
+def es_dispersa_externa(A):
+    """¿Es una matriz de scipy.sparse (o algo con la misma interfaz)? No importa scipy."""
+    return hasattr(A, 'tocoo') and hasattr(A, 'nnz')
+
+
+def preparar_matriz(A):
+    """
+    Convierte la entrada de A al formato con el que conviene trabajar:
+    MatrizDispersa si es grande y con pocos no nulos, ndarray denso en otro caso.
+    Devuelve (matriz, es_dispersa).
+    """
+    if isinstance(A, dict):
+        A = MatrizDispersa.desde_json(A)
+    elif es_dispersa_externa(A):
+        coo = A.tocoo()
+        A = MatrizDispersa.desde_triplete(coo.row, coo.col, coo.data, coo.shape)
+
+    if isinstance(A, MatrizDispersa):
+        m, n = A.shape
+        if m * n >= TAMANO_MINIMO_DISPERSO and A.densidad < UMBRAL_DENSIDAD:
+            return A, True
+        return A.toarray(), False
+
+    A = np.array(A, dtype=float)
+    if A.ndim == 2 and A.size >= TAMANO_MINIMO_DISPERSO:
+        if np.count_nonzero(A) / A.size < UMBRAL_DENSIDAD:
+            return MatrizDispersa.desde_densa(A), True
+    return A, False
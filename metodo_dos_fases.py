@@ -16,21 +16,90 @@ PASOS DEL ALGORITMO (resumen):
 
 import numpy as np
 
+from control_resolucion import ESTADOS_PARADA, ControlResolucion, resultado_interrumpido
+from degeneracion import ControlDegeneracion
+from detalle import validar_detalle
+from eventos_pasos import validar_formato_pasos, completar_pasos
+from escalado import escalar_metodo
+from limites import desplazar_limites_inferiores, normalizar_limites
+from matriz_dispersa import MatrizDispersa, preparar_matriz
+from nucleo_pivoteo import NucleoPivoteo
+from historial_tablas import HistorialTablas
+from presolve import presolve_metodo
+from reglas_precio import ContextoTabla, crear_regla_precio, limite_iteraciones
+from simplex_revisado import MODOS, SimplexRevisado, arranque_en_caliente
+
 
 class MetodoDosFases:
-    def __init__(self, c, A, b, operadores, objetivo='max'):
-        """Mismo formato que Simplex: c, A, b, operadores, objetivo. Guardamos todo para las dos fases."""
+    def __init__(self, c, A, b, operadores, objetivo='max', modo=None, precio='dantzig',
+                 degeneracion='lexicografico', umbral_bland=10, base_inicial=None, limites=None,
+                 presolve=True, escalado=True, detalle='full', retencion=None,
+                 formato_pasos='texto', max_iteraciones=None, limite_tiempo=None, cancelacion=None):
+        """
+        Mismo formato que Simplex: c, A, b, operadores, objetivo. Guardamos todo para las dos fases.
+        A puede ser densa, scipy.sparse o un triplete COO/CSR/CSC; con A dispersa las dos fases
+        se hacen con el Simplex Revisado (modo='revisado') y los datos nunca se densifican.
+        modo: 'tabla' o 'revisado'; si no se indica, según la densidad de A.
+        precio: regla de la variable entrante en ambas fases (ver reglas_precio).
+        degeneracion / umbral_bland: manejo de pivotes degenerados en ambas fases (ver degeneracion).
+        base_inicial: base conocida sin artificiales ('variables_basicas' de un resultado anterior
+        o índices de columna). Si es primal o dual factible se salta la Fase 1 y se resuelve con
+        el Simplex Revisado (primal o dual); si no sirve, se hacen las dos fases normalmente.
+        limites: [inferior, superior] por variable (None = 0 / sin límite), sin agregar filas
+        (ver limites). Las dos fases se hacen entonces con el Simplex Revisado.
+        presolve: quitar filas vacías, duplicadas y redundantes, variables fijas y columnas
+        dominadas antes de resolver; la solución se devuelve en las variables originales
+        y el resultado trae "presolve" con lo que se quitó (ver presolve).
+        escalado: escalar filas y columnas de A (potencias de 2) si sus coeficientes tienen
+        un rango grande; la solución se desescala y el resultado trae "escalado" con el rango
+        de coeficientes antes y después (ver escalado).
+        detalle: 'full' (pasos de cada iteración y tablas), 'summary' (planteo, fases y
+        resultado) o 'none' (sin pasos ni tablas). Ver detalle.
+        retencion: qué tablas devolver con detalle='full': todas (None) o un dict con
+        'primeras' (N), 'ultimas' (N) y/o 'cada' (k). Ver historial_tablas.
+        formato_pasos: 'texto' (frases) o 'eventos' (código + números; los renderiza la
+        interfaz, respuesta mucho más chica). Ver eventos_pasos.
+        max_iteraciones (pivoteos de las dos fases) / limite_tiempo (segundos) / cancelacion
+        (TokenCancelacion): cortes revisados antes de cada pivoteo; se devuelve la base actual
+        con status 'iteration_limit', 'time_limit' o 'cancelled'. Ver control_resolucion.
+        """
+        if modo is not None and modo not in MODOS:
+            raise ValueError(f"modo debe ser uno de {', '.join(MODOS)} (se recibió {modo!r})")
         self.c = np.array(c, dtype=float)
-        self.A = np.array(A, dtype=float)
+        self.A, self.es_dispersa = preparar_matriz(A)
         self.b = np.array(b, dtype=float)
         self.operadores = operadores
         self.objetivo = objetivo
+        if modo is None:
+            modo = 'revisado' if self.es_dispersa else 'tabla'
+        if modo == 'tabla' and self.es_dispersa:
+            self.A, self.es_dispersa = self.A.toarray(), False
+        self.modo = modo
+        self.regla_precio = crear_regla_precio(precio)
+        self.degeneracion = degeneracion
+        self.umbral_bland = umbral_bland
+        self.base_inicial = base_inicial
+        self.base_en_superior = []   # no básicas de base_inicial en su límite superior (las marca el presolve)
+        self.presolve = presolve
+        self.escalado = escalado
+        self.inferiores = self.superiores = None
+        if limites is not None:
+            self.inferiores, self.superiores = normalizar_limites(limites, len(self.c))
+        self.pivotes_degenerados = 0   # suma de las dos fases
+        self.cambios_a_bland = 0
+        self.detalle = validar_detalle(detalle)
+        self.formato_pasos = validar_formato_pasos(formato_pasos)
+        self.control = ControlResolucion(max_iteraciones, limite_tiempo, cancelacion)
+        self.parada = None   # estado del corte si alguna fase se interrumpió
+        self.con_pasos = self.detalle != 'none'     # ¿se guarda algún paso?
+        self.paso_a_paso = self.detalle == 'full'   # ¿detalle de cada iteración y tablas?
         self.pasos = []
-        self.tablas = []   # tablas de Fase 1 y Fase 2 para mostrarlas
+        self.historial = HistorialTablas(retencion=retencion)   # tablas de Fase 1 y Fase 2 (por repetición de pivoteos)
 
     def registrar_paso(self, mensaje):
-        """Añado una línea al log."""
-        self.pasos.append(mensaje)
+        """Añado una línea al log (nada con detalle='none')."""
+        if self.con_pasos:
+            self.pasos.append(mensaje)
 
     def _convertir_a_nativo(self, valor):
         """Convierto NumPy a tipos nativos para poder serializar a JSON (igual que en Simplex)."""
@@ -56,47 +125,47 @@ class MetodoDosFases:
     def registrar_tabla(self, tabla, iteracion, variables_basicas=None, explicacion="",
                        nombres_columnas=None, col_entrante=None, fila_saliente=None,
                        elemento_pivote=None, ratios=None, fase=1):
-        """Guardo la tabla de esta iteración indicando si es Fase 1 o Fase 2."""
-        tabla_lista = tabla.tolist()
-        tabla_nativa = self._convertir_a_nativo(tabla_lista)
-        
-        ratios_nativo = None
-        if ratios is not None:
-            ratios_nativo = []
-            for r in ratios:
-                if r == np.inf or r == float('inf') or (isinstance(r, (float, np.floating)) and np.isinf(r) and r > 0):
-                    ratios_nativo.append(None)
-                elif r == -np.inf or r == float('-inf') or (isinstance(r, (float, np.floating)) and np.isinf(r) and r < 0):
-                    ratios_nativo.append(None)
-                else:
-                    ratios_nativo.append(self._convertir_a_nativo(r))
+        """
+        Registro la tabla de esta iteración indicando si es Fase 1 o Fase 2. Como en Simplex, no
+        se copia: con col_entrante solo se anota el pivoteo; sin él, `tabla` es una tabla base.
+        """
+        if col_entrante is None:
+            self.historial.anclar(tabla)
+        else:
+            self.historial.pivotear(fila_saliente + 1, col_entrante, tabla)
         
-        self.tablas.append({
+        self.historial.registrar({
             "fase": int(fase),
             "iteracion": int(iteracion),
-            "tabla": tabla_nativa,
+            "tabla": None,  # se reconstruye al serializar
             "variables_basicas": variables_basicas if variables_basicas else [],
             "explicacion": explicacion,
             "nombres_columnas": nombres_columnas if nombres_columnas else [],
             "col_entrante": int(col_entrante) if col_entrante is not None else None,
             "fila_saliente": int(fila_saliente) if fila_saliente is not None else None,
             "elemento_pivote": self._convertir_a_nativo(elemento_pivote) if elemento_pivote is not None else None,
-            "ratios": ratios_nativo if ratios_nativo is not None else []
+            # Copia del buffer del núcleo; pasa a lista (∞ → None) al serializar
+            "ratios": np.array(ratios, dtype=float) if ratios is not None else []
         })
     
+    def _tablas_serializadas(self):
+        """Tablas de ambas fases, reconstruidas y pasadas a tipos nativos para el JSON."""
+        return self.historial.serializar(lambda arreglo: self._convertir_a_nativo(arreglo.tolist()))
+
     def convertir_forma_estandar(self):
         """
         Forma estándar como en Simplex: <= holgura, >= exceso+artificial, = solo artificial.
         No se usa Big M en Z; Fase 1 minimiza W = suma de artificiales.
         Se guardan índices de columnas artificiales para armar la fila W.
         """
-        self.registrar_paso("CONVERSIÓN A FORMA ESTÁNDAR:")
-        objetivo_str = f"{self.c[0]}x₁"
-        for i in range(1, len(self.c)):
-            signo = '-' if self.c[i] < 0 else '+'
-            abs_val = abs(self.c[i])
-            objetivo_str += f" {signo} {abs_val}x₁₊₁".replace("₁₊₁", f"{i+1}")
-        self.registrar_paso(f"Problema original: {self.objetivo.upper()} Z = {objetivo_str}")
+        if self.con_pasos:
+            self.registrar_paso("CONVERSIÓN A FORMA ESTÁNDAR:")
+            objetivo_str = f"{self.c[0]}x₁"
+            for i in range(1, len(self.c)):
+                signo = '-' if self.c[i] < 0 else '+'
+                abs_val = abs(self.c[i])
+                objetivo_str += f" {signo} {abs_val}x₁₊₁".replace("₁₊₁", f"{i+1}")
+            self.registrar_paso(f"Problema original: {self.objetivo.upper()} Z = {objetivo_str}")
         
         num_vars = len(self.c)
         num_rest = len(self.b)
@@ -105,11 +174,20 @@ class MetodoDosFases:
         num_exceso = sum(1 for op in self.operadores if op == '>=')
         num_artificiales = sum(1 for op in self.operadores if op in ['>=', '='])
 
-        self.registrar_paso(f"Variables de holgura necesarias: {num_holgura}")
-        self.registrar_paso(f"Variables de exceso necesarias: {num_exceso}")
-        self.registrar_paso(f"Variables artificiales necesarias: {num_artificiales}")
-        
-        A_estandar = np.zeros((num_rest, num_vars + num_holgura + num_exceso + num_artificiales))
+        if self.con_pasos:
+            self.registrar_paso(f"Variables de holgura necesarias: {num_holgura}")
+            self.registrar_paso(f"Variables de exceso necesarias: {num_exceso}")
+            self.registrar_paso(f"Variables artificiales necesarias: {num_artificiales}")
+        
+        ancho = self.A.shape[1] if len(self.A.shape) == 2 else 0
+        if num_rest and ancho != num_vars:
+            raise ValueError(
+                f"La restricción 1 tiene {ancho} variables, "
+                f"pero la función objetivo tiene {num_vars} variables."
+            )
+        # Columnas auxiliares como (fila, valor); A_estandar se arma al final, densa o dispersa
+        filas_aux = []
+        valores_aux = []
         col_actual = num_vars
         idx_holgura = 0
         idx_exceso = 0
@@ -117,34 +195,42 @@ class MetodoDosFases:
         indices_artificiales = []   # columnas de artificiales (para fila W en Fase 1)
 
         for i in range(num_rest):
-            if len(self.A[i]) != num_vars:
-                raise ValueError(
-                    f"La restricción {i+1} tiene {len(self.A[i])} variables, "
-                    f"pero la función objetivo tiene {num_vars} variables."
-                )
-            A_estandar[i, :num_vars] = self.A[i]
-            
             if self.operadores[i] == '<=':
-                A_estandar[i, col_actual] = 1
-                self.registrar_paso(f"R{i+1}: Agregada variable de holgura s{idx_holgura+1}")
+                filas_aux.append(i)
+                valores_aux.append(1)
+                if self.con_pasos:
+                    self.registrar_paso(f"R{i+1}: Agregada variable de holgura s{idx_holgura+1}")
                 col_actual += 1
                 idx_holgura += 1
             elif self.operadores[i] == '>=':
-                A_estandar[i, col_actual] = -1
-                self.registrar_paso(f"R{i+1}: Agregada variable de exceso e{idx_exceso+1}")
+                filas_aux.append(i)
+                valores_aux.append(-1)
+                if self.con_pasos:
+                    self.registrar_paso(f"R{i+1}: Agregada variable de exceso e{idx_exceso+1}")
                 col_actual += 1
                 idx_exceso += 1
-                A_estandar[i, col_actual] = 1
-                self.registrar_paso(f"R{i+1}: Agregada variable artificial a{idx_artificial+1}")
+                filas_aux.append(i)
+                valores_aux.append(1)
+                if self.con_pasos:
+                    self.registrar_paso(f"R{i+1}: Agregada variable artificial a{idx_artificial+1}")
                 indices_artificiales.append(col_actual)
                 col_actual += 1
                 idx_artificial += 1
             elif self.operadores[i] == '=':
-                A_estandar[i, col_actual] = 1
-                self.registrar_paso(f"R{i+1}: Agregada variable artificial a{idx_artificial+1}")
+                filas_aux.append(i)
+                valores_aux.append(1)
+                if self.con_pasos:
+                    self.registrar_paso(f"R{i+1}: Agregada variable artificial a{idx_artificial+1}")
                 indices_artificiales.append(col_actual)
                 col_actual += 1
                 idx_artificial += 1
+
+        if isinstance(self.A, MatrizDispersa):
+            A_estandar = self.A.agregar_columnas(filas_aux, valores_aux)
+        else:
+            A_estandar = np.zeros((num_rest, num_vars + num_holgura + num_exceso + num_artificiales))
+            A_estandar[:, :num_vars] = self.A.reshape(num_rest, num_vars)
+            A_estandar[filas_aux, num_vars + np.arange(len(filas_aux))] = valores_aux
         
         # c extendido: coef. originales para x's, 0 para holgura/exceso/artificiales (en Fase 2 usamos esto para Z)
         c_estandar = np.zeros(num_vars + num_holgura + num_exceso + num_artificiales)
@@ -223,73 +309,95 @@ class MetodoDosFases:
                 nombres_columnas.append(f"a{idx_artificial}")
                 idx_artificial += 1
         
-        self.registrar_paso("\nTABLA INICIAL DE FASE 1:")
-        self.registrar_tabla(tabla.copy(), 0, variables_basicas.copy(), "Tabla inicial Fase 1 (minimizar W)", 
-                           nombres_columnas=nombres_columnas, fase=1)
-        
-        # Simplex minimizando W: entrante = mayor coef. positivo en W; saliente = ratio mínimo
+        if self.paso_a_paso:
+            self.registrar_paso(['col', nombres_columnas])   # los eventos nombran columnas por índice
+            self.registrar_paso("\nTABLA INICIAL DE FASE 1:")
+            self.registrar_tabla(tabla, 0, variables_basicas.copy(), "Tabla inicial Fase 1 (minimizar W)", 
+                               nombres_columnas=nombres_columnas, fase=1)
+        
+        # Simplex minimizando W: entrante = coef. positivo en W según la regla de precio; saliente = ratio mínimo
+        nucleo = NucleoPivoteo(tabla)
+        regla = self.regla_precio
+        regla.iniciar(num_cols_totales, indices_basicas)
+        contexto = ContextoTabla(tabla, num_cols_totales)
+        control = ControlDegeneracion(self.degeneracion, self.umbral_bland)
+        base_inicial = list(indices_basicas)
+        control.perturbar_tabla(tabla, base_inicial)
+        if self.paso_a_paso and control.modo == 'perturbacion':
+            self.historial.anclar(tabla)   # el RHS perturbado no sale de un pivoteo
         iteracion = 0
-        max_iteraciones = 100
+        max_iteraciones = limite_iteraciones(num_rest, num_cols_totales)
+        estado = 'iteration_limit'   # si el bucle termina sin óptimo ni corte del control
 
         while iteracion < max_iteraciones:
             iteracion += 1
-            self.registrar_paso(f"\n--- FASE 1 - ITERACIÓN {iteracion} ---")
+            if self.paso_a_paso:
+                self.registrar_paso(['itf', 1, iteracion])
 
             fila_w = tabla[0, :num_cols_totales]
-            indices_positivos = np.where(fila_w > 1e-9)[0]
-            if len(indices_positivos) == 0:
+            col_entrante = control.elegir_entrante(-fila_w, regla)
+            if col_entrante is None:
                 self.registrar_paso("✓ Condición de optimalidad alcanzada en Fase 1")
+                estado = 'optimal'
+                break
+            parada = self.control.parar()
+            if parada is not None:
+                estado = parada
+                iteracion -= 1   # como en Fase 2: el corte no cuenta como iteración
                 break
-            
-            col_entrante = int(indices_positivos[np.argmax(fila_w[indices_positivos])])
             
             # Nombre de variable entrante (usar nombres_columnas ya calculado)
             var_entrante_nombre = nombres_columnas[col_entrante]
 
-            self.registrar_paso(f"📌 VARIABLE ENTRANTE: {var_entrante_nombre}")
+            if self.paso_a_paso:
+                self.registrar_paso(['e', col_entrante])
             
-            # Calcular ratios
-            ratios = []
-            for i in range(num_rest):
-                fila_rest = i + 1
-                if tabla[fila_rest, col_entrante] > 1e-9:
-                    ratio = float(tabla[fila_rest, -1] / tabla[fila_rest, col_entrante])
-                    ratios.append(ratio)
-                else:
-                    ratios.append(np.inf)
+            # Prueba de ratio vectorizada (np.inf donde el coeficiente es ≤ 0); empates según el control
+            fila_saliente = control.elegir_saliente(
+                nucleo.ratios, nucleo.prueba_ratio(tabla, col_entrante), tabla[1:, col_entrante],
+                lambda k: tabla[1:, base_inicial[k]], indices_basicas)
+            ratios = nucleo.ratios
             
-            if all(np.isinf(r) for r in ratios):
+            if fila_saliente < 0:
                 self.registrar_paso("\n⚠ Problema no acotado en Fase 1")
                 return False, tabla, variables_basicas, indices_basicas
 
-            fila_saliente = int(np.argmin(ratios))
             var_saliente_actual = variables_basicas[fila_saliente]
-            self.registrar_paso(f"📌 VARIABLE SALIENTE: {var_saliente_actual}")
+            if self.paso_a_paso:
+                self.registrar_paso(['s', indices_basicas[fila_saliente]])
 
             fila_pivote = fila_saliente + 1
-            elemento_pivote = float(tabla[fila_pivote, col_entrante])
+            if control.registrar_pivote(ratios[fila_saliente]) and self.paso_a_paso:
+                self.registrar_paso("⚠ Pivote degenerado (ratio 0)" +
+                                    (" · regla de Bland activa" if control.en_bland else ""))
+            if regla.usa_pesos:
+                regla.actualizar(col_entrante, fila_saliente, indices_basicas, contexto)
             
             variables_basicas[fila_saliente] = var_entrante_nombre
             indices_basicas[fila_saliente] = col_entrante
             
-            tabla[fila_pivote, :] /= elemento_pivote
-            for i in range(num_rest + 1):
-                if i != fila_pivote:
-                    factor = tabla[i, col_entrante]
-                    tabla[i, :] -= factor * tabla[fila_pivote, :]
+            elemento_pivote = nucleo.pivotear(tabla, fila_pivote, col_entrante)
             
-            w_val = tabla[0, -1]
-            self.registrar_paso(f"Nuevo valor de W: {w_val:.6f}")
+            if self.paso_a_paso:
+                self.registrar_paso(['w', float(tabla[0, -1])])
             
-            self.registrar_tabla(tabla.copy(), iteracion, variables_basicas.copy(), 
-                               f"Fase 1 - Iteración {iteracion}",
-                               nombres_columnas=nombres_columnas,
-                               col_entrante=col_entrante,
-                               fila_saliente=fila_saliente,
-                               elemento_pivote=elemento_pivote,
-                               ratios=ratios,
-                               fase=1)
-        
+                self.registrar_tabla(tabla, iteracion, variables_basicas.copy(), 
+                                   f"Fase 1 - Iteración {iteracion}",
+                                   nombres_columnas=nombres_columnas,
+                                   col_entrante=col_entrante,
+                                   fila_saliente=fila_saliente,
+                                   elemento_pivote=elemento_pivote,
+                                   ratios=ratios,
+                                   fase=1)
+        
+        control.restaurar_tabla(tabla, base_inicial)
+        self.pivotes_degenerados += control.pivotes_degenerados
+        self.cambios_a_bland += control.cambios_a_bland
+        if estado != 'optimal':
+            # Corte en Fase 1: quien llama devuelve la base actual (sin Fase 2)
+            self.parada = estado
+            self.registrar_paso(self.control.mensaje(estado))
+            return False, tabla, variables_basicas, indices_basicas
         w_final = tabla[0, -1]
         self.registrar_paso(f"\n=== FIN DE FASE 1 ===")
         self.registrar_paso(f"Valor final de W: {w_final:.6f}")
@@ -307,8 +415,8 @@ class MetodoDosFases:
              num_vars, num_holgura, num_exceso, num_artificiales, indices_artificiales):
         """
         Fase 2: partir de tabla final de Fase 1; eliminar columnas de variables artificiales
-        (y filas redundantes 0=0 si alguna artificial sigue en la base); reemplazar fila W por Z.
-        Simplex normal hasta óptimo.
+        (una artificial que sigue en la base en cero sale antes con un pivote degenerado, o su
+        fila se elimina si es 0=0); reemplazar fila W por Z. Simplex normal hasta óptimo.
         """
         self.registrar_paso("\n" + "="*60)
         self.registrar_paso("FASE 2: OPTIMIZAR FUNCIÓN OBJETIVO ORIGINAL")
@@ -316,6 +424,21 @@ class MetodoDosFases:
         
         num_rest = len(self.b)
         num_cols_totales = c_estandar.shape[0]
+
+        # Nombres de columnas (solo las que quedan: x, s, e; sin artificiales en Fase 2)
+        nombres_columnas = []
+        for i in range(num_vars):
+            nombres_columnas.append(f"x{i+1}")
+        idx_holgura = 1
+        idx_exceso = 1
+        for i in range(len(self.b)):
+            if self.operadores[i] == '<=':
+                nombres_columnas.append(f"s{idx_holgura}")
+                idx_holgura += 1
+            elif self.operadores[i] == '>=':
+                nombres_columnas.append(f"e{idx_exceso}")
+                idx_exceso += 1
+            # No añadir nombres de artificiales; en Fase 2 ya no existen esas columnas
         
         if tabla_fase1 is None:
             # Sin artificiales: tabla inicial solo con holguras y fila Z
@@ -343,6 +466,23 @@ class MetodoDosFases:
         else:
             # Eliminar columnas de variables artificiales (y filas donde la básica es artificial)
             keep_cols = [j for j in range(num_cols_totales) if j not in indices_artificiales]
+            # Una artificial básica en cero cuya fila tiene algún coeficiente fuera de las
+            # artificiales no es una fila 0=0: sale con un pivote degenerado (RHS 0) por esa columna
+            tabla_fase1 = tabla_fase1.copy()
+            variables_basicas, indices_basicas = list(variables_basicas), list(indices_basicas)
+            nombre_columna = dict(zip(keep_cols, nombres_columnas))
+            for i in range(num_rest):
+                if not variables_basicas[i].startswith('a'):
+                    continue
+                coeficientes = np.abs(tabla_fase1[i + 1, keep_cols])
+                if coeficientes.max(initial=0.0) <= 1e-9:
+                    continue
+                col = keep_cols[int(np.argmax(coeficientes))]
+                NucleoPivoteo(tabla_fase1).pivotear(tabla_fase1, i + 1, col)
+                tabla_fase1[i + 1, -1] += 0.0   # 0 / negativo da -0.0
+                self.registrar_paso(f"{variables_basicas[i]} sigue en la base con valor 0: sale y entra "
+                                    f"{nombre_columna[col]} (pivote degenerado).")
+                variables_basicas[i], indices_basicas[i] = nombre_columna[col], col
             # Filas de restricción a mantener: las que tienen variable básica no artificial
             keep_row_indices = [i for i in range(num_rest) if not variables_basicas[i].startswith('a')]
             num_rest = len(keep_row_indices)
@@ -374,66 +514,59 @@ class MetodoDosFases:
                 if abs(tabla[0, idx_basica]) > 1e-9:
                     factor = tabla[0, idx_basica]
                     tabla[0, :] -= factor * tabla[i + 1, :]
-        
-        # Nombres de columnas (solo las que quedan: x, s, e; sin artificiales en Fase 2)
-        nombres_columnas = []
-        for i in range(num_vars):
-            nombres_columnas.append(f"x{i+1}")
-        idx_holgura = 1
-        idx_exceso = 1
-        for i in range(len(self.b)):
-            if self.operadores[i] == '<=':
-                nombres_columnas.append(f"s{idx_holgura}")
-                idx_holgura += 1
-            elif self.operadores[i] == '>=':
-                nombres_columnas.append(f"e{idx_exceso}")
-                idx_exceso += 1
-            # No añadir nombres de artificiales; en Fase 2 ya no existen esas columnas
 
-        self.registrar_paso("\nTABLA INICIAL DE FASE 2:")
-        self.registrar_tabla(tabla.copy(), 0, variables_basicas.copy(), "Tabla inicial Fase 2 (optimizar Z)",
-                           nombres_columnas=nombres_columnas, fase=2)
+        if self.paso_a_paso:
+            self.registrar_paso(['col', nombres_columnas])
+            self.registrar_paso("\nTABLA INICIAL DE FASE 2:")
+            self.registrar_tabla(tabla, 0, variables_basicas.copy(), "Tabla inicial Fase 2 (optimizar Z)",
+                               nombres_columnas=nombres_columnas, fase=2)
 
+        nucleo = NucleoPivoteo(tabla)
+        regla = self.regla_precio
+        regla.iniciar(num_cols_totales, indices_basicas)
+        contexto = ContextoTabla(tabla, num_cols_totales)
+        control = ControlDegeneracion(self.degeneracion, self.umbral_bland)
+        base_inicial = list(indices_basicas)
+        control.perturbar_tabla(tabla, base_inicial)
+        if self.paso_a_paso and control.modo == 'perturbacion':
+            self.historial.anclar(tabla)   # el RHS perturbado no sale de un pivoteo
         iteracion = 0
-        max_iteraciones = 100
+        max_iteraciones = limite_iteraciones(num_rest, num_cols_totales)
+        estado = 'iteration_limit'   # si el bucle termina sin óptimo ni corte del control
         
         while iteracion < max_iteraciones:
             iteracion += 1
-            self.registrar_paso(f"\n--- FASE 2 - ITERACIÓN {iteracion} ---")
+            if self.paso_a_paso:
+                self.registrar_paso(['itf', 2, iteracion])
             
             fila_z = tabla[0, :num_cols_totales]
-            
-            if self.objetivo == 'max':
-                indices_negativos = np.where(fila_z < -1e-9)[0]
-                if len(indices_negativos) == 0:
-                    self.registrar_paso("✓ Condición de optimalidad alcanzada")
-                    break
-                col_entrante = int(indices_negativos[np.argmin(fila_z[indices_negativos])])
-            else:  # min
-                indices_positivos = np.where(fila_z > 1e-9)[0]
-                if len(indices_positivos) == 0:
-                    self.registrar_paso("✓ Condición de optimalidad alcanzada")
-                    break
-                col_entrante = int(indices_positivos[np.argmax(fila_z[indices_positivos])])
+            # max → entra un coef. negativo de Z; min → uno positivo (se cambia el signo para la regla)
+            col_entrante = control.elegir_entrante(fila_z if self.objetivo == 'max' else -fila_z, regla)
+            if col_entrante is None:
+                self.registrar_paso("✓ Condición de optimalidad alcanzada")
+                estado = 'optimal'
+                break
+            parada = self.control.parar()
+            if parada is not None:
+                estado = parada
+                iteracion -= 1
+                break
             
             # Nombre variable entrante (usar nombres_columnas ya calculado)
             var_entrante_nombre = nombres_columnas[col_entrante]
             
-            self.registrar_paso(f"📌 VARIABLE ENTRANTE: {var_entrante_nombre}")
+            if self.paso_a_paso:
+                self.registrar_paso(['e', col_entrante])
             
-            # Calcular ratios
-            ratios = []
-            for i in range(num_rest):
-                fila_rest = i + 1
-                if tabla[fila_rest, col_entrante] > 1e-9:
-                    ratio = float(tabla[fila_rest, -1] / tabla[fila_rest, col_entrante])
-                    ratios.append(ratio)
-                else:
-                    ratios.append(np.inf)
+            # Prueba de ratio vectorizada (np.inf donde el coeficiente es ≤ 0); empates según el control
+            fila_saliente = control.elegir_saliente(
+                nucleo.ratios, nucleo.prueba_ratio(tabla, col_entrante), tabla[1:, col_entrante],
+                lambda k: tabla[1:, base_inicial[k]], indices_basicas)
+            ratios = nucleo.ratios
             
-            if all(np.isinf(r) for r in ratios):
+            if fila_saliente < 0:
                 self.registrar_paso("\n⚠ Problema no acotado")
-                tablas_serializadas = [self._convertir_a_nativo(t) for t in self.tablas]
+                tablas_serializadas = self._tablas_serializadas()
                 return {
                     "status": "unbounded",
                     "tipo_solucion": "Problema No Acotado",
@@ -442,49 +575,60 @@ class MetodoDosFases:
                     "tablas": tablas_serializadas
                 }
             
-            fila_saliente = int(np.argmin(ratios))
             var_saliente_actual = variables_basicas[fila_saliente]
             
-            self.registrar_paso(f"📌 VARIABLE SALIENTE: {var_saliente_actual}")
+            if self.paso_a_paso:
+                self.registrar_paso(['s', indices_basicas[fila_saliente]])
             
-            # Pivoteo
+            # Pivoteo (normalizar fila pivote + actualización de rango 1)
             fila_pivote = fila_saliente + 1
-            elemento_pivote = float(tabla[fila_pivote, col_entrante])
+            if control.registrar_pivote(ratios[fila_saliente]) and self.paso_a_paso:
+                self.registrar_paso("⚠ Pivote degenerado (ratio 0)" +
+                                    (" · regla de Bland activa" if control.en_bland else ""))
+            if regla.usa_pesos:
+                regla.actualizar(col_entrante, fila_saliente, indices_basicas, contexto)
             
             variables_basicas[fila_saliente] = var_entrante_nombre
             indices_basicas[fila_saliente] = col_entrante
             
-            tabla[fila_pivote, :] /= elemento_pivote
-            
-            for i in range(num_rest + 1):
-                if i != fila_pivote:
-                    factor = tabla[i, col_entrante]
-                    tabla[i, :] -= factor * tabla[fila_pivote, :]
+            elemento_pivote = nucleo.pivotear(tabla, fila_pivote, col_entrante)
             
-            z_val = tabla[0, -1]
-            self.registrar_paso(f"Nuevo valor de Z: {z_val:.4f}")
+            if self.paso_a_paso:
+                self.registrar_paso(['z', float(tabla[0, -1])])
             
-            self.registrar_tabla(tabla.copy(), iteracion, variables_basicas.copy(), 
-                               f"Fase 2 - Iteración {iteracion}",
-                               nombres_columnas=nombres_columnas,
-                               col_entrante=col_entrante,
-                               fila_saliente=fila_saliente,
-                               elemento_pivote=elemento_pivote,
-                               ratios=ratios,
-                               fase=2)
-        
+                self.registrar_tabla(tabla, iteracion, variables_basicas.copy(), 
+                                   f"Fase 2 - Iteración {iteracion}",
+                                   nombres_columnas=nombres_columnas,
+                                   col_entrante=col_entrante,
+                                   fila_saliente=fila_saliente,
+                                   elemento_pivote=elemento_pivote,
+                                   ratios=ratios,
+                                   fase=2)
+        
+        control.restaurar_tabla(tabla, base_inicial)
+        self.pivotes_degenerados += control.pivotes_degenerados
+        self.cambios_a_bland += control.cambios_a_bland
+
         # Leer solución: x's básicas = RHS de su fila; resto 0
         solucion = np.zeros(num_vars)
         for i, idx_basica in enumerate(indices_basicas):
             if idx_basica < num_vars:
                 fila_rest = i + 1
                 solucion[idx_basica] = tabla[fila_rest, -1]
+        if estado != 'optimal':
+            # Corte en Fase 2: la base ya es factible y es la mejor encontrada
+            self.registrar_paso(self.control.mensaje(estado))
+            return resultado_interrumpido(
+                estado, self.control.iteraciones, True, self.pasos, self._tablas_serializadas(),
+                solucion=[float(v) for v in solucion], z_actual=float(self.c @ solucion),
+                variables_basicas=variables_basicas)
         z_optimo = float(tabla[0, -1])
         
-        self.registrar_paso(f"\n=== SOLUCIÓN ÓPTIMA ===")
-        self.registrar_paso(f"Valor óptimo de Z: {z_optimo:.4f}")
-        for i in range(num_vars):
-            self.registrar_paso(f"x{i+1} = {solucion[i]:.4f}")
+        if self.con_pasos:
+            self.registrar_paso(f"\n=== SOLUCIÓN ÓPTIMA ===")
+            self.registrar_paso(f"Valor óptimo de Z: {z_optimo:.4f}")
+            for i in range(num_vars):
+                self.registrar_paso(f"x{i+1} = {solucion[i]:.4f}")
         
         # Analizar tipo de solución
         fila_z_final = tabla[0, :num_cols_totales]
@@ -536,7 +680,7 @@ class MetodoDosFases:
             explicacion = "Se encontró una solución óptima única."
         
         solucion_lista = [float(solucion[i]) for i in range(num_vars)]
-        tablas_serializadas = [self._convertir_a_nativo(t) for t in self.tablas]
+        tablas_serializadas = self._tablas_serializadas()
         
         return {
             "status": "optimal",
@@ -545,42 +689,286 @@ class MetodoDosFases:
             "z_optimo": z_optimo,
             "solucion": solucion_lista,
             "iteraciones": iteracion,
+            "pivotes_degenerados": int(self.pivotes_degenerados),
+            "cambios_a_bland": int(self.cambios_a_bland),
             "pasos": self.pasos,
-            "tablas": tablas_serializadas
+            "tablas": tablas_serializadas,
+            "variables_basicas": variables_basicas
         }
     
+    def _aplicar_limites(self):
+        """Registra los límites y hace el cambio x = l + x' (los superiores los maneja el revisado)."""
+        if self.con_pasos:
+            self.registrar_paso("LÍMITES DE LAS VARIABLES (sin filas adicionales):")
+            for j, (l, u) in enumerate(zip(self.inferiores, self.superiores)):
+                if l != 0 or np.isfinite(u):
+                    self.registrar_paso(f"  {l:g} ≤ x{j+1} ≤ {u:g}".replace("inf", "∞"))
+        if np.any(self.inferiores != 0):
+            self.A, self.b, self.operadores, invertidas = desplazar_limites_inferiores(
+                self.A, self.b, self.operadores, self.inferiores)
+            if self.con_pasos:
+                self.registrar_paso("Cambio de variable x = l + x' (x' ≥ 0): b ← b − A·l")
+                for i in invertidas:
+                    self.registrar_paso(f"  R{i+1} queda con lado derecho negativo: se multiplica por -1 ({self.operadores[i]})")
+
+    def _resolver_revisado(self, A_estandar, num_vars, indices_artificiales):
+        """
+        Las dos fases con SimplexRevisado (sin tabla): Fase 1 minimiza la suma de artificiales;
+        si W=0 se sacan de la base las artificiales que quedaron en cero y Fase 2 optimiza Z
+        con las columnas artificiales bloqueadas. Sirve para A densa o dispersa.
+        """
+        num_cols = A_estandar.shape[1]
+        # Base inicial y nombres en el orden en que convertir_forma_estandar creó las columnas
+        indices_basicas = []
+        nombres_columnas = [f"x{i+1}" for i in range(num_vars)]
+        col_actual = num_vars
+        cuenta = {'s': 0, 'e': 0, 'a': 0}   # contadores: nombres en O(m)
+
+        def nombre(prefijo):
+            cuenta[prefijo] += 1
+            return f"{prefijo}{cuenta[prefijo]}"
+
+        for op in self.operadores:
+            if op == '<=':
+                nombres_columnas.append(nombre('s'))
+                indices_basicas.append(col_actual)
+                col_actual += 1
+            elif op == '>=':
+                nombres_columnas.append(nombre('e'))
+                nombres_columnas.append(nombre('a'))
+                indices_basicas.append(col_actual + 1)
+                col_actual += 2
+            else:
+                nombres_columnas.append(nombre('a'))
+                indices_basicas.append(col_actual)
+                col_actual += 1
+
+        c_z = np.zeros(num_cols)
+        c_z[:num_vars] = -self.c if self.objetivo == 'max' else self.c
+        opciones = dict(precio=self.regla_precio, degeneracion=self.degeneracion,
+                        umbral_bland=self.umbral_bland, control=self.control)
+        if self.superiores is not None:
+            superiores = np.full(num_cols, np.inf)
+            superiores[:num_vars] = self.superiores - self.inferiores
+            opciones["superiores"] = superiores
+        iteraciones = cambios_de_limite = 0
+        # El motor registra cada iteración: solo con detalle='full'
+        registrar_paso = self.registrar_paso if self.paso_a_paso else None
+        motor = res = None
+        if self.base_inicial is not None:
+            artificiales = {nombres_columnas[j] for j in indices_artificiales} | set(indices_artificiales)
+            if any(v in artificiales for v in self.base_inicial):
+                self.registrar_paso("⚠ La base dada incluye variables artificiales; se resuelve con las dos fases.")
+            else:
+                # Base sin artificiales: se salta la Fase 1
+                en_superior = np.zeros(num_cols, dtype=bool)
+                en_superior[self.base_en_superior] = True
+                motor, res = arranque_en_caliente(A_estandar, self.b, c_z, self.base_inicial, nombres_columnas,
+                                                  registrar_paso, columnas_bloqueadas=indices_artificiales,
+                                                  en_superior=en_superior, **opciones)
+        if res is None:
+            if indices_artificiales:
+                self.registrar_paso("\n" + "="*60)
+                self.registrar_paso("FASE 1 (Simplex Revisado): MINIMIZAR W = SUMA DE VARIABLES ARTIFICIALES")
+                self.registrar_paso("="*60)
+                c_w = np.zeros(num_cols)
+                c_w[indices_artificiales] = 1.0
+                motor = SimplexRevisado(A_estandar, self.b, c_w, indices_basicas,
+                                        registrar_paso=registrar_paso,
+                                        nombres_columnas=nombres_columnas, **opciones)
+                res = motor.resolver()
+                iteraciones += res["iteraciones"]
+                self.pivotes_degenerados += res["pivotes_degenerados"]
+                self.cambios_a_bland += res["cambios_a_bland"]
+                cambios_de_limite += res["cambios_de_limite"]
+                if res["estado"] in ESTADOS_PARADA:
+                    return self._resultado_cortado_revisado(res, num_vars, nombres_columnas,
+                                                            factible=res["z"] <= 1e-6)
+                self.registrar_paso(f"Valor final de W: {res['z']:.6f}")
+                if res["z"] > 1e-6:
+                    self.registrar_paso("❌ W > 0: El problema es NO FACTIBLE")
+                    return {
+                        "status": "infeasible",
+                        "tipo_solucion": "Problema No Factible",
+                        "explicacion": "El problema no tiene solución factible. Las restricciones son contradictorias.",
+                        "pasos": self.pasos,
+                        "tablas": []
+                    }
+                redundantes = motor.sacar_artificiales(indices_artificiales)
+                if redundantes:
+                    self.registrar_paso(f"{redundantes} restricción(es) redundante(s): su artificial queda en la base con valor 0.")
+                indices_basicas = motor.indices_basicas
+                # Las no básicas que quedaron en su límite superior siguen ahí en la Fase 2
+                opciones["en_superior"] = motor.en_superior
+                self.registrar_paso("✓ W = 0: Se encontró una solución básica factible")
+
+            self.registrar_paso("\n" + "="*60)
+            self.registrar_paso("FASE 2 (Simplex Revisado): OPTIMIZAR FUNCIÓN OBJETIVO ORIGINAL")
+            self.registrar_paso("="*60)
+            motor = SimplexRevisado(A_estandar, self.b, c_z, indices_basicas,
+                                    registrar_paso=registrar_paso,
+                                    nombres_columnas=nombres_columnas,
+                                    columnas_bloqueadas=indices_artificiales, **opciones)
+            res = motor.resolver()
+        iteraciones += res["iteraciones"]
+        self.pivotes_degenerados += res["pivotes_degenerados"]
+        self.cambios_a_bland += res["cambios_a_bland"]
+        cambios_de_limite += res["cambios_de_limite"]
+
+        if res["estado"] in ESTADOS_PARADA:
+            # Fase 2 o arranque primal: base factible; arranque dual: todavía no
+            return self._resultado_cortado_revisado(res, num_vars, nombres_columnas,
+                                                    factible=res.get("arranque") != 'dual')
+
+        # El Simplex Dual (arranque en caliente) detecta la infactibilidad por una fila sin negativos
+        if res["estado"] == 'infeasible':
+            return {
+                "status": "infeasible",
+                "tipo_solucion": "Problema No Factible",
+                "explicacion": "El problema no tiene solución factible. Las restricciones son contradictorias.",
+                "pasos": self.pasos,
+                "tablas": []
+            }
+
+        if res["estado"] == 'unbounded':
+            self.registrar_paso("\n⚠ Problema no acotado")
+            return {
+                "status": "unbounded",
+                "tipo_solucion": "Problema No Acotado",
+                "explicacion": "El problema no tiene solución óptima finita. La región factible es no acotada.",
+                "pasos": self.pasos,
+                "tablas": []
+            }
+
+        x = res["x"]
+        solucion = x[:num_vars]
+        if self.inferiores is not None:
+            solucion = solucion + self.inferiores   # deshacer x = l + x'
+        z_optimo = float(self.c @ solucion)
+        if self.con_pasos:
+            self.registrar_paso(f"\n=== SOLUCIÓN ÓPTIMA ===")
+            self.registrar_paso(f"Valor óptimo de Z: {z_optimo:.4f}")
+            for i in range(num_vars):
+                self.registrar_paso(f"x{i+1} = {solucion[i]:.4f}")
+
+        x_B = x[res["indices_basicas"]]
+        ceros, alternativo = motor.hay_optimo_alternativo(res["costos_reducidos"], x_B)
+        nombres_vars_nb_cero = [nombres_columnas[j] for j in ceros]
+        vars_basicas_cero = sum(1 for j, v in zip(res["indices_basicas"], x_B)
+                                if j not in indices_artificiales and abs(v) < 1e-9)
+        if nombres_vars_nb_cero and alternativo:
+            tipo_solucion = "Solución Múltiple (Infinitas Soluciones)"
+            explicacion = (f"Se encontró una solución óptima, pero existen variable(s) no básica(s) "
+                         f"({', '.join(nombres_vars_nb_cero)}) con costo reducido cero. "
+                         f"Esto permite alcanzar otro vértice óptimo sin cambiar Z, generando infinitas "
+                         f"soluciones óptimas a lo largo de un borde de la región factible.")
+        elif vars_basicas_cero > 0:
+            tipo_solucion = "Solución Única (Degenerada)"
+            explicacion = (f"Se encontró una solución óptima única, pero hay {vars_basicas_cero} variable(s) básica(s) "
+                         f"con valor cero. Esto se llama degeneración y ocurre cuando múltiples restricciones se "
+                         f"cruzan en el mismo punto óptimo. A pesar de la degeneración, la solución es única.")
+        else:
+            tipo_solucion = "Solución Única"
+            explicacion = "Se encontró una solución óptima única."
+
+        return {
+            "status": "optimal",
+            "tipo_solucion": tipo_solucion,
+            "explicacion": explicacion,
+            "z_optimo": z_optimo,
+            "solucion": [float(v) for v in solucion],
+            "iteraciones": int(iteraciones),
+            "pivotes_degenerados": int(self.pivotes_degenerados),
+            "cambios_a_bland": int(self.cambios_a_bland),
+            "cambios_de_limite": int(cambios_de_limite),
+            "arranque": res.get("arranque", 'frio'),
+            "pasos": self.pasos,
+            "tablas": [],
+            "variables_basicas": [nombres_columnas[j] for j in res["indices_basicas"]]
+        }
+
+    def _resultado_cortado_revisado(self, res, num_vars, nombres_columnas, factible):
+        """Corte del motor revisado (en cualquiera de las fases): se devuelve su base actual."""
+        self.registrar_paso(self.control.mensaje(res["estado"]))
+        solucion = res["x"][:num_vars]
+        if self.inferiores is not None:
+            solucion = solucion + self.inferiores   # deshacer x = l + x'
+        return resultado_interrumpido(
+            res["estado"], self.control.iteraciones, factible, self.pasos, [],
+            solucion=[float(v) for v in solucion], z_actual=float(self.c @ solucion),
+            variables_basicas=[nombres_columnas[j] for j in res["indices_basicas"]])
+
     def resolver(self):
+        """Presolve y escalado (si están activos) → Dos Fases → desescalado y postsolve."""
+        self.control.iniciar()
+        presolve = None
+        if self.presolve:
+            presolve = presolve_metodo(self)
+            if presolve.estado != 'reducido':
+                return completar_pasos(presolve.resultado_directo(self.pasos), self.formato_pasos)
+        escalado = escalar_metodo(self) if self.escalado else None
+        resultado = self._resolver()
+        if escalado is not None:
+            resultado = escalado.completar_resultado(resultado)
+        if presolve is not None:
+            resultado = presolve.completar_resultado(resultado, self.operadores)
+        return completar_pasos(resultado, self.formato_pasos)
+
+    def _resolver(self):
         """Ejecuta: forma estándar → Fase 1 (min W) → si W=0, Fase 2 (opt Z); si W>0 → infactible."""
-        self.registrar_paso("=== MÉTODO DE LAS DOS FASES ===")
-        
-        # Formatear función objetivo
-        objetivo_str = f"{self.c[0]}x₁"
-        for i in range(1, len(self.c)):
-            signo = '-' if self.c[i] < 0 else '+'
-            abs_val = abs(self.c[i])
-            objetivo_str += f" {signo} {abs_val}x₁₊₁".replace("₁₊₁", f"{i+1}")
-        self.registrar_paso(f"FUNCIÓN OBJETIVO: {self.objetivo.upper()} Z = {objetivo_str}")
-        
-        self.registrar_paso("RESTRICCIONES:")
-        for idx, (a_row, b_val, op) in enumerate(zip(self.A, self.b, self.operadores), 1):
-            restriccion_str = f"{a_row[0]}x₁"
-            for i in range(1, len(a_row)):
-                signo = '-' if a_row[i] < 0 else '+'
-                abs_val = abs(a_row[i])
-                restriccion_str += f" {signo} {abs_val}x₁₊₁".replace("₁₊₁", f"{i+1}")
-            self.registrar_paso(f"  R{idx}: {restriccion_str} {op} {b_val}")
-        
+        if self.con_pasos:
+            self.registrar_paso("=== MÉTODO DE LAS DOS FASES ===")
+        
+            # Formatear función objetivo
+            objetivo_str = f"{self.c[0]}x₁"
+            for i in range(1, len(self.c)):
+                signo = '-' if self.c[i] < 0 else '+'
+                abs_val = abs(self.c[i])
+                objetivo_str += f" {signo} {abs_val}x₁₊₁".replace("₁₊₁", f"{i+1}")
+            self.registrar_paso(f"FUNCIÓN OBJETIVO: {self.objetivo.upper()} Z = {objetivo_str}")
+        
+            self.registrar_paso("RESTRICCIONES:")
+            if self.es_dispersa:
+                self.registrar_paso(f"  {self.A.shape[0]} restricciones dispersas: {self.A.nnz} coeficientes no nulos "
+                                    f"(densidad {self.A.densidad:.2%})")
+            for idx, (a_row, b_val, op) in enumerate(zip(self.A if not self.es_dispersa else [],
+                                                         self.b, self.operadores), 1):
+                restriccion_str = f"{a_row[0]}x₁"
+                for i in range(1, len(a_row)):
+                    signo = '-' if a_row[i] < 0 else '+'
+                    abs_val = abs(a_row[i])
+                    restriccion_str += f" {signo} {abs_val}x₁₊₁".replace("₁₊₁", f"{i+1}")
+                self.registrar_paso(f"  R{idx}: {restriccion_str} {op} {b_val}")
+        
+        if self.superiores is not None:
+            self._aplicar_limites()
+
         # Convertir a forma estándar
         (A_estandar, c_estandar, num_vars, num_holgura, num_exceso, 
          num_artificiales, indices_artificiales) = self.convertir_forma_estandar()
+
+        # El arranque en caliente y los límites necesitan el Simplex Revisado
+        if self.modo == 'revisado' or self.base_inicial is not None or self.superiores is not None:
+            return self._resolver_revisado(A_estandar, num_vars, indices_artificiales)
         
         # FASE 1
         factible, tabla_fase1, variables_basicas, indices_basicas = self.fase1(
             A_estandar, num_vars, num_holgura, num_exceso, num_artificiales, indices_artificiales
         )
         
+        if self.parada is not None:
+            # Corte en Fase 1: la base actual todavía tiene artificiales (salvo que W ya sea 0)
+            solucion = np.zeros(num_vars)
+            for i, j in enumerate(indices_basicas):
+                if j < num_vars:
+                    solucion[j] = tabla_fase1[i + 1, -1]
+            return resultado_interrumpido(
+                self.parada, self.control.iteraciones, abs(tabla_fase1[0, -1]) <= 1e-6, self.pasos,
+                self._tablas_serializadas(), solucion=[float(v) for v in solucion],
+                z_actual=float(self.c @ solucion), variables_basicas=variables_basicas)
+
         if not factible:
-            tablas_serializadas = [self._convertir_a_nativo(t) for t in self.tablas]
+            tablas_serializadas = self._tablas_serializadas()
             return {
                 "status": "infeasible",
                 "tipo_solucion": "Problema No Factible",
@@ -0,0 +1,374 @@
+"""
+Método Simplex Dual para Programación Lineal.
+
+Pensado para los modelos de costos: minimizar con costos ≥ 0 y restricciones >=. Con Big M o
+Dos Fases cada fila >= necesita una artificial (y una Fase 1 o coeficientes M en Z). Aquí no:
+cada restricción se escribe como <= (las >= se multiplican por -1) y la base de holguras ya es
+óptima para Z ("dual factible"), aunque tenga valores negativos (no factible). El Simplex Dual
+mantiene la fila Z óptima y en cada iteración arregla una fila con RHS negativo.
+
+PASOS DEL ALGORITMO (resumen):
+  1. Pasar todo a <=: las >= se multiplican por -1; una = se escribe como <= y >=.
+  2. Tabla inicial con holguras en la base (sin artificiales). Fila Z = -c.
+  3. Si la fila Z no es óptima (algún costo con el signo contrario), se agrega la restricción
+     artificial Σx_j <= M y un pivote en ella la vuelve óptima.
+  4. Iterar: sale la fila con el RHS más negativo; entra la columna con coeficiente negativo
+     en esa fila y menor ratio dual |Z_j / a_rj| (así la fila Z sigue siendo óptima); pivoteo.
+  5. Parar cuando todo RHS ≥ 0 (óptimo) o cuando la fila a arreglar no tiene coeficientes
+     negativos (no factible).
+"""
+
+import numpy as np
+
+from control_resolucion import ESTADOS_PARADA, ControlResolucion, resultado_interrumpido
+from detalle import validar_detalle
+from eventos_pasos import validar_formato_pasos, completar_pasos
+from escalado import escalar_metodo
+from matriz_dispersa import preparar_matriz
+from nucleo_pivoteo import NucleoPivoteo
+from historial_tablas import HistorialTablas
+from reglas_precio import limite_iteraciones
+
+
+class MetodoDualSimplex:
+    def __init__(self, c, A, b, operadores, objetivo='min', escalado=True, detalle='full', retencion=None,
+                 formato_pasos='texto', max_iteraciones=None, limite_tiempo=None, cancelacion=None):
+        """
+        Mismo formato que Simplex: c, A, b, operadores por fila y objetivo.
+        A puede venir también dispersa (se trabaja en tabla, así que se pasa a densa).
+        escalado: escalar filas y columnas si los coeficientes tienen un rango grande (ver escalado).
+        detalle: 'full' (pasos de cada iteración y tablas), 'summary' o 'none' (ver detalle).
+        retencion: qué tablas devolver (primeras / ultimas / cada; ver historial_tablas).
+        formato_pasos: 'texto' (frases) o 'eventos' (código + números; los renderiza la
+        interfaz, respuesta mucho más chica). Ver eventos_pasos.
+        max_iteraciones / limite_tiempo (segundos) / cancelacion (TokenCancelacion): cortes
+        revisados antes de cada pivoteo (ver control_resolucion).
+        """
+        self.c = np.array(c, dtype=float)
+        A, es_dispersa = preparar_matriz(A)
+        self.A = A.toarray() if es_dispersa else A
+        self.b = np.array(b, dtype=float)
+        self.operadores = operadores
+        self.objetivo = objetivo
+        self.escalado = escalado
+        self.tol = 1e-9
+        self.detalle = validar_detalle(detalle)
+        self.formato_pasos = validar_formato_pasos(formato_pasos)
+        self.control = ControlResolucion(max_iteraciones, limite_tiempo, cancelacion)
+        self.con_pasos = self.detalle != 'none'     # ¿se guarda algún paso?
+        self.paso_a_paso = self.detalle == 'full'   # ¿detalle de cada iteración y tablas?
+        self.pasos = []
+        self.historial = HistorialTablas(retencion=retencion)   # tablas base + pivoteos (ver historial_tablas)
+
+    def registrar_paso(self, mensaje):
+        """Añado una línea al log (nada con detalle='none')."""
+        if self.con_pasos:
+            self.pasos.append(mensaje)
+
+    def _convertir_a_nativo(self, valor):
+        """np.float64 / np.inf → float / None para poder serializar a JSON."""
+        if isinstance(valor, np.ndarray):
+            return [self._convertir_a_nativo(v) for v in valor.tolist()]
+        if isinstance(valor, (list, tuple)):
+            return [self._convertir_a_nativo(v) for v in valor]
+        if isinstance(valor, (np.integer,)):
+            return int(valor)
+        if isinstance(valor, (float, np.floating)):
+            return None if np.isinf(valor) else float(valor)
+        return valor
+
+    def registrar_tabla(self, tabla, iteracion, variables_basicas, explicacion, nombres_columnas,
+                        col_entrante=None, fila_saliente=None, elemento_pivote=None, ratios_duales=None):
+        """
+        Tabla de la iteración (mismo formato que Simplex). En el dual los ratios son por columna,
+        así que van en 'ratios_duales' y 'ratios' queda vacío. Con col_entrante solo se anota
+        el pivoteo (fila_saliente + 1, col_entrante); sin él, `tabla` es una tabla base.
+        """
+        if col_entrante is None:
+            self.historial.anclar(tabla)
+        else:
+            self.historial.pivotear(fila_saliente + 1, col_entrante, tabla)
+        self.historial.registrar({
+            "iteracion": int(iteracion),
+            "tabla": None,  # se reconstruye al serializar
+            "variables_basicas": list(variables_basicas),
+            "explicacion": explicacion,
+            "nombres_columnas": list(nombres_columnas),
+            "col_entrante": int(col_entrante) if col_entrante is not None else None,
+            "fila_saliente": int(fila_saliente) if fila_saliente is not None else None,
+            "elemento_pivote": float(elemento_pivote) if elemento_pivote is not None else None,
+            "ratios": [],
+            "ratios_duales": ratios_duales.copy() if ratios_duales is not None else [],
+        })
+
+    def _tablas_serializadas(self):
+        return self.historial.serializar(self._convertir_a_nativo)
+
+    def convertir_forma_menor_igual(self):
+        """
+        Todas las filas como a·x <= b: >= se multiplica por -1, = se parte en <= y >=.
+        Devuelve (A_menor, b_menor, origen) con origen[k] = índice de la restricción original.
+        """
+        num_vars = len(self.c)
+        filas, rhs, origen = [], [], []
+        for i, op in enumerate(self.operadores):
+            if len(self.A[i]) != num_vars:
+                raise ValueError(f"La restricción {i + 1} tiene {len(self.A[i])} variables, "
+                                 f"pero la función objetivo tiene {num_vars}")
+            if op in ('<=', '='):
+                filas.append(self.A[i])
+                rhs.append(self.b[i])
+                origen.append(i)
+            if op in ('>=', '='):
+                filas.append(-self.A[i])
+                rhs.append(-self.b[i])
+                origen.append(i)
+        return np.array(filas, dtype=float).reshape(len(filas), num_vars), np.array(rhs), origen
+
+    def _d(self, tabla, num_cols):
+        """Fila Z normalizada: d_j < 0 ⇔ la base no es óptima en j (dual no factible)."""
+        fila_z = tabla[0, :num_cols]
+        return fila_z if self.objetivo == 'max' else -fila_z
+
+    def _resultado_sin_optimo(self, status, tipo, explicacion):
+        return {
+            "status": status,
+            "tipo_solucion": tipo,
+            "explicacion": explicacion,
+            "pasos": self.pasos,
+            "tablas": self._tablas_serializadas(),
+        }
+
+    def resolver(self):
+        """Escalado (si está activo) → Simplex Dual → desescalado."""
+        self.control.iniciar()
+        if not self.escalado:
+            return completar_pasos(self._resolver(), self.formato_pasos)
+        escalado = escalar_metodo(self)
+        return completar_pasos(escalado.completar_resultado(self._resolver()), self.formato_pasos)
+
+    def _resolver(self):
+        num_vars = len(self.c)
+        if self.con_pasos:
+            self.registrar_paso(f"Problema original: {self.objetivo.upper()} Z = " +
+                                " + ".join(f"{self.c[i]}x{i+1}" for i in range(num_vars)))
+
+        A_menor, b_menor, origen = self.convertir_forma_menor_igual()
+        num_rest = len(b_menor)
+        if self.con_pasos:
+            self.registrar_paso("\nFORMA <= (sin variables artificiales):")
+            for k in range(num_rest):
+                op = self.operadores[origen[k]]
+                if op == '>=':
+                    nota = " (>= multiplicada por -1)"
+                elif op == '=':
+                    segunda = k > 0 and origen[k - 1] == origen[k]
+                    nota = " (igualdad, parte >= por -1)" if segunda else " (igualdad, parte <=)"
+                else:
+                    nota = ""
+                terminos = " + ".join(f"{A_menor[k, j]:g}x{j+1}" for j in range(num_vars))
+                self.registrar_paso(f"  {terminos} + s{k+1} = {b_menor[k]:g}{nota}")
+
+        # Tabla: fila 0 = Z, filas 1..m = restricciones; columnas x, s y RHS
+        num_cols = num_vars + num_rest
+        tabla = np.zeros((num_rest + 1, num_cols + 1))
+        tabla[0, :num_vars] = -self.c
+        tabla[1:, :num_vars] = A_menor
+        tabla[1:, num_vars:num_cols] = np.eye(num_rest)
+        tabla[1:, -1] = b_menor
+        nombres_columnas = [f"x{i+1}" for i in range(num_vars)] + [f"s{k+1}" for k in range(num_rest)]
+        indices_basicas = list(range(num_vars, num_cols))
+        variables_basicas = [nombres_columnas[j] for j in indices_basicas]
+
+        if self.paso_a_paso:
+            self.registrar_paso(['col', list(nombres_columnas)])   # los eventos nombran columnas por índice
+            self.registrar_paso("\nTABLA INICIAL (base = holguras):")
+            self.registrar_tabla(tabla, 0, variables_basicas, "Tabla inicial del Simplex Dual", nombres_columnas)
+
+        # Si la fila Z no es óptima, restricción artificial Σ x_j <= M sobre las columnas con d_j < 0
+        fila_artificial = None
+        d = self._d(tabla, num_cols)
+        if (d < -self.tol).any():
+            malas = np.flatnonzero(d < -self.tol)
+            M = 1e4 * (1.0 + float(np.abs(b_menor).max(initial=0.0)))
+            if self.con_pasos:
+                self.registrar_paso(f"\nLa base de holguras no es dual factible ({', '.join(nombres_columnas[j] for j in malas)} "
+                                    f"con costo del signo contrario). Se agrega la restricción artificial "
+                                    f"{' + '.join(nombres_columnas[j] for j in malas)} + sM = {M:g}.")
+            nueva = np.zeros((num_rest + 2, num_cols + 2))
+            nueva[:num_rest + 1, :num_cols] = tabla[:, :num_cols]
+            nueva[:num_rest + 1, -1] = tabla[:, -1]
+            nueva[-1, malas] = 1.0
+            nueva[-1, num_cols] = 1.0
+            nueva[-1, -1] = M
+            tabla = nueva
+            restricciones_con_cota = tabla[1:].copy()   # [A | I | b] con la fila de la cota, sin pivotear
+            nombres_columnas.append("sM")
+            indices_basicas.append(num_cols)
+            variables_basicas.append("sM")
+            num_cols += 1
+            num_rest += 1
+            fila_artificial = num_rest - 1
+            # Pivote en la fila artificial con la columna más negativa → fila Z óptima
+            q = int(malas[np.argmin(d[malas])])
+            if self.paso_a_paso:
+                self.historial.anclar(tabla)   # la tabla cambió de forma: nueva base del historial
+            NucleoPivoteo(tabla).pivotear(tabla, fila_artificial + 1, q)
+            indices_basicas[fila_artificial] = q
+            variables_basicas[fila_artificial] = nombres_columnas[q]
+            if self.paso_a_paso:
+                self.registrar_paso(['col', list(nombres_columnas)])   # ahora con sM
+                self.registrar_paso(f"Pivote en fila sM, columna {nombres_columnas[q]}: la fila Z queda óptima.")
+                self.registrar_tabla(tabla, 0, variables_basicas, "Restricción artificial: base dual factible",
+                                     nombres_columnas, col_entrante=q, fila_saliente=fila_artificial, elemento_pivote=1.0)
+
+        nucleo = NucleoPivoteo(tabla)
+        max_iteraciones = limite_iteraciones(num_rest, num_cols)
+        iteracion = 0
+        pivotes_degenerados = 0
+        estado = 'iteration_limit'
+        while iteracion < max_iteraciones:
+            rhs = tabla[1:, -1]
+            r = int(np.argmin(rhs))
+            if rhs[r] >= -self.tol:
+                self.registrar_paso("\n✓ Todas las variables básicas son ≥ 0: la tabla es factible y óptima")
+                estado = 'optimal'
+                break
+            parada = self.control.parar()
+            if parada is not None:
+                estado = parada
+                break
+            iteracion += 1
+            if self.paso_a_paso:
+                self.registrar_paso(['it', iteracion])
+                self.registrar_paso(['dsal', indices_basicas[r], float(rhs[r])])
+
+            # Ratio dual: solo columnas con coeficiente negativo en la fila saliente
+            fila = tabla[r + 1, :num_cols]
+            negativos = fila < -self.tol
+            if not negativos.any():
+                self.registrar_paso(f"⚠ La fila de {variables_basicas[r]} no tiene coeficientes negativos: "
+                                    f"no hay forma de volverla ≥ 0.")
+                estado = 'infeasible'
+                break
+            d = self._d(tabla, num_cols)
+            ratios = np.full(num_cols, np.inf)
+            ratios[negativos] = np.abs(d[negativos] / fila[negativos])
+            q = int(np.argmin(ratios))
+            if self.paso_a_paso:
+                columnas = np.flatnonzero(negativos)
+                self.registrar_paso(['drat', q, float(ratios[q]), columnas.tolist(), ratios[columnas].tolist()])
+            if ratios[q] <= self.tol:
+                pivotes_degenerados += 1
+
+            variable_saliente = variables_basicas[r]
+            indices_basicas[r] = q
+            variables_basicas[r] = nombres_columnas[q]
+            elemento_pivote = nucleo.pivotear(tabla, r + 1, q)
+            if self.paso_a_paso:
+                self.registrar_paso(['dpiv', elemento_pivote, float(tabla[0, -1])])
+                self.registrar_tabla(tabla, iteracion, variables_basicas,
+                                     f"Iteración {iteracion}: {nombres_columnas[q]} entra, {variable_saliente} sale",
+                                     nombres_columnas, col_entrante=q, fila_saliente=r,
+                                     elemento_pivote=elemento_pivote, ratios_duales=ratios)
+
+        if estado == 'infeasible':
+            return self._resultado_sin_optimo(
+                "infeasible", "Problema No Factible",
+                "Una fila con valor negativo no tiene coeficientes negativos: ninguna combinación de "
+                "variables ≥ 0 puede cumplirla. Las restricciones son contradictorias.")
+        if estado in ESTADOS_PARADA:
+            # Corte: la base actual es dual factible pero todavía tiene RHS negativos. Sus valores
+            # no son una solución (y con la cota artificial dependen de M): solo va la base
+            self.registrar_paso(self.control.mensaje(estado))
+            return resultado_interrumpido(
+                estado, iteracion, False, self.pasos, self._tablas_serializadas(),
+                variables_basicas=[v for v in variables_basicas if v != "sM"])
+
+        # Con sM no básica la restricción artificial está activa: si su costo reducido no es cero,
+        # Z cambia con M y mejora sin límite en el problema real. Con costo cero Z no depende de
+        # M (solo la solución): sM entra a la base con la prueba de ratio y el óptimo es finito.
+        if fila_artificial is not None:
+            col_sM = nombres_columnas.index("sM")
+            if col_sM not in indices_basicas:
+                d = self._d(tabla, num_cols)
+                columna = tabla[1:, col_sM]
+                positivos = columna > self.tol
+                if abs(d[col_sM]) > self.tol or not positivos.any():
+                    self.registrar_paso("\n⚠ La restricción artificial Σx <= M quedó activa: el problema es no acotado")
+                    return self._resultado_sin_optimo(
+                        "unbounded", "Problema No Acotado",
+                        "El óptimo depende de la cota artificial M: sin ella, Z puede mejorar indefinidamente. "
+                        "La región factible es no acotada en la dirección de mejora.")
+                ratios = np.full(num_rest, np.inf)
+                ratios[positivos] = tabla[1:, -1][positivos] / columna[positivos]
+                r = int(np.argmin(ratios))
+                variable_saliente = variables_basicas[r]
+                indices_basicas[r] = col_sM
+                variables_basicas[r] = "sM"
+                elemento_pivote = nucleo.pivotear(tabla, r + 1, col_sM)
+                if self.con_pasos:
+                    self.registrar_paso(f"\nLa restricción artificial quedó activa pero sM tiene costo cero: "
+                                        f"Z no depende de M. sM entra a la base y sale {variable_saliente}.")
+                if self.paso_a_paso:
+                    self.registrar_tabla(tabla, iteracion, variables_basicas,
+                                         f"sM entra, {variable_saliente} sale (solución sin la cota M)",
+                                         nombres_columnas, col_entrante=col_sM, fila_saliente=r,
+                                         elemento_pivote=elemento_pivote)
+
+        valores = tabla[1:, -1]
+        if fila_artificial is not None:
+            # La tabla arrastra el redondeo de los pivotes con M: los valores de la base salen de
+            # B·x_B = b con las columnas originales (sM es unitaria, así que M no toca a las demás)
+            valores = np.linalg.solve(restricciones_con_cota[:, indices_basicas], restricciones_con_cota[:, -1])
+        solucion = np.zeros(num_vars)
+        for i, j in enumerate(indices_basicas):
+            if j < num_vars:
+                solucion[j] = valores[i]
+        z_optimo = float(self.c @ solucion)
+        if self.con_pasos:
+            self.registrar_paso("\n=== SOLUCIÓN ÓPTIMA ===")
+            self.registrar_paso(f"Valor óptimo de Z: {z_optimo:.4f}")
+            for i in range(num_vars):
+                self.registrar_paso(f"x{i+1} = {solucion[i]:.4f}")
+
+        # Misma clasificación que Simplex: múltiple / degenerada / única
+        d = self._d(tabla, num_cols)
+        excluir = set(indices_basicas) | ({nombres_columnas.index("sM")} if fila_artificial is not None else set())
+        ceros = [j for j in np.flatnonzero(np.abs(d) < self.tol) if j not in excluir]
+        alternativo = False
+        for j in ceros:
+            positivos = tabla[1:, j] > self.tol
+            if positivos.any() and np.min(tabla[1:, -1][positivos] / tabla[1:, j][positivos]) > self.tol:
+                alternativo = True
+                break
+        # Las holguras de una igualdad partida en dos valen 0 siempre: no cuentan como degeneración
+        holguras_igualdad = {num_vars + k for k in range(len(origen)) if self.operadores[origen[k]] == '='}
+        basicas_cero = sum(1 for i, j in enumerate(indices_basicas)
+                           if nombres_columnas[j] != "sM" and j not in holguras_igualdad
+                           and abs(tabla[i + 1, -1]) < self.tol)
+        if alternativo:
+            tipo_solucion = "Solución Múltiple (Infinitas Soluciones)"
+            explicacion = (f"Existen variable(s) no básica(s) ({', '.join(nombres_columnas[j] for j in ceros)}) "
+                           f"con coeficiente cero en la fila Z: se puede llegar a otro vértice óptimo sin cambiar Z.")
+        elif basicas_cero > 0:
+            tipo_solucion = "Solución Única (Degenerada)"
+            explicacion = (f"Solución óptima única con {basicas_cero} variable(s) básica(s) en cero (degeneración).")
+        else:
+            tipo_solucion = "Solución Única"
+            explicacion = ("Se encontró una solución óptima única: todos los valores de la base son ≥ 0 y la "
+                           "fila Z se mantuvo óptima en cada iteración.")
+
+        return {
+            "status": "optimal",
+            "tipo_solucion": tipo_solucion,
+            "explicacion": explicacion,
+            "z_optimo": z_optimo,
+            "solucion": [float(v) for v in solucion],
+            "iteraciones": int(iteracion),
+            "pivotes_degenerados": int(pivotes_degenerados),
+            "pasos": self.pasos,
+            "tablas": self._tablas_serializadas(),
+            # sM básica es la fila de la cota artificial, que no es una restricción del problema
+            "variables_basicas": [v for v in variables_basicas if v != "sM"],
+        }
@@ -9,27 +9,121 @@ PASOS DEL ALGORITMO (resumen):
   1. Calcular todos los puntos donde se cortan las rectas (restricciones + ejes).
   2. De esos puntos, quedarse solo con los que cumplen todas las restricciones (factibles).
   3. En cada vértice factible evaluar Z; el que da mejor Z (max o min) es la solución.
+
+Los tres pasos van vectorizados (con cientos de restricciones el doble bucle con
+np.linalg.solve tardaba segundos): los cortes de todos los pares salen juntos por Cramer,
+la factibilidad es un solo A @ P y los repetidos se quitan redondeando a una grilla.
+Con detalle='full' el log se arma después, recorriendo esos resultados.
+
+Con modo='semiplanos' no se enumeran los pares: la región sale como intersección de
+semiplanos en O(m log m) (ver semiplanos), ya ordenada, y se detectan regiones no acotadas.
+
+En modo 'vertices', antes de enumerar se quitan las filas redundantes (las que no forman
+parte del borde de la región, ver semiplanos.filas_del_borde): los pares salen solo de las
+restricciones que limitan la región, y el log las lista como redundantes.
+
+Todo lo anterior a evaluar Z depende solo de las restricciones: con cache=True la región se
+guarda (ver cache_regiones) y, si solo cambia la función objetivo, se reutiliza y se evalúa Z
+en sus k vértices.
+
+El resultado trae además "grafica", lista para dibujar: el recuadro de la vista, el polígono
+de la región recortado a él (ordenado y cerrado) y el tramo visible de cada restricción.
+
+Con enteros=True se agrega "entero": el mejor punto con x e y enteras y los puntos enteros de
+la región, contados por columnas sobre ese polígono (ver puntos_enteros).
 """
 
 import numpy as np
 
+from cache_regiones import CACHE_REGIONES, clave_restricciones
+from detalle import validar_detalle
+from presolve import Presolve
+from puntos_enteros import LIMITE_COLUMNAS, barrido_enteros
+from semiplanos import (EJE_X, EJE_Y, conos_normales, en_caja, filas_del_borde, recortar_rectas,
+                        region_factible, sin_caja)
+
+TOL = 1e-9
+TOL_PARALELAS = 1e-12   # |det| relativo por debajo del cual dos rectas se toman como paralelas
+GRILLA_VERTICES = 1e-9  # paso de la grilla (relativo a la escala) para detectar vértices repetidos
+MODOS = ('vertices', 'semiplanos')
+COLUMNAS_EN_LOG = 30    # con detalle='full', columnas del barrido de enteros que se listan
+
+
+def caja_vista(vertices):
+    """Recuadro [xmin, xmax, ymin, ymax] de la gráfica: hasta 1.5 veces la mayor coordenada (o 10)."""
+    mayor = max(0.0, float(np.max(vertices, initial=0.0)))
+    rango = mayor * 1.5 or 10.0
+    return [-1.0, rango, -1.0, rango]
+
+
+def armar_grafica(caja, poligono, A, b):
+    """"grafica" del resultado: el recuadro, el polígono ya recortado a él (aquí se cierra) y el tramo visible de cada recta."""
+    poligono = np.vstack([poligono, poligono[:1]])
+    extremos, visibles = recortar_rectas(A, b, caja)
+    return {
+        "caja": caja,
+        "poligono": {"x": poligono[:, 0].tolist(), "y": poligono[:, 1].tolist()},
+        "segmentos": [{"x": e[0].tolist(), "y": e[1].tolist()} if visible else None
+                      for e, visible in zip(extremos, visibles)],
+    }
+
+
+def _copiar_grafica(grafica):
+    """Copia de los datos de la gráfica (la entrada de la caché no se comparte con el resultado)."""
+    return {
+        "caja": list(grafica["caja"]),
+        "poligono": {"x": list(grafica["poligono"]["x"]), "y": list(grafica["poligono"]["y"])},
+        "segmentos": [None if s is None else {"x": list(s["x"]), "y": list(s["y"])}
+                      for s in grafica["segmentos"]],
+    }
+
 
 class MetodoGrafico:
-    def __init__(self, c, A, b, operadores, objetivo='max'):
-        """Guarda el problema: coeficientes de Z (c), restricciones (A, b, operadores), y si es max o min."""
+    def __init__(self, c, A, b, operadores, objetivo='max', presolve=True, detalle='full', modo='vertices',
+                 quitar_redundantes=True, cache=True, enteros=False):
+        """
+        Guarda el problema: coeficientes de Z (c), restricciones (A, b, operadores), y si es max o min.
+        presolve: quitar antes filas vacías, duplicadas y redundantes (ver presolve); en 2D no
+        se elimina ninguna variable, así que la gráfica no cambia.
+        detalle: 'full' (cada intersección y cada verificación), 'summary' o 'none' (ver detalle).
+        modo: 'vertices' (todos los cortes entre pares de rectas, con su verificación en el log)
+        o 'semiplanos' (intersección de semiplanos: polígono ordenado y detección de no acotado).
+        quitar_redundantes: en modo 'vertices', no enumerar los cortes de filas que no tocan el
+        borde de la región (se listan en el log como redundantes).
+        cache: reutilizar la región de una consulta anterior con las mismas restricciones y
+        opciones (ver cache_regiones); solo se vuelve a evaluar Z.
+        enteros: con óptimo, buscar también el mejor punto entero (ver puntos_enteros); no
+        cambia la región, así que no es parte de la clave de la caché.
+        """
+        if modo not in MODOS:
+            raise ValueError(f"modo debe ser uno de {', '.join(MODOS)} (se recibió {modo!r})")
+        self.modo = modo
         self.c = np.array(c)
         self.A = np.array(A)
         self.b = np.array(b)
+        # Las rectas tal como llegaron: la gráfica las dibuja todas aunque el presolve quite filas
+        self.A_entrada, self.b_entrada = self.A, self.b
         self.objetivo = objetivo
         self.operadores = operadores
+        self.presolve = presolve
+        self.quitar_redundantes = quitar_redundantes
+        self.cache = cache
+        self.enteros = enteros
+        # Nombre de cada fila que queda (si el presolve quita filas, se conservan los originales)
+        self.etiquetas_filas = [f"R{i+1}" for i in range(len(self.b))]
+        self.resumen_presolve = None
         # Aquí irán los vértices de la región factible que encontremos
         self.vertice = []
         # Lista donde voy guardando cada paso del proceso para mostrarlo después (log)
         self.pasos = []
+        self.detalle = validar_detalle(detalle)
+        self.con_pasos = self.detalle != 'none'
+        self.paso_a_paso = self.detalle == 'full'
     
     def registrar_paso(self, mensaje):
         """Simplemente añado un mensaje al log de pasos para que el usuario vea qué hice."""
-        self.pasos.append(mensaje)
+        if self.con_pasos:
+            self.pasos.append(mensaje)
 
 
     def mostrar_datos(self):
@@ -39,52 +133,91 @@ class MetodoGrafico:
         for i in range(len(self.b)):
             print(f"{self.A[i][0]}x + {self.A[i][1]}y <= {self.b[i]}")
 
+    def _rectas(self):
+        """Restricciones + ejes x=0, y=0 como rectas a·(x, y) = b."""
+        matriz_total = np.vstack([self.A.reshape(-1, 2), [[1, 0], [0, 1]]])
+        vector_total = np.concatenate([self.b.ravel(), [0, 0]])
+        return matriz_total, vector_total
+
+    def _cortes(self):
+        """
+        Cortes de todos los pares de rectas a la vez (regla de Cramer sobre los pares i < j).
+        Devuelve (i, j, puntos) en el orden de los pares, sin los de rectas paralelas.
+        """
+        M, v = self._rectas()
+        i, j = np.triu_indices(len(v), k=1)
+        det = M[i, 0] * M[j, 1] - M[i, 1] * M[j, 0]
+        escala = np.abs(M[i, 0] * M[j, 1]) + np.abs(M[i, 1] * M[j, 0])
+        cortan = np.abs(det) > TOL_PARALELAS * escala   # paralelas: no hay corte único
+        i, j, det = i[cortan], j[cortan], det[cortan]
+        x = (v[i] * M[j, 1] - M[i, 1] * v[j]) / det
+        y = (M[i, 0] * v[j] - v[i] * M[j, 0]) / det
+        return i, j, np.column_stack([x, y]) + 0.0   # + 0.0: sin -0.0 en los cortes con los ejes
+
+    def _verificar(self, puntos):
+        """
+        Factibilidad de todos los puntos con un solo A @ P. Devuelve (no_negativos, cumple,
+        valores): cumple[k, i] dice si el punto k cumple la fila i, valores = A @ punto.
+        """
+        valores = puntos @ self.A.reshape(-1, 2).T
+        ops = np.array(self.operadores, dtype=object)
+        b = self.b.ravel()
+        cumple = np.where(ops == '<=', valores <= b + TOL,
+                          np.where(ops == '>=', valores >= b - TOL, np.isclose(valores, b)))
+        no_negativos = (puntos >= -TOL).all(axis=1)
+        return no_negativos, cumple, valores
+
     def encontrar_intersecciones(self):
         """Calcula todos los puntos donde se cortan las rectas (restricciones + ejes x=0, y=0)."""
-        posibles_puntos = []
-
-        # Incluir ejes x=0 e y=0 como “rectas” más para obtener cortes con los ejes
-        matriz_total_A = np.vstack([self.A, [[1, 0], [0, 1]]])
-        vector_total_b = np.concatenate([self.b, [0, 0]])
-        num_lineas = len(vector_total_b)
-
-        # Por cada par de rectas: resolver sistema 2x2 → (x,y) del corte
-        for i in range(num_lineas):
-            for j in range(i + 1, num_lineas):
-                a_sistema = np.array([matriz_total_A[i], matriz_total_A[j]])
-                b_sistema = np.array([vector_total_b[i], vector_total_b[j]])
-                try:
-                    punto = np.linalg.solve(a_sistema, b_sistema)
-                    posibles_puntos.append(punto)
-                except np.linalg.LinAlgError:
-                    continue  # rectas paralelas, no hay corte único
-
-        return posibles_puntos
+        return self._cortes()[2]
 
     def es_factible(self, punto):
         """Indica si el punto cumple x≥0, y≥0 y todas las restricciones (<=, >=, =)."""
-        x, y = punto
-        if x < -1e-9 or y < -1e-9:
-            return False
-        for i in range(len(self.b)):
-            valor = np.dot(self.A[i], punto)
-            limite = self.b[i]
-            op = self.operadores[i]
-            if op == '<=' and valor > limite + 1e-9:
-                return False
-            if op == '>=' and valor < limite - 1e-9:
-                return False
-            if op == '=' and not np.isclose(valor, limite):
-                return False
-        return True
+        no_negativos, cumple, _ = self._verificar(np.atleast_2d(np.asarray(punto, dtype=float)))
+        return bool(no_negativos[0] and cumple[0].all())
+
+    @staticmethod
+    def _primeros_unicos(puntos):
+        """Índices (en orden) de la primera aparición de cada punto, redondeando a una grilla."""
+        if len(puntos) == 0:
+            return np.arange(0)
+        paso = GRILLA_VERTICES * max(1.0, float(np.abs(puntos).max()))
+        claves = np.round(puntos / paso)
+        _, primeros = np.unique(claves, axis=0, return_index=True)
+        return np.sort(primeros)
 
     def obtener_vertices_validos(self):
         """De todos los cortes entre rectas, deja solo los que son factibles y quita duplicados."""
-        todos_puntos = self.encontrar_intersecciones()
-        validos = [p for p in todos_puntos if self.es_factible(p)]
-        self.vertice = np.unique(np.array(validos), axis=0)
+        puntos = self.encontrar_intersecciones()
+        no_negativos, cumple, _ = self._verificar(puntos)
+        validos = puntos[no_negativos & cumple.all(axis=1)]
+        self.vertice = validos[self._primeros_unicos(validos)]
         return self.vertice
 
+    def _aplicar_presolve(self):
+        """Reduce las filas del problema. Devuelve un resultado si el presolve ya lo decide."""
+        presolve = Presolve(self.c, self.A, self.b, self.operadores, self.objetivo,
+                            convertir_singletons=False, eliminar_columnas=False)
+        presolve.reducir()
+        self.registrar_paso("PRESOLVE:")
+        for reduccion in presolve.reducciones:
+            self.registrar_paso(f"  {reduccion}")
+        if not presolve.reducciones:
+            self.registrar_paso("  Sin reducciones: se resuelve el problema tal cual.")
+        self.resumen_presolve = presolve.resumen()
+        if presolve.estado == 'infeasible':
+            return {
+                "status": "infeasible",
+                "tipo_solucion": "No Factible",
+                "explicacion": f"Las restricciones son contradictorias: {presolve.motivo}.",
+                "pasos": self.pasos,
+                "presolve": self.resumen_presolve
+            }
+        if presolve.reducciones and len(presolve.filas) > 0:
+            _, self.A, self.b, self.operadores, _, _ = presolve.problema_reducido()
+            self.etiquetas_filas = [f"R{i+1}" for i in presolve.filas]
+        return None
+
     def resolver(self):
         """
         Ejecuta el método gráfico completo:
@@ -92,175 +225,397 @@ class MetodoGrafico:
         2. Calcula intersecciones entre todas las rectas (restricciones + ejes).
         3. Filtra los puntos factibles (cumplen todo).
         4. Evalúa Z en cada vértice; el mejor (max o min) es la solución.
+        Los pasos 1 a 3 no dependen de Z: con cache=True se reutilizan si otra consulta ya
+        armó la región con las mismas restricciones.
         """
-        # Log: función objetivo
-        signo_y = '-' if self.c[1] < 0 else '+'
-        abs_y = abs(self.c[1])
-        self.registrar_paso(f"FUNCIÓN OBJETIVO: {self.objetivo.upper()} Z = {self.c[0]}x {signo_y} {abs_y}y")
-
-        self.registrar_paso("RESTRICCIONES:")
-        for idx, (a_row, b_val, op) in enumerate(zip(self.A, self.b, self.operadores), 1):
-            signo_y = '-' if a_row[1] < 0 else '+'
-            abs_y = abs(a_row[1])
-            self.registrar_paso(f"  R{idx}: {a_row[0]}x {signo_y} {abs_y}y {op} {b_val}")
-        
-        # Paso 1: intersecciones entre rectas (restricciones + ejes)
-        puntos_corte = []
-        matriz_total = np.vstack([self.A, [[1, 0], [0, 1]]])
-        vector_total = np.concatenate([self.b, [0, 0]])
-        
-        # Etiquetas para las líneas (restricciones + ejes)
-        etiquetas = [f"R{i+1}" for i in range(len(self.A))] + ["Eje Y (x=0)", "Eje X (y=0)"]
-        
-        self.registrar_paso("CÁLCULO DE INTERSECCIONES:")
-        num_lineas = len(vector_total)
-        intersecciones_info = []
-        
-        for i in range(num_lineas):
-            for j in range(i + 1, num_lineas):
-                try:
-                    A_temp = np.array([matriz_total[i], matriz_total[j]])
-                    b_temp = np.array([vector_total[i], vector_total[j]])
-                    punto = np.linalg.solve(A_temp, b_temp)
-                    puntos_corte.append(punto)
-                    
-                    # Mostrar el cálculo de la intersección con formato correcto
-                    signo1_y = '-' if matriz_total[i][1] < 0 else '+'
-                    abs1_y = abs(matriz_total[i][1])
-                    signo2_y = '-' if matriz_total[j][1] < 0 else '+'
-                    abs2_y = abs(matriz_total[j][1])
-                    eq1 = f"{matriz_total[i][0]}x {signo1_y} {abs1_y}y = {vector_total[i]}"
-                    eq2 = f"{matriz_total[j][0]}x {signo2_y} {abs2_y}y = {vector_total[j]}"
-                    self.registrar_paso(f"  {etiquetas[i]} ∩ {etiquetas[j]}:")
-                    self.registrar_paso(f"    Sistema: {eq1} y {eq2}")
-                    self.registrar_paso(f"    Solución: P({punto[0]:.2f}, {punto[1]:.2f})")
-                    
-                    intersecciones_info.append({
-                        "punto": [float(punto[0]), float(punto[1])],
-                        "lineas": [etiquetas[i], etiquetas[j]]
-                    })
-                except np.linalg.LinAlgError:
-                    continue
-
-        # Paso 2: de esos puntos, cuáles cumplen todas las restricciones (factibles)
-        self.registrar_paso("VERIFICACIÓN DE FACTIBILIDAD:")
-        validos = []
-        validos_info = []
-        
-        for info in intersecciones_info:
-            p = np.array(info["punto"])
-            es_valido = self.es_factible(p)
-            
-            # Mostrar verificación de cada restricción
-            self.registrar_paso(f"  Punto P({p[0]:.2f}, {p[1]:.2f}):")
-            factible = True
-            
-            # Verificar no negatividad
-            if p[0] < -1e-9 or p[1] < -1e-9:
-                self.registrar_paso(f"    ✗ No cumple: x ≥ 0, y ≥ 0")
-                factible = False
-            else:
-                self.registrar_paso(f"    ✓ Cumple: x ≥ 0, y ≥ 0")
-            
-            # Verificar cada restricción
-            for idx, (a_row, b_val, op) in enumerate(zip(self.A, self.b, self.operadores), 1):
-                valor = np.dot(a_row, p)
-                cumple = False
-                
-                if op == '<=' and valor <= b_val + 1e-9:
-                    cumple = True
-                elif op == '>=' and valor >= b_val - 1e-9:
-                    cumple = True
-                elif op == '=' and np.isclose(valor, b_val):
-                    cumple = True
-                
-                simbolo = "✓" if cumple else "✗"
-                signo_y = '-' if a_row[1] < 0 else '+'
-                abs_a1 = abs(a_row[1])
-                signo_calc = '-' if a_row[1]*p[1] < 0 else '+'
-                abs_calc = abs(a_row[1]*p[1])
-                self.registrar_paso(f"    {simbolo} R{idx}: {a_row[0]}·{p[0]:.2f} {signo_y} {abs_a1}·{p[1]:.2f} = {a_row[0]*p[0]:.2f} {signo_calc} {abs_calc} = {valor:.2f} {op} {b_val}")
-                
-                if not cumple:
-                    factible = False
-            
-            if factible:
-                self.registrar_paso(f"    → P({p[0]:.2f}, {p[1]:.2f}) es FACTIBLE")
-                validos.append(p)
-                validos_info.append(info)
+        self.registrar_objetivo()
+
+        clave = None
+        if self.cache:
+            clave = clave_restricciones(self.A, self.b, self.operadores, self.modo, self.presolve,
+                                        self.quitar_redundantes, self.detalle)
+        region = CACHE_REGIONES.obtener(clave) if clave is not None else None
+        if region is None:
+            inicio = len(self.pasos)
+            region = self._armar_region()
+            region["pasos"] = self.pasos[inicio:]
+            if clave is not None:
+                CACHE_REGIONES.guardar(clave, region)
+        else:
+            self.pasos.extend(region["pasos"])
+            self.registrar_paso("REGIÓN FACTIBLE: la misma de una consulta anterior (solo cambió Z), se reutiliza.")
+        return self.evaluar_region(region)
+
+    def registrar_objetivo(self):
+        """Primer paso del log: la función objetivo."""
+        if self.con_pasos:
+            signo_y = '-' if self.c[1] < 0 else '+'
+            abs_y = abs(self.c[1])
+            self.registrar_paso(f"FUNCIÓN OBJETIVO: {self.objetivo.upper()} Z = {self.c[0]}x {signo_y} {abs_y}y")
+
+    def evaluar_region(self, region):
+        """
+        Paso 4 sobre una región ya armada: la de _armar_region, la de la caché o la de una
+        sesión (ver sesion_grafica), con sus pasos ya en el log. "vertices" None sin
+        "resultado" es una región vacía.
+        """
+        # La entrada de la caché no se toca: el resultado lleva copias
+        resumen = region["presolve"]
+        self.resumen_presolve = None if resumen is None else {**resumen, "reducciones": list(resumen["reducciones"])}
+        if region["resultado"] is not None:
+            return {**region["resultado"], "pasos": self.pasos, "presolve": self.resumen_presolve}
+        if region["vertices"] is None:
+            return self._resultado_infactible()
+        self.vertices = region["vertices"]
+        self.grafica = _copiar_grafica(region["grafica"])
+        self.rangos_optimalidad = self._rangos_optimalidad(region["conos"])
+        if self.modo == 'semiplanos':
+            resultado = self._evaluar_semiplanos(region["vertices_caja"])
+        else:
+            resultado = self._evaluar_vertices()
+        if self.enteros and resultado["status"] == "optimal":
+            resultado["entero"] = self._solucion_entera()
+        return resultado
+
+    def _armar_region(self):
+        """
+        Pasos 1 a 3 (presolve, restricciones, vértices y datos de la gráfica): lo que no
+        depende de Z. Devuelve la entrada para la caché; "resultado" trae el resultado si la
+        región es vacía.
+        """
+        region = {"resultado": None, "vertices": None, "vertices_caja": None, "grafica": None, "conos": None}
+        if self.presolve:
+            region["resultado"] = self._aplicar_presolve()
+        if region["resultado"] is None:
+            if self.con_pasos:
+                self.registrar_paso("RESTRICCIONES:")
+                for etiqueta, a_row, b_val, op in zip(self.etiquetas_filas, self.A, self.b, self.operadores):
+                    signo_y = '-' if a_row[1] < 0 else '+'
+                    abs_y = abs(a_row[1])
+                    self.registrar_paso(f"  {etiqueta}: {a_row[0]}x {signo_y} {abs_y}y {op} {b_val}")
+            if self.modo == 'semiplanos':
+                region["resultado"] = self._region_semiplanos()
             else:
-                self.registrar_paso(f"    → P({p[0]:.2f}, {p[1]:.2f}) NO es factible")
-        
-        if not validos:
+                region["resultado"] = self._region_vertices()
+        if region["resultado"] is None:
+            region["vertices"], region["vertices_caja"] = self.vertices, self.vertices_caja
+            region["grafica"] = self._datos_grafica()
+            region["conos"] = self._conos_optimalidad()
+        else:
+            # pasos y presolve los pone cada consulta
+            region["resultado"] = {k: v for k, v in region["resultado"].items() if k not in ("pasos", "presolve")}
+        region["presolve"] = self.resumen_presolve
+        return region
+
+    def _region_vertices(self):
+        """Modo 'vertices': cortes de todos los pares y su verificación. None si hay región."""
+        if self.quitar_redundantes:
+            self._quitar_redundantes()
+
+        # Paso 1: intersecciones entre rectas (restricciones + ejes), todos los pares a la vez
+        matriz_total, vector_total = self._rectas()
+        pares_i, pares_j, puntos_corte = self._cortes()
+
+        # Etiquetas para las líneas (restricciones + ejes)
+        etiquetas = self.etiquetas_filas + ["Eje Y (x=0)", "Eje X (y=0)"]
+
+        if self.paso_a_paso:
+            self.registrar_paso("CÁLCULO DE INTERSECCIONES:")
+            for i, j, punto in zip(pares_i, pares_j, puntos_corte):
+                # Mostrar el cálculo de la intersección con formato correcto
+                signo1_y = '-' if matriz_total[i][1] < 0 else '+'
+                abs1_y = abs(matriz_total[i][1])
+                signo2_y = '-' if matriz_total[j][1] < 0 else '+'
+                abs2_y = abs(matriz_total[j][1])
+                eq1 = f"{matriz_total[i][0]}x {signo1_y} {abs1_y}y = {vector_total[i]}"
+                eq2 = f"{matriz_total[j][0]}x {signo2_y} {abs2_y}y = {vector_total[j]}"
+                self.registrar_paso(f"  {etiquetas[i]} ∩ {etiquetas[j]}:")
+                self.registrar_paso(f"    Sistema: {eq1} y {eq2}")
+                self.registrar_paso(f"    Solución: P({punto[0]:.2f}, {punto[1]:.2f})")
+
+        # Paso 2: de esos puntos, cuáles cumplen todas las restricciones (factibles), con un solo A @ P
+        no_negativos, cumple, valores = self._verificar(puntos_corte)
+        factibles = no_negativos & cumple.all(axis=1)
+
+        if self.paso_a_paso:
+            self.registrar_paso("VERIFICACIÓN DE FACTIBILIDAD:")
+            for k, p in enumerate(puntos_corte):
+                # Mostrar verificación de cada restricción
+                self.registrar_paso(f"  Punto P({p[0]:.2f}, {p[1]:.2f}):")
+                if no_negativos[k]:
+                    self.registrar_paso(f"    ✓ Cumple: x ≥ 0, y ≥ 0")
+                else:
+                    self.registrar_paso(f"    ✗ No cumple: x ≥ 0, y ≥ 0")
+                for etiqueta, a_row, b_val, op, valor, ok in zip(self.etiquetas_filas, self.A, self.b,
+                                                                 self.operadores, valores[k], cumple[k]):
+                    simbolo = "✓" if ok else "✗"
+                    signo_y = '-' if a_row[1] < 0 else '+'
+                    abs_a1 = abs(a_row[1])
+                    signo_calc = '-' if a_row[1]*p[1] < 0 else '+'
+                    abs_calc = abs(a_row[1]*p[1])
+                    self.registrar_paso(f"    {simbolo} {etiqueta}: {a_row[0]}·{p[0]:.2f} {signo_y} {abs_a1}·{p[1]:.2f} = {a_row[0]*p[0]:.2f} {signo_calc} {abs_calc} = {valor:.2f} {op} {b_val}")
+                if factibles[k]:
+                    self.registrar_paso(f"    → P({p[0]:.2f}, {p[1]:.2f}) es FACTIBLE")
+                else:
+                    self.registrar_paso(f"    → P({p[0]:.2f}, {p[1]:.2f}) NO es factible")
+
+        validos = puntos_corte[factibles]
+        if not len(validos):
             # Si ningún punto de corte es factible, las restricciones no tienen región común
-            self.registrar_paso("RESULTADO: No existe ningún punto que cumpla todas las restricciones.")
+            return self._resultado_infactible()
+
+        # Quito vértices repetidos (a veces dos intersecciones dan casi el mismo punto por float)
+        self.vertices = validos[self._primeros_unicos(validos)]
+        self.vertices_caja = np.empty((0, 2))
+        return None
+
+    def _quitar_redundantes(self):
+        """
+        Deja solo las filas del borde de la región (O(m log m)); las demás no cambian ni la
+        región ni sus vértices. Con región vacía no se quita nada: la verificación lo muestra.
+        """
+        borde = filas_del_borde(self.A, self.b, self.operadores)
+        if borde is None or len(borde) == len(self.b):
+            return
+        quedan = np.zeros(len(self.b), dtype=bool)
+        quedan[borde] = True
+        self.registrar_paso("RESTRICCIONES REDUNDANTES:")
+        for etiqueta in np.array(self.etiquetas_filas, dtype=object)[~quedan]:
+            self.registrar_paso(f"  {etiqueta}: redundante (no toca el borde de la región factible), se quita")
+        self.A, self.b = self.A.reshape(-1, 2)[quedan], self.b.ravel()[quedan]
+        self.operadores = [op for op, q in zip(self.operadores, quedan) if q]
+        self.etiquetas_filas = [e for e, q in zip(self.etiquetas_filas, quedan) if q]
+
+    def _resultado_infactible(self):
+        self.registrar_paso("RESULTADO: No existe ningún punto que cumpla todas las restricciones.")
+        return {
+            "status": "infeasible",
+            "tipo_solucion": "No Factible",
+            "explicacion": "Las restricciones son contradictorias. No existe una región común entre ellas.",
+            "pasos": self.pasos,
+            "presolve": self.resumen_presolve
+        }
+
+    def _nombre_recta(self, indice):
+        """Índice de recta de semiplanos (fila de A o eje) → etiqueta para el log."""
+        if indice == EJE_Y:
+            return "Eje Y (x=0)"
+        if indice == EJE_X:
+            return "Eje X (y=0)"
+        return self.etiquetas_filas[indice]
+
+    def _region_semiplanos(self):
+        """
+        Región como intersección de semiplanos (ver semiplanos): los vértices ya vienen en
+        orden antihorario. Los de la caja lejana quedan aparte (vertices_caja). None si hay región.
+        """
+        self.registrar_paso("INTERSECCIÓN DE SEMIPLANOS:")
+        region = region_factible(self.A, self.b, self.operadores)
+        if region is None:
+            return self._resultado_infactible()
+        self.poligono_caja = region
+        self.vertices, lineas_reales, self.vertices_caja = sin_caja(*region)
+
+        if self.con_pasos:
+            self.registrar_paso(f"  Región factible: {len(self.vertices)} vértice(s) en orden antihorario"
+                                f"{' (región no acotada)' if len(self.vertices_caja) else ''}")
+        if self.paso_a_paso:
+            for v, (l1, l2) in zip(self.vertices, lineas_reales):
+                self.registrar_paso(f"  P({v[0]:.2f}, {v[1]:.2f}): {self._nombre_recta(l1)} ∩ {self._nombre_recta(l2)}")
+        return None
+
+    def _evaluar_semiplanos(self, vertices_caja):
+        """
+        Si la región sigue más allá de la caja y Z mejora hacia allá, el problema es no
+        acotado; si Z empata allá, el óptimo sigue por todo un borde infinito.
+        """
+        rayo_optimo = False
+        if len(vertices_caja):
+            # Vértices de la caja: puntos muy lejanos de los bordes infinitos
+            signo = 1.0 if self.objetivo == 'max' else -1.0
+            z_caja = signo * (vertices_caja @ self.c)
+            z_real = signo * (self.vertices @ self.c) if len(self.vertices) else np.array([-np.inf])
+            mejora = z_caja.max() - z_real.max()
+            if mejora > 1e-6 * (1.0 + abs(z_real.max())):
+                self.registrar_paso("RESULTADO: Z mejora sin límite a lo largo de un borde infinito de la región.")
+                return {
+                    "status": "unbounded",
+                    "tipo_solucion": "No Acotada",
+                    "explicacion": ("La región factible no está acotada y la función objetivo mejora sin límite "
+                                    "en esa dirección: no hay un valor óptimo finito."),
+                    "vertices": [[float(x), float(y)] for x, y in self.vertices],
+                    "grafica": self.grafica,
+                    "rangos_optimalidad": self.rangos_optimalidad,
+                    "pasos": self.pasos,
+                    "presolve": self.resumen_presolve
+                }
+            rayo_optimo = mejora >= -1e-6 * (1.0 + abs(z_real.max()))
+        return self._evaluar_vertices(rayo_optimo)
+
+    def _conos_optimalidad(self):
+        """
+        (vertices, desde, hasta): para cada vértice real del polígono (orden antihorario), el
+        rango de ángulos de c en el que maximiza Z (ver semiplanos.conos_normales). Se calcula
+        con la caja lejana: las direcciones que no caen en ningún rango son las de los vértices
+        de la caja, o sea, las que hacen a Z no acotada. No depende de Z: va en la caché.
+        """
+        region = self.poligono_caja if self.modo == 'semiplanos' else region_factible(self.A, self.b, self.operadores)
+        if region is None:
+            # Solo por tolerancias (la enumeración encontró vértices y el barrido no): sin rangos
+            return np.empty((0, 2)), np.empty(0), np.empty(0)
+        vertices, lineas = region
+        desde, hasta = conos_normales(vertices)
+        reales = ~en_caja(lineas)
+        return vertices[reales], desde[reales], hasta[reales]
+
+    def _rangos_optimalidad(self, conos):
+        """
+        "rangos_optimalidad" del resultado: por vértice, el punto y el intervalo [desde, hasta]
+        (radianes, desde en [-π, π)) del ángulo atan2(c_y, c_x) en el que es óptimo para este
+        objetivo (al minimizar, el de -c). En un extremo compartido con el vecino hay empate.
+        """
+        vertices, desde, hasta = conos
+        if self.objetivo != 'max':
+            desde, hasta = desde + np.pi, hasta + np.pi
+        inicio = np.mod(desde + np.pi, 2 * np.pi) - np.pi
+        fin = inicio + (hasta - desde)
+        return [{"punto": [float(v[0]), float(v[1])], "desde": float(a), "hasta": float(h)}
+                for v, a, h in zip(vertices, inicio, fin)]
+
+    def _datos_grafica(self):
+        """
+        Datos para dibujar sin cálculos en el navegador. "caja": [xmin, xmax, ymin, ymax]
+        (hasta 1.5 veces la mayor coordenada de los vértices, o 10); "poligono": la región
+        recortada a la caja, ordenada y cerrada (x e y por separado); "segmentos": el tramo
+        visible de cada restricción de entrada ({"x": [x1, x2], "y": [y1, y2]} o None).
+        """
+        caja = caja_vista(self.vertices)
+        rango = caja[1]
+        region = region_factible(np.vstack([self.A.reshape(-1, 2), [[1, 0], [0, 1]]]),
+                                 np.concatenate([self.b.ravel(), [rango, rango]]),
+                                 list(self.operadores) + ['<=', '<='])
+        poligono = region[0] if region is not None else self.vertices
+        return armar_grafica(caja, poligono, self.A_entrada, self.b_entrada)
+
+    def _solucion_entera(self):
+        """
+        "entero" del resultado: el barrido por columnas sobre el polígono de la gráfica. Si la
+        región no está acotada, el polígono llega hasta el borde de la vista y solo se cuentan
+        los puntos enteros que se ven.
+        """
+        caja = self.grafica["caja"]
+        poligono = np.column_stack([self.grafica["poligono"]["x"], self.grafica["poligono"]["y"]])
+        acotada = bool(poligono.max(initial=0.0) < caja[1] - TOL * max(1.0, caja[1]))
+        barrido = barrido_enteros(poligono, self.c, self.objetivo)
+        self.registrar_paso("SOLUCIÓN ENTERA (barrido por columnas):")
+        if barrido is None:
+            self.registrar_paso(f"  La región tiene más de {LIMITE_COLUMNAS} columnas enteras: no se barre.")
+            return {
+                "status": "error",
+                "tipo_solucion": "Región Demasiado Ancha",
+                "explicacion": (f"La región es demasiado ancha para contar sus puntos enteros "
+                                f"(más de {LIMITE_COLUMNAS} columnas en cada eje)."),
+            }
+        eje, otro = barrido["eje"], 'y' if barrido["eje"] == 'x' else 'x'
+        columnas = list(zip(barrido["valores"], barrido["desde"], barrido["hasta"]))
+        if self.con_pasos:
+            self.registrar_paso(f"  Se barre por {eje} entera: {len(columnas)} columna(s) con puntos, "
+                                f"{barrido['total']} punto(s) entero(s)"
+                                f"{'' if acotada else ' dentro de la vista (región no acotada)'}")
+        if self.paso_a_paso:
+            for valor, desde, hasta in columnas[:COLUMNAS_EN_LOG]:
+                self.registrar_paso(f"  {eje} = {valor}: {otro} de {desde} a {hasta} ({hasta - desde + 1} punto(s))")
+            if len(columnas) > COLUMNAS_EN_LOG:
+                self.registrar_paso(f"  ... ({len(columnas) - COLUMNAS_EN_LOG} columna(s) más)")
+        entero = {
+            "columnas": {"eje": eje, "valores": barrido["valores"], "desde": barrido["desde"],
+                         "hasta": barrido["hasta"]},
+            "total_puntos": barrido["total"],
+            "puntos": barrido["puntos"],
+            "acotada": acotada,
+        }
+        if barrido["punto"] is None:
+            self.registrar_paso("  La región no contiene puntos con x e y enteras.")
             return {
                 "status": "infeasible",
-                "tipo_solucion": "No Factible",
-                "explicacion": "Las restricciones son contradictorias. No existe una región común entre ellas.",
-                "pasos": self.pasos
+                "tipo_solucion": "Sin Solución Entera",
+                "explicacion": ("La región factible no contiene ningún punto con coordenadas enteras"
+                                f"{'' if acotada else ' dentro de la vista'}."),
+                **entero
             }
+        punto, z = barrido["punto"], barrido["z"]
+        empates = barrido["empates"]
+        if self.con_pasos:
+            self.registrar_paso(f"  Mejor punto entero: ({punto[0]}, {punto[1]}) con Z = {z:.2f}"
+                                f"{f' ({empates} puntos empatan)' if empates > 1 else ''}")
+        explicacion = (f"El mejor punto con coordenadas enteras es ({punto[0]}, {punto[1]}) con Z={z:.2f}, "
+                       f"entre {barrido['total']} punto(s) entero(s) de la región.")
+        if empates > 1:
+            explicacion += f" Otros {empates - 1} punto(s) entero(s) dan el mismo Z."
+        if not acotada:
+            explicacion += " La región no está acotada: solo se miraron los puntos dentro de la vista."
+        return {
+            "status": "optimal",
+            "tipo_solucion": "Solución Entera Múltiple" if empates > 1 else "Solución Entera Única",
+            "explicacion": explicacion,
+            "punto_optimo": punto,
+            "z_optimo": z,
+            "empates": empates,
+            **entero
+        }
 
-        # Quito vértices repetidos (a veces dos intersecciones dan casi el mismo punto por float)
-        vertices_array = np.array(validos)
-        vertices_unicos = []
-        tolerancia = 1e-9
-
-        for vertice in vertices_array:
-            es_duplicado = False
-            for v_unico in vertices_unicos:
-                if np.allclose(vertice, v_unico, atol=tolerancia):
-                    es_duplicado = True
-                    break
-            if not es_duplicado:
-                vertices_unicos.append(vertice)
-        
-        self.vertices = np.array(vertices_unicos)
-
+    def _evaluar_vertices(self, rayo_optimo=False):
+        """Paso 3 y clasificación; rayo_optimo: el mejor Z también se alcanza en un borde infinito."""
         # Paso 3: evaluar Z en cada vértice; el mejor (max o min) es el óptimo
-        self.registrar_paso("EVALUACIÓN DE VÉRTICES EN LA FUNCIÓN OBJETIVO:")
-        signo_y = '-' if self.c[1] < 0 else '+'
-        abs_y = abs(self.c[1])
-        self.registrar_paso(f"  Z = {self.c[0]}x {signo_y} {abs_y}y")
-        
-        resultados_vertices = []
-        
-        # Calculamos Z para todos primero
-        for v in self.vertices:
-            z = np.dot(self.c, v)
+        if self.con_pasos:
+            self.registrar_paso("EVALUACIÓN DE VÉRTICES EN LA FUNCIÓN OBJETIVO:")
             signo_y = '-' if self.c[1] < 0 else '+'
-            abs_c1 = abs(self.c[1])
-            signo_calc = '-' if self.c[1]*v[1] < 0 else '+'
-            abs_calc = abs(self.c[1]*v[1])
-            calculo = f"{self.c[0]}·{v[0]:.2f} {signo_y} {abs_c1}·{v[1]:.2f} = {self.c[0]*v[0]:.2f} {signo_calc} {abs_calc} = {z:.2f}"
-            self.registrar_paso(f"  Vértice ({v[0]:.2f}, {v[1]:.2f}):")
-            self.registrar_paso(f"    Z = {calculo}")
-            
-            resultados_vertices.append({
-                "punto": [float(v[0]), float(v[1])],
-                "z": float(z)
-            })
+            abs_y = abs(self.c[1])
+            self.registrar_paso(f"  Z = {self.c[0]}x {signo_y} {abs_y}y")
+        
+        # Calculamos Z para todos primero (un solo producto)
+        valores_z = self.vertices @ self.c
+        if self.paso_a_paso:
+            for v, z in zip(self.vertices, valores_z):
+                signo_y = '-' if self.c[1] < 0 else '+'
+                abs_c1 = abs(self.c[1])
+                signo_calc = '-' if self.c[1]*v[1] < 0 else '+'
+                abs_calc = abs(self.c[1]*v[1])
+                calculo = f"{self.c[0]}·{v[0]:.2f} {signo_y} {abs_c1}·{v[1]:.2f} = {self.c[0]*v[0]:.2f} {signo_calc} {abs_calc} = {z:.2f}"
+                self.registrar_paso(f"  Vértice ({v[0]:.2f}, {v[1]:.2f}):")
+                self.registrar_paso(f"    Z = {calculo}")
+
+        resultados_vertices = [{"punto": [float(v[0]), float(v[1])], "z": float(z)}
+                               for v, z in zip(self.vertices, valores_z)]
 
         # El óptimo es el mayor Z si maximizamos, o el menor si minimizamos
-        valores_z = [r['z'] for r in resultados_vertices]
-        mejor_z = max(valores_z) if self.objetivo == 'max' else min(valores_z)
+        mejor_z = float(valores_z.max() if self.objetivo == 'max' else valores_z.min())
 
-        self.registrar_paso(f"  Valores de Z obtenidos: {[f'{z:.2f}' for z in valores_z]}")
-        self.registrar_paso(f"  Objetivo: {self.objetivo.upper()}")
-        self.registrar_paso(f"  Mejor Z: {mejor_z:.2f}")
+        if self.con_pasos:
+            self.registrar_paso(f"  Valores de Z obtenidos: {[f'{z:.2f}' for z in valores_z]}")
+            self.registrar_paso(f"  Objetivo: {self.objetivo.upper()}")
+            self.registrar_paso(f"  Mejor Z: {mejor_z:.2f}")
 
         # Puede haber varios vértices con el mismo Z óptimo (solución múltiple); los identifico con tolerancia
-        ganadores = [r for r in resultados_vertices if np.isclose(r['z'], mejor_z)]
+        ganadores = [resultados_vertices[k] for k in np.flatnonzero(np.isclose(valores_z, mejor_z))]
 
-        self.registrar_paso(f"  Vértices óptimos: {len(ganadores)}")
-        for g in ganadores:
-            self.registrar_paso(f"    → ({g['punto'][0]:.2f}, {g['punto'][1]:.2f}) con Z = {g['z']:.2f}")
+        if self.con_pasos:
+            self.registrar_paso(f"  Vértices óptimos: {len(ganadores)}")
+            for g in ganadores:
+                self.registrar_paso(f"    → ({g['punto'][0]:.2f}, {g['punto'][1]:.2f}) con Z = {g['z']:.2f}")
 
         # Decido si es solución única, múltiple, etc. para el mensaje final
         tipo_solucion = ""
         explicacion = ""
         
-        if len(ganadores) == 1:
+        if rayo_optimo:
+            tipo_solucion = "Solución Múltiple (Infinitas Soluciones)"
+            explicacion = (f"El valor óptimo Z={mejor_z:.2f} se alcanza en un borde no acotado de la región: "
+                           f"la función objetivo es PARALELA a esa restricción y cualquier punto de la semirrecta "
+                           f"que sale de ({ganadores[0]['punto'][0]}, {ganadores[0]['punto'][1]}) es una solución válida.")
+            punto_final = ganadores[0]['punto']
+
+        elif len(ganadores) == 1:
             tipo_solucion = "Solución Única"
             explicacion = (f"Existe un único vértice ({ganadores[0]['punto'][0]}, {ganadores[0]['punto'][1]}) "
                            f"que maximiza/minimiza la función. Esto ocurre porque la pendiente de la función objetivo "
@@ -282,5 +637,8 @@ class MetodoGrafico:
             "punto_optimo": punto_final, # Uno de los puntos para centrar la gráfica
             "vertices": [r['punto'] for r in resultados_vertices],
             "puntos_ganadores": [g['punto'] for g in ganadores], # Enviamos todos los ganadores
-            "pasos": self.pasos
+            "grafica": self.grafica,
+            "rangos_optimalidad": self.rangos_optimalidad,
+            "pasos": self.pasos,
+            "presolve": self.resumen_presolve
         }
@@ -0,0 +1,202 @@
+"""
+Método Gráfico para Programación Lineal con 3 variables (x, y, z).
+
+Es la misma idea que con 2 variables: la región factible ahora es un poliedro, el óptimo
+está en alguno de sus vértices y se evalúa Z en cada uno. Lo caro es encontrar los vértices:
+en vez de probar todas las ternas de planos contra todas las restricciones, el poliedro se
+arma por doble descripción (ver poliedros), cortando un cubo con una restricción a la vez.
+Con pocas restricciones se resuelven todas las ternas de una vez (vectorizado).
+
+Como el modo 'semiplanos' del gráfico, la región se cierra con una caja lejana: si Z mejora
+en un vértice de la caja el problema es no acotado, y si empata el óptimo sigue por un borde
+infinito.
+
+El resultado trae "grafica" lista para un mesh3d de Plotly: el recuadro de la vista, los
+vértices del poliedro recortado a él, los triángulos (i, j, k) y las caras con su plano.
+"""
+
+import numpy as np
+
+from detalle import validar_detalle
+from metodo_grafico import caja_vista
+from poliedros import (METODOS, PLANO_X, PLANO_Y, PLANO_Z, caras, elegir_metodo, en_caja, poliedro_factible,
+                       triangulos)
+
+NOMBRES_METODOS = {'doble_descripcion': "doble descripción", 'ternas': "todas las ternas de planos a la vez"}
+
+
+class MetodoGrafico3D:
+    def __init__(self, c, A, b, operadores, objetivo='max', detalle='full', enumeracion='auto'):
+        """
+        Guarda el problema: coeficientes de Z (c, 3 valores), restricciones (A con 3 columnas,
+        b, operadores) y si es max o min. x, y, z ≥ 0 van siempre.
+        detalle: 'full' (cada vértice con sus planos), 'summary' o 'none' (ver detalle).
+        enumeracion: 'doble_descripcion', 'ternas' o 'auto' (ternas si hay pocos planos).
+        """
+        if enumeracion not in METODOS:
+            raise ValueError(f"enumeracion debe ser uno de {', '.join(METODOS)} (se recibió {enumeracion!r})")
+        self.c = np.array(c, dtype=float).ravel()
+        self.A = np.array(A, dtype=float).reshape(-1, 3)
+        self.b = np.array(b, dtype=float).ravel()
+        if len(self.c) != 3:
+            raise ValueError(f"El método gráfico 3D necesita 3 coeficientes en Z (se recibieron {len(self.c)})")
+        self.objetivo = objetivo
+        self.operadores = list(operadores)
+        self.enumeracion = elegir_metodo(self.operadores) if enumeracion == 'auto' else enumeracion
+        self.etiquetas_filas = [f"R{i+1}" for i in range(len(self.b))]
+        self.pasos = []
+        self.detalle = validar_detalle(detalle)
+        self.con_pasos = self.detalle != 'none'
+        self.paso_a_paso = self.detalle == 'full'
+
+    def registrar_paso(self, mensaje):
+        if self.con_pasos:
+            self.pasos.append(mensaje)
+
+    @staticmethod
+    def _expresion(coefs):
+        """'a·x + b·y - c·z' como en el log del gráfico."""
+        texto = f"{coefs[0]}x"
+        for coef, var in zip(coefs[1:], "yz"):
+            texto += f" {'-' if coef < 0 else '+'} {abs(coef)}{var}"
+        return texto
+
+    def _nombre_plano(self, ident):
+        """Id de plano de poliedros (fila de A o eje) → etiqueta para el log y la gráfica."""
+        ejes = {PLANO_X: "Plano x=0", PLANO_Y: "Plano y=0", PLANO_Z: "Plano z=0"}
+        if ident in ejes:
+            return ejes[ident]
+        if 0 <= ident < len(self.etiquetas_filas):
+            return self.etiquetas_filas[ident]
+        return "Borde de la vista"
+
+    def resolver(self):
+        """
+        1. Registra objetivo y restricciones en el log.
+        2. Arma el poliedro (vértices e incidencia) con la caja lejana.
+        3. Evalúa Z en cada vértice real; revisa los de la caja para detectar no acotado.
+        """
+        if self.con_pasos:
+            self.registrar_paso(f"FUNCIÓN OBJETIVO: {self.objetivo.upper()} Z = {self._expresion(self.c)}")
+            self.registrar_paso("RESTRICCIONES:")
+            for etiqueta, a_row, b_val, op in zip(self.etiquetas_filas, self.A, self.b, self.operadores):
+                self.registrar_paso(f"  {etiqueta}: {self._expresion(a_row)} {op} {b_val}")
+
+        self.registrar_paso(f"ENUMERACIÓN DE VÉRTICES ({NOMBRES_METODOS[self.enumeracion]}):")
+        poliedro = poliedro_factible(self.A, self.b, self.operadores, metodo=self.enumeracion)
+        if poliedro is None:
+            self.registrar_paso("RESULTADO: No existe ningún punto que cumpla todas las restricciones.")
+            return {
+                "status": "infeasible",
+                "tipo_solucion": "No Factible",
+                "explicacion": "Las restricciones son contradictorias. No existe una región común entre ellas.",
+                "pasos": self.pasos
+            }
+        vertices, incidencia, ids, _ = poliedro
+        caja = en_caja(incidencia, ids)
+        self.vertices, self.vertices_caja = vertices[~caja], vertices[caja]
+        if self.con_pasos:
+            self.registrar_paso(f"  Región factible: {len(self.vertices)} vértice(s)"
+                                f"{' (región no acotada)' if caja.any() else ''}")
+            # Una fila que no pasa por ningún vértice no limita el poliedro
+            tocan = set(ids[incidencia.any(axis=0)].tolist())
+            for fila, etiqueta in enumerate(self.etiquetas_filas):
+                if fila not in tocan:
+                    self.registrar_paso(f"  {etiqueta}: redundante (no toca el borde de la región factible)")
+        if self.paso_a_paso:
+            for v, planos in zip(self.vertices, incidencia[~caja]):
+                nombres = " ∩ ".join(self._nombre_plano(int(p)) for p in ids[planos])
+                self.registrar_paso(f"  P({v[0]:.2f}, {v[1]:.2f}, {v[2]:.2f}): {nombres}")
+        self.grafica = self._datos_grafica()
+        return self._evaluar()
+
+    def _datos_grafica(self):
+        """
+        "caja": [xmin, xmax, ymin, ymax, zmin, zmax] (hasta 1.5 veces la mayor coordenada de
+        los vértices, o 10); "malla": el poliedro recortado a la caja como mesh3d de Plotly
+        (x, y, z de los vértices e i, j, k de los triángulos); "caras": por cara, su plano y sus
+        vértices (índices en la malla) en orden antihorario vistos desde afuera.
+        """
+        caja = caja_vista(self.vertices)
+        caja += caja[:2]
+        rango = caja[1]
+        # El poliedro con tres filas más (x, y, z ≤ rango): también una región no acotada se dibuja
+        recortado = poliedro_factible(np.vstack([self.A, np.eye(3)]), np.concatenate([self.b, [rango] * 3]),
+                                      self.operadores + ['<='] * 3, metodo=self.enumeracion)
+        if recortado is None:
+            # Solo por tolerancias: se dibujan los vértices sin caras
+            recortado = (self.vertices, np.zeros((len(self.vertices), 0), dtype=bool), np.empty(0, dtype=np.int64),
+                         np.empty((0, 3)))
+        vertices, incidencia, ids, normales = recortado
+        lista_caras = caras(vertices, incidencia, normales)
+        i, j, k = triangulos(lista_caras)
+        return {
+            "caja": caja,
+            "malla": {"x": vertices[:, 0].tolist(), "y": vertices[:, 1].tolist(), "z": vertices[:, 2].tolist(),
+                      "i": i, "j": j, "k": k},
+            "caras": [{"plano": self._nombre_plano(int(ids[col])), "vertices": indices.tolist()}
+                      for col, indices in lista_caras],
+        }
+
+    def _evaluar(self):
+        """Z en los vértices reales; si en la caja lejana Z es mejor, el problema es no acotado."""
+        signo = 1.0 if self.objetivo == 'max' else -1.0
+        valores_z = self.vertices @ self.c
+        mejor_z = float(valores_z.max() if self.objetivo == 'max' else valores_z.min())
+        puntos = [[float(x), float(y), float(z)] for x, y, z in self.vertices]
+        rayo_optimo = False
+        if len(self.vertices_caja):
+            mejora = float((signo * (self.vertices_caja @ self.c)).max()) - signo * mejor_z
+            if mejora > 1e-6 * (1.0 + abs(mejor_z)):
+                self.registrar_paso("RESULTADO: Z mejora sin límite a lo largo de un borde infinito de la región.")
+                return {
+                    "status": "unbounded",
+                    "tipo_solucion": "No Acotada",
+                    "explicacion": ("La región factible no está acotada y la función objetivo mejora sin límite "
+                                    "en esa dirección: no hay un valor óptimo finito."),
+                    "vertices": puntos,
+                    "grafica": self.grafica,
+                    "pasos": self.pasos
+                }
+            rayo_optimo = mejora >= -1e-6 * (1.0 + abs(mejor_z))
+
+        if self.con_pasos:
+            self.registrar_paso("EVALUACIÓN DE VÉRTICES EN LA FUNCIÓN OBJETIVO:")
+            self.registrar_paso(f"  Z = {self._expresion(self.c)}")
+        if self.paso_a_paso:
+            for v, z in zip(self.vertices, valores_z):
+                self.registrar_paso(f"  Vértice ({v[0]:.2f}, {v[1]:.2f}, {v[2]:.2f}): Z = {z:.2f}")
+        ganadores = [puntos[k] for k in np.flatnonzero(np.isclose(valores_z, mejor_z))]
+        if self.con_pasos:
+            self.registrar_paso(f"  Mejor Z ({self.objetivo.upper()}): {mejor_z:.2f}")
+            self.registrar_paso(f"  Vértices óptimos: {len(ganadores)}")
+            for g in ganadores:
+                self.registrar_paso(f"    → ({g[0]:.2f}, {g[1]:.2f}, {g[2]:.2f})")
+
+        if rayo_optimo:
+            tipo_solucion = "Solución Múltiple (Infinitas Soluciones)"
+            explicacion = (f"El valor óptimo Z={mejor_z:.2f} se alcanza en un borde no acotado de la región: "
+                           f"la función objetivo es PARALELA a esa cara y desde ({ganadores[0][0]}, "
+                           f"{ganadores[0][1]}, {ganadores[0][2]}) hay infinitas soluciones.")
+        elif len(ganadores) == 1:
+            tipo_solucion = "Solución Única"
+            explicacion = (f"Existe un único vértice ({ganadores[0][0]}, {ganadores[0][1]}, {ganadores[0][2]}) "
+                           f"que maximiza/minimiza la función.")
+        else:
+            tipo_solucion = "Solución Múltiple (Infinitas Soluciones)"
+            explicacion = (f"Se encontraron {len(ganadores)} vértices con el mismo valor óptimo Z={mejor_z:.2f}: "
+                           f"la función objetivo es PARALELA a una arista o cara de la región y cualquier punto "
+                           f"entre esos vértices es una solución válida.")
+        self.registrar_paso(f"RESULTADO: {tipo_solucion}")
+
+        return {
+            "status": "optimal",
+            "tipo_solucion": tipo_solucion,
+            "explicacion": explicacion,
+            "z_optimo": mejor_z,
+            "punto_optimo": ganadores[0],
+            "vertices": puntos,
+            "puntos_ganadores": ganadores,
+            "grafica": self.grafica,
+            "pasos": self.pasos
+        }
@@ -15,24 +15,93 @@ PASOS DEL ALGORITMO (resumen):
 
 import numpy as np
 
+from control_resolucion import ESTADOS_PARADA, ControlResolucion, resultado_interrumpido
+from degeneracion import ControlDegeneracion
+from detalle import validar_detalle
+from eventos_pasos import validar_formato_pasos, completar_pasos
+from escalado import escalar_metodo
+from limites import desplazar_limites_inferiores, normalizar_limites
+from matriz_dispersa import MatrizDispersa, preparar_matriz
+from nucleo_pivoteo import NucleoPivoteo
+from historial_tablas import HistorialTablas
+from presolve import presolve_metodo
+from reglas_precio import ContextoTabla, crear_regla_precio, limite_iteraciones
+from simplex_revisado import MODOS, SimplexRevisado, arranque_en_caliente
+
 
 class MetodoSimplex:
-    def __init__(self, c, A, b, operadores, objetivo='max'):
+    def __init__(self, c, A, b, operadores, objetivo='max', modo=None, precio='dantzig',
+                 degeneracion='lexicografico', umbral_bland=10, base_inicial=None, limites=None,
+                 presolve=True, escalado=True, detalle='full', retencion=None,
+                 formato_pasos='texto', max_iteraciones=None, limite_tiempo=None, cancelacion=None):
         """
         Recibo el problema: c (coef. de Z), A y b (restricciones), operadores por fila,
         y si queremos maximizar o minimizar. Todo lo guardo como arrays de numpy.
+        A puede ser densa, scipy.sparse o un triplete COO/CSR/CSC (ver matriz_dispersa).
+        modo: 'tabla' (tabla completa, paso a paso) o 'revisado' (Simplex Revisado con
+        base factorizada; mucho más rápido en problemas grandes, sin tablas intermedias).
+        Si no se indica, se usa 'revisado' cuando A es dispersa y 'tabla' en otro caso.
+        precio: regla para elegir la variable entrante ('dantzig', 'parcial', 'devex',
+        'steepest_edge'; ver reglas_precio).
+        degeneracion: 'lexicografico' (empates del ratio), 'perturbacion' (RHS + ε) o 'ninguno';
+        en todos, tras `umbral_bland` pivotes degenerados seguidos se usa Bland (ver degeneracion).
+        base_inicial: arranque en caliente desde una base conocida ('variables_basicas' de un
+        resultado anterior, o índices de columna de la forma estándar). Se resuelve con el
+        Simplex Revisado: primal si la base es factible, dual si es óptima en Z; si no sirve,
+        se arranca en frío.
+        limites: [inferior, superior] por variable (None = 0 / sin límite). Se manejan sin
+        agregar filas (ver limites); como el arranque en caliente, usan el modo revisado.
+        presolve: quitar filas vacías, duplicadas y redundantes, variables fijas y columnas
+        dominadas antes de resolver; la solución se devuelve en las variables originales
+        y el resultado trae "presolve" con lo que se quitó (ver presolve).
+        escalado: escalar filas y columnas de A (potencias de 2) si sus coeficientes tienen
+        un rango grande; la solución se desescala y el resultado trae "escalado" con el rango
+        de coeficientes antes y después (ver escalado).
+        detalle: 'full' (pasos de cada iteración y tablas), 'summary' (planteo y resultado) o
+        'none' (sin pasos ni tablas; solo z_optimo, solucion y el estado). Ver detalle.
+        retencion: qué tablas devolver con detalle='full': todas (None) o un dict con
+        'primeras' (N), 'ultimas' (N) y/o 'cada' (k). Ver historial_tablas.
+        formato_pasos: 'texto' (frases) o 'eventos' (código + números; los renderiza la
+        interfaz, respuesta mucho más chica). Ver eventos_pasos.
+        max_iteraciones / limite_tiempo (segundos) / cancelacion (TokenCancelacion): cortes
+        que se revisan antes de cada pivoteo; al cumplirse se devuelve la base actual con
+        status 'iteration_limit', 'time_limit' o 'cancelled'. Ver control_resolucion.
         """
+        if modo is not None and modo not in MODOS:
+            raise ValueError(f"modo debe ser uno de {', '.join(MODOS)} (se recibió {modo!r})")
         self.c = np.array(c, dtype=float)
-        self.A = np.array(A, dtype=float)
+        self.A, self.es_dispersa = preparar_matriz(A)
         self.b = np.array(b, dtype=float)
         self.operadores = operadores
         self.objetivo = objetivo
-        self.pasos = []   # log de texto para el usuario
-        self.tablas = []  # cada tabla del Simplex para mostrarla en la interfaz
+        if modo is None:
+            modo = 'revisado' if self.es_dispersa else 'tabla'
+        if modo == 'tabla' and self.es_dispersa:
+            # La tabla es densa por naturaleza (se llena al pivotear)
+            self.A, self.es_dispersa = self.A.toarray(), False
+        self.modo = modo
+        self.regla_precio = crear_regla_precio(precio)
+        self.degeneracion = degeneracion
+        self.umbral_bland = umbral_bland
+        self.base_inicial = base_inicial
+        self.base_en_superior = []   # no básicas de base_inicial en su límite superior (las marca el presolve)
+        self.presolve = presolve
+        self.escalado = escalado
+        self.inferiores = self.superiores = None
+        if limites is not None:
+            self.inferiores, self.superiores = normalizar_limites(limites, len(self.c))
+        self.detalle = validar_detalle(detalle)
+        self.formato_pasos = validar_formato_pasos(formato_pasos)
+        self.control = ControlResolucion(max_iteraciones, limite_tiempo, cancelacion)
+        self.con_pasos = self.detalle != 'none'     # ¿se guarda algún paso?
+        self.paso_a_paso = self.detalle == 'full'   # ¿detalle de cada iteración y tablas?
+        self.pasos = []   # log para el usuario: texto y eventos [código, ...] (ver eventos_pasos)
+        self.historial = HistorialTablas(retencion=retencion)  # tablas del Simplex para la interfaz (por repetición de pivoteos)
 
     def registrar_paso(self, mensaje):
-        """Añado una línea al log de pasos."""
-        self.pasos.append(mensaje)
+        """Añado una línea al log de pasos (nada con detalle='none')."""
+        if self.con_pasos:
+            self.pasos.append(mensaje)
 
     def _convertir_a_nativo(self, valor):
         """NumPy usa tipos que JSON no entiende (np.int64, np.float64, etc.). Convierto a int/float/list para poder serializar."""
@@ -59,35 +128,33 @@ class MetodoSimplex:
     def registrar_tabla(self, tabla, iteracion, variables_basicas=None, explicacion="",
                        nombres_columnas=None, col_entrante=None, fila_saliente=None,
                        elemento_pivote=None, ratios=None):
-        """Guardo una foto de la tabla en esta iteración (con variable entrante, saliente, pivote, ratios) para mostrarla después."""
-        # Paso todo a tipos nativos para que el front pueda serializar a JSON
-        tabla_lista = tabla.tolist()
-        tabla_nativa = self._convertir_a_nativo(tabla_lista)
-        
-        # Convertir ratios si existen
-        ratios_nativo = None
-        if ratios is not None:
-            ratios_nativo = []
-            for r in ratios:
-                if r == np.inf or r == float('inf') or (isinstance(r, (float, np.floating)) and np.isinf(r) and r > 0):
-                    ratios_nativo.append(None)  # Usar None para representar infinito en JSON
-                elif r == -np.inf or r == float('-inf') or (isinstance(r, (float, np.floating)) and np.isinf(r) and r < 0):
-                    ratios_nativo.append(None)  # Usar None para representar infinito negativo en JSON
-                else:
-                    ratios_nativo.append(self._convertir_a_nativo(r))
+        """
+        Registro la tabla de esta iteración (con variable entrante, saliente, pivote, ratios) para
+        mostrarla después. No se copia: si hubo pivoteo (col_entrante), `tabla` es la anterior
+        pivoteada en (fila_saliente + 1, col_entrante) y solo se anota eso; si no, es una tabla base.
+        """
+        if col_entrante is None:
+            self.historial.anclar(tabla)
+        else:
+            self.historial.pivotear(fila_saliente + 1, col_entrante, tabla)
         
-        self.tablas.append({
+        self.historial.registrar({
             "iteracion": int(iteracion),
-            "tabla": tabla_nativa,
+            "tabla": None,  # se reconstruye al serializar
             "variables_basicas": variables_basicas if variables_basicas else [],
             "explicacion": explicacion,
             "nombres_columnas": nombres_columnas if nombres_columnas else [],
             "col_entrante": int(col_entrante) if col_entrante is not None else None,
             "fila_saliente": int(fila_saliente) if fila_saliente is not None else None,
             "elemento_pivote": self._convertir_a_nativo(elemento_pivote) if elemento_pivote is not None else None,
-            "ratios": ratios_nativo if ratios_nativo is not None else []
+            # Copia del buffer del núcleo; pasa a lista (∞ → None) al serializar
+            "ratios": np.array(ratios, dtype=float) if ratios is not None else []
         })
     
+    def _tablas_serializadas(self):
+        """Tablas registradas, reconstruidas y pasadas a tipos nativos para el JSON."""
+        return self.historial.serializar(lambda arreglo: self._convertir_a_nativo(arreglo.tolist()))
+
     def convertir_forma_estandar(self):
         """
         Pasa el problema a forma estándar (todas restricciones en igualdad):
@@ -96,8 +163,9 @@ class MetodoSimplex:
         - =  : solo variable artificial.
         En Z: 0 para holgura/exceso, M (Big M) para artificiales.
         """
-        self.registrar_paso("CONVERSIÓN A FORMA ESTÁNDAR:")
-        self.registrar_paso(f"Problema original: {self.objetivo.upper()} Z = {' + '.join([f'{self.c[i]}x{i+1}' for i in range(len(self.c))])}")
+        if self.con_pasos:
+            self.registrar_paso("CONVERSIÓN A FORMA ESTÁNDAR:")
+            self.registrar_paso(f"Problema original: {self.objetivo.upper()} Z = {' + '.join([f'{self.c[i]}x{i+1}' for i in range(len(self.c))])}")
         
         num_vars = len(self.c)
         num_rest = len(self.b)
@@ -107,86 +175,293 @@ class MetodoSimplex:
         num_exceso = sum(1 for op in self.operadores if op == '>=')
         num_artificiales = sum(1 for op in self.operadores if op in ['>=', '='])
 
-        self.registrar_paso(f"Variables de holgura necesarias: {num_holgura}")
-        self.registrar_paso(f"Variables de exceso necesarias: {num_exceso}")
-        self.registrar_paso(f"Variables artificiales necesarias: {num_artificiales}")
+        if self.con_pasos:
+            self.registrar_paso(f"Variables de holgura necesarias: {num_holgura}")
+            self.registrar_paso(f"Variables de exceso necesarias: {num_exceso}")
+            self.registrar_paso(f"Variables artificiales necesarias: {num_artificiales}")
         
-        # Matriz A ampliada: columnas = x's + holguras + excesos + artificiales
-        A_estandar = np.zeros((num_rest, num_vars + num_holgura + num_exceso + num_artificiales))
-        col_actual = num_vars
+        # Matriz A ampliada: columnas = x's + holguras + excesos + artificiales.
+        # Las columnas auxiliares se anotan como (fila, valor) y al final se arma A_estandar
+        # (densa o dispersa según self.A) sin copiar ceros.
+        # (todas las filas de A tienen el mismo ancho, así que basta revisar la primera)
+        ancho = self.A.shape[1] if len(self.A.shape) == 2 else 0
+        if num_rest and ancho != num_vars:
+            raise ValueError(
+                f"La restricción 1 tiene {ancho} variables, "
+                f"pero la función objetivo tiene {num_vars} variables. "
+                f"Todas las restricciones deben tener el mismo número de variables que el objetivo."
+            )
+        filas_aux = []
+        valores_aux = []
         idx_holgura = 0
         idx_exceso = 0
         idx_artificial = 0
         
         for i in range(num_rest):
-            # Copiar coeficientes de las x's; luego añadir columna(s) según operador
-            if len(self.A[i]) != num_vars:
-                raise ValueError(
-                    f"La restricción {i+1} tiene {len(self.A[i])} variables, "
-                    f"pero la función objetivo tiene {num_vars} variables. "
-                    f"Todas las restricciones deben tener el mismo número de variables que el objetivo."
-                )
-            A_estandar[i, :num_vars] = self.A[i]
-            
+            # Añadir columna(s) según operador
             if self.operadores[i] == '<=':
-                A_estandar[i, col_actual] = 1   # holgura: ax + ... + s = b
-                self.registrar_paso(f"R{i+1}: Agregada variable de holgura s{idx_holgura+1}")
-                col_actual += 1
+                filas_aux.append(i)
+                valores_aux.append(1)    # holgura: ax + ... + s = b
+                if self.con_pasos:
+                    self.registrar_paso(f"R{i+1}: Agregada variable de holgura s{idx_holgura+1}")
                 idx_holgura += 1
             elif self.operadores[i] == '>=':
-                A_estandar[i, col_actual] = -1   # exceso: ax - e + a = b (luego la artificial)
-                self.registrar_paso(f"R{i+1}: Agregada variable de exceso e{idx_exceso+1}")
-                col_actual += 1
+                filas_aux.append(i)
+                valores_aux.append(-1)   # exceso: ax - e + a = b (luego la artificial)
+                if self.con_pasos:
+                    self.registrar_paso(f"R{i+1}: Agregada variable de exceso e{idx_exceso+1}")
                 idx_exceso += 1
-                A_estandar[i, col_actual] = 1     # artificial para tener columna con 1 y formar base
-                self.registrar_paso(f"R{i+1}: Agregada variable artificial a{idx_artificial+1}")
-                col_actual += 1
+                filas_aux.append(i)
+                valores_aux.append(1)    # artificial para tener columna con 1 y formar base
+                if self.con_pasos:
+                    self.registrar_paso(f"R{i+1}: Agregada variable artificial a{idx_artificial+1}")
                 idx_artificial += 1
             elif self.operadores[i] == '=':
-                A_estandar[i, col_actual] = 1      # solo artificial
-                self.registrar_paso(f"R{i+1}: Agregada variable artificial a{idx_artificial+1}")
-                col_actual += 1
+                filas_aux.append(i)
+                valores_aux.append(1)    # solo artificial
+                if self.con_pasos:
+                    self.registrar_paso(f"R{i+1}: Agregada variable artificial a{idx_artificial+1}")
                 idx_artificial += 1
 
-        # Z extendida: coef. originales en x's, 0 en holgura/exceso, M en artificiales (Big M)
+        if isinstance(self.A, MatrizDispersa):
+            A_estandar = self.A.agregar_columnas(filas_aux, valores_aux)
+        else:
+            A_estandar = np.zeros((num_rest, num_vars + num_holgura + num_exceso + num_artificiales))
+            A_estandar[:, :num_vars] = self.A.reshape(num_rest, num_vars)
+            A_estandar[filas_aux, num_vars + np.arange(len(filas_aux))] = valores_aux
+
+        # Z extendida: coef. originales en x's, 0 en holgura/exceso, M en artificiales (Big M).
+        # La penalización va contra el objetivo: -M si se maximiza, +M si se minimiza.
         c_estandar = np.zeros(num_vars + num_holgura + num_exceso + num_artificiales)
         c_estandar[:num_vars] = np.array(self.c)
         M = 10000   # Big M: penaliza artificiales para que salgan de la base
-        if num_artificiales > 0:
-            idx_art = num_vars + num_holgura + num_exceso
-            for i in range(num_artificiales):
-                c_estandar[idx_art + i] = M
+        _, _, indices_artificiales = self._columnas_estandar(num_vars)
+        c_estandar[indices_artificiales] = -M if self.objetivo == 'max' else M
         
         return A_estandar, c_estandar, num_vars, num_holgura, num_exceso, num_artificiales
+
+    def _columnas_estandar(self, num_vars):
+        """
+        convertir_forma_estandar crea las columnas auxiliares fila por fila (holgura; exceso +
+        artificial; artificial), así que recorro en el mismo orden. Devuelve los nombres de
+        todas las columnas, la base inicial (una columna por fila) y las artificiales.
+        """
+        indices_basicas = []
+        indices_artificiales = []
+        nombres_columnas = [f"x{i+1}" for i in range(num_vars)]
+        col_actual = num_vars
+        num_holgura = num_exceso = 0   # contadores: nombres en O(m)
+        for op in self.operadores:
+            if op == '<=':
+                indices_basicas.append(col_actual)
+                num_holgura += 1
+                nombres_columnas.append(f"s{num_holgura}")
+                col_actual += 1
+            elif op == '>=':
+                num_exceso += 1
+                nombres_columnas.append(f"e{num_exceso}")
+                nombres_columnas.append(f"a{len(indices_artificiales) + 1}")
+                indices_basicas.append(col_actual + 1)
+                indices_artificiales.append(col_actual + 1)
+                col_actual += 2
+            else:
+                nombres_columnas.append(f"a{len(indices_artificiales) + 1}")
+                indices_basicas.append(col_actual)
+                indices_artificiales.append(col_actual)
+                col_actual += 1
+        return nombres_columnas, indices_basicas, indices_artificiales
     
+    def _aplicar_limites(self):
+        """Registra los límites y hace el cambio x = l + x' (los superiores los maneja el revisado)."""
+        if self.con_pasos:
+            self.registrar_paso("LÍMITES DE LAS VARIABLES (sin filas adicionales):")
+            for j, (l, u) in enumerate(zip(self.inferiores, self.superiores)):
+                if l != 0 or np.isfinite(u):
+                    self.registrar_paso(f"  {l:g} ≤ x{j+1} ≤ {u:g}".replace("inf", "∞"))
+        if np.any(self.inferiores != 0):
+            self.A, self.b, self.operadores, invertidas = desplazar_limites_inferiores(
+                self.A, self.b, self.operadores, self.inferiores)
+            if self.con_pasos:
+                self.registrar_paso("Cambio de variable x = l + x' (x' ≥ 0): b ← b − A·l")
+                for i in invertidas:
+                    self.registrar_paso(f"  R{i+1} queda con lado derecho negativo: se multiplica por -1 ({self.operadores[i]})")
+
+    def _resolver_revisado(self, A_estandar, c_estandar, num_vars, num_holgura, num_exceso, num_artificiales):
+        """
+        Modo 'revisado': misma forma estándar y mismo Big M, pero en vez de la tabla se usa
+        SimplexRevisado (LU de la base + actualizaciones eta). Solo se calcula la fila de
+        precios y la columna entrante por iteración. Devuelve el mismo dict que la tabla.
+        """
+        # Base inicial y nombres de columnas (mismo orden que convertir_forma_estandar)
+        nombres_columnas, indices_basicas, indices_artificiales = self._columnas_estandar(num_vars)
+
+        # SimplexRevisado siempre minimiza: en max se cambia el signo de c; artificiales con +M
+        M = 10000
+        c_min = np.zeros(A_estandar.shape[1])
+        c_min[:num_vars] = -self.c if self.objetivo == 'max' else self.c
+        c_min[indices_artificiales] = M
+
+        if self.con_pasos:
+            self.registrar_paso("\nSIMPLEX REVISADO (base factorizada LU, actualizaciones eta):")
+            self.registrar_paso(f"Base inicial: {', '.join(nombres_columnas[j] for j in indices_basicas)}")
+        opciones = dict(precio=self.regla_precio, degeneracion=self.degeneracion,
+                        umbral_bland=self.umbral_bland, control=self.control)
+        if self.superiores is not None:
+            superiores = np.full(A_estandar.shape[1], np.inf)
+            superiores[:num_vars] = self.superiores - self.inferiores
+            opciones["superiores"] = superiores
+        # El motor registra cada iteración: solo con detalle='full'
+        registrar_paso = self.registrar_paso if self.paso_a_paso else None
+        motor = res = None
+        if self.base_inicial is not None:
+            en_superior = np.zeros(A_estandar.shape[1], dtype=bool)
+            en_superior[self.base_en_superior] = True
+            motor, res = arranque_en_caliente(A_estandar, self.b, c_min, self.base_inicial,
+                                              nombres_columnas, registrar_paso, en_superior=en_superior,
+                                              **opciones)
+        if res is None:
+            motor = SimplexRevisado(A_estandar, self.b, c_min, indices_basicas,
+                                    registrar_paso=registrar_paso,
+                                    nombres_columnas=nombres_columnas, **opciones)
+            res = motor.resolver()
+        arranque = res.get("arranque", 'frio')
+        variables_basicas = [nombres_columnas[j] for j in res["indices_basicas"]]
+
+        if res["estado"] in ESTADOS_PARADA:
+            # Corte: la base actual; no es factible con artificiales > 0 o si venía del Simplex Dual
+            self.registrar_paso(self.control.mensaje(res["estado"]))
+            x = res["x"]
+            solucion = x[:num_vars] + (self.inferiores if self.inferiores is not None else 0.0)
+            factible = arranque != 'dual' and not np.any(x[indices_artificiales] > 1e-6)
+            return resultado_interrumpido(
+                res["estado"], res["iteraciones"], factible,
+                self.pasos, [], solucion=[float(v) for v in solucion],
+                z_actual=float(self.c @ solucion), variables_basicas=variables_basicas)
+
+        if res["estado"] == 'unbounded':
+            return {
+                "status": "unbounded",
+                "tipo_solucion": "Problema No Acotado",
+                "explicacion": "El problema no tiene solución óptima finita. La región factible es no acotada en la dirección de mejora de la función objetivo, lo que significa que Z puede crecer (maximización) o decrecer (minimización) indefinidamente.",
+                "pasos": self.pasos,
+                "tablas": []
+            }
+
+        x = res["x"]
+        # El Simplex Dual (arranque en caliente) detecta la infactibilidad por una fila sin negativos
+        if res["estado"] == 'infeasible' or (indices_artificiales and np.any(x[indices_artificiales] > 1e-6)):
+            return {
+                "status": "infeasible",
+                "tipo_solucion": "Problema No Factible",
+                "explicacion": "Una variable artificial permanece en la base con valor distinto de cero. Esto indica que las restricciones son contradictorias y no existe una solución factible que satisfaga todas las restricciones simultáneamente.",
+                "pasos": self.pasos,
+                "tablas": []
+            }
+
+        solucion = x[:num_vars]
+        if self.inferiores is not None:
+            solucion = solucion + self.inferiores   # deshacer x = l + x'
+        z_optimo = float(self.c @ solucion)
+        if self.con_pasos:
+            self.registrar_paso(f"\n=== SOLUCIÓN ÓPTIMA ===")
+            self.registrar_paso(f"Valor óptimo de Z: {z_optimo:.4f}")
+            for i in range(num_vars):
+                self.registrar_paso(f"x{i+1} = {solucion[i]:.4f}")
+
+        # Misma clasificación que en la tabla: múltiple / degenerada / única
+        x_B = x[res["indices_basicas"]]
+        ceros, alternativo = motor.hay_optimo_alternativo(res["costos_reducidos"], x_B,
+                                                          excluir=indices_artificiales)
+        nombres_vars_nb_cero = [nombres_columnas[j] for j in ceros]
+        vars_basicas_cero = sum(1 for j, v in zip(res["indices_basicas"], x_B)
+                                if j not in indices_artificiales and abs(v) < 1e-9)
+        if nombres_vars_nb_cero and alternativo:
+            tipo_solucion = "Solución Múltiple (Infinitas Soluciones)"
+            explicacion = (f"Se encontró una solución óptima, pero existen variable(s) no básica(s) "
+                         f"({', '.join(nombres_vars_nb_cero)}) con costo reducido cero. "
+                         f"Esto permite alcanzar otro vértice óptimo sin cambiar Z, generando infinitas "
+                         f"soluciones óptimas a lo largo de un borde de la región factible.")
+        elif vars_basicas_cero > 0:
+            tipo_solucion = "Solución Única (Degenerada)"
+            explicacion = (f"Se encontró una solución óptima única, pero hay {vars_basicas_cero} variable(s) básica(s) "
+                         f"con valor cero. Esto se llama degeneración y ocurre cuando múltiples restricciones se "
+                         f"cruzan en el mismo punto óptimo. A pesar de la degeneración, la solución es única.")
+        else:
+            tipo_solucion = "Solución Única"
+            explicacion = "Se encontró una solución óptima única."
+
+        return {
+            "status": "optimal",
+            "tipo_solucion": tipo_solucion,
+            "explicacion": explicacion,
+            "z_optimo": z_optimo,
+            "solucion": [float(v) for v in solucion],
+            "iteraciones": int(res["iteraciones"]),
+            "pivotes_degenerados": int(res["pivotes_degenerados"]),
+            "cambios_a_bland": int(res["cambios_a_bland"]),
+            "cambios_de_limite": int(res["cambios_de_limite"]),
+            "arranque": arranque,
+            "pasos": self.pasos,
+            "tablas": [],
+            "variables_basicas": variables_basicas
+        }
+
     def resolver(self):
+        """Presolve y escalado (si están activos) → Simplex → desescalado y postsolve."""
+        self.control.iniciar()
+        presolve = None
+        if self.presolve:
+            presolve = presolve_metodo(self)
+            if presolve.estado != 'reducido':
+                return completar_pasos(presolve.resultado_directo(self.pasos), self.formato_pasos)
+        escalado = escalar_metodo(self) if self.escalado else None
+        resultado = self._resolver()
+        if escalado is not None:
+            resultado = escalado.completar_resultado(resultado)
+        if presolve is not None:
+            resultado = presolve.completar_resultado(resultado, self.operadores)
+        return completar_pasos(resultado, self.formato_pasos)
+
+    def _resolver(self):
         """
         1. Convierte a forma estándar y arma tabla inicial (fila Z + restricciones).
         2. Base inicial: columnas de holguras y artificiales.
         3. Bucle: entrante (mejor mejora en Z), saliente (ratio mínimo), pivoteo.
         4. Si fila Z óptima → leer solución; si artificial con valor > 0 → infactible.
         """
-        self.registrar_paso(f"=== MÉTODO SIMPLEX ===")
-        # Formatear función objetivo con operadores correctos
-        objetivo_str = f"{self.c[0]}x₁"
-        for i in range(1, len(self.c)):
-            signo = '-' if self.c[i] < 0 else '+'
-            abs_val = abs(self.c[i])
-            objetivo_str += f" {signo} {abs_val}x{i+1}"
-        self.registrar_paso(f"FUNCIÓN OBJETIVO: {self.objetivo.upper()} Z = {objetivo_str}")
+        if self.con_pasos:
+            self.registrar_paso(f"=== MÉTODO SIMPLEX ===")
+            # Formatear función objetivo con operadores correctos
+            objetivo_str = f"{self.c[0]}x₁"
+            for i in range(1, len(self.c)):
+                signo = '-' if self.c[i] < 0 else '+'
+                abs_val = abs(self.c[i])
+                objetivo_str += f" {signo} {abs_val}x{i+1}"
+            self.registrar_paso(f"FUNCIÓN OBJETIVO: {self.objetivo.upper()} Z = {objetivo_str}")
         
-        self.registrar_paso("RESTRICCIONES:")
-        for idx, (a_row, b_val, op) in enumerate(zip(self.A, self.b, self.operadores), 1):
-            # Formatear restricción con operadores correctos
-            restriccion_str = f"{a_row[0]}x₁"
-            for i in range(1, len(a_row)):
-                signo = '-' if a_row[i] < 0 else '+'
-                abs_val = abs(a_row[i])
-                restriccion_str += f" {signo} {abs_val}x{i+1}"
-            self.registrar_paso(f"  R{idx}: {restriccion_str} {op} {b_val}")
+            self.registrar_paso("RESTRICCIONES:")
+            if self.es_dispersa:
+                self.registrar_paso(f"  {self.A.shape[0]} restricciones dispersas: {self.A.nnz} coeficientes no nulos "
+                                    f"(densidad {self.A.densidad:.2%})")
+            for idx, (a_row, b_val, op) in enumerate(zip(self.A if not self.es_dispersa else [],
+                                                         self.b, self.operadores), 1):
+                # Formatear restricción con operadores correctos
+                restriccion_str = f"{a_row[0]}x₁"
+                for i in range(1, len(a_row)):
+                    signo = '-' if a_row[i] < 0 else '+'
+                    abs_val = abs(a_row[i])
+                    restriccion_str += f" {signo} {abs_val}x{i+1}"
+                self.registrar_paso(f"  R{idx}: {restriccion_str} {op} {b_val}")
         
+        if self.superiores is not None:
+            self._aplicar_limites()
+
         # Paso 1: forma estándar (A y c ampliados)
         A_estandar, c_estandar, num_vars, num_holgura, num_exceso, num_artificiales = self.convertir_forma_estandar()
+        # El arranque en caliente y los límites necesitan el Simplex Revisado
+        if self.modo == 'revisado' or self.base_inicial is not None or self.superiores is not None:
+            return self._resolver_revisado(A_estandar, c_estandar, num_vars, num_holgura,
+                                           num_exceso, num_artificiales)
         num_rest = len(self.b)
         num_cols_totales = A_estandar.shape[1]
 
@@ -213,104 +488,81 @@ class MetodoSimplex:
         tabla[1:, :num_cols_totales] = A_estandar
         tabla[1:, -1] = self.b
         tabla[0, :num_cols_totales] = -c_estandar  # Z - c'x = 0 → en tabla van -c_j
-        z_val = sum(c_estandar[indices_basicas[i]] * self.b[i] for i in range(num_rest))
-        tabla[0, -1] = z_val
-        # Expresar fila Z solo en no básicas (combinar con filas de restricción para anular básicas)
+        # Expresar fila Z solo en no básicas (combinar con filas de restricción para anular básicas);
+        # al hacerlo, el RHS de la fila Z queda en Z = Σ c_B·b de la base inicial
         for i, idx_basica in enumerate(indices_basicas):
             if abs(tabla[0, idx_basica]) > 1e-9:
                 factor = tabla[0, idx_basica]
                 tabla[0, :] -= factor * tabla[i + 1, :]
         
-        # Generar nombres de columnas
-        nombres_columnas = []
-        for i in range(num_vars):
-            nombres_columnas.append(f"x{i+1}")
-        for i in range(num_holgura):
-            nombres_columnas.append(f"s{i+1}")
-        for i in range(num_exceso):
-            nombres_columnas.append(f"e{i+1}")
-        for i in range(num_artificiales):
-            nombres_columnas.append(f"a{i+1}")
+        # Nombres de columnas (holguras, excesos y artificiales en el orden de las filas)
+        nombres_columnas, _, indices_artificiales = self._columnas_estandar(num_vars)
         
-        self.registrar_paso("\nTABLA INICIAL:")
-        self.registrar_tabla(tabla, 0, variables_basicas, "Tabla inicial del Simplex", 
-                           nombres_columnas=nombres_columnas)
+        if self.paso_a_paso:
+            # Los eventos nombran columnas por índice y el renderizador sigue la base (ver eventos_pasos)
+            self.registrar_paso(['col', nombres_columnas])
+            self.registrar_paso(['base', list(indices_basicas)])
+            self.registrar_paso("\nTABLA INICIAL:")
+            self.registrar_tabla(tabla, 0, variables_basicas.copy(), "Tabla inicial del Simplex", 
+                               nombres_columnas=nombres_columnas)
         
+        nucleo = NucleoPivoteo(tabla)   # buffers del pivoteo y la prueba de ratio
+        regla = self.regla_precio
+        regla.iniciar(num_cols_totales, indices_basicas)
+        contexto = ContextoTabla(tabla, num_cols_totales)
+        control = ControlDegeneracion(self.degeneracion, self.umbral_bland)
+        base_inicial = list(indices_basicas)
+        control.perturbar_tabla(tabla, base_inicial)
+        if self.paso_a_paso and control.modo == 'perturbacion':
+            self.historial.anclar(tabla)   # el RHS perturbado no sale de un pivoteo
         iteracion = 0
-        max_iteraciones = 100
+        max_iteraciones = limite_iteraciones(num_rest, num_cols_totales)
+        estado = 'iteration_limit'   # si el bucle termina sin óptimo ni corte del control
         
         while iteracion < max_iteraciones:
             iteracion += 1
-            self.registrar_paso(f"\n--- ITERACIÓN {iteracion} ---")
+            if self.paso_a_paso:
+                self.registrar_paso(['it', iteracion])
             fila_z = tabla[0, :num_cols_totales]
-            # Parada: max → todos coef. Z ≥ 0; min → todos ≤ 0
-            if self.objetivo == 'max':
-                indices_negativos = np.where(fila_z < -1e-9)[0]
-                if len(indices_negativos) == 0:
-                    self.registrar_paso("✓ Condición de optimalidad alcanzada (todos los coeficientes ≥ 0)")
-                    break
-                col_entrante = int(indices_negativos[np.argmin(fila_z[indices_negativos])])
-            else:  # min
-                # Buscamos el más positivo (el que más reduce Z)
-                indices_positivos = np.where(fila_z > 1e-9)[0]
-                if len(indices_positivos) == 0:
-                    self.registrar_paso("✓ Condición de optimalidad alcanzada (todos los coeficientes ≤ 0)")
-                    break
-                col_entrante = int(indices_positivos[np.argmax(fila_z[indices_positivos])])
+            # Parada: max → todos coef. Z ≥ 0; min → todos ≤ 0.
+            # La regla de precio trabaja con "d_j < 0 mejora", así que en min se cambia el signo.
+            col_entrante = control.elegir_entrante(fila_z if self.objetivo == 'max' else -fila_z, regla)
+            if col_entrante is None:
+                signo = '≥' if self.objetivo == 'max' else '≤'
+                self.registrar_paso(f"✓ Condición de optimalidad alcanzada (todos los coeficientes {signo} 0)")
+                estado = 'optimal'
+                break
+            # Límite de iteraciones, tiempo o cancelación: se corta antes de pivotear
+            parada = self.control.parar()
+            if parada is not None:
+                estado = parada
+                iteracion -= 1
+                break
             
             # Identificar nombre de variable entrante
-            if col_entrante < num_vars:
-                var_entrante_nombre = f"x{col_entrante + 1}"
-            elif col_entrante < num_vars + num_holgura:
-                var_entrante_nombre = f"s{col_entrante - num_vars + 1}"
-            elif col_entrante < num_vars + num_holgura + num_exceso:
-                var_entrante_nombre = f"e{col_entrante - num_vars - num_holgura + 1}"
-            else:
-                var_entrante_nombre = f"a{col_entrante - num_vars - num_holgura - num_exceso + 1}"
-            
-            self.registrar_paso(f"\n📌 VARIABLE ENTRANTE: {var_entrante_nombre}")
-            self.registrar_paso(f"   Razón: El coeficiente en la fila Z es {fila_z[col_entrante]:.4f}, que es {'negativo' if fila_z[col_entrante] < 0 else 'positivo'}.")
-            if self.objetivo == 'max':
-                self.registrar_paso(f"   En maximización, valores negativos en la fila Z indican que aumentar {var_entrante_nombre} mejorará el valor de Z.")
-            else:
-                self.registrar_paso(f"   En minimización, valores positivos en la fila Z indican que aumentar {var_entrante_nombre} reducirá el valor de Z.")
+            var_entrante_nombre = nombres_columnas[col_entrante]
             
-            # Variable saliente: ratio = RHS / coef. entrante (solo si coef. > 0); mínimo ratio → sale
-            self.registrar_paso(f"\n📊 CÁLCULO DE RATIOS (para determinar variable saliente):")
-            self.registrar_paso(f"   Ratio = Valor en columna 'Solución' ÷ Valor en columna '{var_entrante_nombre}'")
-            self.registrar_paso(f"   Solo se calculan ratios para filas donde el coeficiente de {var_entrante_nombre} es positivo.")
+            if self.paso_a_paso:
+                # Entrante con su razón y el planteo del cálculo de ratios (ver eventos_pasos)
+                self.registrar_paso(['ent', col_entrante, float(fila_z[col_entrante]), self.objetivo == 'max'])
             
-            ratios = []
-            for i in range(num_rest):
-                fila_rest = i + 1  # Las restricciones empiezan en fila 1
-                var_basica_actual = variables_basicas[i] if i < len(variables_basicas) else f"Fila {i+1}"
-                if tabla[fila_rest, col_entrante] > 1e-9:
-                    ratio = float(tabla[fila_rest, -1] / tabla[fila_rest, col_entrante])
-                    ratios.append(ratio)
-                    self.registrar_paso(f"   {var_basica_actual}: {tabla[fila_rest, -1]:.4f} ÷ {tabla[fila_rest, col_entrante]:.4f} = {ratio:.4f}")
-                else:
-                    ratios.append(np.inf)  # Usar np.inf internamente
-                    self.registrar_paso(f"   {var_basica_actual}: No se calcula (coeficiente ≤ 0 o muy pequeño)")
+
+            # Variable saliente: ratio = RHS / coef. entrante (solo si coef. > 0); mínimo ratio → sale.
+            # Prueba de ratio vectorizada (np.inf en filas con coeficiente ≤ 0); empates según el control
+            fila_saliente = control.elegir_saliente(
+                nucleo.ratios, nucleo.prueba_ratio(tabla, col_entrante), tabla[1:, col_entrante],
+                lambda k: tabla[1:, base_inicial[k]], indices_basicas)
+            ratios = nucleo.ratios
+            if self.paso_a_paso:
+                # RHS y columna entrante: de ahí salen los ratios, el pivote y las restas de filas
+                self.registrar_paso(['rat', tabla[1:, -1].tolist(), tabla[1:, col_entrante].tolist()])
             
-            # Verificar si todos los ratios son infinito usando np.isinf
-            if all(np.isinf(r) for r in ratios):
+            # Ninguna fila limita a la variable entrante
+            if fila_saliente < 0:
                 self.registrar_paso("\n⚠ Problema no acotado: No se puede encontrar variable saliente")
                 self.registrar_paso("   Razón: Todas las filas tienen coeficientes no positivos en la columna entrante.")
                 self.registrar_paso("   Esto significa que {var_entrante_nombre} puede crecer indefinidamente sin violar restricciones.")
-                # Serializar tablas antes de retornar
-                tablas_serializadas = []
-                for tabla_info in self.tablas:
-                    tablas_serializadas.append({
-                        "iteracion": int(tabla_info["iteracion"]),
-                        "tabla": self._convertir_a_nativo(tabla_info["tabla"]),
-                        "variables_basicas": tabla_info["variables_basicas"],
-                        "explicacion": tabla_info["explicacion"],
-                        "nombres_columnas": tabla_info.get("nombres_columnas", []),
-                        "col_entrante": tabla_info.get("col_entrante"),
-                        "fila_saliente": tabla_info.get("fila_saliente"),
-                        "elemento_pivote": self._convertir_a_nativo(tabla_info.get("elemento_pivote")) if tabla_info.get("elemento_pivote") is not None else None,
-                        "ratios": self._convertir_a_nativo(tabla_info.get("ratios", []))
-                    })
+                tablas_serializadas = self._tablas_serializadas()
                 return {
                     "status": "unbounded",
                     "tipo_solucion": "Problema No Acotado",
@@ -319,25 +571,23 @@ class MetodoSimplex:
                     "tablas": tablas_serializadas
                 }
             
-            fila_saliente = int(np.argmin(ratios))
             ratio_minimo = ratios[fila_saliente]
-            # Convertir ratio_minimo a float para mostrar, manejando infinito
-            if np.isinf(ratio_minimo):
-                ratio_minimo_float = None  # Para JSON, pero para mostrar usaremos "∞"
-                ratio_minimo_str = "∞"
-            else:
-                ratio_minimo_float = float(ratio_minimo)
-                ratio_minimo_str = f"{ratio_minimo_float:.4f}"
-            var_saliente_actual = variables_basicas[fila_saliente] if fila_saliente < len(variables_basicas) else f"Fila {fila_saliente + 1}"
-            
-            self.registrar_paso(f"\n📌 VARIABLE SALIENTE: {var_saliente_actual}")
-            self.registrar_paso(f"   Razón: Tiene el ratio mínimo ({ratio_minimo_str}).")
-            if not np.isinf(ratio_minimo):
-                self.registrar_paso(f"   El ratio mínimo asegura que al hacer {var_entrante_nombre} = {ratio_minimo_str}, la variable {var_saliente_actual} se vuelve cero (sale de la base).")
+            var_saliente_actual = variables_basicas[fila_saliente]
+            if self.paso_a_paso:
+                self.registrar_paso(['sal', fila_saliente])
+            en_bland = control.en_bland
+            if control.registrar_pivote(ratio_minimo) and self.paso_a_paso:
+                self.registrar_paso("   ⚠ Pivote degenerado (ratio 0): cambia la base pero no el punto ni Z.")
+                if control.en_bland and not en_bland:
+                    self.registrar_paso(f"   {control.umbral_bland} pivotes degenerados seguidos: se usa la regla de Bland hasta salir del estancamiento.")
             
             # Guardar valor anterior de Z antes del pivoteo
             z_val_anterior = float(tabla[0, -1])
             
+            # Los pesos de Devex/steepest edge se actualizan con la tabla de antes del pivoteo
+            if regla.usa_pesos:
+                regla.actualizar(col_entrante, fila_saliente, indices_basicas, contexto)
+            
             # Actualizar variable básica (usar var_entrante_nombre que ya está definido)
             variables_basicas[fila_saliente] = var_entrante_nombre
             indices_basicas[fila_saliente] = col_entrante
@@ -346,58 +596,25 @@ class MetodoSimplex:
             fila_pivote = fila_saliente + 1
             elemento_pivote = float(tabla[fila_pivote, col_entrante])
 
-            self.registrar_paso(f"\n🔄 OPERACIONES DE PIVOTEO:")
-            self.registrar_paso(f"   Elemento Pivote: {elemento_pivote:.4f} (intersección de fila {var_saliente_actual} y columna {var_entrante_nombre})")
-            self.registrar_paso(f"   Paso 1: Normalizar la fila pivote (dividir toda la fila por {elemento_pivote:.4f})")
-            self.registrar_paso(f"           Esto hace que el elemento pivote sea 1 y {var_entrante_nombre} entre a la base con coeficiente 1.")
+            if self.paso_a_paso:
+                self.registrar_paso(['piv'])   # pivote y restas por fila, con la columna del evento 'rat'
+            # Normalizar fila pivote y hacer 0 la columna entrante en el resto (una actualización de rango 1)
+            nucleo.pivotear(tabla, fila_pivote, col_entrante)
             
-            tabla[fila_pivote, :] /= elemento_pivote  # normalizar fila pivote
-            self.registrar_paso(f"   Paso 2: Eliminación gaussiana (hacer cero la columna {var_entrante_nombre} en todas las demás filas)")
-            self.registrar_paso(f"           Para cada fila i ≠ fila pivote: Fila[i] = Fila[i] - (coeficiente en columna {var_entrante_nombre}) × Fila[pivote]")
-            # Hacer 0 la columna entrante en el resto de filas (restar múltiplo de fila pivote)
-            for i in range(num_rest + 1):
-                if i != fila_pivote:
-                    factor = tabla[i, col_entrante]
-                    if abs(factor) > 1e-9:
-                        nombre_fila = 'Z' if i == 0 else (variables_basicas[i-1] if i-1 < len(variables_basicas) else f"Fila {i}")
-                        self.registrar_paso(f"           - Fila {nombre_fila}: Restamos {factor:.4f} × Fila[{var_saliente_actual}]")
-                    tabla[i, :] -= factor * tabla[fila_pivote, :]
-            
-            # Actualizar Z
-            z_val = tabla[0, -1]  # Z está en la fila 0
-            self.registrar_paso(f"\n✅ RESULTADO DE LA ITERACIÓN:")
-            self.registrar_paso(f"   Valor anterior de Z: {z_val_anterior:.4f}")
-            self.registrar_paso(f"   Nuevo valor de Z: {z_val:.4f}")
-            if not np.isinf(ratio_minimo):
-                mejora = z_val - z_val_anterior
-                self.registrar_paso(f"   Mejora en Z: {mejora:+.4f} ({'aumento' if mejora > 0 else 'disminución' if mejora < 0 else 'sin cambio'})")
-            self.registrar_paso(f"   Nueva base: {', '.join(variables_basicas)}")
-            if not np.isinf(ratio_minimo):
-                self.registrar_paso(f"   {var_entrante_nombre} ahora es básica (valor = {ratio_minimo_str}), {var_saliente_actual} sale de la base (valor = 0)")
-            else:
-                self.registrar_paso(f"   {var_entrante_nombre} ahora es básica, {var_saliente_actual} sale de la base (valor = 0)")
-            
-            # Generar nombres de columnas (mismo que antes)
-            nombres_columnas = []
-            for i in range(num_vars):
-                nombres_columnas.append(f"x{i+1}")
-            for i in range(num_holgura):
-                nombres_columnas.append(f"s{i+1}")
-            for i in range(num_exceso):
-                nombres_columnas.append(f"e{i+1}")
-            for i in range(num_artificiales):
-                nombres_columnas.append(f"a{i+1}")
-            
-            var_saliente_anterior = var_saliente_actual
-            
-            self.registrar_tabla(tabla.copy(), iteracion, variables_basicas.copy(), 
-                               f"Iteración {iteracion}: {var_entrante_nombre} entra, {var_saliente_anterior} sale",
-                               nombres_columnas=nombres_columnas,
-                               col_entrante=col_entrante,
-                               fila_saliente=fila_saliente,
-                               elemento_pivote=elemento_pivote,
-                               ratios=ratios)
+            # Resultado de la iteración (Z anterior y nuevo, nueva base)
+            if self.paso_a_paso:
+                self.registrar_paso(['res', z_val_anterior, float(tabla[0, -1])])
+                self.registrar_tabla(tabla, iteracion, variables_basicas.copy(), 
+                                   f"Iteración {iteracion}: {var_entrante_nombre} entra, {var_saliente_actual} sale",
+                                   nombres_columnas=nombres_columnas,
+                                   col_entrante=col_entrante,
+                                   fila_saliente=fila_saliente,
+                                   elemento_pivote=elemento_pivote,
+                                   ratios=ratios)
         
+        # Con perturbación: volver al RHS original con la base final
+        control.restaurar_tabla(tabla, base_inicial)
+
         # Leer solución: x's básicas = valor RHS de su fila; no básicas = 0
         solucion = np.zeros(num_vars)
         for i, idx_basica in enumerate(indices_basicas):
@@ -405,34 +622,33 @@ class MetodoSimplex:
                 fila_rest = i + 1
                 solucion[idx_basica] = tabla[fila_rest, -1]
 
+        if estado != 'optimal':
+            # Corte: la base actual es la mejor encontrada (Z mejora en cada pivoteo);
+            # con una artificial > 0 en la base todavía no es factible
+            self.registrar_paso(self.control.mensaje(estado))
+            factible = all(abs(tabla[i + 1, -1]) <= 1e-6 for i, j in enumerate(indices_basicas)
+                           if j in indices_artificiales)
+            return resultado_interrumpido(
+                estado, iteracion, factible, self.pasos, self._tablas_serializadas(),
+                solucion=[float(v) for v in solucion], z_actual=float(self.c @ solucion),
+                variables_basicas=variables_basicas)
+
         z_optimo = float(tabla[0, -1])
         
-        self.registrar_paso(f"\n=== SOLUCIÓN ÓPTIMA ===")
-        self.registrar_paso(f"Valor óptimo de Z: {z_optimo:.4f}")
-        for i in range(num_vars):
-            self.registrar_paso(f"x{i+1} = {solucion[i]:.4f}")
+        if self.con_pasos:
+            self.registrar_paso(f"\nIteraciones: {iteracion}")
+            self.registrar_paso(f"\n=== SOLUCIÓN ÓPTIMA ===")
+            self.registrar_paso(f"Valor óptimo de Z: {z_optimo:.4f}")
+            for i in range(num_vars):
+                self.registrar_paso(f"x{i+1} = {solucion[i]:.4f}")
         
         # Si queda alguna artificial en base con valor > 0 → problema infactible
         if num_artificiales > 0:
-            idx_art_inicio = num_vars + num_holgura + num_exceso
             for i, idx_basica in enumerate(indices_basicas):
-                if idx_basica >= idx_art_inicio:
+                if idx_basica in indices_artificiales:
                     fila_rest = i + 1  # Las restricciones empiezan en fila 1
                     if abs(tabla[fila_rest, -1]) > 1e-6:
-                        # Serializar tablas antes de retornar
-                        tablas_serializadas = []
-                        for tabla_info in self.tablas:
-                            tablas_serializadas.append({
-                                "iteracion": int(tabla_info["iteracion"]),
-                                "tabla": self._convertir_a_nativo(tabla_info["tabla"]),
-                                "variables_basicas": tabla_info["variables_basicas"],
-                                "explicacion": tabla_info["explicacion"],
-                                "nombres_columnas": tabla_info.get("nombres_columnas", []),
-                                "col_entrante": tabla_info.get("col_entrante"),
-                                "fila_saliente": tabla_info.get("fila_saliente"),
-                                "elemento_pivote": self._convertir_a_nativo(tabla_info.get("elemento_pivote")) if tabla_info.get("elemento_pivote") is not None else None,
-                                "ratios": self._convertir_a_nativo(tabla_info.get("ratios", []))
-                            })
+                        tablas_serializadas = self._tablas_serializadas()
                         return {
                             "status": "infeasible",
                             "tipo_solucion": "Problema No Factible",
@@ -447,14 +663,9 @@ class MetodoSimplex:
         existe_pivote_con_ratio_positivo = False  # ¿Podemos llegar a otro vértice con el mismo Z?
         
         for j in range(num_cols_totales):
-            es_artificial = (j >= num_vars + num_holgura + num_exceso)
+            es_artificial = j in indices_artificiales
             if j not in indices_basicas and not es_artificial and abs(fila_z_final[j]) < 1e-9:
-                if j < num_vars:
-                    nombres_vars_nb_cero.append(f"x{j+1}")
-                elif j < num_vars + num_holgura:
-                    nombres_vars_nb_cero.append(f"s{j - num_vars + 1}")
-                else:
-                    nombres_vars_nb_cero.append(f"e{j - num_vars - num_holgura + 1}")
+                nombres_vars_nb_cero.append(nombres_columnas[j])
                 # Si al pivotar j el ratio mínimo > 0 → hay otro vértice óptimo (solución múltiple)
                 ratios = []
                 for i in range(num_rest):
@@ -466,7 +677,7 @@ class MetodoSimplex:
         # Verificar degeneración (variables básicas con valor cero)
         vars_basicas_cero = 0
         for i, idx_basica in enumerate(indices_basicas):
-            es_artificial = (idx_basica >= num_vars + num_holgura + num_exceso)
+            es_artificial = idx_basica in indices_artificiales
             if not es_artificial:
                 fila_rest = i + 1
                 if abs(tabla[fila_rest, -1]) < 1e-9:
@@ -494,20 +705,8 @@ class MetodoSimplex:
         # Convertir solución a lista de floats nativos
         solucion_lista = [float(solucion[i]) for i in range(num_vars)]
         
-        # Asegurar que las tablas estén completamente convertidas a tipos nativos
-        tablas_serializadas = []
-        for tabla_info in self.tablas:
-            tablas_serializadas.append({
-                "iteracion": int(tabla_info["iteracion"]),
-                "tabla": self._convertir_a_nativo(tabla_info["tabla"]),
-                "variables_basicas": tabla_info["variables_basicas"],
-                "explicacion": tabla_info["explicacion"],
-                "nombres_columnas": tabla_info.get("nombres_columnas", []),
-                "col_entrante": tabla_info.get("col_entrante"),
-                "fila_saliente": tabla_info.get("fila_saliente"),
-                "elemento_pivote": self._convertir_a_nativo(tabla_info.get("elemento_pivote")) if tabla_info.get("elemento_pivote") is not None else None,
-                "ratios": self._convertir_a_nativo(tabla_info.get("ratios", []))
-            })
+        # Tablas reconstruidas desde la inicial y los pivoteos, ya en tipos nativos
+        tablas_serializadas = self._tablas_serializadas()
         
         return {
             "status": "optimal",
@@ -516,6 +715,8 @@ class MetodoSimplex:
             "z_optimo": float(z_optimo),
             "solucion": solucion_lista,
             "iteraciones": int(iteracion),
+            "pivotes_degenerados": int(control.pivotes_degenerados),
+            "cambios_a_bland": int(control.cambios_a_bland),
             "pasos": self.pasos,
             "tablas": tablas_serializadas,
             "variables_basicas": variables_basicas
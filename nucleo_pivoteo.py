@@ -0,0 +1,53 @@
+"""
+Núcleo de pivoteo compartido por las tablas de Simplex y Dos Fases.
+
+Es el bucle más caliente de los métodos de tabla. Antes cada iteración hacía un
+`for i in range(num_rest + 1)` restando filas una a una y armaba una lista de Python
+con los ratios. Aquí las dos operaciones se hacen con NumPy sobre buffers reservados
+una sola vez por tabla:
+  - prueba de ratio: máscara (coef. > tol) + división enmascarada + argmin,
+  - pivoteo: normalizar la fila pivote y una única actualización de rango 1
+    T ← T − col ⊗ fila_pivote (con la columna del pivote anulada en su propia fila).
+"""
+
+import numpy as np
+
+
+class NucleoPivoteo:
+    """Buffers para una tabla de forma (filas, columnas); se reutilizan en cada iteración."""
+
+    def __init__(self, tabla, tol=1e-9):
+        num_filas, num_cols = tabla.shape
+        self.tol = tol
+        self._columna = np.empty(num_filas)
+        self._producto = np.empty((num_filas, num_cols))
+        self._mascara = np.empty(num_filas - 1, dtype=bool)
+        # Ratios de la última prueba (np.inf donde el coeficiente no es positivo)
+        self.ratios = np.empty(num_filas - 1)
+
+    def prueba_ratio(self, tabla, col_entrante):
+        """
+        Ratio = RHS / coef. de la columna entrante, solo en filas de restricción con coef. > tol.
+        Devuelve el índice (0 = primera restricción) del ratio mínimo, o -1 si ninguna fila
+        limita a la variable entrante (problema no acotado). Los ratios quedan en self.ratios.
+        """
+        columna = tabla[1:, col_entrante]
+        np.greater(columna, self.tol, out=self._mascara)
+        self.ratios.fill(np.inf)
+        if not self._mascara.any():
+            return -1
+        np.divide(tabla[1:, -1], columna, out=self.ratios, where=self._mascara)
+        return int(np.argmin(self.ratios))
+
+    def pivotear(self, tabla, fila_pivote, col_entrante):
+        """
+        Pivoteo en el sitio sobre `tabla` (fila_pivote incluye la fila 0 de Z/W).
+        Devuelve el elemento pivote original.
+        """
+        elemento_pivote = float(tabla[fila_pivote, col_entrante])
+        tabla[fila_pivote, :] /= elemento_pivote
+        np.copyto(self._columna, tabla[:, col_entrante])
+        self._columna[fila_pivote] = 0.0
+        np.multiply(self._columna[:, None], tabla[fila_pivote, :], out=self._producto)
+        np.subtract(tabla, self._producto, out=tabla)
+        return elemento_pivote
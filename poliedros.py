@@ -0,0 +1,277 @@
+"""
+Región factible de un problema de 3 variables: vértices y caras del poliedro.
+
+Probar las C(m+3, 3) ternas de planos y cada punto contra las m restricciones es O(m⁴).
+Aquí cada restricción (y x ≥ 0, y ≥ 0, z ≥ 0) es un semiespacio n·p ≤ d con |n| = 1 y el
+poliedro se arma por doble descripción (Motzkin): se parte del cubo [0, R]³ y se lo corta con
+un semiespacio a la vez.
+  1. Cada vértice guarda su incidencia: en qué planos está.
+  2. Al cortar, los vértices de afuera salen; los del plano quedan y suman ese plano.
+  3. Por cada arista entre un vértice de afuera y uno de adentro aparece un vértice nuevo
+     sobre el plano. Dos vértices forman arista si comparten dos planos no paralelos: se
+     cortan en una recta y el poliedro sobre ella es un lado con esos dos extremos. Con un
+     índice (par de planos → vértices) cada corte solo recorre los vértices que quedan afuera.
+
+Con pocos planos (C(H, 3) ≤ LIMITE_TERNAS) es más rápido resolver todas las ternas de una
+vez: los sistemas 3×3 van apilados en un solo np.linalg.solve y la factibilidad es un
+producto matricial (metodo='ternas').
+
+Como en semiplanos, la caja lejana (x, y, z ≤ R) cierra las regiones no acotadas: los
+vértices que están en alguna de sus caras no son vértices reales. Una fila '=' entra como
+dos semiespacios (n·p ≤ d y -n·p ≤ -d) y el poliedro queda aplastado sobre su plano.
+
+Cada columna de la incidencia corresponde a un plano: índice de fila de A o PLANO_X,
+PLANO_Y, PLANO_Z (los de x, y, z ≥ 0) y CAJA_X, CAJA_Y, CAJA_Z. caras() ordena los
+vértices de cada plano alrededor de su centro y los triangula para un mesh3d de Plotly.
+"""
+
+from itertools import combinations
+from math import comb
+
+import numpy as np
+
+from semiplanos import ESCALA_CAJA, TOL
+
+PLANO_X = -1   # x ≥ 0
+PLANO_Y = -2   # y ≥ 0
+PLANO_Z = -3   # z ≥ 0
+CAJA_X = -4    # x ≤ R (caja)
+CAJA_Y = -5    # y ≤ R (caja)
+CAJA_Z = -6    # z ≤ R (caja)
+PLANOS_CAJA = (CAJA_X, CAJA_Y, CAJA_Z)
+
+LIMITE_TERNAS = 2000     # con hasta tantas ternas de planos, metodo='auto' usa 'ternas'
+GRILLA_VERTICES = 1e-9   # paso de la grilla (relativo a la escala del punto) para juntar repetidos
+METODOS = ('auto', 'doble_descripcion', 'ternas')
+
+
+def _semiespacios(A, b, operadores):
+    """Filas como n·p ≤ d normalizados (las '=' dos veces), más x, y, z ≥ 0; y si es vacía."""
+    A = np.asarray(A, dtype=float).reshape(-1, 3)
+    b = np.asarray(b, dtype=float).ravel()
+    ops = np.array(operadores, dtype=object).reshape(-1)
+    normas = np.linalg.norm(A, axis=1)
+    # Filas 0·x + 0·y + 0·z op b: sin plano; si no se cumplen la región es vacía
+    nulas = normas <= TOL
+    vacia = bool(((ops == '<=') & nulas & (b < -TOL)).any() or ((ops == '>=') & nulas & (b > TOL)).any()
+                 or ((ops == '=') & nulas & (np.abs(b) > TOL)).any())
+    normas = np.where(nulas, 1.0, normas)
+    signo = np.where(ops == '>=', -1.0, 1.0)
+    filas = np.flatnonzero(~nulas)
+    iguales = np.flatnonzero(~nulas & (ops == '='))
+    N = np.vstack([(A * (signo / normas)[:, None])[filas], -A[iguales] / normas[iguales, None], -np.eye(3)])
+    d = np.concatenate([(b * signo / normas)[filas], -b[iguales] / normas[iguales], np.zeros(3)])
+    ids = np.concatenate([filas, iguales, [PLANO_X, PLANO_Y, PLANO_Z]]).astype(np.int64)
+    return N, d, ids, vacia
+
+
+def radio_caja(A, b):
+    """R de la caja: ESCALA_CAJA · (distancia al origen del plano más lejano, al menos 1)."""
+    A = np.asarray(A, dtype=float).reshape(-1, 3)
+    b = np.asarray(b, dtype=float).ravel()
+    normas = np.linalg.norm(A, axis=1)
+    validas = normas > TOL
+    return ESCALA_CAJA * max(1.0, float((np.abs(b[validas]) / normas[validas]).max(initial=0.0)))
+
+
+def elegir_metodo(operadores):
+    """'ternas' si hay pocos planos (C(H, 3) ≤ LIMITE_TERNAS), si no 'doble_descripcion'."""
+    planos = len(operadores) + sum(op == '=' for op in operadores) + 6
+    return 'ternas' if comb(planos, 3) <= LIMITE_TERNAS else 'doble_descripcion'
+
+
+def _tolerancias(V):
+    """Tolerancia de cada punto, relativa a su magnitud (como semiplanos._fuera)."""
+    return TOL * np.maximum(1.0, np.abs(V).max(axis=1))
+
+
+def _unicos(V, Z):
+    """Junta los vértices repetidos (grilla relativa a cada punto); las incidencias se suman."""
+    if len(V) < 2:
+        return V, Z
+    # La escala va en potencias de 10 y el exponente es parte de la clave: si no, p y 100·p chocan.
+    # Se redondea el logaritmo: el salto queda en √10·10^k, no en 1, 10, 100 (datos enteros)
+    exponente = np.round(np.log10(np.maximum(1.0, np.abs(V).max(axis=1))))
+    # (+ 0.0: np.unique por filas compara bytes y -0.0 no sería 0.0)
+    clave = np.column_stack([np.round(V / (GRILLA_VERTICES * 10.0 ** exponente)[:, None]), exponente]) + 0.0
+    _, primero, grupo = np.unique(clave, axis=0, return_index=True, return_inverse=True)
+    orden = np.argsort(primero)
+    nuevo = np.empty_like(orden)
+    nuevo[orden] = np.arange(len(orden))
+    Zu = np.zeros((len(primero), Z.shape[1]), dtype=bool)
+    np.logical_or.at(Zu, nuevo[grupo.ravel()], Z)
+    return V[primero[orden]], Zu
+
+
+def _doble_descripcion(N, d, R):
+    """
+    Vértices e incidencia de {N·p ≤ d} ∩ [0, R]³ cortando el cubo (las 3 últimas filas de N
+    son los ejes; las columnas H, H+1, H+2 de la incidencia, la caja).
+
+    Cada vértice guarda sus planos y `aristas` lleva, por par de planos no paralelos, los
+    vértices que están en ambos: en 3-D esos dos planos se cortan en una recta y el poliedro
+    sobre ella es una arista, así que sus dos vértices son vecinos. Cada corte solo recorre los
+    vértices que quedan afuera (más un producto con todos para clasificarlos).
+    """
+    H = len(N)
+    normales = np.vstack([N, np.eye(3)])
+    V = np.array([[x, y, z] for x in (0.0, R) for y in (0.0, R) for z in (0.0, R)])
+    planos = [{H - 3 + e for e in range(3) if v[e] == 0.0} | {H + e for e in range(3) if v[e] == R} for v in V]
+    vivo = np.ones(len(V), dtype=bool)
+    tol = _tolerancias(V)
+    aristas = {}
+
+    unitarias = [tuple(n) for n in normales.tolist()]
+
+    def no_paralelos(a, b):
+        # |n_a × n_b| (a mano: np.cross por par es lo que más tardaba)
+        (ax, ay, az), (bx, by, bz) = unitarias[a], unitarias[b]
+        return (ay * bz - az * by) ** 2 + (az * bx - ax * bz) ** 2 + (ax * by - ay * bx) ** 2 > TOL * TOL
+
+    def registrar(k, nuevos):
+        for a in nuevos:
+            for b in planos[k]:
+                if a != b and no_paralelos(a, b):
+                    aristas.setdefault((min(a, b), max(a, b)), set()).add(k)
+
+    for k in range(len(V)):
+        registrar(k, list(planos[k]))
+
+    for j in range(H - 3):
+        indices = np.flatnonzero(vivo)
+        s = np.zeros(len(V))
+        s[indices] = V[indices] @ N[j] - d[j]
+        afuera = vivo & (s > tol)
+        sobre = vivo & (np.abs(s) <= tol)
+        if not afuera.any():
+            for k in np.flatnonzero(sobre):
+                planos[k].add(j)
+                registrar(k, [j])
+            continue
+        if not (vivo & ~afuera).any():
+            return None
+        # Vértice nuevo en cada arista de un vértice de afuera a uno de adentro
+        hechos, nuevos_V, nuevos_planos = set(), [], []
+        for u in np.flatnonzero(afuera):
+            for par in combinations(sorted(planos[u]), 2):
+                recta = aristas.get(par)
+                if recta is None:
+                    continue
+                vecinos = [w for w in recta if w != u]
+                if len(recta) > 2:
+                    # Por tolerancias puede haber más de dos en la recta: solo los contiguos a u
+                    direccion = np.cross(normales[par[0]], normales[par[1]])
+                    orden = sorted(recta, key=lambda w: V[w] @ direccion)
+                    pos = orden.index(u)
+                    vecinos = orden[max(pos - 1, 0):pos] + orden[pos + 1:pos + 2]
+                for w in vecinos:
+                    if s[w] >= -tol[w] or (u, w) in hechos:
+                        continue
+                    hechos.add((u, w))
+                    t = s[u] / (s[u] - s[w])
+                    nuevos_V.append(V[u] + t * (V[w] - V[u]))
+                    nuevos_planos.append((planos[u] & planos[w]) | {j})
+        for u in np.flatnonzero(afuera):
+            for par in combinations(sorted(planos[u]), 2):
+                recta = aristas.get(par)
+                if recta is not None:
+                    recta.discard(u)
+        vivo &= ~afuera
+        for k in np.flatnonzero(sobre):
+            planos[k].add(j)
+            registrar(k, [j])
+        if nuevos_V:
+            inicio = len(V)
+            V = np.vstack([V, nuevos_V])
+            tol = np.concatenate([tol, _tolerancias(V[inicio:])])
+            vivo = np.concatenate([vivo, np.ones(len(nuevos_V), dtype=bool)])
+            for k, conjunto in enumerate(nuevos_planos, start=inicio):
+                planos.append(conjunto)
+                registrar(k, list(conjunto))
+
+    indices = np.flatnonzero(vivo)
+    Z = np.zeros((len(indices), H + 3), dtype=bool)
+    for fila, k in enumerate(indices):
+        Z[fila, list(planos[k])] = True
+    return _unicos(V[indices], Z)
+
+
+def _ternas(N, d, R):
+    """Lo mismo resolviendo los sistemas 3×3 de todas las ternas de planos a la vez."""
+    N = np.vstack([N, np.eye(3)])
+    d = np.concatenate([d, [R, R, R]])
+    ternas = np.array(list(combinations(range(len(N)), 3)), dtype=np.int64).reshape(-1, 3)
+    M = N[ternas]
+    det = np.linalg.det(M)
+    validas = np.abs(det) > 1e-12
+    V = np.linalg.solve(M[validas], d[ternas[validas]][..., None])[..., 0] + 0.0
+    holgura = V @ N.T - d
+    tol = _tolerancias(V)[:, None]
+    factibles = (holgura <= tol).all(axis=1)
+    V, holgura = V[factibles], holgura[factibles]
+    if not len(V):
+        return None
+    return _unicos(V, np.abs(holgura) <= _tolerancias(V)[:, None])
+
+
+def poliedro_factible(A, b, operadores, radio=None, metodo='auto'):
+    """
+    Poliedro de {x, y, z ≥ 0, A·p op b} dentro de la caja. Devuelve (vertices (k×3),
+    incidencia (k×H, bool), ids (H: fila de A, PLANO_* o CAJA_*), normales (H×3)) o None si es
+    vacío. metodo: 'doble_descripcion', 'ternas' o 'auto' (ver elegir_metodo).
+    """
+    if metodo not in METODOS:
+        raise ValueError(f"metodo debe ser uno de {', '.join(METODOS)} (se recibió {metodo!r})")
+    if metodo == 'auto':
+        metodo = elegir_metodo(operadores)
+    N, d, ids, vacia = _semiespacios(A, b, operadores)
+    if vacia:
+        return None
+    R = radio_caja(A, b) if radio is None else radio
+    region = (_ternas if metodo == 'ternas' else _doble_descripcion)(N, d, R)
+    if region is None:
+        return None
+    vertices, incidencia = region
+    ids = np.concatenate([ids, PLANOS_CAJA])
+    normales = np.vstack([N, np.eye(3)])
+    return vertices, incidencia, ids, normales
+
+
+def en_caja(incidencia, ids):
+    """Qué vértices están en alguna cara de la caja lejana (no son vértices reales)."""
+    return incidencia[:, np.isin(ids, PLANOS_CAJA)].any(axis=1)
+
+
+def caras(vertices, incidencia, normales):
+    """
+    Caras del poliedro: por plano con al menos 3 vértices no alineados, (columna, índices en
+    orden antihorario vistos desde afuera). Las repetidas (una fila '=' son dos planos) van una vez.
+    """
+    resultado, vistas = [], set()
+    for j in range(incidencia.shape[1]):
+        indices = np.flatnonzero(incidencia[:, j])
+        if len(indices) < 3 or frozenset(indices.tolist()) in vistas:
+            continue
+        n = normales[j]
+        # Base del plano: u ⟂ n y w = n × u (u, w, n en sentido directo)
+        u = np.cross(n, np.eye(3)[np.argmin(np.abs(n))])
+        u /= np.linalg.norm(u)
+        w = np.cross(n, u)
+        puntos = vertices[indices]
+        relativos = puntos - puntos.mean(axis=0)
+        indices = indices[np.argsort(np.arctan2(relativos @ w, relativos @ u))]
+        # Área (doble) del polígono: si es ~0 los vértices están sobre una recta (arista, no cara)
+        p = vertices[indices]
+        area = np.linalg.norm(np.cross(p, np.roll(p, -1, axis=0)).sum(axis=0))
+        if area <= TOL * max(1.0, float(np.abs(p).max())) ** 2:
+            continue
+        vistas.add(frozenset(indices.tolist()))
+        resultado.append((j, indices))
+    return resultado
+
+
+def triangulos(lista_caras):
+    """Triángulos en abanico de cada cara: (i, j, k) como los pide un mesh3d de Plotly."""
+    tri = [(cara[0], cara[t], cara[t + 1]) for _, cara in lista_caras for t in range(1, len(cara) - 1)]
+    i, j, k = (list(map(int, col)) for col in zip(*tri)) if tri else ([], [], [])
+    return i, j, k
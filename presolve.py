@@ -0,0 +1,530 @@
+"""
+Presolve / postsolve: reducir el problema antes de resolverlo.
+
+Los modelos que llegan del usuario suelen traer filas repetidas, vacías o implícitas que
+en la tabla cuestan O(m·n) por pivote sin aportar nada. Antes de llamar al método se
+aplican, hasta que ya no cambia nada, estas reducciones:
+
+  - Filas vacías (0 ≤ b, 0 ≥ b, 0 = b): se quitan, o el problema es infactible.
+  - Filas singleton (a·x_j op b): son un límite de x_j. Si el método acepta límites
+    (modo revisado) la fila se quita y pasa a `limites`; en la tabla la fila se deja pero
+    el límite se usa igual para las demás reducciones.
+  - Variables fijas (l_j = u_j): se reemplazan por su valor (b ← b − a_j·l_j) y se quita la columna.
+  - Columnas dominadas: si subir x_j empeora Z y no ayuda a ninguna restricción, x_j queda
+    en su límite inferior (o en el superior, si es finito, en el caso opuesto).
+  - Filas duplicadas (proporcionales): se deja la más ajustada de cada sentido.
+  - Filas redundantes por actividad: con los límites de las variables, si el lado
+    izquierdo nunca puede violar la restricción, la fila sobra (y si nunca puede
+    cumplirla, el problema es infactible).
+  - Al final, las filas que quedan con b < 0 se multiplican por -1 (≤ ↔ ≥) para que la
+    base inicial de holguras/artificiales sea factible.
+
+El postsolve devuelve la solución al espacio original (variables fijas incluidas) y deja
+en el resultado qué se quitó, para que el registro de pasos siga siendo explicable.
+"""
+
+import numpy as np
+
+from matriz_dispersa import MatrizDispersa
+
+
+class Presolve:
+    """Reduce un problema (c, A, b, operadores, límites) y deshace la reducción en la solución."""
+
+    def __init__(self, c, A, b, operadores, objetivo='max', inferiores=None, superiores=None,
+                 convertir_singletons=True, eliminar_columnas=True, tol=1e-9, max_pasadas=20):
+        self.c = np.array(c, dtype=float)
+        self.A = A
+        self.b = np.array(b, dtype=float)
+        self.operadores = list(operadores)
+        self.objetivo = objetivo
+        m, n = len(self.b), len(self.c)
+        self.m, self.n = m, n
+        self.inferiores = np.zeros(n) if inferiores is None else np.array(inferiores, dtype=float)
+        self.superiores = np.full(n, np.inf) if superiores is None else np.array(superiores, dtype=float)
+        # Límites para el análisis: los reales más los que implican las filas singleton que se dejan
+        self.l_analisis = self.inferiores.copy()
+        self.u_analisis = self.superiores.copy()
+        self.convertir_singletons = convertir_singletons
+        self.eliminar_columnas = eliminar_columnas
+        self.tol = tol
+        self.max_pasadas = max_pasadas
+
+        # Coeficientes no nulos como tripletes (igual para A densa o dispersa)
+        if isinstance(A, MatrizDispersa):
+            self.fila_t = A.indices.copy()
+            self.col_t = np.repeat(np.arange(A.shape[1]), np.diff(A.indptr))
+            self.val_t = A.datos.copy()
+        else:
+            A = np.asarray(A, dtype=float).reshape(m, n)
+            self.fila_t, self.col_t = np.nonzero(A)
+            self.val_t = A[self.fila_t, self.col_t]
+        no_nulos = np.abs(self.val_t) > tol
+        self.fila_t, self.col_t, self.val_t = self.fila_t[no_nulos], self.col_t[no_nulos], self.val_t[no_nulos]
+
+        self.fila_activa = np.ones(m, dtype=bool)
+        self.col_activa = np.ones(n, dtype=bool)
+        self.singleton_fija = np.zeros(m, dtype=bool)   # singletons que se dejan como fila
+        self.singletons = {}                           # fila pasada a límite → (columna, valor)
+        self.en_superior_base = []                     # ver traducir_base
+        self.signo_fila = np.ones(m)                    # -1 en las filas que se invierten al final
+        self.valores_fijos = {}                        # columna original → valor
+        self.reducciones = []                          # texto para el registro de pasos
+        self.motivo = ""                               # por qué es infactible / no acotado
+        self.estado = None
+        self.solucion = None                           # si el presolve resuelve todo
+
+    # ---- Utilidades ----
+
+    @property
+    def c_min(self):
+        """Costos en forma de minimización."""
+        return -self.c if self.objetivo == 'max' else self.c
+
+    def _entradas_activas(self):
+        mascara = self.fila_activa[self.fila_t] & self.col_activa[self.col_t]
+        return self.fila_t[mascara], self.col_t[mascara], self.val_t[mascara]
+
+    def _cumple(self, valor, op, b):
+        holgura = self.tol * (1.0 + abs(b))
+        if op == '<=':
+            return valor <= b + holgura
+        if op == '>=':
+            return valor >= b - holgura
+        return abs(valor - b) <= holgura
+
+    def _infactible(self, motivo):
+        self.motivo = motivo
+        self.reducciones.append(f"✗ {motivo}")
+        self.estado = 'infeasible'
+        return self.estado
+
+    def _fijar(self, j, valor, razon):
+        """Sustituye x_j = valor en todas las filas y quita la columna."""
+        filas, cols, vals = self._entradas_activas()
+        en_j = cols == j
+        np.subtract.at(self.b, filas[en_j], vals[en_j] * valor)
+        self.col_activa[j] = False
+        self.valores_fijos[j] = float(valor)
+        self.reducciones.append(f"x{j+1} = {valor:g} ({razon}): se quita la columna")
+
+    # ---- Reducciones ----
+
+    def _filas_vacias_y_singletons(self):
+        filas, cols, vals = self._entradas_activas()
+        nnz = np.bincount(filas, minlength=self.m)
+        cambio = False
+        for i in np.flatnonzero(self.fila_activa & (nnz == 0)):
+            op = self.operadores[i]
+            if not self._cumple(0.0, op, self.b[i]):
+                return self._infactible(f"R{i+1} quedó como 0 {op} {self.b[i]:g}")
+            self.fila_activa[i] = False
+            self.reducciones.append(f"R{i+1}: fila vacía (0 {op} {self.b[i]:g}), se quita")
+            cambio = True
+        for i in np.flatnonzero(self.fila_activa & (nnz == 1) & ~self.singleton_fija):
+            k = int(np.flatnonzero(filas == i)[0])
+            j, a = int(cols[k]), float(vals[k])
+            valor = self.b[i] / a
+            op = self.operadores[i]
+            if a < 0 and op != '=':
+                op = '>=' if op == '<=' else '<='
+            pares = [(self.l_analisis, self.u_analisis)]
+            if self.convertir_singletons:
+                pares.append((self.inferiores, self.superiores))
+            for inferiores, superiores in pares:
+                if op in ('<=', '='):
+                    superiores[j] = min(superiores[j], valor)
+                if op in ('>=', '='):
+                    inferiores[j] = max(inferiores[j], valor)
+            if self.l_analisis[j] > self.u_analisis[j] + self.tol * (1.0 + abs(valor)):
+                return self._infactible(f"x{j+1} no puede cumplir {self.l_analisis[j]:g} ≤ x{j+1} ≤ {self.u_analisis[j]:g}")
+            if self.convertir_singletons:
+                self.fila_activa[i] = False
+                self.singletons[int(i)] = (j, valor)
+                self.reducciones.append(f"R{i+1}: fila singleton → límite x{j+1} {op} {valor:g}")
+            else:
+                self.singleton_fija[i] = True
+            cambio = True
+        return cambio
+
+    def _variables_fijas(self):
+        if not self.eliminar_columnas:
+            return False
+        cambio = False
+        for j in np.flatnonzero(self.col_activa):
+            l, u = self.l_analisis[j], self.u_analisis[j]
+            if np.isfinite(u) and u - l <= self.tol * (1.0 + abs(l)):
+                self._fijar(j, l, "límite inferior = superior")
+                cambio = True
+        return cambio
+
+    def _columnas_dominadas(self):
+        if not self.eliminar_columnas:
+            return False
+        filas, cols, vals = self._entradas_activas()
+        ops = np.array(self.operadores)[filas] if len(filas) else np.array([], dtype=str)
+        # Subir x_j empeora la fila ('pesa') o la ayuda; en una igualdad no se sabe
+        pesa = ((ops == '<=') & (vals > 0)) | ((ops == '>=') & (vals < 0))
+        ayuda = ((ops == '<=') & (vals < 0)) | ((ops == '>=') & (vals > 0))
+        total = np.bincount(cols, minlength=self.n)
+        n_pesa = np.bincount(cols, weights=pesa, minlength=self.n)
+        n_ayuda = np.bincount(cols, weights=ayuda, minlength=self.n)
+        c_min = self.c_min
+        cambio = False
+        for j in np.flatnonzero(self.col_activa):
+            if c_min[j] > self.tol and n_pesa[j] == total[j]:
+                self._fijar(j, self.l_analisis[j], "columna dominada: subirla solo empeora Z")
+                cambio = True
+            elif c_min[j] < -self.tol and n_ayuda[j] == total[j] and np.isfinite(self.u_analisis[j]):
+                self._fijar(j, self.u_analisis[j], "columna dominada: conviene en su límite superior")
+                cambio = True
+        return cambio
+
+    def _filas_duplicadas(self):
+        filas, cols, vals = self._entradas_activas()
+        orden = np.lexsort((cols, filas))
+        filas, cols, vals = filas[orden], cols[orden], vals[orden]
+        cortes = np.flatnonzero(np.diff(filas)) + 1
+        grupos = {}
+        for f, c, v in zip(np.split(filas, cortes), np.split(cols, cortes), np.split(vals, cortes)):
+            if not len(f):
+                continue
+            i = int(f[0])
+            escala = v[0]
+            clave = (tuple(c.tolist()), tuple(np.round(v / escala, 9).tolist()))
+            grupos.setdefault(clave, []).append((i, escala))
+        cambio = False
+        for miembros in grupos.values():
+            if len(miembros) < 2:
+                continue
+            # Cada fila normalizada da una cota inferior y/o superior para la misma expresión
+            superiores, inferiores = [], []
+            for i, escala in miembros:
+                op = self.operadores[i]
+                if escala < 0 and op != '=':
+                    op = '>=' if op == '<=' else '<='
+                valor = self.b[i] / escala
+                preferencia = 0 if op == '=' else 1   # en empates se queda la igualdad
+                if op in ('<=', '='):
+                    superiores.append((valor, preferencia, i))
+                if op in ('>=', '='):
+                    inferiores.append((-valor, preferencia, i))
+            conservar = set()
+            if superiores:
+                conservar.add(min(superiores)[2])
+            if inferiores:
+                conservar.add(min(inferiores)[2])
+            if superiores and inferiores and -min(inferiores)[0] > min(superiores)[0] + self.tol * (1.0 + abs(min(superiores)[0])):
+                return self._infactible(f"R{min(inferiores)[2]+1} y R{min(superiores)[2]+1} son proporcionales y se contradicen")
+            for i, _ in miembros:
+                if i not in conservar:
+                    self.fila_activa[i] = False
+                    self.singleton_fija[i] = False
+                    self.reducciones.append(f"R{i+1}: duplicada (proporcional a "
+                                            f"R{'/R'.join(str(k+1) for k in sorted(conservar))}), se quita")
+                    cambio = True
+        return cambio
+
+    def _filas_redundantes(self):
+        filas, cols, vals = self._entradas_activas()
+        l, u = self.l_analisis[cols], self.u_analisis[cols]
+        with np.errstate(invalid='ignore'):
+            minimo = np.bincount(filas, weights=np.where(vals > 0, vals * l, vals * u), minlength=self.m)
+            maximo = np.bincount(filas, weights=np.where(vals > 0, vals * u, vals * l), minlength=self.m)
+        cambio = False
+        for i in np.flatnonzero(self.fila_activa & ~self.singleton_fija):
+            op, b = self.operadores[i], self.b[i]
+            holgura = self.tol * (1.0 + abs(b))
+            if (op != '>=' and minimo[i] > b + holgura) or (op != '<=' and maximo[i] < b - holgura):
+                return self._infactible(f"R{i+1} no se puede cumplir con los límites de las variables "
+                                        f"(el lado izquierdo está entre {minimo[i]:g} y {maximo[i]:g})")
+            if (op == '<=' and maximo[i] <= b + holgura) or (op == '>=' and minimo[i] >= b - holgura):
+                self.fila_activa[i] = False
+                self.reducciones.append(f"R{i+1}: redundante (el lado izquierdo está entre "
+                                        f"{minimo[i]:g} y {maximo[i]:g}), se quita")
+                cambio = True
+        return cambio
+
+    def _resolver_sin_filas(self):
+        """Sin restricciones: cada variable va al límite que más conviene a Z."""
+        x = self.l_analisis.copy()
+        c_min = self.c_min
+        for j in np.flatnonzero(self.col_activa):
+            if c_min[j] < -self.tol:
+                if not np.isfinite(self.u_analisis[j]):
+                    self.motivo = f"x{j+1} mejora Z sin límite y ninguna restricción la frena"
+                    self.reducciones.append(f"⚠ {self.motivo}")
+                    return 'unbounded'
+                x[j] = self.u_analisis[j]
+        for j, valor in self.valores_fijos.items():
+            x[j] = valor
+        self.solucion = x
+        self.reducciones.append("No quedan restricciones: cada variable toma su mejor límite")
+        return 'resuelto'
+
+    def reducir(self):
+        """
+        Aplica las reducciones hasta que ya no cambia nada.
+        Devuelve 'reducido', 'infeasible', 'unbounded' o 'resuelto' (no quedó nada por resolver).
+        """
+        for _ in range(self.max_pasadas):
+            cambio = False
+            for paso in (self._filas_vacias_y_singletons, self._variables_fijas, self._columnas_dominadas,
+                         self._filas_duplicadas, self._filas_redundantes):
+                resultado = paso()
+                if self.estado == 'infeasible':
+                    return self.estado
+                cambio = cambio or resultado
+            if not cambio:
+                break
+        if not self.fila_activa.any() and self.eliminar_columnas:
+            self.estado = self._resolver_sin_filas()
+            return self.estado
+        for i in np.flatnonzero(self.fila_activa & (self.b < -self.tol)):
+            self.signo_fila[i] = -1.0
+            self.reducciones.append(f"R{i+1}: lado derecho negativo, se multiplica por -1")
+        self.estado = 'reducido'
+        return self.estado
+
+    # ---- Problema reducido y postsolve ----
+
+    @property
+    def filas(self):
+        return np.flatnonzero(self.fila_activa)
+
+    @property
+    def columnas(self):
+        return np.flatnonzero(self.col_activa)
+
+    def problema_reducido(self):
+        """(c, A, b, operadores, inferiores, superiores) con las filas y columnas que quedan."""
+        filas, columnas = self.filas, self.columnas
+        signo = self.signo_fila[filas]
+        if isinstance(self.A, MatrizDispersa):
+            nueva_fila = np.full(self.m, -1)
+            nueva_fila[filas] = np.arange(len(filas))
+            nueva_col = np.full(self.n, -1)
+            nueva_col[columnas] = np.arange(len(columnas))
+            f, c, v = self._entradas_activas()
+            A = MatrizDispersa.desde_triplete(nueva_fila[f], nueva_col[c], v * self.signo_fila[f],
+                                              (len(filas), len(columnas)))
+        else:
+            A = np.asarray(self.A, dtype=float).reshape(self.m, self.n)[np.ix_(filas, columnas)] * signo[:, None]
+        opuesto = {'<=': '>=', '>=': '<=', '=': '='}
+        operadores = [opuesto[self.operadores[i]] if self.signo_fila[i] < 0 else self.operadores[i] for i in filas]
+        return (self.c[columnas], A, self.b[filas] * signo, operadores,
+                self.inferiores[columnas], self.superiores[columnas])
+
+    @staticmethod
+    def _nombres_por_fila(operadores):
+        """
+        Holgura/exceso y artificial de cada fila (None si no tiene), numeradas como en la
+        forma estándar: s por cada <=, e por cada >=, a por cada >= o =.
+        """
+        cuenta = {'s': 0, 'e': 0, 'a': 0}
+
+        def nombre(prefijo):
+            cuenta[prefijo] += 1
+            return f"{prefijo}{cuenta[prefijo]}"
+
+        holguras, artificiales = [], []
+        for op in operadores:
+            holguras.append(nombre('s') if op == '<=' else nombre('e') if op == '>=' else None)
+            artificiales.append(nombre('a') if op != '<=' else None)
+        return holguras, artificiales
+
+    def _equivalencias(self, reducidos=None):
+        """
+        Nombres s/e/a del problema reducido ↔ originales, fila por fila. Una fila invertida
+        (≤ ↔ ≥) cambia de holgura a exceso; si solo uno de los dos lados tiene artificial, esta
+        se corresponde con la holgura/exceso de la misma fila del otro lado. `reducidos`: los
+        operadores con que el método resolvió el reducido (el cambio x = l + x' puede invertir filas).
+        """
+        filas = self.filas
+        if reducidos is None:
+            opuesto = {'<=': '>=', '>=': '<=', '=': '='}
+            reducidos = [opuesto[self.operadores[i]] if self.signo_fila[i] < 0 else self.operadores[i] for i in filas]
+        h_red, a_red = self._nombres_por_fila(reducidos)
+        h_orig, a_orig = self._nombres_por_fila(self.operadores)
+        a_original, a_reducido = {}, {}
+        for k, i in enumerate(filas):
+            for nombre, destino in ((h_red[k], h_orig[i] or a_orig[i]), (a_red[k], a_orig[i] or h_orig[i])):
+                if nombre is not None:
+                    a_original[nombre] = destino
+            for nombre, destino in ((h_orig[i], h_red[k] or a_red[k]), (a_orig[i], a_red[k] or h_red[k])):
+                if nombre is not None:
+                    a_reducido[nombre] = destino
+        return a_original, a_reducido, h_orig, a_orig
+
+    def traducir_nombre(self, nombre, equivalencias=None):
+        """Nombre de columna del problema reducido → nombre en el problema original."""
+        if nombre.startswith('x') and nombre[1:].isdigit():
+            return f"x{self.columnas[int(nombre[1:]) - 1] + 1}"
+        a_original = (equivalencias or self._equivalencias())[0]
+        return a_original.get(nombre, nombre)
+
+    def traducir_variables_basicas(self, basicas, solucion=None, operadores=None):
+        """
+        Base del problema reducido → base del original, con una variable por fila original:
+        cada fila quitada aporta su holgura (o exceso / artificial), salvo una singleton pasada
+        a límite cuya variable quedó en ese límite fuera de la base reducida: ahí la básica de
+        la fila es la variable y la holgura queda en 0.
+        """
+        equivalencias = self._equivalencias(operadores)
+        _, _, h_orig, a_orig = equivalencias
+        traducidas = [self.traducir_nombre(v, equivalencias) for v in basicas]
+        presentes = set(traducidas)
+        por_fila = {}
+        for i in np.flatnonzero(~self.fila_activa):
+            nombre = h_orig[i] or a_orig[i]
+            if i in self.singletons and solucion is not None:
+                j, valor = self.singletons[i]
+                if f"x{j+1}" not in presentes and abs(solucion[j] - valor) <= self.tol * (1.0 + abs(valor)):
+                    nombre = f"x{j+1}"
+            por_fila[int(i)] = nombre
+            presentes.add(nombre)
+        if len(traducidas) != len(self.filas):
+            return traducidas + list(por_fila.values())
+        # Misma cantidad que filas reducidas: cada básica queda en la posición de su fila
+        resto = iter(traducidas)
+        return [por_fila[i] if i in por_fila else next(resto) for i in range(self.m)]
+
+    def traducir_base(self, base):
+        """
+        Base con nombres originales → nombres del problema reducido (para el arranque en
+        caliente). Se descartan las variables de filas y columnas quitadas, y la de una fila
+        singleton pasada a límite cuya holgura no está en la base (la variable queda en su límite).
+        Guarda en `en_superior_base` las columnas reducidas que quedan en el límite superior.
+        """
+        nueva_posicion = {int(j): k for k, j in enumerate(self.columnas)}
+        _, a_reducido, h_orig, a_orig = self._equivalencias()
+        quitadas = {v for i in np.flatnonzero(~self.fila_activa) for v in (h_orig[i], a_orig[i]) if v}
+        nombres = {v for v in base if isinstance(v, str)}
+        en_limite = {}
+        for i, (j, valor) in self.singletons.items():
+            if (h_orig[i] or a_orig[i]) not in nombres and f"x{j+1}" in nombres:
+                en_limite[f"x{j+1}"] = valor == self.superiores[j]
+        traducida = []
+        self.en_superior_base = []
+        for v in base:
+            if not isinstance(v, str):
+                traducida.append(v)
+            elif v in en_limite:
+                if en_limite[v] and int(v[1:]) - 1 in nueva_posicion:
+                    self.en_superior_base.append(nueva_posicion[int(v[1:]) - 1])
+            elif v.startswith('x') and v[1:].isdigit():
+                if int(v[1:]) - 1 in nueva_posicion:
+                    traducida.append(f"x{nueva_posicion[int(v[1:]) - 1] + 1}")
+                elif int(v[1:]) - 1 not in self.valores_fijos:
+                    traducida.append(v)
+            elif v not in quitadas:
+                traducida.append(a_reducido.get(v, v))
+        return traducida
+
+    def postsolve(self, solucion_reducida):
+        """Solución del problema reducido → solución en las variables originales."""
+        x = np.zeros(self.n)
+        x[self.columnas] = solucion_reducida
+        for j, valor in self.valores_fijos.items():
+            x[j] = valor
+        return x
+
+    def resumen(self):
+        return {
+            "filas_eliminadas": int(self.m - self.fila_activa.sum()),
+            "columnas_eliminadas": int(self.n - self.col_activa.sum()),
+            "reducciones": list(self.reducciones),
+        }
+
+    def completar_resultado(self, resultado, operadores=None):
+        """
+        Lleva el resultado del método (problema reducido) al problema original. `operadores`:
+        los del método al terminar, para nombrar sus holguras como él (ver _equivalencias).
+        """
+        if "solucion" in resultado:   # óptima o la base actual de un corte (z_actual)
+            x = self.postsolve(np.array(resultado["solucion"], dtype=float))
+            resultado["solucion"] = [float(v) for v in x]
+            resultado["z_optimo" if resultado.get("status") == "optimal" else "z_actual"] = float(self.c @ x)
+        if "variables_basicas" in resultado:
+            resultado["variables_basicas"] = self.traducir_variables_basicas(resultado["variables_basicas"],
+                                                                             resultado.get("solucion"), operadores)
+        resultado["presolve"] = self.resumen()
+        return resultado
+
+    def resultado_directo(self, pasos):
+        """Resultado cuando el presolve ya decide el problema (infactible, no acotado o resuelto)."""
+        if self.estado == 'infeasible':
+            return {
+                "status": "infeasible",
+                "tipo_solucion": "Problema No Factible",
+                "explicacion": f"El presolve encontró restricciones contradictorias: {self.motivo}.",
+                "pasos": pasos,
+                "tablas": [],
+                "presolve": self.resumen(),
+            }
+        if self.estado == 'unbounded':
+            return {
+                "status": "unbounded",
+                "tipo_solucion": "Problema No Acotado",
+                "explicacion": f"El problema no tiene solución óptima finita: {self.motivo}.",
+                "pasos": pasos,
+                "tablas": [],
+                "presolve": self.resumen(),
+            }
+        x = self.solucion
+        libres = [j for j in self.columnas if abs(self.c_min[j]) <= self.tol
+                  and self.u_analisis[j] > self.l_analisis[j] + self.tol]
+        if libres:
+            tipo_solucion = "Solución Múltiple (Infinitas Soluciones)"
+            explicacion = (f"Las variables {', '.join(f'x{j+1}' for j in libres)} no aparecen en Z ni en "
+                           f"ninguna restricción que quede: cualquier valor dentro de sus límites es óptimo.")
+        else:
+            tipo_solucion = "Solución Única"
+            explicacion = "El presolve resolvió el problema: cada variable quedó en su mejor límite."
+        return {
+            "status": "optimal",
+            "tipo_solucion": tipo_solucion,
+            "explicacion": explicacion,
+            "z_optimo": float(self.c @ x),
+            "solucion": [float(v) for v in x],
+            "iteraciones": 0,
+            "pasos": pasos,
+            "tablas": [],
+            "presolve": self.resumen(),
+        }
+
+
+def presolve_metodo(metodo):
+    """
+    Aplica el presolve a un MetodoSimplex / MetodoDosFases: registra las reducciones y
+    reemplaza su problema por el reducido. Las filas singleton pasan a límites solo si el
+    método va a usar el Simplex Revisado. Devuelve el Presolve (para el postsolve).
+    """
+    convertir = (metodo.modo == 'revisado' or metodo.base_inicial is not None
+                 or metodo.superiores is not None)
+    presolve = Presolve(metodo.c, metodo.A, metodo.b, metodo.operadores, metodo.objetivo,
+                        metodo.inferiores, metodo.superiores, convertir_singletons=convertir)
+    presolve.reducir()
+    if metodo.con_pasos:
+        metodo.registrar_paso("=== PRESOLVE ===")
+        for reduccion in presolve.reducciones:
+            metodo.registrar_paso(f"  {reduccion}")
+        if not presolve.reducciones:
+            metodo.registrar_paso("  Sin reducciones: se resuelve el problema tal cual.")
+    if presolve.estado != 'reducido' or not presolve.reducciones:
+        return presolve
+
+    c, A, b, operadores, inferiores, superiores = presolve.problema_reducido()
+    metodo.c, metodo.A, metodo.b, metodo.operadores = c, A, b, operadores
+    if convertir and (metodo.superiores is not None or np.any(inferiores != 0) or np.isfinite(superiores).any()):
+        metodo.inferiores, metodo.superiores = inferiores, superiores
+    if metodo.base_inicial is not None:
+        metodo.base_inicial = presolve.traducir_base(metodo.base_inicial)
+        metodo.base_en_superior = presolve.en_superior_base
+    if metodo.con_pasos:
+        metodo.registrar_paso(f"  Problema reducido: {presolve.m} → {len(b)} restricciones, "
+                              f"{presolve.n} → {len(c)} variables")
+        if len(c) < presolve.n:
+            metodo.registrar_paso("  Variables del problema reducido: " + ", ".join(
+                f"x{k+1} = x{j+1}" for k, j in enumerate(presolve.columnas)))
+    return presolve
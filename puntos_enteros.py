@@ -0,0 +1,108 @@
+"""
+Puntos enteros de la región factible del método gráfico (modo enteros).
+
+Los puntos con x e y enteros dentro de un polígono convexo se cuentan por columnas: para
+cada x entera, la recta vertical corta el polígono en un intervalo [y_abajo, y_arriba] que
+sale de interpolar en la cadena inferior y en la superior del borde; los enteros de la
+columna son ceil(y_abajo) .. floor(y_arriba). Se barre el eje con menos columnas, así que el
+costo es O(k + ancho) y no el de recorrer todo el recuadro (ancho · alto).
+
+En cada columna el mejor entero para Z está en una punta del intervalo (Z es lineal en y),
+así que el óptimo entero sale comparando una punta por columna, sin listar los puntos. La
+lista para la gráfica se arma solo si hay a lo sumo LIMITE_PUNTOS.
+"""
+
+import numpy as np
+
+TOL = 1e-9
+LIMITE_PUNTOS = 5000        # más puntos no se listan (solo las columnas)
+LIMITE_COLUMNAS = 100_000   # más columnas: la región es demasiado ancha para barrerla
+
+
+def _cadenas(P):
+    """
+    Cadenas inferior y superior del polígono convexo P (k×2, sin repetir el primero al final),
+    las dos con x creciente para np.interp. También sirve si P es un segmento o un punto.
+    """
+    x, y = P[:, 0], P[:, 1]
+    area2 = float(np.sum(x * np.roll(y, -1) - np.roll(x, -1) * y))
+    if area2 < 0:
+        P = P[::-1]
+    # Se empieza en el punto más a la izquierda y más abajo; en sentido antihorario se
+    # recorre el borde de abajo hasta la derecha y vuelve por arriba
+    P = np.roll(P, -int(np.lexsort((P[:, 1], P[:, 0]))[0]), axis=0)
+    x, y = P[:, 0], P[:, 1]
+    fin_inferior = int(np.lexsort((y, -x))[0])      # más a la derecha, más abajo
+    inicio_superior = int(np.lexsort((-y, -x))[0])  # más a la derecha, más arriba
+    fin_superior = int(np.lexsort((-y, x))[0])      # más a la izquierda, más arriba
+    inferior = P[:fin_inferior + 1]
+    if fin_superior == 0:
+        superior = np.vstack([P[inicio_superior:], P[:1]])
+    else:
+        superior = P[inicio_superior:fin_superior + 1]
+    return inferior, superior[::-1]
+
+
+def barrido_enteros(poligono, c, objetivo='max', limite_puntos=LIMITE_PUNTOS):
+    """
+    poligono: vértices (k×2) en orden, cerrado o no, de una región convexa acotada.
+    Devuelve un dict con las columnas ("eje" barrido, "valores", "desde", "hasta"), "total"
+    de puntos enteros, el mejor ("punto", "z", "empates": cuántos enteros lo alcanzan) y
+    "puntos" ({"x": [...], "y": [...]} o None si pasan de limite_puntos). Sin puntos
+    enteros, "punto" y "z" son None. None si hay más de LIMITE_COLUMNAS columnas.
+    """
+    P = np.asarray(poligono, dtype=float).reshape(-1, 2)
+    if len(P) > 1 and np.allclose(P[0], P[-1]):
+        P = P[:-1]
+    c = np.asarray(c, dtype=float).ravel()
+    escala = max(1.0, float(np.abs(P).max(initial=0.0)))
+    tol = TOL * escala
+
+    # Eje con menos columnas enteras
+    lo, hi = P.min(axis=0), P.max(axis=0)
+    columnas = np.floor(hi + tol) - np.ceil(lo - tol) + 1
+    eje = 'y' if columnas[1] < columnas[0] else 'x'
+    if eje == 'y':
+        P, c, lo, hi = P[:, ::-1], c[::-1], lo[::-1], hi[::-1]
+    n = int(max(0.0, min(columnas)))
+    if n > LIMITE_COLUMNAS:
+        return None
+
+    u = np.ceil(lo[0] - tol) + np.arange(n, dtype=float)
+    # x casi iguales a los extremos se igualan: un lado vertical no debe quedar inclinado
+    x = P[:, 0].copy()
+    x[x <= lo[0] + tol], x[x >= hi[0] - tol] = lo[0], hi[0]
+    inferior, superior = _cadenas(np.column_stack([x, P[:, 1]]))
+    desde = np.ceil(np.interp(u, inferior[:, 0], inferior[:, 1]) - tol)
+    hasta = np.floor(np.interp(u, superior[:, 0], superior[:, 1]) + tol)
+    con_puntos = desde <= hasta
+    u, desde, hasta = u[con_puntos], desde[con_puntos], hasta[con_puntos]
+    cuantos = (hasta - desde + 1).astype(np.int64)
+    total = int(cuantos.sum())
+
+    resultado = {"eje": eje, "valores": u.astype(int).tolist(), "desde": desde.astype(int).tolist(),
+                 "hasta": hasta.astype(int).tolist(), "total": total, "punto": None, "z": None,
+                 "empates": 0, "puntos": None}
+    if total == 0:
+        return resultado
+
+    # Mejor punta de cada columna: la de arriba si subir y mejora Z
+    signo = 1.0 if objetivo == 'max' else -1.0
+    mejor_v = np.where(signo * c[1] > 0, hasta, desde)
+    z = c[0] * u + c[1] * mejor_v
+    k = int(np.argmax(signo * z))
+    empatan = np.isclose(z, z[k], rtol=TOL, atol=TOL * (1.0 + abs(z[k])))
+    # Con c_y = 0 empata toda la columna
+    resultado["empates"] = int(cuantos[empatan].sum()) if c[1] == 0 else int(empatan.sum())
+    punto = [int(u[k]), int(mejor_v[k])]
+    resultado["punto"] = punto[::-1] if eje == 'y' else punto
+    resultado["z"] = float(z[k])
+
+    if total <= limite_puntos:
+        # Columna repetida por cada punto y, dentro de ella, desde, desde+1, ...
+        inicio = np.repeat(np.cumsum(cuantos) - cuantos, cuantos)
+        pu = np.repeat(u, cuantos).astype(int)
+        pv = (np.repeat(desde, cuantos) + np.arange(total) - inicio).astype(int)
+        px, py = (pv, pu) if eje == 'y' else (pu, pv)
+        resultado["puntos"] = {"x": px.tolist(), "y": py.tolist()}
+    return resultado
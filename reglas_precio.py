@@ -0,0 +1,197 @@
+"""
+Reglas de precio (pricing): cómo elegir la variable entrante.
+
+Hasta ahora los tres bucles Simplex usaban siempre la regla de Dantzig (el costo reducido
+más negativo). En problemas degenerados o grandes otras reglas hacen muchas menos
+iteraciones. Todas las reglas trabajan con el mismo convenio:
+
+    d_j < -tol  ⇔  la variable j mejora el objetivo al entrar
+
+(cada método normaliza su fila Z/W a ese convenio antes de llamar a `elegir`).
+
+Reglas disponibles (parámetro `precio` de los métodos y campo "precio" de los endpoints):
+  - 'dantzig'       : mínimo d_j.
+  - 'parcial'       : precio parcial/múltiple; se revisa un segmento de columnas por vez y
+                      se guarda una lista corta de candidatos para las siguientes iteraciones.
+  - 'devex'         : d_j² / w_j con pesos de referencia Devex (Forrest-Goldfarb).
+  - 'steepest_edge' : d_j² / γ_j con γ_j = norma proyectada de la arista (marco de referencia
+                      = variables no básicas iniciales), actualizada con la recurrencia exacta.
+
+Las reglas con pesos necesitan, al pivotear, la columna entrante α_q y la fila pivote α_r;
+las pide a un "contexto" (ContextoTabla aquí, o el del Simplex Revisado).
+"""
+
+import math
+
+import numpy as np
+
+
+class ContextoTabla:
+    """Acceso a columnas/filas transformadas cuando la tabla completa está disponible."""
+
+    def __init__(self, tabla, num_cols):
+        self.tabla = tabla
+        self.num_cols = num_cols
+
+    def columna(self, j):
+        """α_j = B⁻¹a_j (columna j de la tabla sin la fila 0)."""
+        return self.tabla[1:, j]
+
+    def fila_pivote(self, r):
+        """α_r = fila r de B⁻¹A (fila r+1 de la tabla), antes de pivotear."""
+        return self.tabla[r + 1, :self.num_cols]
+
+    def productos(self, v):
+        """α_jᵀ·v para todas las columnas j."""
+        return self.tabla[1:, :self.num_cols].T @ v
+
+
+class ReglaPrecio:
+    """Regla de Dantzig; las demás reglas heredan de esta."""
+
+    nombre = 'dantzig'
+    usa_pesos = False
+
+    def __init__(self, tol=1e-9):
+        self.tol = tol
+
+    def iniciar(self, num_cols, indices_basicas):
+        """Se llama una vez con la base inicial (antes de la primera iteración)."""
+
+    def elegir(self, d, contexto=None):
+        """Devuelve la columna entrante o None si ninguna mejora (óptimo)."""
+        candidatos = np.flatnonzero(d < -self.tol)
+        if candidatos.size == 0:
+            return None
+        return int(candidatos[np.argmin(d[candidatos])])
+
+    def actualizar(self, col_entrante, fila_saliente, indices_basicas, contexto):
+        """Se llama después de elegir el pivote y ANTES de pivotear (la base aún es la vieja)."""
+
+
+class PrecioParcial(ReglaPrecio):
+    """Precio parcial + múltiple: segmentos de ~√n columnas y lista corta de candidatos."""
+
+    nombre = 'parcial'
+
+    def __init__(self, tol=1e-9, tam_segmento=None, num_candidatos=4):
+        super().__init__(tol)
+        self.tam_segmento = tam_segmento
+        self.num_candidatos = num_candidatos
+        self.inicio = 0
+        self.candidatos = []
+
+    def iniciar(self, num_cols, indices_basicas):
+        self.tam = self.tam_segmento or max(1, int(math.ceil(math.sqrt(num_cols))))
+        self.inicio = 0
+        self.candidatos = []
+
+    def elegir(self, d, contexto=None):
+        n = len(d)
+        # Precio múltiple: primero los candidatos guardados que sigan siendo atractivos
+        self.candidatos = [j for j in self.candidatos if d[j] < -self.tol]
+        if self.candidatos:
+            j = min(self.candidatos, key=lambda k: d[k])
+            self.candidatos.remove(j)
+            return j
+        # Precio parcial: recorrer segmentos a partir del último, dando la vuelta
+        for _ in range(int(math.ceil(n / self.tam))):
+            segmento = (self.inicio + np.arange(self.tam)) % n
+            self.inicio = (self.inicio + self.tam) % n
+            valores = d[segmento]
+            mejora = valores < -self.tol
+            if mejora.any():
+                orden = np.argsort(valores[mejora])[:self.num_candidatos]
+                mejores = segmento[mejora][orden]
+                self.candidatos = [int(j) for j in mejores[1:]]
+                return int(mejores[0])
+        return None
+
+
+class PrecioDevex(ReglaPrecio):
+    """Devex: pesos de referencia w_j ≈ norma de la arista; se elige max d_j² / w_j."""
+
+    nombre = 'devex'
+    usa_pesos = True
+
+    def iniciar(self, num_cols, indices_basicas):
+        self.pesos = np.ones(num_cols)
+
+    def elegir(self, d, contexto=None):
+        candidatos = np.flatnonzero(d < -self.tol)
+        if candidatos.size == 0:
+            return None
+        puntaje = d[candidatos] ** 2 / self.pesos[candidatos]
+        return int(candidatos[np.argmax(puntaje)])
+
+    def actualizar(self, col_entrante, fila_saliente, indices_basicas, contexto):
+        alfa_r = contexto.fila_pivote(fila_saliente)
+        alfa_rq = alfa_r[col_entrante]
+        w_q = self.pesos[col_entrante]
+        beta = alfa_r / alfa_rq
+        self.pesos = np.maximum(self.pesos, beta ** 2 * w_q)
+        self.pesos[indices_basicas[fila_saliente]] = max(w_q / alfa_rq ** 2, 1.0)
+        self.pesos[col_entrante] = 1.0  # pasa a básica; su peso ya no se usa
+        # Si los pesos crecen demasiado se reinicia el marco de referencia
+        if self.pesos.max() > 1e6:
+            self.pesos.fill(1.0)
+
+
+class PrecioSteepestEdge(ReglaPrecio):
+    """
+    Steepest edge proyectado: γ_j = [j∈R] + Σ_{i: B_i∈R} α_ij², con R = no básicas iniciales.
+    Se actualiza con la recurrencia exacta γ_j ← γ_j − 2β_j·α_jᵀ(m∘α_q) + β_j²·γ_q.
+    """
+
+    nombre = 'steepest_edge'
+    usa_pesos = True
+
+    def iniciar(self, num_cols, indices_basicas):
+        self.referencia = np.ones(num_cols, dtype=bool)
+        self.referencia[list(indices_basicas)] = False
+        self.pesos = np.ones(num_cols)   # con la base inicial, γ_j = 1 para toda j ∈ R
+
+    def elegir(self, d, contexto=None):
+        candidatos = np.flatnonzero(d < -self.tol)
+        if candidatos.size == 0:
+            return None
+        puntaje = d[candidatos] ** 2 / self.pesos[candidatos]
+        return int(candidatos[np.argmax(puntaje)])
+
+    def actualizar(self, col_entrante, fila_saliente, indices_basicas, contexto):
+        q = col_entrante
+        alfa_q = contexto.columna(q)
+        alfa_r = contexto.fila_pivote(fila_saliente)
+        alfa_rq = alfa_r[q]
+        # Filas cuya variable básica está en el marco de referencia
+        mascara = self.referencia[list(indices_basicas)]
+        gamma_q = self.pesos[q]
+        beta = alfa_r / alfa_rq
+        productos = contexto.productos(np.where(mascara, alfa_q, 0.0))
+        self.pesos = np.maximum(self.pesos - 2 * beta * productos + beta ** 2 * gamma_q, 1e-4)
+        self.pesos[indices_basicas[fila_saliente]] = max(gamma_q / alfa_rq ** 2, 1e-4)
+        self.pesos[q] = 1.0
+
+
+REGLAS_PRECIO = {
+    'dantzig': ReglaPrecio,
+    'parcial': PrecioParcial,
+    'devex': PrecioDevex,
+    'steepest_edge': PrecioSteepestEdge,
+}
+
+
+def crear_regla_precio(precio):
+    """Acepta el nombre de la regla (o una instancia ya creada) y devuelve la regla."""
+    if isinstance(precio, ReglaPrecio):
+        return precio
+    nombre = (precio or 'dantzig').lower()
+    if nombre not in REGLAS_PRECIO:
+        raise ValueError(f"Regla de precio desconocida: {precio}. "
+                         f"Opciones: {', '.join(REGLAS_PRECIO)}")
+    return REGLAS_PRECIO[nombre]()
+
+
+def limite_iteraciones(num_filas, num_cols):
+    """Límite por defecto: crece con el tamaño (antes era 100 fijo y cortaba problemas grandes)."""
+    return max(100, 10 * (num_filas + num_cols))
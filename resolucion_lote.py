@@ -0,0 +1,375 @@
+"""
+Resolución por lotes: muchos problemas chicos de la misma forma en una sola pasada.
+
+Con MetodoSimplex cada problema paga su propio bucle de Python (y, por HTTP, su propio pedido).
+Aquí los problemas con la misma forma (m, n y operadores por fila) se apilan en una tabla 3-D
+(problema × fila × columna) y cada iteración pivotea todos a la vez: la entrante, la prueba
+de ratio y la actualización de rango 1 son operaciones de NumPy sobre la pila.
+
+  - Mismo planteo que el Simplex con Big M (holgura; exceso + artificial; artificial), con
+    M proporcional a los costos de cada problema. Las filas con b < 0 se multiplican por -1
+    (cambiando el operador) antes de agrupar.
+  - Dantzig; un problema con UMBRAL_BLAND pivotes degenerados seguidos pasa a Bland (entrante
+    y saliente de menor índice) hasta salir del estancamiento, como ControlDegeneracion.
+  - Los problemas que terminan (óptimo, no acotado, infactible) salen de la pila: la tabla se
+    compacta y el resto sigue pivoteando sin máscaras ni copias.
+  - Cada problema se escala antes de apilarlo (ver escalado), como hacen los métodos: con
+    coeficientes de 1e-3 a 1e6 la M y las tolerancias fijas dejan de alcanzar. La solución
+    se desescala y Z se calcula con los costos originales.
+  - Sin presolve, límites por variable ni pasos/tablas (equivale a detalle='none').
+  - Con Big M, un rayo con una artificial todavía positiva no decide: el problema puede ser
+    no acotado o infactible. Esos (pocos) se resuelven aparte con MetodoDosFases, sobre el
+    mismo problema escalado y con lo que quede del tiempo límite del lote.
+
+resolver_lote() devuelve un resultado por problema, en el orden recibido, con las mismas claves
+que los métodos (status, tipo_solucion, explicacion, z_optimo, solucion, ...). Un problema mal
+formado da status 'error' sin afectar al resto.
+"""
+
+import time
+
+import numpy as np
+
+from control_resolucion import ControlResolucion, resultado_interrumpido
+from escalado import UMBRAL, Escalado
+from metodo_dos_fases import MetodoDosFases
+from reglas_precio import limite_iteraciones
+
+TOL = 1e-9
+TOL_ARTIFICIAL = 1e-6   # igual que MetodoSimplex: artificial en la base con valor > tol → infactible
+UMBRAL_BLAND = 10
+OPUESTO = {'<=': '>=', '>=': '<=', '=': '='}
+
+
+def _normalizar(problema):
+    """dict con c, A, b, operadores y objetivo → (c en forma max, A, b ≥ 0, operadores, signo)."""
+    c = np.asarray(problema['c'], dtype=float).ravel()
+    b = np.asarray(problema['b'], dtype=float).ravel()
+    A = np.asarray(problema['A'], dtype=float)
+    if A.shape != (len(b), len(c)):
+        raise ValueError(f"A debe ser {len(b)}×{len(c)} (se recibió {'×'.join(map(str, A.shape))})")
+    operadores = list(problema['operadores'])
+    if len(operadores) != len(b) or any(op not in OPUESTO for op in operadores):
+        raise ValueError("operadores debe tener un '<=', '>=' o '=' por restricción")
+    objetivo = problema.get('objetivo', 'max')
+    if objetivo not in ('max', 'min'):
+        raise ValueError(f"objetivo debe ser 'max' o 'min' (se recibió {objetivo!r})")
+    negativos = b < 0
+    if negativos.any():
+        A, b = A.copy(), b.copy()
+        A[negativos] *= -1
+        b[negativos] *= -1
+        operadores = [OPUESTO[op] if neg else op for op, neg in zip(operadores, negativos)]
+    signo = 1.0 if objetivo == 'max' else -1.0
+    return signo * c, A, b, tuple(operadores), signo
+
+
+def _escalar_grupo(c, A, b):
+    """
+    Escala en el lugar los problemas de la pila que lo necesitan (rango de A o mayor costo
+    sobre UMBRAL; el resto no paga el Escalado). Devuelve el Escalado de cada problema (None
+    si no se escaló) y la tolerancia de la artificial de cada fila (k×m).
+    """
+    absoluto = np.abs(A)
+    no_nulos = absoluto > TOL
+    maximo = np.where(no_nulos, absoluto, 0.0).max(axis=(1, 2), initial=0.0)
+    minimo = np.where(no_nulos, absoluto, np.inf).min(axis=(1, 2), initial=np.inf)
+    rango = np.divide(maximo, minimo, out=np.ones_like(maximo), where=no_nulos.any(axis=(1, 2)))
+    escalados = [None] * len(c)
+    tol_filas = np.full(b.shape, TOL_ARTIFICIAL)
+    for q in np.flatnonzero((rango > UMBRAL) | (np.abs(c).max(axis=1, initial=0.0) > UMBRAL)):
+        escalado = Escalado(A[q], c[q])
+        if escalado.calcular():
+            A[q], b[q], c[q] = escalado.escalar(A[q], b[q], c[q])
+            escalados[q] = escalado
+            # La artificial cuenta como positiva si lo es en las unidades originales (b' = R·b):
+            # una fila muy achicada no debe esconder una infactibilidad
+            tol_filas[q] = TOL_ARTIFICIAL * np.minimum(1.0, escalado.filas)
+    return escalados, tol_filas
+
+
+def _desescalar(resultado, escalado, c, signo):
+    """Resultado en forma max (y escalado, si `escalado`) → original: x = S·x' y Z con los costos originales."""
+    if "solucion" in resultado:
+        x = np.asarray(resultado["solucion"], dtype=float)
+        if escalado is not None:
+            x = escalado.desescalar(x)
+            resultado["solucion"] = [float(v) for v in x]
+        resultado["z_optimo" if resultado.get("status") == "optimal" else "z_actual"] = float(signo * (c @ x))
+    return resultado
+
+
+def _estructura(n, operadores):
+    """Columnas auxiliares en el orden de convertir_forma_estandar: bloque m×k, nombres, base y artificiales."""
+    m = len(operadores)
+    filas, valores, nombres = [], [], [f"x{j+1}" for j in range(n)]
+    base, artificiales = [], []
+    cuenta = {'s': 0, 'e': 0, 'a': 0}
+
+    def agregar(fila, valor, prefijo):
+        filas.append(fila)
+        valores.append(valor)
+        cuenta[prefijo] += 1
+        nombres.append(f"{prefijo}{cuenta[prefijo]}")
+        return n + len(filas) - 1
+
+    for i, op in enumerate(operadores):
+        if op == '<=':
+            base.append(agregar(i, 1.0, 's'))
+        else:
+            if op == '>=':
+                agregar(i, -1.0, 'e')
+            base.append(agregar(i, 1.0, 'a'))
+            artificiales.append(base[-1])
+    auxiliares = np.zeros((m, len(filas)))
+    auxiliares[filas, np.arange(len(filas))] = valores
+    return auxiliares, nombres, np.array(base, dtype=np.int64), np.array(artificiales, dtype=np.int64)
+
+
+class _Grupo:
+    """Pila de tablas de problemas con la misma forma; se resuelven juntos."""
+
+    def __init__(self, c, A, b, operadores, tol_filas=None):
+        """tol_filas (k×m): con qué valor la artificial de cada fila cuenta como positiva."""
+        k, m, n = A.shape
+        auxiliares, self.nombres, base, self.artificiales = _estructura(n, operadores)
+        self.n, self.N = n, n + auxiliares.shape[1]
+        self.tol_columnas = np.full((k, self.N), TOL_ARTIFICIAL)
+        if tol_filas is not None and self.artificiales.size:
+            filas_artificiales = np.argmax(auxiliares[:, self.artificiales - n] != 0, axis=0)
+            self.tol_columnas[:, self.artificiales] = tol_filas[:, filas_artificiales]
+        # Tabla de cada problema: fila 0 = Z (forma max), filas 1..m = restricciones, última columna = RHS
+        T = np.zeros((k, m + 1, self.N + 1))
+        T[:, 1:, :n] = A
+        T[:, 1:, n:self.N] = auxiliares
+        T[:, 1:, -1] = b
+        T[:, 0, :n] = -c
+        if self.artificiales.size:
+            M = 1e4 * (1.0 + np.abs(c).max(axis=1, initial=0.0))
+            T[:, 0, self.artificiales] = M[:, None]
+            # Fila Z solo en no básicas: se le resta M·(filas con artificial básica)
+            filas_art = 1 + np.flatnonzero(np.isin(base, self.artificiales))
+            T[:, 0, :] -= M[:, None] * T[:, filas_art, :].sum(axis=1)
+        self.T = T
+        self.base = np.tile(base, (k, 1))
+        self.indices = np.arange(k)           # posición en el grupo de cada fila de la pila
+        self.iteraciones = np.zeros(k, dtype=np.int64)
+        self.degenerados = np.zeros(k, dtype=np.int64)   # pivotes degenerados seguidos
+
+    def _quitar(self, salen):
+        """Saca de la pila los problemas en `salen` (máscara) y devuelve sus datos."""
+        datos = (self.indices[salen], self.T[salen], self.base[salen], self.iteraciones[salen])
+        quedan = ~salen
+        self.T, self.base = self.T[quedan], self.base[quedan]
+        self.indices, self.iteraciones = self.indices[quedan], self.iteraciones[quedan]
+        self.degenerados = self.degenerados[quedan]
+        return datos
+
+    def paso(self, limite, control):
+        """
+        Una iteración para toda la pila. Los que siguen sin óptimo se cortan si ya hicieron
+        `limite` pivoteos o si `control` (reloj y cancelación del lote) dice parar. Devuelve
+        (terminados, cortados, estado): los que terminaron como (indices, tablas, bases,
+        iteraciones, no_acotado), los cortados como (indices, tablas, bases, iteraciones)
+        y el estado del corte; None donde no hay ninguno.
+        """
+        T, base = self.T, self.base
+        k = len(T)
+        filas = np.arange(k)
+        d = T[:, 0, :self.N]
+        bland = self.degenerados >= UMBRAL_BLAND
+        col = np.where(bland, np.argmax(d < -TOL, axis=1), np.argmin(d, axis=1))
+        optimo = d[filas, col] >= -TOL
+
+        columna = T[filas, 1:, col]   # (k, m)
+        rhs = T[:, 1:, -1]
+        positivos = columna > TOL
+        ratios = np.full(columna.shape, np.inf)
+        np.divide(rhs, columna, out=ratios, where=positivos)
+        r = np.argmin(ratios, axis=1)
+        if bland.any():
+            # Bland: entre los ratios mínimos, la básica de menor índice
+            minimo = ratios[filas, r][:, None]
+            empate = np.where(ratios <= minimo + TOL, base, np.iinfo(np.int64).max)
+            r = np.where(bland, np.argmin(empate, axis=1), r)
+        no_acotado = ~optimo & ~positivos.any(axis=1)
+
+        terminan = optimo | no_acotado
+        # El límite se mira solo en los que van a pivotear: uno que llega al óptimo justo en
+        # el pivoteo `limite` termina 'optimal', como en los métodos
+        estado = control.parar() if not terminan.all() else None
+        cortan = ~terminan if estado is not None else ~terminan & (self.iteraciones >= limite)
+        estado = estado or 'iteration_limit'
+        salen = terminan | cortan
+        terminados = cortados = None
+        if salen.any():
+            datos = self._quitar(salen)
+            en_terminan = terminan[salen]
+            if en_terminan.any():
+                terminados = tuple(d[en_terminan] for d in datos) + (no_acotado[terminan],)
+            if cortan.any():
+                cortados = tuple(d[~en_terminan] for d in datos)
+            quedan = ~salen
+            T, base = self.T, self.base
+            col, r, ratios_min = col[quedan], r[quedan], ratios[quedan][np.arange(len(T)), r[quedan]]
+            filas = np.arange(len(T))
+        else:
+            ratios_min = ratios[filas, r]
+        if len(T):
+            # Pivoteo de toda la pila: fila pivote normalizada y actualización de rango 1
+            fila_pivote = T[filas, r + 1, :] / T[filas, r + 1, col][:, None]
+            T -= T[filas, :, col][:, :, None] * fila_pivote[:, None, :]
+            T[filas, r + 1, :] = fila_pivote
+            base[filas, r] = col
+            self.iteraciones += 1
+            degenerado = ratios_min <= TOL
+            self.degenerados = np.where(degenerado, self.degenerados + 1, 0)
+        return terminados, cortados, estado
+
+    def resultados(self, indices, T, base, iteraciones, no_acotado, c, signo, estado=None):
+        """
+        Resultados (dict por problema) de los que salieron de la pila; `estado` si fue un corte.
+        None si terminó en un rayo con una artificial positiva (no acotado o infactible).
+        """
+        n, N = self.n, self.N
+        k = len(T)
+        rhs = T[:, 1:, -1]
+        solucion = np.zeros((k, n))
+        p, i = np.nonzero(base < n)
+        solucion[p, base[p, i]] = rhs[p, i]
+        es_artificial = np.isin(base, self.artificiales)
+        infactible = (es_artificial & (rhs > self.tol_columnas[np.asarray(indices)[:, None], base])).any(axis=1)
+        basicas_cero = (~es_artificial & (np.abs(rhs) < TOL)).sum(axis=1)
+        # Óptimo alternativo: no básica (no artificial) con d_j = 0 y ratio mínimo > 0 en su columna
+        no_basica = np.ones((k, N), dtype=bool)
+        no_basica[np.arange(k)[:, None], base] = False
+        no_basica[:, self.artificiales] = False
+        cuerpo = T[:, 1:, :N]
+        ratios = np.full(cuerpo.shape, np.inf)
+        np.divide(rhs[:, :, None], cuerpo, out=ratios, where=cuerpo > TOL)
+        minimo = ratios.min(axis=1)
+        alternativo = (no_basica & (np.abs(T[:, 0, :N]) < TOL) & np.isfinite(minimo) & (minimo > TOL)).any(axis=1)
+
+        salida = []
+        for q in range(k):
+            g = indices[q]
+            x = solucion[q]
+            variables_basicas = [self.nombres[j] for j in base[q]]
+            z = float(signo[g] * (c[g] @ x))   # c en forma max: se vuelve al signo original
+            if estado is not None:
+                salida.append(resultado_interrumpido(
+                    estado, iteraciones[q], not infactible[q], [], [], solucion=[float(v) for v in x],
+                    z_actual=z, variables_basicas=variables_basicas))
+            elif no_acotado[q] and infactible[q]:
+                salida.append(None)
+            elif no_acotado[q]:
+                salida.append({
+                    "status": "unbounded",
+                    "tipo_solucion": "Problema No Acotado",
+                    "explicacion": "El problema no tiene solución óptima finita. La región factible es no acotada.",
+                    "iteraciones": int(iteraciones[q]),
+                    "pasos": [],
+                    "tablas": [],
+                })
+            elif infactible[q]:
+                salida.append({
+                    "status": "infeasible",
+                    "tipo_solucion": "Problema No Factible",
+                    "explicacion": "Una variable artificial permanece en la base con valor distinto de cero: "
+                                   "las restricciones son contradictorias.",
+                    "iteraciones": int(iteraciones[q]),
+                    "pasos": [],
+                    "tablas": [],
+                })
+            else:
+                if alternativo[q]:
+                    tipo, explicacion = ("Solución Múltiple (Infinitas Soluciones)",
+                                         "Hay variables no básicas con costo reducido cero: otro vértice tiene el mismo Z.")
+                elif basicas_cero[q]:
+                    tipo, explicacion = ("Solución Única (Degenerada)",
+                                         f"Solución óptima única con {basicas_cero[q]} variable(s) básica(s) en cero.")
+                else:
+                    tipo, explicacion = "Solución Única", "Se encontró una solución óptima única."
+                salida.append({
+                    "status": "optimal",
+                    "tipo_solucion": tipo,
+                    "explicacion": explicacion,
+                    "z_optimo": z,
+                    "solucion": [float(v) for v in x],
+                    "iteraciones": int(iteraciones[q]),
+                    "pasos": [],
+                    "tablas": [],
+                    "variables_basicas": variables_basicas,
+                })
+        return list(indices), salida
+
+
+def _resolver_grupo(c, A, b, operadores, signo, control, tol_filas=None, max_iteraciones=None):
+    """
+    Resuelve una pila de problemas con la misma forma; resultados en el orden de la pila.
+    max_iteraciones es por problema; `control` solo aporta el reloj y la cancelación.
+    """
+    grupo = _Grupo(c, A, b, operadores, tol_filas)
+    resultados = [None] * len(c)
+    limite = limite_iteraciones(A.shape[1], grupo.N)
+    if max_iteraciones is not None:
+        limite = min(limite, max_iteraciones)
+    while len(grupo.T):
+        terminados, cortados, estado = grupo.paso(limite, control)
+        for datos, corte in ((terminados, None), (cortados, estado)):
+            if datos is None:
+                continue
+            if corte is not None:
+                datos = datos + (None,)
+            indices, salida = grupo.resultados(*datos, c, signo, estado=corte)
+            for g, resultado in zip(indices, salida):
+                resultados[g] = resultado
+    return resultados
+
+
+def resolver_lote(problemas, max_iteraciones=None, limite_tiempo=None, cancelacion=None):
+    """
+    Resuelve una lista de problemas (dicts con c, A, b, operadores y objetivo) agrupando los
+    de igual forma en tablas apiladas. Devuelve un resultado por problema, en el mismo orden.
+    max_iteraciones: pivoteos por problema; limite_tiempo (segundos) y cancelacion valen para
+    todo el lote: al cumplirse, los que faltan devuelven su base actual (ver control_resolucion).
+    """
+    control = ControlResolucion(max_iteraciones, limite_tiempo, cancelacion)
+    # Las iteraciones se cuentan por problema en cada grupo; el control compartido por todos
+    # los grupos solo lleva el reloj y la cancelación
+    max_iteraciones, control.max_iteraciones = control.max_iteraciones, None
+    control.iniciar()
+    resultados = [None] * len(problemas)
+    grupos = {}   # (m, n, operadores) → [(posición, c, A, b, signo)]
+    for posicion, problema in enumerate(problemas):
+        try:
+            c, A, b, operadores, signo = _normalizar(problema)
+        except KeyError as e:
+            resultados[posicion] = {"status": "error", "explicacion": f"Falta el campo {e}."}
+            continue
+        except (TypeError, ValueError) as e:
+            resultados[posicion] = {"status": "error", "explicacion": f"Problema inválido: {e}"}
+            continue
+        grupos.setdefault((A.shape[0], A.shape[1], operadores), []).append((posicion, c, A, b, signo))
+    for (_, _, operadores), miembros in grupos.items():
+        posiciones, cs, As, bs, signos = zip(*miembros)
+        c, A, b = np.array(cs), np.array(As), np.array(bs)
+        c_original = c.copy()
+        escalados, tol_filas = _escalar_grupo(c, A, b)
+        salida = _resolver_grupo(c, A, b, operadores, np.array(signos), control, tol_filas, max_iteraciones)
+        for q, (posicion, resultado) in enumerate(zip(posiciones, salida)):
+            recalcular = escalados[q] is not None
+            if resultado is None:
+                # Rayo con artificial positiva: Dos Fases sobre el mismo problema (escalado, en
+                # forma max), con lo que le quede de tiempo al lote; su Z es el de la forma max
+                restante = None
+                if control.fin is not None:
+                    restante = max(control.fin - time.monotonic(), 1e-9)
+                resultado = MetodoDosFases(c[q], A[q], b[q], list(operadores), 'max', presolve=False, escalado=False,
+                                           detalle='none', max_iteraciones=max_iteraciones,
+                                           limite_tiempo=restante, cancelacion=cancelacion).resolver()
+                recalcular = True
+            if recalcular:
+                resultado = _desescalar(resultado, escalados[q], c_original[q], signos[q])
+            resultados[posicion] = resultado
+    return resultados
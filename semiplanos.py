@@ -0,0 +1,325 @@
+"""
+Región factible del método gráfico como intersección de semiplanos, en O(m log m).
+
+Enumerar los cortes de todos los pares de rectas y probar cada uno contra cada restricción
+es O(m³). Aquí cada restricción (y x ≥ 0, y ≥ 0) es un semiplano n·p ≤ d con |n| = 1:
+  1. Se ordenan por el ángulo de su recta (la región queda a la izquierda); de los paralelos
+     con el mismo sentido queda el más restrictivo.
+  2. Un barrido con una deque agrega cada semiplano y saca de los extremos los que dejan de
+     formar parte del borde. Lo que queda, en orden, es el polígono (antihorario).
+  3. Una fila '=' (o una región que se aplasta sobre una recta) se resuelve en 1-D: sobre
+     esa recta cada semiplano es una cota para el parámetro t.
+
+Para detectar regiones no acotadas se agrega una caja lejana (x ≤ R, y ≤ R, con R mucho
+mayor que la escala del problema): los vértices que salen de la caja no son vértices
+reales, y si Z mejora en ellos la región es no acotada en esa dirección.
+
+Cada vértice viene con las dos rectas que lo forman: índice de fila de A o EJE_Y, EJE_X,
+CAJA_X, CAJA_Y. lineas[k] = [la del lado que llega a v_k, la del lado que sale], así que el
+lado de v_k a v_k+1 está sobre lineas[k][1] (= lineas[k+1][0]). Las filas que no quedan en el borde no pueden limitar la región: son
+redundantes (filas_del_borde). Con el polígono ordenado, conos_normales da para cada vértice
+el rango de direcciones de la función objetivo en el que es óptimo.
+"""
+
+from collections import deque
+
+import numpy as np
+
+TOL = 1e-9
+ESCALA_CAJA = 1e6   # R = ESCALA_CAJA · (distancia al origen de la recta más lejana, al menos 1)
+
+EJE_Y = -1    # x ≥ 0
+EJE_X = -2    # y ≥ 0
+CAJA_X = -3   # x ≤ R (caja)
+CAJA_Y = -4   # y ≤ R (caja)
+RECTAS_CAJA = (CAJA_X, CAJA_Y)
+
+
+def _semiplanos(A, b, operadores):
+    """Filas '<=' y '>=' (más ejes) como n·p ≤ d normalizados, y las filas '=' aparte."""
+    A = np.asarray(A, dtype=float).reshape(-1, 2)
+    b = np.asarray(b, dtype=float).ravel()
+    ops = np.array(operadores, dtype=object)
+    signo = np.where(ops == '>=', -1.0, 1.0)
+    normas = np.hypot(A[:, 0], A[:, 1])
+    # Filas 0·x + 0·y op b: el presolve las quita; si llegan, se comprueban aquí
+    nulas = normas <= TOL
+    vacia = bool(((ops == '<=') & nulas & (b < -TOL)).any() or ((ops == '>=') & nulas & (b > TOL)).any()
+                 or ((ops == '=') & nulas & (np.abs(b) > TOL)).any())
+    normas = np.where(nulas, 1.0, normas)
+    N = A * (signo / normas)[:, None]
+    d = b * signo / normas
+    desigualdades = np.flatnonzero((ops != '=') & ~nulas)
+    igualdades = np.flatnonzero((ops == '=') & ~nulas)
+    N = np.vstack([N[desigualdades], [[-1.0, 0.0], [0.0, -1.0]]])
+    d = np.concatenate([d[desigualdades], [0.0, 0.0]])
+    ids = np.concatenate([desigualdades, [EJE_Y, EJE_X]])
+    # La fila '=' es n·p ≤ d y -n·p ≤ -d: se guarda la normal con su d
+    normales_eq = A[igualdades] / normas[igualdades, None]
+    d_eq = b[igualdades] / normas[igualdades]
+    return N, d, ids, (normales_eq, d_eq, igualdades), vacia
+
+
+def _corte(n1, d1, n2, d2):
+    """Punto donde se cortan dos rectas n·p = d (Cramer)."""
+    det = n1[0] * n2[1] - n1[1] * n2[0]
+    return np.array([(d1 * n2[1] - n1[1] * d2) / det, (n1[0] * d2 - d1 * n2[0]) / det]) + 0.0
+
+
+def _fuera(n, d, p):
+    """p viola n·p ≤ d (con tolerancia relativa a la magnitud de p)."""
+    return n @ p - d > TOL * max(1.0, abs(p[0]), abs(p[1]), abs(d))
+
+
+def _sobre_recta(n0, d0, id0, N, d, ids):
+    """
+    Región sobre la recta n0·p = d0: cada semiplano acota t en p = p0 + t·u.
+    Devuelve (vertices, lineas, borde) con 1 o 2 vértices, o None si es vacía.
+    """
+    p0 = n0 * d0
+    u = np.array([-n0[1], n0[0]])
+    coef = N @ u
+    holgura = d - N @ p0
+    paralelos = np.abs(coef) <= TOL
+    if (holgura[paralelos] < -TOL * np.maximum(1.0, np.abs(d[paralelos]))).any():
+        return None
+    t = np.divide(holgura, coef, out=np.zeros_like(holgura), where=~paralelos)
+    arriba, abajo = ~paralelos & (coef > 0), ~paralelos & (coef < 0)
+    # La caja está entre los semiplanos: siempre hay una cota por cada lado
+    k_sup = np.flatnonzero(arriba)[np.argmin(t[arriba])]
+    k_inf = np.flatnonzero(abajo)[np.argmax(t[abajo])]
+    t_sup, t_inf = t[k_sup], t[k_inf]
+    if t_inf > t_sup + TOL * max(1.0, abs(t_sup), abs(t_inf)):
+        return None
+    extremos = [(p0 + t_inf * u + 0.0, [id0, ids[k_inf]]), (p0 + t_sup * u + 0.0, [id0, ids[k_sup]])]
+    if np.allclose(extremos[0][0], extremos[1][0], rtol=0.0, atol=TOL * max(1.0, np.abs(extremos[0][0]).max())):
+        extremos = extremos[:1]
+    return (np.array([p for p, _ in extremos]), np.array([l for _, l in extremos]),
+            np.array([id0, ids[k_inf], ids[k_sup]]))
+
+
+def radio_caja(A, b):
+    """R de la caja: ESCALA_CAJA · (distancia al origen de la recta más lejana, al menos 1)."""
+    A = np.asarray(A, dtype=float).reshape(-1, 2)
+    b = np.asarray(b, dtype=float).ravel()
+    normas = np.hypot(A[:, 0], A[:, 1])
+    validas = normas > TOL
+    return ESCALA_CAJA * max(1.0, float((np.abs(b[validas]) / normas[validas]).max(initial=0.0)))
+
+
+def region_factible(A, b, operadores, radio=None):
+    """
+    Polígono de {x ≥ 0, y ≥ 0, A·p op b} dentro de la caja, en orden antihorario.
+    Devuelve (vertices (k×2), lineas (k×2): las dos rectas de cada vértice) o None si es
+    vacía. Un segmento o un punto vienen con 2 o 1 vértices. radio: R de la caja (por
+    defecto radio_caja).
+    """
+    region = _region(A, b, operadores, radio)
+    return None if region is None else region[:2]
+
+
+def filas_del_borde(A, b, operadores):
+    """
+    Filas de A que forman el borde de la región (ordenadas), o None si es vacía. Las demás
+    no cambian la región si se quitan: son redundantes.
+    """
+    region = _region(A, b, operadores)
+    if region is None:
+        return None
+    borde = region[2]
+    return np.unique(borde[borde >= 0])
+
+
+def _region(A, b, operadores, radio=None):
+    """region_factible más los semiplanos que quedaron en el borde (sus rectas)."""
+    N, d, ids, (normales_eq, d_eq, filas_eq), vacia = _semiplanos(A, b, operadores)
+    if vacia:
+        return None
+    R = radio_caja(A, b) if radio is None else radio
+    N = np.vstack([N, [[1.0, 0.0], [0.0, 1.0]]])
+    d = np.concatenate([d, [R, R]])
+    ids = np.concatenate([ids, RECTAS_CAJA])
+
+    if len(filas_eq):
+        # La primera igualdad fija la recta; las demás entran como dos semiplanos cada una
+        N = np.vstack([N, normales_eq[1:], -normales_eq[1:]])
+        d = np.concatenate([d, d_eq[1:], -d_eq[1:]])
+        ids = np.concatenate([ids, filas_eq[1:], filas_eq[1:]])
+        return _sobre_recta(normales_eq[0], d_eq[0], filas_eq[0], N, d, ids)
+
+    # 1. Orden por ángulo de la recta (dirección u = (-n_y, n_x), región a la izquierda);
+    #    con el mismo ángulo, primero el más restrictivo (menor d)
+    angulos = np.round(np.arctan2(N[:, 0], -N[:, 1]), 12)
+    angulos[angulos == np.round(-np.pi, 12)] = np.round(np.pi, 12)   # -π y π (con -0.0) son el mismo
+    orden = np.lexsort((d, angulos))
+    primeros = np.ones(len(orden), dtype=bool)
+    primeros[1:] = angulos[orden[1:]] != angulos[orden[:-1]]
+    orden = orden[primeros]
+
+    # 2. Barrido: en la deque quedan los semiplanos del borde, y entre vecinos, sus cortes
+    def corte(h1, h2):
+        return _corte(N[h1], d[h1], N[h2], d[h2])
+
+    borde = deque()
+    for h in orden:
+        while len(borde) > 1 and _fuera(N[h], d[h], corte(borde[-2], borde[-1])):
+            borde.pop()
+        while len(borde) > 1 and _fuera(N[h], d[h], corte(borde[0], borde[1])):
+            borde.popleft()
+        if borde and abs(N[h][0] * N[borde[-1]][1] - N[h][1] * N[borde[-1]][0]) <= TOL:
+            # Opuesto al último (con el mismo sentido no puede ser: se filtró arriba) y vecinos
+            # tras sacar lo de en medio: la franja entre ambos es vacía, salvo que tenga ancho
+            # cero; entonces la región está sobre esa recta
+            if N[h] @ N[borde[-1]] < 0:
+                if abs(d[h] + d[borde[-1]]) > TOL * max(1.0, abs(d[h])):
+                    return None
+                return _sobre_recta(N[h], d[h], ids[h], N, d, ids)
+        borde.append(h)
+    while len(borde) > 2 and _fuera(N[borde[0]], d[borde[0]], corte(borde[-2], borde[-1])):
+        borde.pop()
+    while len(borde) > 2 and _fuera(N[borde[-1]], d[borde[-1]], corte(borde[0], borde[1])):
+        borde.popleft()
+    if len(borde) < 3:
+        return None
+
+    # 3. Vértices: cortes de vecinos (cíclico); los repetidos (región degenerada) se juntan
+    borde = list(borde)
+    vertices, lineas, salidas = [], [], []
+    for k, h in enumerate(borde):
+        siguiente = borde[(k + 1) % len(borde)]
+        p = corte(h, siguiente)
+        if vertices and np.allclose(p, vertices[-1], rtol=0.0, atol=TOL * max(1.0, np.abs(p).max())):
+            # El lado sobre h tiene largo cero: del vértice anterior se sale por la siguiente
+            salidas[-1] = ids[siguiente]
+            continue
+        vertices.append(p)
+        lineas.append([ids[h], ids[siguiente]])
+        salidas.append(ids[siguiente])
+    entrada = None
+    if len(vertices) > 1 and np.allclose(vertices[0], vertices[-1], rtol=0.0,
+                                         atol=TOL * max(1.0, np.abs(vertices[0]).max())):
+        vertices.pop()
+        salidas.pop()
+        entrada = lineas.pop()[0]
+    if len(vertices) >= 3:
+        # Con lados de verdad, cada vértice lleva la recta por la que se llega y por la que
+        # se sale. En un polígono aplastado queda la primera pareja (la que nombra a la caja)
+        for par, salida in zip(lineas, salidas):
+            par[1] = salida
+        if entrada is not None:
+            lineas[0][0] = entrada
+    vertices = np.array(vertices)
+    if len(vertices) < 3:
+        # Polígono aplastado: con tolerancias, una región vacía puede cerrar así. Se comprueba
+        if (vertices @ N.T - d > TOL * np.maximum(1.0, np.abs(vertices).max(axis=1))[:, None]).any():
+            return None
+    return vertices, np.array(lineas, dtype=np.int64), ids[borde]
+
+
+def conos_normales(vertices):
+    """
+    Para cada vértice de un polígono convexo en orden antihorario, los ángulos (desde, hasta)
+    en radianes, con hasta ≥ desde, de las direcciones c en las que ese vértice maximiza c·p:
+    las que quedan entre las normales exteriores de sus dos lados. En un segmento cada extremo
+    tiene medio círculo y en un punto el círculo entero.
+    """
+    vertices = np.asarray(vertices, dtype=float).reshape(-1, 2)
+    if len(vertices) == 1:
+        return np.array([-np.pi]), np.array([np.pi])
+    lados = np.roll(vertices, -1, axis=0) - vertices       # lado k: de v_k a v_k+1
+    normales = np.arctan2(-lados[:, 0], lados[:, 1])       # exterior, a la derecha del lado: (l_y, -l_x)
+    desde = np.roll(normales, 1)                           # normal del lado que llega a v_k
+    # Giro entre las dos normales, en [0, π]; un -1e-17 no debe volverse una vuelta entera
+    giro = np.clip(np.mod(normales - desde + TOL, 2 * np.pi) - TOL, 0.0, None)
+    return desde, desde + giro
+
+
+def recortar_poligono(vertices, lineas, rectas, nueva):
+    """
+    Recorta un polígono convexo (antihorario, con sus lineas) con el semiplano n·p ≤ d de la
+    recta nueva, en O(k) (Sutherland-Hodgman). rectas[id] = (n, d) para las rectas del polígono
+    y la nueva. Los cortes salen de las ecuaciones de las rectas, no de interpolar sobre el lado:
+    recortar muchas veces seguidas no acumula error. Devuelve (vertices, lineas) o None si no
+    queda nada; puede quedar aplastado (menos de 3 vértices).
+    """
+    n, d = rectas[nueva]
+    holgura = vertices @ n - d
+    dentro = holgura <= TOL * np.maximum(np.maximum(1.0, np.abs(vertices).max(axis=1)), abs(d))
+    if dentro.all():
+        return vertices, lineas
+    if not dentro.any():
+        return None
+    nuevos, pares = [], []
+
+    def agregar(p, par):
+        escala = TOL * max(1.0, np.abs(p).max())
+        if nuevos and np.allclose(p, nuevos[-1], rtol=0.0, atol=escala):
+            pares[-1] = [pares[-1][0], par[1]]   # mismo punto: se llega por la anterior, se sale por esta
+            return
+        nuevos.append(p)
+        pares.append(list(par))
+
+    k = len(vertices)
+    for i in range(k):
+        j = (i + 1) % k
+        if dentro[i]:
+            agregar(vertices[i], lineas[i])
+        if dentro[i] != dentro[j]:
+            lado = lineas[i][1]
+            n_lado, d_lado = rectas[lado]
+            if abs(n_lado[0] * n[1] - n_lado[1] * n[0]) > TOL:
+                p = _corte(n_lado, d_lado, n, d)
+            else:
+                # Casi paralelas (solo por tolerancias): se interpola sobre el lado
+                p = vertices[i] + holgura[i] / (holgura[i] - holgura[j]) * (vertices[j] - vertices[i])
+            agregar(p, [lado, nueva] if dentro[i] else [nueva, lado])
+    if len(nuevos) > 1 and np.allclose(nuevos[0], nuevos[-1], rtol=0.0, atol=TOL * max(1.0, np.abs(nuevos[0]).max())):
+        nuevos.pop()
+        pares[0][0] = pares.pop()[0]
+    return np.array(nuevos), np.array(pares, dtype=np.int64)
+
+
+def en_caja(lineas):
+    """Máscara de los vértices que forma la caja (no son vértices reales de la región)."""
+    return np.isin(lineas, RECTAS_CAJA).any(axis=1)
+
+
+def sin_caja(vertices, lineas):
+    """
+    (vertices reales, sus lineas, vertices de la caja), con los reales en orden desde el
+    primero después de la caja: así forman el borde real de corrido.
+    """
+    caja = en_caja(lineas)
+    if caja.any() and not caja.all():
+        # Los de la caja son consecutivos (cíclicamente): el borde real empieza después de ellos
+        inicio = (np.flatnonzero(caja & ~np.roll(caja, -1))[0] + 1) % len(caja)
+        vertices, lineas, caja = (np.roll(x, -inicio, axis=0) for x in (vertices, lineas, caja))
+    return vertices[~caja], lineas[~caja], vertices[caja]
+
+
+def recortar_rectas(A, b, caja):
+    """
+    Tramo visible de cada recta a·p = b dentro de caja = [xmin, xmax, ymin, ymax] (Liang-Barsky,
+    todas las filas a la vez). Devuelve (extremos (m×2×2): [[x1, x2], [y1, y2]], visibles (m,)).
+    """
+    A = np.asarray(A, dtype=float).reshape(-1, 2)
+    b = np.asarray(b, dtype=float).ravel()
+    normas2 = (A ** 2).sum(axis=1)
+    validas = normas2 > TOL ** 2
+    normas2 = np.where(validas, normas2, 1.0)
+    p0 = A * (b / normas2)[:, None]            # punto de la recta más cercano al origen
+    u = np.column_stack([-A[:, 1], A[:, 0]])   # dirección de la recta
+    t_min = np.full(len(b), -np.inf)
+    t_max = np.full(len(b), np.inf)
+    for eje, (lo, hi) in enumerate(((caja[0], caja[1]), (caja[2], caja[3]))):
+        ue, pe = u[:, eje], p0[:, eje]
+        paralela = np.abs(ue) <= TOL
+        validas &= ~paralela | ((pe >= lo - TOL) & (pe <= hi + TOL))
+        ue = np.where(paralela, 1.0, ue)
+        t1, t2 = (lo - pe) / ue, (hi - pe) / ue
+        t_min = np.where(paralela, t_min, np.maximum(t_min, np.minimum(t1, t2)))
+        t_max = np.where(paralela, t_max, np.minimum(t_max, np.maximum(t1, t2)))
+    visibles = validas & (t_min <= t_max)
+    t_min, t_max = np.where(visibles, t_min, 0.0), np.where(visibles, t_max, 0.0)
+    extremos = np.stack([p0 + t_min[:, None] * u, p0 + t_max[:, None] * u], axis=2) + 0.0
+    return extremos, visibles
@@ -0,0 +1,347 @@
+"""
+Sesiones del método gráfico: editar restricciones de a una sin resolver todo de nuevo.
+
+En la interfaz se agregan y quitan filas una por vez; con /calcular cada cambio vuelve a armar
+la región desde cero. Una sesión guarda en el servidor el polígono actual (con la caja lejana
+de semiplanos, así también sirve para regiones no acotadas) y lo edita:
+
+  - Agregar una fila recorta el polígono con su semiplano en O(k) (semiplanos.recortar_poligono).
+  - Quitar una fila que no toca el borde no cambia nada. Si toca el borde, la región solo
+    crece del otro lado de su lado, entre las rectas de los dos lados vecinos: se arma ese
+    "bolsillo", se recorta con las filas que lo cortan (un solo producto matricial para saber
+    cuáles) y se pega en lugar del lado.
+  - Con igualdades, región vacía o aplastada (segmento, punto) se vuelve a armar todo con el
+    barrido de semiplanos, que resuelve esos casos de forma exacta.
+
+Z se evalúa con MetodoGrafico.evaluar_region sobre el polígono guardado: el resultado tiene el
+mismo formato que /calcular en modo 'semiplanos'. Las sesiones viven TTL_SESION segundos sin
+uso y como mucho hay MAX_SESIONES (sale la usada hace más tiempo).
+"""
+
+import secrets
+import time
+from collections import OrderedDict
+from threading import Lock
+
+import numpy as np
+
+from detalle import validar_detalle
+from metodo_grafico import MetodoGrafico, armar_grafica, caja_vista
+from semiplanos import (CAJA_X, CAJA_Y, EJE_X, EJE_Y, ESCALA_CAJA, TOL, conos_normales, en_caja, radio_caja,
+                        recortar_poligono, region_factible, sin_caja)
+
+TTL_SESION = 30 * 60   # segundos sin uso
+MAX_SESIONES = 1000
+
+# Rectas auxiliares (las de semiplanos van de -1 a -4)
+_CONTRARIA = -5   # lado de afuera de la fila que se quita (el bolsillo)
+_VISTA_X = -6     # x ≤ borde derecho de la gráfica
+_VISTA_Y = -7     # y ≤ borde superior de la gráfica
+
+
+class SesionGrafica:
+    """Restricciones de un problema de 2 variables y el polígono de su región."""
+
+    def __init__(self, A, b, operadores, c=None, objetivo='max', detalle='full', enteros=False):
+        self.lock = Lock()   # un pedido a la vez por sesión
+        self.c, self.objetivo, self.detalle = c, objetivo, detalle   # los del último resultado
+        self.enteros = enteros
+        self.ids = []        # id de cada fila, en el orden de la interfaz (R1, R2, ...)
+        self.filas = {}      # id → (a, b, op) tal como llegó
+        self.rectas = {EJE_Y: (np.array([-1.0, 0.0]), 0.0), EJE_X: (np.array([0.0, -1.0]), 0.0)}
+        self._siguiente = 0
+        self._igualdades = 0   # cuántas filas '=' hay (con alguna, se arma todo con el barrido)
+        # Semiplanos n·p ≤ d de las filas, alineados con ids, para ver en un producto cuáles cortan algo
+        self.N = np.empty((0, 2))
+        self.d = np.empty(0)
+        for a_fila, b_fila, op in zip(np.asarray(A, dtype=float).reshape(-1, 2), np.asarray(b, dtype=float).ravel(),
+                                      operadores):
+            self._registrar(a_fila, b_fila, op)
+        self.pasos = []      # qué hizo la última operación (va al log del resultado)
+        self._reconstruir()
+        self.pasos.append(f"SESIÓN: {len(self.ids)} restricción(es), región armada con el barrido de semiplanos.")
+
+    # ---- Filas ----
+
+    def _registrar(self, a, b, op):
+        """Agrega la fila al final y guarda su semiplano normalizado. Devuelve su id."""
+        if op not in ('<=', '>=', '='):
+            raise ValueError(f"Operador inválido: {op!r}")
+        fila = self._siguiente
+        self._siguiente += 1
+        a = np.asarray(a, dtype=float).ravel()
+        norma = float(np.hypot(a[0], a[1]))
+        signo = -1.0 if op == '>=' else 1.0
+        # Fila 0·x + 0·y op b: sin recta; si no se cumple, la región es vacía (la reconstrucción lo ve)
+        escala = norma if norma > TOL else 1.0
+        n, d = a * (signo / escala), float(b) * signo / escala
+        self._igualdades += op == '='
+        self.ids.append(fila)
+        self.filas[fila] = (a, float(b), op)
+        self.rectas[fila] = (n, d)
+        self.N = np.vstack([self.N, n])
+        self.d = np.append(self.d, d)
+        return fila
+
+    def _datos(self):
+        """(A, b, operadores) en el orden de la interfaz."""
+        A = np.array([self.filas[i][0] for i in self.ids]).reshape(-1, 2)
+        b = np.array([self.filas[i][1] for i in self.ids])
+        return A, b, [self.filas[i][2] for i in self.ids]
+
+    # ---- Región ----
+
+    def _poner_caja(self, R):
+        self.R = R
+        self.rectas[CAJA_X] = (np.array([1.0, 0.0]), R)
+        self.rectas[CAJA_Y] = (np.array([0.0, 1.0]), R)
+
+    def _reconstruir(self):
+        """Región completa con el barrido de semiplanos (O(m log m))."""
+        A, b, operadores = self._datos()
+        self._poner_caja(radio_caja(A, b))
+        region = region_factible(A, b, operadores, radio=self.R)
+        if region is None:
+            self.vertices = self.lineas = None
+            return
+        vertices, lineas = region
+        # Las filas vienen como posición en A: se pasan a id de la sesión
+        ids = np.array(self.ids, dtype=np.int64)
+        self.vertices = vertices
+        self.lineas = np.where(lineas >= 0, ids[np.maximum(lineas, 0)] if len(ids) else lineas, lineas)
+
+    def _universo(self):
+        """El cuadrado [0, R]² (ejes y caja), antihorario, con sus lineas."""
+        R = self.R
+        vertices = np.array([[0.0, 0.0], [R, 0.0], [R, R], [0.0, R]])
+        lineas = np.array([[EJE_Y, EJE_X], [EJE_X, CAJA_X], [CAJA_X, CAJA_Y], [CAJA_Y, EJE_Y]], dtype=np.int64)
+        return vertices, lineas
+
+    def _se_puede_editar(self):
+        """El polígono se edita en su lugar solo si tiene lados (sin igualdades ni aplastado)."""
+        return self.vertices is not None and len(self.vertices) >= 3 and not self._igualdades
+
+    def agregar(self, a, b, op):
+        """Agrega una fila al final (como agregarRestriccionGrafico)."""
+        fila = self._registrar(a, b, op)
+        etiqueta = f"R{len(self.ids)}"
+        n, d = self.rectas[fila]
+        if self.vertices is None:
+            self.pasos = [f"{etiqueta} agregada: la región ya era vacía y sigue así."]
+            return
+        if not self._se_puede_editar() or np.hypot(*self.filas[fila][0]) <= TOL or abs(d) * ESCALA_CAJA > self.R:
+            # Igualdad, región aplastada, fila sin recta o recta más allá de la caja
+            self._reconstruir()
+            self.pasos = [f"{etiqueta} agregada: se vuelve a armar la región completa (barrido de semiplanos)."]
+            return
+        antes = len(self.vertices)
+        region = recortar_poligono(self.vertices, self.lineas, self.rectas, fila)
+        if region is None:
+            self.vertices = self.lineas = None
+            self.pasos = [f"{etiqueta} agregada: deja afuera todo el polígono, la región queda vacía."]
+            return
+        if region[0] is self.vertices:
+            self.pasos = [f"{etiqueta} agregada: no corta el polígono (por ahora es redundante)."]
+            return
+        if len(region[0]) < 3:
+            self._reconstruir()
+            self.pasos = [f"{etiqueta} agregada: la región se aplasta, se vuelve a armar completa."]
+            return
+        self.vertices, self.lineas = region
+        self.pasos = [f"{etiqueta} agregada: recorta el polígono ({antes} → {len(self.vertices)} vértices), "
+                      f"sin tocar las demás restricciones."]
+
+    def eliminar(self, indice):
+        """Quita la fila en la posición indice (0 = R1)."""
+        if not 0 <= indice < len(self.ids):
+            raise IndexError(f"No hay restricción R{indice + 1}")
+        etiqueta = f"R{indice + 1}"
+        fila = self.ids[indice]
+        op = self.filas[fila][2]
+        editable = self._se_puede_editar()
+        del self.ids[indice]
+        del self.filas[fila]
+        self._igualdades -= op == '='
+        n, d = self.rectas.pop(fila)
+        self.N = np.delete(self.N, indice, axis=0)
+        self.d = np.delete(self.d, indice)
+        if not editable or op == '=':
+            self._reconstruir()
+            self.pasos = [f"{etiqueta} quitada: se vuelve a armar la región completa (barrido de semiplanos)."]
+            return
+        if not (self.lineas == fila).any():
+            self.pasos = [f"{etiqueta} quitada: no tocaba el borde, el polígono no cambia."]
+            return
+        cortan = self._abrir(fila, n, d)
+        if cortan is None:
+            self._reconstruir()
+            self.pasos = [f"{etiqueta} quitada: se vuelve a armar la región completa (barrido de semiplanos)."]
+            return
+        self.pasos = [f"{etiqueta} quitada: se rehace solo la zona que liberó ({cortan} restricción(es) la cortan)."]
+
+    def _abrir(self, fila, n, d):
+        """
+        Quita del polígono el lado sobre la fila (n·p ≤ d, ya borrada de la sesión) y pega en su
+        lugar la zona que se libera. Devuelve cuántas filas cortaron esa zona, o None si no se
+        pudo (el que llama reconstruye).
+        """
+        lados = np.flatnonzero(self.lineas[:, 1] == fila)
+        if len(lados) != 1:
+            return None
+        # Girado para que el lado de la fila sea el último: P2 queda primero y P1 último
+        k = len(self.vertices)
+        vertices = np.roll(self.vertices, -(lados[0] + 1), axis=0)
+        lineas = np.roll(self.lineas, -(lados[0] + 1), axis=0)
+        llega, sale = lineas[-1][0], lineas[0][1]
+        if fila in (llega, sale):
+            return None
+
+        # Bolsillo: del otro lado de la fila, entre las rectas de los lados vecinos
+        rectas = dict(self.rectas)
+        rectas[_CONTRARIA] = (-n, -d)
+        bolsillo = self._universo()
+        for recta in (_CONTRARIA, llega, sale):
+            bolsillo = recortar_poligono(*bolsillo, rectas, recta)
+            if bolsillo is None:
+                return None
+        # Filas que dejan afuera algún vértice del bolsillo: solo esas pueden recortarlo
+        afuera = bolsillo[0] @ self.N.T - self.d > TOL * np.maximum(1.0, np.abs(bolsillo[0]).max(axis=1))[:, None]
+        cortan = [self.ids[i] for i in np.flatnonzero(afuera.any(axis=0))]
+        for recta in cortan:
+            bolsillo = recortar_poligono(*bolsillo, rectas, recta)
+            if bolsillo is None:
+                return None
+        if len(bolsillo[0]) < 3 or _area(bolsillo[0]) <= TOL * max(1.0, np.abs(bolsillo[0]).max()) ** 2:
+            # Bolsillo sin área (otra fila sobre la misma recta): lo resuelve la reconstrucción
+            return None
+        v_bolsillo, l_bolsillo = bolsillo
+
+        # En el bolsillo (antihorario) el lado de la fila va de P2 a P1: la cadena nueva va de P1 a P2
+        inicio = np.flatnonzero(l_bolsillo[:, 0] == _CONTRARIA)
+        if len(inicio) != 1:
+            return None
+        cadena_v = np.roll(v_bolsillo, -inicio[0], axis=0)
+        cadena_l = np.roll(l_bolsillo, -inicio[0], axis=0)
+        if cadena_l[-1][1] != _CONTRARIA or (cadena_l[1:-1] == _CONTRARIA).any():
+            return None
+        cadena_l = cadena_l.copy()
+        cadena_l[0][0], cadena_l[-1][1] = llega, sale
+        # P1 (o P2) deja de ser vértice si el borde sigue derecho por la recta vecina
+        quedan = np.ones(len(cadena_v), dtype=bool)
+        quedan[0] = not self._misma_recta(cadena_l[0][1], llega)
+        quedan[-1] = not self._misma_recta(cadena_l[-1][0], sale)
+        self.vertices = np.vstack([cadena_v[quedan], vertices[1:k - 1]])
+        self.lineas = np.vstack([cadena_l[quedan], lineas[1:k - 1]])
+        return len(cortan)
+
+    def _misma_recta(self, i, j):
+        """Dos ids de la misma recta (por ejemplo una fila 0x + 5y >= 0 y el eje y ≥ 0)."""
+        (n_i, d_i), (n_j, d_j) = self.rectas[i], self.rectas[j]
+        return bool(np.allclose(n_i, n_j, rtol=0.0, atol=TOL) and abs(d_i - d_j) <= TOL * max(1.0, abs(d_i)))
+
+    def _region(self):
+        """La región en el formato de MetodoGrafico._armar_region (sin presolve)."""
+        region = {"resultado": None, "vertices": None, "vertices_caja": None, "grafica": None, "conos": None,
+                  "presolve": None}
+        if self.vertices is None:
+            return region
+        reales, _, region["vertices_caja"] = sin_caja(self.vertices, self.lineas)
+        region["vertices"] = reales
+        desde, hasta = conos_normales(self.vertices)
+        mascara = ~en_caja(self.lineas)
+        region["conos"] = (self.vertices[mascara], desde[mascara], hasta[mascara])
+        # El polígono de la gráfica: el de la sesión recortado al recuadro de la vista, en O(k)
+        caja = caja_vista(reales)
+        rectas = {**self.rectas, _VISTA_X: (np.array([1.0, 0.0]), caja[1]), _VISTA_Y: (np.array([0.0, 1.0]), caja[3])}
+        poligono = (self.vertices, self.lineas)
+        for recta in (_VISTA_X, _VISTA_Y):
+            if poligono is not None and len(poligono[0]) >= 3:
+                poligono = recortar_poligono(*poligono, rectas, recta)
+        A, b, _ = self._datos()
+        region["grafica"] = armar_grafica(caja, reales if poligono is None else poligono[0], A, b)
+        return region
+
+    def validar_opciones(self, objetivo=None, detalle=None):
+        """
+        (objetivo, detalle) del pedido, o los del resultado anterior si no se pasan. ValueError
+        si no son válidos, sin tocar la sesión: un pedido con opciones malas no la deja rota.
+        """
+        objetivo = objetivo or self.objetivo
+        if objetivo not in ('max', 'min'):
+            raise ValueError(f"objetivo debe ser 'max' o 'min' (se recibió {objetivo!r})")
+        return objetivo, validar_detalle(detalle or self.detalle)
+
+    def resultado(self, c=None, objetivo=None, detalle=None, enteros=None):
+        """
+        Evalúa Z sobre el polígono guardado (mismo formato que MetodoGrafico en modo 'semiplanos').
+        Lo que no se pasa queda como en el resultado anterior.
+        """
+        objetivo, detalle = self.validar_opciones(objetivo, detalle)
+        self.c = self.c if c is None else c
+        self.objetivo, self.detalle = objetivo, detalle
+        self.enteros = self.enteros if enteros is None else enteros
+        A, b, operadores = self._datos()
+        metodo = MetodoGrafico(self.c, A, b, operadores, self.objetivo, presolve=False, detalle=self.detalle,
+                               modo='semiplanos', cache=False, enteros=self.enteros)
+        metodo.registrar_objetivo()
+        for paso in self.pasos:
+            metodo.registrar_paso(paso)
+        if metodo.con_pasos and self.vertices is not None:
+            caja = en_caja(self.lineas)
+            metodo.registrar_paso(f"  Región factible: {int((~caja).sum())} vértice(s) en orden antihorario"
+                                  f"{' (región no acotada)' if caja.any() else ''}")
+        return metodo.evaluar_region(self._region())
+
+
+def _area(vertices):
+    """Área de un polígono (fórmula del zapatero)."""
+    x, y = vertices[:, 0], vertices[:, 1]
+    return 0.5 * abs(float(x @ np.roll(y, -1) - y @ np.roll(x, -1)))
+
+
+class AlmacenSesiones:
+    """Sesiones por id, con vencimiento por falta de uso y tamaño máximo; seguro entre hilos."""
+
+    def __init__(self, ttl=TTL_SESION, maximo=MAX_SESIONES):
+        self.ttl = ttl
+        self.maximo = maximo
+        self._sesiones = OrderedDict()   # id → (sesión, último uso), la usada hace más tiempo primero
+        self._lock = Lock()
+
+    def _vencer(self, ahora):
+        while self._sesiones:
+            sesion_id, (_, uso) = next(iter(self._sesiones.items()))
+            if ahora - uso <= self.ttl and len(self._sesiones) <= self.maximo:
+                break
+            del self._sesiones[sesion_id]
+
+    def crear(self, sesion):
+        sesion_id = secrets.token_urlsafe(16)
+        with self._lock:
+            ahora = time.monotonic()
+            self._sesiones[sesion_id] = (sesion, ahora)
+            self._vencer(ahora)
+        return sesion_id
+
+    def obtener(self, sesion_id):
+        """La sesión (y renueva su vencimiento), o None si no existe o ya venció."""
+        with self._lock:
+            ahora = time.monotonic()
+            self._vencer(ahora)
+            entrada = self._sesiones.get(sesion_id)
+            if entrada is None:
+                return None
+            self._sesiones[sesion_id] = (entrada[0], ahora)
+            self._sesiones.move_to_end(sesion_id)
+            return entrada[0]
+
+    def borrar(self, sesion_id):
+        with self._lock:
+            return self._sesiones.pop(sesion_id, None) is not None
+
+    def __len__(self):
+        return len(self._sesiones)
+
+
+# Las que usa app.py (una por proceso)
+SESIONES = AlmacenSesiones()
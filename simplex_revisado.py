@@ -0,0 +1,548 @@
+"""
+Simplex Revisado con base factorizada.
+
+En lugar de pivotear la tabla completa (O(m·(n+m)) por iteración), aquí solo se guarda
+una factorización LU de la matriz base B. En cada iteración se calcula:
+  - la fila de precios (costos reducidos d = c - Aᵀy, con y = B⁻ᵀ c_B), y
+  - la columna de la variable entrante (α = B⁻¹ a_q).
+Después de cada pivote la factorización se actualiza con una matriz eta (forma producto
+de la inversa) y cada cierto número de pivotes se vuelve a factorizar desde cero para
+no acumular error numérico.
+
+PASOS DEL ALGORITMO (resumen):
+  1. Factorizar B (LU con pivoteo parcial, sin las columnas de holgura) a partir de la
+     base inicial factible.
+  2. BTRAN: y = B⁻ᵀ c_B  →  costos reducidos d_j = c_j - a_jᵀ y.
+  3. Si ningún d_j < 0 → óptimo (se trabaja siempre minimizando).
+  4. FTRAN: α = B⁻¹ a_q; ratio mínimo sobre α > 0 → variable saliente (o no acotado).
+  5. Actualizar x_B, la base y la factorización (eta); refactorizar si toca.
+
+A puede ser un ndarray denso o una MatrizDispersa (CSC); solo se accede a ella por
+columnas y con Aᵀ·y, así que los datos nunca se densifican salvo la base m×m.
+
+Con `superiores` (u_j por columna, ∞ si no hay) las variables no básicas pueden estar en 0
+o en su límite superior (ver limites): x_B = B⁻¹(b − Σ a_j·u_j de las que están arriba) y la
+prueba de ratio acotada también frena a las básicas que suben hasta su u, o a la entrante
+cuando llega a su propio límite (cambio de límite, sin pivote).
+"""
+
+import warnings
+
+import numpy as np
+# LU de LAPACK (getrf) y sustituciones triangulares (getrs), que numpy no trae
+from scipy.linalg import lu_factor, lu_solve
+
+from control_resolucion import ControlResolucion
+from degeneracion import ControlDegeneracion
+from matriz_dispersa import MatrizDispersa
+from reglas_precio import crear_regla_precio, limite_iteraciones
+
+MODOS = ('tabla', 'revisado')   # motores de MetodoSimplex y MetodoDosFases
+
+
+class FactorizacionBase:
+    """
+    Factorización P·B = L·U de la base, más una lista de matrices eta con los pivotes
+    hechos desde la última refactorización.
+
+    Las columnas básicas con un solo no nulo (holguras, excesos, artificiales) no entran en
+    la LU: con filas y columnas reordenadas B queda triangular por bloques,
+
+        [ núcleo  0    ]   (filas restantes)
+        [ acople  diag ]   (filas de las columnas unitarias)
+
+    y solo se factoriza el núcleo k×k, que al principio es vacío (base de holguras) y crece
+    con las variables que entran. La diagonal y el acople se resuelven con una división y
+    un producto.
+
+    La LU del núcleo sale de LAPACK y FTRAN/BTRAN son dos sustituciones triangulares sobre
+    los factores, sin formar inversas.
+    """
+
+    def __init__(self, B, frecuencia_refactorizacion=50, tol=1e-12):
+        self.frecuencia_refactorizacion = frecuencia_refactorizacion
+        self.tol = tol
+        self.refactorizar(B)
+
+    def refactorizar(self, B):
+        """LU con pivoteo parcial del núcleo de B (densa, m×m). Descarta las etas acumuladas."""
+        B = np.array(B, dtype=float)
+        m = len(B)
+        no_nulos = B != 0
+        self.unitarias = np.flatnonzero(no_nulos.sum(axis=0) == 1)
+        self.filas_unitarias = no_nulos[:, self.unitarias].argmax(axis=0)
+        self.diagonal = B[self.filas_unitarias, self.unitarias]
+        escala = max(1.0, np.abs(B).max(initial=0.0))
+        # Dos columnas unitarias en la misma fila son paralelas
+        if (len(np.unique(self.filas_unitarias)) < len(self.unitarias)
+                or np.abs(self.diagonal).min(initial=np.inf) < self.tol * escala):
+            raise np.linalg.LinAlgError("La matriz base es singular")
+        self.resto_columnas = np.setdiff1d(np.arange(m), self.unitarias)
+        self.resto_filas = np.setdiff1d(np.arange(m), self.filas_unitarias)
+        self.acople = B[np.ix_(self.filas_unitarias, self.resto_columnas)]
+        self.lu = self._factorizar(B[np.ix_(self.resto_filas, self.resto_columnas)])
+        self.etas = []   # lista de (fila r, columna α) de cada pivote
+
+    def _factorizar(self, M):
+        """(LU, pivotes) de M como los da lu_factor, o None si M es vacía; error si es singular."""
+        if len(M) == 0:
+            return None
+        with warnings.catch_warnings():
+            # Con un pivote cero scipy avisa; el error se da abajo
+            warnings.simplefilter('ignore')
+            lu = lu_factor(M, check_finite=False)
+        if np.abs(np.diag(lu[0])).min() < self.tol * max(1.0, np.abs(M).max()):
+            raise np.linalg.LinAlgError("La matriz base es singular")
+        return lu
+
+    @property
+    def necesita_refactorizar(self):
+        return len(self.etas) >= self.frecuencia_refactorizacion
+
+    def _resolver_nucleo(self, v, trans=0):
+        """Resuelve núcleo·x = v (o núcleoᵀ·x = v con trans=1)."""
+        if self.lu is None:
+            return v   # núcleo vacío: la base son solo columnas unitarias
+        return lu_solve(self.lu, v, trans=trans, check_finite=False)
+
+    def _resolver_lu(self, v):
+        """Resuelve B·x = v: primero el núcleo y después las columnas unitarias."""
+        v = np.asarray(v, dtype=float)
+        x = np.empty(len(v))
+        x_resto = self._resolver_nucleo(v[self.resto_filas])
+        x[self.resto_columnas] = x_resto
+        x[self.unitarias] = (v[self.filas_unitarias] - self.acople @ x_resto) / self.diagonal
+        return x
+
+    def _resolver_lu_transpuesta(self, v):
+        """Resuelve Bᵀ·y = v: primero las columnas unitarias y después el núcleo transpuesto."""
+        v = np.asarray(v, dtype=float)
+        y = np.empty(len(v))
+        y_unitarias = v[self.unitarias] / self.diagonal
+        y[self.filas_unitarias] = y_unitarias
+        y[self.resto_filas] = self._resolver_nucleo(v[self.resto_columnas] - self.acople.T @ y_unitarias,
+                                                    trans=1)
+        return y
+
+    def ftran(self, a):
+        """α = B⁻¹·a (primero LU, después las etas en el orden en que se hicieron)."""
+        x = self._resolver_lu(a)
+        for r, alfa in self.etas:
+            x_r = x[r] / alfa[r]
+            x -= x_r * alfa
+            x[r] = x_r
+        return x
+
+    def btran(self, c):
+        """y = B⁻ᵀ·c (las etas en orden inverso y luego LU transpuesta)."""
+        y = np.array(c, dtype=float)
+        for r, alfa in reversed(self.etas):
+            y[r] = (y[r] - (y @ alfa - y[r] * alfa[r])) / alfa[r]
+        return self._resolver_lu_transpuesta(y)
+
+    def actualizar(self, r, alfa):
+        """Registra el pivote en la fila r con la columna entrante ya transformada α = B⁻¹a_q."""
+        self.etas.append((int(r), np.array(alfa, dtype=float)))
+
+
+class ContextoRevisado:
+    """
+    Lo que piden las reglas de precio con pesos, sin tener la tabla: α_q ya calculada,
+    la fila pivote α_r = (e_rᵀB⁻¹)·A y productos α_jᵀ·v = aᵀ_j·(B⁻ᵀv), ambos con un BTRAN.
+    """
+
+    def __init__(self, simplex, factorizacion, col_entrante, alfa):
+        self.simplex = simplex
+        self.factorizacion = factorizacion
+        self.col_entrante = col_entrante
+        self.alfa = alfa
+
+    def columna(self, j):
+        if j == self.col_entrante:
+            return self.alfa
+        return self.factorizacion.ftran(self.simplex.columna(j))
+
+    def fila_pivote(self, r):
+        e_r = np.zeros(len(self.alfa))
+        e_r[r] = 1.0
+        return self.productos(e_r)
+
+    def productos(self, v):
+        return self.simplex.producto_transpuesto(self.factorizacion.btran(v))
+
+
+class SimplexRevisado:
+    """
+    Resuelve  min cᵀx  s.a.  A·x = b, 0 ≤ x ≤ u  partiendo de una base factible.
+    A puede venir ya en forma estándar (con holguras/artificiales), densa o dispersa.
+    """
+
+    def __init__(self, A, b, c, indices_basicas, tol=1e-9, frecuencia_refactorizacion=50,
+                 max_iteraciones=None, registrar_paso=None, nombres_columnas=None,
+                 columnas_bloqueadas=(), precio='dantzig', degeneracion='lexicografico',
+                 umbral_bland=10, superiores=None, en_superior=None, control=None):
+        self.A = A if isinstance(A, MatrizDispersa) else np.array(A, dtype=float)
+        self.b = np.array(b, dtype=float)
+        self.c = np.array(c, dtype=float)
+        self.indices_basicas = list(indices_basicas)
+        self.tol = tol
+        self.frecuencia_refactorizacion = frecuencia_refactorizacion
+        m, n = self.A.shape
+        self.max_iteraciones = max_iteraciones if max_iteraciones is not None else limite_iteraciones(m, n)
+        self.registrar_paso = registrar_paso
+        self.nombres_columnas = nombres_columnas
+        # Los eventos de cada iteración nombran columnas por índice (ver eventos_pasos)
+        self._log(['col', list(nombres_columnas) if nombres_columnas else None])
+        # Columnas que nunca pueden entrar a la base (p. ej. artificiales en Fase 2)
+        self.columnas_bloqueadas = np.asarray(list(columnas_bloqueadas), dtype=np.int64)
+        self.regla_precio = crear_regla_precio(precio)
+        self.degeneracion = degeneracion
+        self.umbral_bland = umbral_bland
+        # Límites superiores y qué no básicas están en ellos (se conserva entre fases)
+        self.superiores = (np.array(superiores, dtype=float) if superiores is not None
+                           else np.full(n, np.inf))
+        self.en_superior = (np.array(en_superior, dtype=bool) if en_superior is not None
+                            else np.zeros(n, dtype=bool))
+        self.cambios_de_limite = 0
+        # Límite total de pivoteos, tiempo y cancelación del método que lo usa (ver control_resolucion)
+        self.control = control if control is not None else ControlResolucion()
+
+    def _nombre(self, j):
+        return self.nombres_columnas[j] if self.nombres_columnas else f"col{j + 1}"
+
+    # Acceso a A igual para densa y dispersa
+    def columna(self, j):
+        if isinstance(self.A, MatrizDispersa):
+            return self.A.columna(j)
+        return self.A[:, j]
+
+    def matriz_base(self):
+        if isinstance(self.A, MatrizDispersa):
+            return self.A.columnas(self.indices_basicas)
+        return self.A[:, self.indices_basicas]
+
+    def producto_transpuesto(self, y):
+        if isinstance(self.A, MatrizDispersa):
+            return self.A.rmatvec(y)
+        return self.A.T @ y
+
+    def rhs_efectivo(self, b):
+        """b − Σ a_j·u_j de las no básicas que están en su límite superior."""
+        if not self.en_superior.any():
+            return b
+        x_N = np.where(self.en_superior, self.superiores, 0.0)
+        if isinstance(self.A, MatrizDispersa):
+            return b - self.A.matvec(x_N)
+        return b - self.A @ x_N
+
+    def _log(self, mensaje):
+        if self.registrar_paso is not None:
+            self.registrar_paso(mensaje)
+
+    def costos_reducidos(self, factorizacion):
+        """Fila de precios: d = c - Aᵀ·y con y = B⁻ᵀ·c_B."""
+        y = factorizacion.btran(self.c[self.indices_basicas])
+        d = self.c - self.producto_transpuesto(y)
+        d[self.indices_basicas] = 0.0
+        d[self.columnas_bloqueadas] = 0.0
+        return d, y
+
+    def resolver(self):
+        """
+        Itera hasta óptimo, no acotado o un corte: límite de iteraciones (el propio o el del
+        control), tiempo límite o cancelación; con un corte, 'estado' es el de ControlResolucion.
+        Devuelve dict con 'estado', 'x', 'z', 'indices_basicas', 'iteraciones', 'costos_reducidos',
+        'pivotes_degenerados', 'cambios_a_bland' y 'cambios_de_limite'.
+        """
+        A, c = self.A, self.c
+        m, n = A.shape
+        base = self.indices_basicas
+        u, en_superior = self.superiores, self.en_superior
+        factorizacion = FactorizacionBase(self.matriz_base(), self.frecuencia_refactorizacion)
+        regla = self.regla_precio
+        regla.iniciar(n, base)
+        control = ControlDegeneracion(self.degeneracion, self.umbral_bland)
+        base_inicial = list(base)
+        # Con perturbación se itera sobre b + ε; al final se recalcula x_B = B⁻¹b
+        b_trabajo = self.b
+        if control.modo == 'perturbacion':
+            b_trabajo = self.b + control.perturbacion(self.b)
+        x_B = factorizacion.ftran(self.rhs_efectivo(b_trabajo))
+
+        iteracion = 0
+        estado = 'iteration_limit'
+        d = None
+        while iteracion < self.max_iteraciones:
+            d, _ = self.costos_reducidos(factorizacion)
+            # Una no básica en su límite superior mejora bajando (d_j > 0): se le cambia el signo
+            # para que todas las reglas sigan el convenio d_j < 0 ⇔ mejora
+            q = control.elegir_entrante(np.where(en_superior, -d, d), regla)
+            if q is None:
+                estado = 'optimal'
+                break
+            parada = self.control.parar()
+            if parada is not None:
+                estado = parada
+                break
+            iteracion += 1
+            alfa = factorizacion.ftran(self.columna(q))
+            # Dirección: x_q sube desde 0 (σ = 1) o baja desde u_q (σ = -1); x_B cambia en −t·σα
+            paso = -alfa if en_superior[q] else alfa
+
+            # Ratio test acotado: básicas que bajan hasta 0 y básicas que suben hasta su u
+            ratios = np.full(m, np.inf)
+            bajan = paso > self.tol
+            ratios[bajan] = x_B[bajan] / paso[bajan]
+            u_B = u[base]
+            suben = (paso < -self.tol) & np.isfinite(u_B)
+            ratios[suben] = (u_B[suben] - x_B[suben]) / -paso[suben]
+            np.maximum(ratios, 0.0, out=ratios)
+            r = int(np.argmin(ratios))
+            if not np.isfinite(ratios[r]) and not np.isfinite(u[q]):
+                self._log(f"Iteración {iteracion}: {self._nombre(q)} puede crecer sin límite → no acotado")
+                estado = 'unbounded'
+                break
+
+            if u[q] <= ratios[r]:
+                # La entrante llega a su propio límite antes que cualquier básica: cambio de límite
+                x_B -= u[q] * paso
+                en_superior[q] = not en_superior[q]
+                self.cambios_de_limite += 1
+                control.registrar_pivote(u[q])
+                if self.registrar_paso is not None:
+                    self._log(['rlim', iteracion, int(q), bool(en_superior[q]), float(u[q])])
+                continue
+
+            r = control.elegir_saliente(
+                ratios, r, np.abs(paso),
+                lambda k: factorizacion.ftran(self.columna(base_inicial[k])), base)
+            theta = ratios[r]
+            control.registrar_pivote(theta)
+            sale_arriba = bool(suben[r])
+
+            if self.registrar_paso is not None:
+                self._log(['rpiv', iteracion, int(q), float(d[q]), int(base[r]), sale_arriba, float(theta)])
+
+            if regla.usa_pesos:
+                regla.actualizar(q, r, base, ContextoRevisado(self, factorizacion, q, alfa))
+            x_B -= theta * paso
+            x_B[r] = u[q] - theta if en_superior[q] else theta
+            en_superior[base[r]] = sale_arriba
+            en_superior[q] = False
+            base[r] = q
+            factorizacion.actualizar(r, alfa)
+            if factorizacion.necesita_refactorizar:
+                factorizacion.refactorizar(self.matriz_base())
+                x_B = factorizacion.ftran(self.rhs_efectivo(b_trabajo))
+
+        if control.modo == 'perturbacion':
+            x_B = factorizacion.ftran(self.rhs_efectivo(self.b))
+            x_B[np.abs(x_B) < max(self.tol, 10 * control.epsilon)] = 0.0
+
+        if estado != 'optimal' or d is None:
+            d, _ = self.costos_reducidos(factorizacion)
+
+        x = np.where(en_superior, u, 0.0)
+        x[base] = x_B
+        self.factorizacion = factorizacion
+        self.x_B = x_B
+        return {
+            "estado": estado,
+            "x": x,
+            "z": float(c @ x),
+            "indices_basicas": list(base),
+            "iteraciones": iteracion,
+            "costos_reducidos": d,
+            "pivotes_degenerados": control.pivotes_degenerados,
+            "cambios_a_bland": control.cambios_a_bland,
+            "cambios_de_limite": self.cambios_de_limite,
+        }
+
+    def resolver_dual(self):
+        """
+        Simplex Dual revisado desde la base actual, que debe ser dual factible (d ≥ 0):
+        sale la fila con x_B más negativo; la fila pivote α_r = (e_rᵀB⁻¹)·A se obtiene con un
+        BTRAN y entra la columna con α_rj < 0 de menor ratio d_j / |α_rj|.
+        Devuelve el mismo dict que resolver(), con estado 'optimal', 'infeasible' o un corte
+        ('iteration_limit', 'time_limit', 'cancelled').
+        """
+        m, n = self.A.shape
+        base = self.indices_basicas
+        factorizacion = FactorizacionBase(self.matriz_base(), self.frecuencia_refactorizacion)
+        x_B = factorizacion.ftran(self.b)
+        control = ControlDegeneracion('ninguno', umbral_bland=0)   # solo para contar degenerados
+
+        iteracion = 0
+        estado = 'iteration_limit'
+        while iteracion < self.max_iteraciones:
+            r = int(np.argmin(x_B))
+            if x_B[r] >= -self.tol:
+                estado = 'optimal'
+                break
+            parada = self.control.parar()
+            if parada is not None:
+                estado = parada
+                break
+            iteracion += 1
+            e_r = np.zeros(m)
+            e_r[r] = 1.0
+            fila = self.producto_transpuesto(factorizacion.btran(e_r))
+            fila[base] = 0.0
+            fila[self.columnas_bloqueadas] = 0.0
+            negativos = fila < -self.tol
+            if not negativos.any():
+                self._log(f"Iteración dual {iteracion}: la fila de {self._nombre(base[r])} no tiene "
+                          f"coeficientes negativos → no factible")
+                estado = 'infeasible'
+                break
+            d, _ = self.costos_reducidos(factorizacion)
+            ratios = np.full(n, np.inf)
+            ratios[negativos] = np.maximum(d[negativos], 0.0) / -fila[negativos]
+            q = int(np.argmin(ratios))
+            control.registrar_pivote(ratios[q])
+
+            alfa = factorizacion.ftran(self.columna(q))
+            theta = x_B[r] / alfa[r]
+            if self.registrar_paso is not None:
+                self._log(['rdual', iteracion, int(base[r]), float(x_B[r]), int(q), float(ratios[q])])
+            x_B -= theta * alfa
+            x_B[r] = theta
+            base[r] = q
+            factorizacion.actualizar(r, alfa)
+            if factorizacion.necesita_refactorizar:
+                factorizacion.refactorizar(self.matriz_base())
+                x_B = factorizacion.ftran(self.b)
+
+        d, _ = self.costos_reducidos(factorizacion)
+        x = np.zeros(n)
+        x[base] = x_B
+        self.factorizacion = factorizacion
+        self.x_B = x_B
+        return {
+            "estado": estado,
+            "x": x,
+            "z": float(self.c @ x),
+            "indices_basicas": list(base),
+            "iteraciones": iteracion,
+            "costos_reducidos": d,
+            "pivotes_degenerados": control.pivotes_degenerados,
+            "cambios_a_bland": 0,
+            "cambios_de_limite": 0,
+        }
+
+    def resolver_desde_base(self):
+        """
+        Arranque en caliente: factoriza la base dada y elige el método según la factibilidad
+        que cumpla. 0 ≤ B⁻¹b ≤ u_B → Simplex primal; d ≥ 0 → Simplex Dual (solo sin límites
+        superiores); ninguna → None (quien llama arranca en frío). Si la base es singular se
+        lanza LinAlgError.
+        """
+        factorizacion = FactorizacionBase(self.matriz_base(), self.frecuencia_refactorizacion)
+        x_B = factorizacion.ftran(self.rhs_efectivo(self.b))
+        if np.all(x_B >= -self.tol) and np.all(x_B <= self.superiores[self.indices_basicas] + self.tol):
+            res = self.resolver()
+            res["arranque"] = 'primal'
+            return res
+        d, _ = self.costos_reducidos(factorizacion)
+        if not np.isfinite(self.superiores).any() and np.all(d >= -self.tol):
+            res = self.resolver_dual()
+            res["arranque"] = 'dual'
+            return res
+        return None
+
+    def hay_optimo_alternativo(self, d, x_B, excluir=()):
+        """
+        ¿Existe una variable no básica con costo reducido 0 que al entrar avance un paso > 0?
+        (misma regla que usa la tabla para decidir 'Solución Múltiple').
+        Devuelve los índices de las no básicas con d_j = 0.
+        """
+        base = set(self.indices_basicas)
+        excluir = set(excluir) | set(self.columnas_bloqueadas.tolist())
+        ceros = [j for j in np.flatnonzero(np.abs(d) < self.tol) if j not in base and j not in excluir]
+        alternativo = False
+        for j in ceros:
+            alfa = self.factorizacion.ftran(self.columna(j))
+            positivos = alfa > self.tol
+            if positivos.any() and np.min(x_B[positivos] / alfa[positivos]) > self.tol:
+                alternativo = True
+                break
+        return ceros, alternativo
+
+    def sacar_artificiales(self, indices_artificiales):
+        """
+        Después de Fase 1: las artificiales que quedaron en la base (con valor 0) se cambian
+        por una columna no artificial con elemento distinto de cero en su fila (pivote
+        degenerado). Si no hay ninguna, esa fila es combinación de las demás (redundante):
+        la artificial se queda en la base con valor 0, y como su fila de B⁻¹A es cero en
+        todas las columnas no artificiales, ningún pivote posterior puede cambiarla.
+        Devuelve cuántas filas resultaron redundantes.
+        """
+        artificiales = set(indices_artificiales)
+        redundantes = 0
+        for r, j_base in enumerate(list(self.indices_basicas)):
+            if j_base not in artificiales:
+                continue
+            e_r = np.zeros(len(self.indices_basicas))
+            e_r[r] = 1.0
+            fila = self.producto_transpuesto(self.factorizacion.btran(e_r))
+            fila[list(artificiales)] = 0.0
+            fila[self.indices_basicas] = 0.0
+            q = int(np.argmax(np.abs(fila)))
+            if abs(fila[q]) <= self.tol:
+                redundantes += 1
+                continue
+            alfa = self.factorizacion.ftran(self.columna(q))
+            self.indices_basicas[r] = q
+            self.en_superior[q] = False   # entra con el valor que ya tenía (0 o su límite)
+            self.factorizacion.actualizar(r, alfa)
+        return redundantes
+
+
+def traducir_base(base, nombres_columnas, num_filas):
+    """
+    Base dada por el usuario → índices de columna. Acepta nombres ('x1', 's2', ... como en
+    'variables_basicas' del resultado) o índices enteros. Lanza ValueError si no es válida.
+    """
+    indices = []
+    for v in base:
+        if isinstance(v, str):
+            if v not in nombres_columnas:
+                raise ValueError(f"Variable básica desconocida: {v}")
+            indices.append(nombres_columnas.index(v))
+        else:
+            j = int(v)
+            if not 0 <= j < len(nombres_columnas):
+                raise ValueError(f"Índice de columna fuera de rango en la base: {j}")
+            indices.append(j)
+    if len(indices) != num_filas:
+        raise ValueError(f"La base tiene {len(indices)} variables y debe tener {num_filas} (una por restricción)")
+    if len(set(indices)) != len(indices):
+        raise ValueError("La base tiene variables repetidas")
+    return indices
+
+
+def arranque_en_caliente(A, b, c, base, nombres_columnas, registrar_paso=None, **opciones):
+    """
+    Intenta resolver partiendo de `base` (nombres o índices). Devuelve (motor, resultado) o
+    (None, None) si la base no sirve (inválida, singular o ni primal ni dual factible); en ese
+    caso queda anotado en los pasos y quien llama debe arrancar en frío.
+    """
+    def log(mensaje):
+        if registrar_paso is not None:
+            registrar_paso(mensaje)
+
+    try:
+        indices = traducir_base(base, nombres_columnas, A.shape[0])
+        motor = SimplexRevisado(A, b, c, indices, registrar_paso=registrar_paso,
+                                nombres_columnas=nombres_columnas, **opciones)
+        log(f"Arranque en caliente desde la base: {', '.join(nombres_columnas[j] for j in indices)}")
+        res = motor.resolver_desde_base()
+    except (ValueError, np.linalg.LinAlgError) as e:
+        log(f"⚠ No se puede usar la base dada ({e}); se arranca desde la base de holguras/artificiales.")
+        return None, None
+    if res is None:
+        log("⚠ La base dada no es primal ni dual factible; se arranca desde la base de holguras/artificiales.")
+        return None, None
+    log(f"Base {'primal' if res['arranque'] == 'primal' else 'dual'} factible → "
+        f"Simplex {'primal' if res['arranque'] == 'primal' else 'Dual'}: {res['iteraciones']} iteración(es).")
+    return motor, res
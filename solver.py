@@ -5,6 +5,10 @@ Este módulo importa y re-exporta las clases de los tres métodos de resolución
 - MetodoGrafico: Para problemas con 2 variables
 - MetodoSimplex: Para problemas con múltiples variables
 - MetodoDosFases: Para problemas con restricciones >= o =
+- MetodoDualSimplex: Para minimizar costos con restricciones >= (sin artificiales)
+- resolver_lote: Muchos problemas chicos de una vez (tablas apiladas por forma)
+- SesionGrafica / SESIONES: Editar las restricciones del método gráfico de a una
+- MetodoGrafico3D: Método geométrico para problemas con 3 variables
 
 También incluye la función helper convertir_restricciones_relacionales
 para facilitar la entrada de restricciones en lenguaje natural.
@@ -14,14 +18,23 @@ import numpy as np
 
 # Importar las clases desde sus módulos individuales
 from metodo_grafico import MetodoGrafico
+from metodo_grafico_3d import MetodoGrafico3D
 from metodo_simplex import MetodoSimplex
 from metodo_dos_fases import MetodoDosFases
+from metodo_dual_simplex import MetodoDualSimplex
+from resolucion_lote import resolver_lote
+from sesion_grafica import SesionGrafica, SESIONES
 
 # Exportar para que app.py pueda importar desde solver
 __all__ = [
     'MetodoGrafico',
+    'MetodoGrafico3D',
     'MetodoSimplex', 
     'MetodoDosFases',
+    'MetodoDualSimplex',
+    'resolver_lote',
+    'SesionGrafica',
+    'SESIONES',
     'convertir_restricciones_relacionales'
 ]
 
@@ -103,10 +103,11 @@ async function resolverProblema() {
     }
 
     // B. Enviar a Python
+    const enteros = document.getElementById('enteros-grafico').checked;
     const respuesta = await fetch('/calcular', {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({ objetivo, z_x, z_y, restricciones })
+        body: JSON.stringify({ objetivo, z_x, z_y, restricciones, enteros })
     });
 
     // C. Mostrar Resultados
@@ -329,11 +330,41 @@ async function resolverProblema() {
     }
 
     // 4. LLENAR TABLA
+    if (datos.vertices) {
+        llenarTablaVertices(datos.vertices, datos.puntos_ganadores || []);
+    }
+
+    // 5. MOSTRAR ANÁLISIS Y EXPLICACIÓN FINAL (al final)
+    const tituloTipo = document.getElementById('titulo-tipo-solucion');
+    const textoExplicacion = document.getElementById('texto-explicacion');
+    const cajaFinal = document.getElementById('caja-resultado-final');
+
+    tituloTipo.innerText = datos.tipo_solucion || "Resultado";
+    textoExplicacion.innerText = datos.explicacion || "Analizando...";
+
+    if(datos.status === 'infeasible') {
+        tituloTipo.style.color = "red";
+        document.getElementById('analisis-box').style.borderLeftColor = "red";
+        cajaFinal.innerHTML = "No hay solución";
+        document.getElementById('cuerpo-tabla').innerHTML = "";
+        document.getElementById('sensibilidad-objetivo').style.display = 'none';
+        return;
+    }
+
+    // Si es factible:
+    tituloTipo.style.color = (datos.tipo_solucion.includes("Múltiple")) ? "#d35400" : "#27ae60"; // Naranja si es múltiple, Verde si es única
+    document.getElementById('analisis-box').style.borderLeftColor = (datos.tipo_solucion.includes("Múltiple")) ? "#d35400" : "#27ae60";
+
+    cajaFinal.innerHTML = `Valor Óptimo Z = <strong>${datos.z_optimo}</strong>`;
+
+    // 6. DESLIZADORES DE LA FUNCIÓN OBJETIVO (se recalculan en el navegador, sin pedidos)
+    prepararDeslizadoresObjetivo(datos, [z_x, z_y]);
+}
+
+// Tabla de vértices con Z calculado con los coeficientes que hay en los campos de la función objetivo
+function llenarTablaVertices(vertices, puntosGanadores) {
     const tbody = document.getElementById('cuerpo-tabla');
     tbody.innerHTML = '';
-    
-    // Convertimos los puntos ganadores a strings para comparar fácil
-    const ganadoresStr = datos.puntos_ganadores.map(p => JSON.stringify(p));
 
     // Recolectar operadores nuevamente para el cálculo de Z en la tabla
     const zOpsRecalc = Array.from(document.querySelectorAll('.z-op-grafico')).map(select => select.value);
@@ -347,7 +378,7 @@ async function resolverProblema() {
     const coef_x = zCoefsRecalc[0];
     const coef_y_abs = Math.abs(zCoefsRecalc[1]);
     
-    datos.vertices.forEach(v => {
+    vertices.forEach(v => {
         const x = v[0];
         const y = v[1];
         const z_calc = (coef_x * x) + (z_y_recalc * y);
@@ -360,7 +391,7 @@ async function resolverProblema() {
         const tr = document.createElement('tr');
         
         // Verificamos si este punto está en la lista de ganadores
-        const esGanador = ganadoresStr.includes(JSON.stringify(v));
+        const esGanador = puntosGanadores.some(g => mismoPunto(g, v));
         
         if (esGanador) tr.className = 'fila-optima';
 
@@ -372,54 +403,150 @@ async function resolverProblema() {
         `;
         tbody.appendChild(tr);
     });
+}
 
-    // 5. MOSTRAR ANÁLISIS Y EXPLICACIÓN FINAL (al final)
-    const tituloTipo = document.getElementById('titulo-tipo-solucion');
-    const textoExplicacion = document.getElementById('texto-explicacion');
-    const cajaFinal = document.getElementById('caja-resultado-final');
-
-    tituloTipo.innerText = datos.tipo_solucion || "Resultado";
-    textoExplicacion.innerText = datos.explicacion || "Analizando...";
+// Dos puntos iguales salvo redondeo (los vértices del servidor vienen de cálculos en float)
+function mismoPunto(p, q) {
+    const escala = Math.max(1, Math.abs(p[0]), Math.abs(p[1]));
+    return Math.abs(p[0] - q[0]) <= 1e-7 * escala && Math.abs(p[1] - q[1]) <= 1e-7 * escala;
+}
 
-    if(datos.status === 'infeasible') {
-        tituloTipo.style.color = "red";
-        document.getElementById('analisis-box').style.borderLeftColor = "red";
-        cajaFinal.innerHTML = "No hay solución";
-        document.getElementById('cuerpo-tabla').innerHTML = "";
+// =============================================================================
+// DESLIZADORES DE LA FUNCIÓN OBJETIVO
+// El servidor manda en rangos_optimalidad, por vértice, el intervalo [desde, hasta] del ángulo
+// de c = (z_x, z_y) en el que ese vértice es óptimo. Al mover un deslizador basta ver en qué
+// intervalo cae el ángulo: óptimo, Z y tipo de solución salen sin volver a llamar a /calcular.
+// =============================================================================
+
+const TOL_ANGULO = 1e-9;
+let rangosObjetivo = null;  // rangos_optimalidad y vértices de la última respuesta
+
+function prepararDeslizadoresObjetivo(datos, c) {
+    const caja = document.getElementById('sensibilidad-objetivo');
+    if (!datos.rangos_optimalidad || !datos.rangos_optimalidad.length) {
+        caja.style.display = 'none';
+        rangosObjetivo = null;
         return;
     }
+    rangosObjetivo = {
+        rangos: datos.rangos_optimalidad,
+        vertices: datos.vertices || [],
+        // Columnas de puntos enteros: el óptimo entero también se recalcula al mover Z
+        columnasEnteras: datos.entero && datos.entero.status === 'optimal' ? datos.entero.columnas : null
+    };
+    const limite = Math.max(10, 2 * Math.max(Math.abs(c[0]), Math.abs(c[1])));
+    ['x', 'y'].forEach((eje, i) => {
+        const deslizador = document.getElementById(`deslizador-z-${eje}`);
+        deslizador.min = -limite;
+        deslizador.max = limite;
+        deslizador.step = limite / 100;
+        deslizador.value = c[i];
+        document.getElementById(`valor-z-${eje}`).innerText = c[i];
+    });
+    caja.style.display = 'block';
+}
 
-    // Si es factible:
-    tituloTipo.style.color = (datos.tipo_solucion.includes("Múltiple")) ? "#d35400" : "#27ae60"; // Naranja si es múltiple, Verde si es única
-    document.getElementById('analisis-box').style.borderLeftColor = (datos.tipo_solucion.includes("Múltiple")) ? "#d35400" : "#27ae60";
+// Óptimo para c según los rangos: {tipo: 'unica' | 'multiple' | 'no_acotada', puntos}
+function optimoPorRangos(rangos, c) {
+    if (c[0] === 0 && c[1] === 0) {
+        // Z constante: todos los vértices empatan
+        return { tipo: rangos.length > 1 ? 'multiple' : 'unica', puntos: rangos.map(r => r.punto) };
+    }
+    const theta = Math.atan2(c[1], c[0]);
+    const puntos = [];
+    let enBorde = false;
+    rangos.forEach(r => {
+        // Ángulo llevado a [desde, desde + 2π)
+        let t = theta;
+        while (t < r.desde - TOL_ANGULO) t += 2 * Math.PI;
+        while (t >= r.desde - TOL_ANGULO + 2 * Math.PI) t -= 2 * Math.PI;
+        if (t > r.hasta + TOL_ANGULO) return;
+        puntos.push(r.punto);
+        const circuloEntero = r.hasta - r.desde >= 2 * Math.PI - TOL_ANGULO;
+        if (!circuloEntero && (Math.abs(t - r.desde) <= TOL_ANGULO || Math.abs(t - r.hasta) <= TOL_ANGULO)) {
+            enBorde = true;
+        }
+    });
+    if (!puntos.length) return { tipo: 'no_acotada', puntos };
+    // En el extremo de un rango sin vecino que empate, el óptimo sigue por un borde infinito
+    return { tipo: (puntos.length > 1 || enBorde) ? 'multiple' : 'unica', puntos };
+}
 
-    cajaFinal.innerHTML = `Valor Óptimo Z = <strong>${datos.z_optimo}</strong>`;
+// Mejor punto entero para c: en cada columna, la punta del intervalo que mejora Z
+function optimoEntero(columnas, c, objetivo) {
+    const signo = objetivo === 'min' ? -1 : 1;
+    const [cu, cv] = columnas.eje === 'x' ? c : [c[1], c[0]];
+    let mejor = null;
+    columnas.valores.forEach((u, k) => {
+        const v = signo * cv > 0 ? columnas.hasta[k] : columnas.desde[k];
+        const z = cu * u + cv * v;
+        if (mejor === null || signo * z > signo * mejor.z) {
+            mejor = { punto: columnas.eje === 'x' ? [u, v] : [v, u], z };
+        }
+    });
+    return mejor;
+}
+
+function moverObjetivo() {
+    if (!rangosObjetivo) return;
+    const c = ['x', 'y'].map(eje => parseFloat(document.getElementById(`deslizador-z-${eje}`).value));
+    document.getElementById('valor-z-x').innerText = c[0];
+    document.getElementById('valor-z-y').innerText = c[1];
+
+    // Los campos de la función objetivo quedan con los valores del deslizador
+    document.getElementById('z_x').value = c[0];
+    document.getElementById('z_y').value = Math.abs(c[1]);
+    document.getElementById('z_op_y').value = c[1] < 0 ? '-' : '+';
+
+    const optimo = optimoPorRangos(rangosObjetivo.rangos, c);
+    const tituloTipo = document.getElementById('titulo-tipo-solucion');
+    const cajaFinal = document.getElementById('caja-resultado-final');
+    const texto = document.getElementById('texto-explicacion');
+    const marcador = document.getElementById('grafico').data.length - 1;  // 'Solución Óptima' es la última traza
+    const marcadorEntero = document.getElementById('grafico').data.findIndex(t => t.name === 'Óptimo Entero');
+    if (marcadorEntero >= 0) {
+        const entero = optimo.tipo === 'no_acotada' ? null
+            : optimoEntero(rangosObjetivo.columnasEnteras, c, document.getElementById('objetivo').value);
+        Plotly.restyle('grafico', { x: [entero ? [entero.punto[0]] : []], y: [entero ? [entero.punto[1]] : []] },
+                       [marcadorEntero]);
+    }
+
+    if (optimo.tipo === 'no_acotada') {
+        tituloTipo.innerText = 'No Acotada';
+        tituloTipo.style.color = 'red';
+        document.getElementById('analisis-box').style.borderLeftColor = 'red';
+        cajaFinal.innerHTML = 'Z mejora sin límite en esta dirección';
+        texto.innerText = `Z = ${c[0]}x ${c[1] < 0 ? '-' : '+'} ${Math.abs(c[1])}y: no hay óptimo finito.`;
+        Plotly.restyle('grafico', { x: [[]], y: [[]] }, [marcador]);
+        llenarTablaVertices(rangosObjetivo.vertices, []);
+        return;
+    }
+
+    const z = c[0] * optimo.puntos[0][0] + c[1] * optimo.puntos[0][1];
+    const multiple = optimo.tipo === 'multiple';
+    tituloTipo.innerText = multiple ? 'Solución Múltiple (Infinitas Soluciones)' : 'Solución Única';
+    tituloTipo.style.color = multiple ? '#d35400' : '#27ae60';
+    document.getElementById('analisis-box').style.borderLeftColor = tituloTipo.style.color;
+    cajaFinal.innerHTML = `Valor Óptimo Z = <strong>${parseFloat(z.toFixed(6))}</strong>`;
+    texto.innerText = `Z = ${c[0]}x ${c[1] < 0 ? '-' : '+'} ${Math.abs(c[1])}y → óptimo en `
+        + optimo.puntos.map(p => `(${p[0].toFixed(2)}, ${p[1].toFixed(2)})`).join(', ')
+        + ' (calculado en el navegador con los rangos de optimalidad).';
+    Plotly.restyle('grafico', { x: [optimo.puntos.map(p => p[0])], y: [optimo.puntos.map(p => p[1])] }, [marcador]);
+    llenarTablaVertices(rangosObjetivo.vertices, optimo.puntos);
 }
 
 function dibujarGrafica(datos, restricciones) {
     let traces = [];
 
-    // 1. Determinar el rango de la gráfica (Escala)
-    // Buscamos el valor más alto entre los vértices para saber qué tan grande hacer el dibujo
-    let maxVal = 0;
-    datos.vertices.forEach(v => {
-        maxVal = Math.max(maxVal, v[0], v[1]);
-    });
-    const rango = maxVal * 1.5 || 10; // Un poco más de espacio (o 10 por defecto)
+    // 1. Rango, polígono y rectas ya vienen calculados del servidor (datos.grafica):
+    // el polígono ordenado y cerrado, y cada restricción recortada al recuadro de la vista
+    const grafica = datos.grafica;
+    const [xMin, xMax, yMin, yMax] = grafica.caja;
 
     // 2. Dibujar Región Factible (El área sombreada)
-    // Necesitamos ordenar los vértices por ángulo para que el polígono se pinte bien
-    const verticesOrdenados = ordenarVertices(datos.vertices);
-    
-    // Añadimos el primer punto al final para cerrar el polígono visualmente
-    let x_poly = verticesOrdenados.map(v => v[0]);
-    let y_poly = verticesOrdenados.map(v => v[1]);
-    x_poly.push(x_poly[0]);
-    y_poly.push(y_poly[0]);
-
     traces.push({
-        x: x_poly,
-        y: y_poly,
+        x: grafica.poligono.x,
+        y: grafica.poligono.y,
         fill: 'toself',
         type: 'scatter',
         mode: 'lines',
@@ -428,33 +555,18 @@ function dibujarGrafica(datos, restricciones) {
         line: {color: 'green'}
     });
 
-    // 3. Dibujar las Líneas de Restricción
+    // 3. Dibujar las Líneas de Restricción (tramo visible; null si no cruza la vista)
     restricciones.forEach((res, index) => {
-        // Ecuación: ax + by = val (donde b ya puede ser negativo si se eligió operador -)
-        // Calculamos dos puntos extremos para dibujar la línea a través de toda la pantalla
-        let x1 = 0, y1 = 0, x2 = 0, y2 = 0;
-
-        if (res.y !== 0) {
-            // Si y no es 0, calculamos y cuando x=0 y x=rango
-            x1 = 0; 
-            y1 = res.val / res.y;
-            x2 = rango; 
-            y2 = (res.val - res.x * rango) / res.y;
-        } else {
-            // Línea vertical (x = val/a)
-            x1 = res.val / res.x;
-            y1 = 0;
-            x2 = x1;
-            y2 = rango;
-        }
-        
+        const segmento = grafica.segmentos[index];
+        if (!segmento) return;
+
         // Formatear el signo para mostrar en la leyenda
         const signoY = res.y >= 0 ? '+' : '-';
         const absY = Math.abs(res.y);
 
         traces.push({
-            x: [x1, x2],
-            y: [y1, y2],
+            x: segmento.x,
+            y: segmento.y,
             type: 'scatter',
             mode: 'lines',
             name: `R${index+1}: ${res.x}x ${signoY} ${absY}y ${res.op} ${res.val}`,
@@ -462,7 +574,30 @@ function dibujarGrafica(datos, restricciones) {
         });
     });
 
-    // 4. Marcar el Punto Óptimo
+    // 4. Puntos enteros de la región y el mejor de ellos (si se pidió "enteros")
+    const entero = datos.entero;
+    if (entero && entero.puntos) {
+        traces.push({
+            x: entero.puntos.x,
+            y: entero.puntos.y,
+            type: 'scatter',
+            mode: 'markers',
+            name: 'Puntos Enteros',
+            marker: {color: '#7f8c8d', size: 4}
+        });
+    }
+    if (entero && entero.status === 'optimal') {
+        traces.push({
+            x: [entero.punto_optimo[0]],
+            y: [entero.punto_optimo[1]],
+            type: 'scatter',
+            mode: 'markers',
+            name: 'Óptimo Entero',
+            marker: {color: '#8e44ad', size: 12, symbol: 'diamond'}
+        });
+    }
+
+    // 5. Marcar el Punto Óptimo (va última: los deslizadores la mueven por índice)
     traces.push({
         x: [datos.punto_optimo[0]],
         y: [datos.punto_optimo[1]],
@@ -484,7 +619,7 @@ function dibujarGrafica(datos, restricciones) {
             font: { color: textColor }
         },
         xaxis: {
-            range: [-1, rango], 
+            range: [xMin, xMax],
             title: { text: 'Variable X', font: { color: textColor } },
             gridcolor: gridColor,
             linecolor: gridColor,
@@ -492,7 +627,7 @@ function dibujarGrafica(datos, restricciones) {
             tickfont: { color: textColor }
         },
         yaxis: {
-            range: [-1, rango], 
+            range: [yMin, yMax],
             title: { text: 'Variable Y', font: { color: textColor } },
             gridcolor: gridColor,
             linecolor: gridColor,
@@ -515,21 +650,6 @@ function dibujarGrafica(datos, restricciones) {
     Plotly.newPlot('grafico', traces, layout, config);
 }
 
-// Función auxiliar matemática para ordenar puntos en sentido anti-horario
-// Esto evita que el polígono se pinte como un "moño" cruzado
-function ordenarVertices(puntos) {
-    // 1. Calcular centroide
-    let cx = 0, cy = 0;
-    puntos.forEach(p => { cx += p[0]; cy += p[1]; });
-    cx /= puntos.length;
-    cy /= puntos.length;
-
-    // 2. Ordenar por ángulo respecto al centroide
-    return puntos.sort((a, b) => {
-        return Math.atan2(a[1] - cy, a[0] - cx) - Math.atan2(b[1] - cy, b[0] - cx);
-    });
-}
-
 // Crear resumen corto de los cálculos
 function crearResumen(datos) {
     const summaryDiv = document.getElementById('calculations-summary');
@@ -569,6 +689,17 @@ function crearResumen(datos) {
                 <span>${datos.puntos_ganadores.map(p => `(${p[0].toFixed(2)}, ${p[1].toFixed(2)})`).join(", ")}</span>
             </div>
         `;
+        if (datos.entero) {
+            const entero = datos.entero;
+            html += `
+            <div class="summary-item">
+                <strong>Solución Entera:</strong>
+                <span>${entero.status === 'optimal'
+                    ? `(${entero.punto_optimo[0]}, ${entero.punto_optimo[1]}) - Z = ${entero.z_optimo.toFixed(2)}`
+                    : entero.explicacion}</span>
+            </div>
+        `;
+        }
     }
     
     html += '</div>';
@@ -1577,10 +1708,12 @@ async function resolverSimplex() {
     }
     
     // Enviar a Python (los operadores ya están aplicados en los coeficientes)
-    const respuesta = await fetch('/calcular-simplex', {
+    // Variante: Simplex con Big M o Simplex Dual (mismo formato de respuesta)
+    const variante = document.getElementById('variante-simplex').value;
+    const respuesta = await fetch(variante === 'dual-simplex' ? '/calcular-dual-simplex' : '/calcular-simplex', {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({ objetivo, z_coefs: zCoefs, restricciones })
+        body: JSON.stringify({ objetivo, z_coefs: zCoefs, restricciones, formato_pasos: 'eventos' })
     });
     
     // Mostrar resultados
@@ -1597,12 +1730,125 @@ async function resolverSimplex() {
     mostrarSolucionSimplex(datos);
 }
 
+// Pasos con formato_pasos: 'eventos' → líneas de texto (mismo catálogo que eventos_pasos.py)
+function renderizarPasos(pasos) {
+    const TOL = 1e-9;
+    const f4 = v => v.toFixed(4);
+    const fRatio = v => v === null ? '∞' : f4(v);
+    const st = { nombres: null, base: [], colEntrante: null, coefZ: 0, rhs: [], columna: [], fila: null, entrante: '', saliente: '' };
+    const nombre = j => j < 0 ? 'Z' : (st.nombres ? st.nombres[j] : `col${j + 1}`);
+    const ratioFila = i => st.columna[i] > TOL ? st.rhs[i] / st.columna[i] : null;
+
+    const eventos = {
+        col: nombres => { st.nombres = nombres; return []; },
+        base: columnas => { st.base = columnas.slice(); return []; },
+        it: k => [`\n--- ITERACIÓN ${k} ---`],
+        itf: (fase, k) => [`\n--- FASE ${fase} - ITERACIÓN ${k} ---`],
+        ent: (col, coef, esMax) => {
+            st.colEntrante = col; st.coefZ = coef;
+            const n = nombre(col);
+            return [
+                `\n📌 VARIABLE ENTRANTE: ${n}`,
+                `   Razón: El coeficiente en la fila Z es ${f4(coef)}, que es ${coef < 0 ? 'negativo' : 'positivo'}.`,
+                esMax
+                    ? `   En maximización, valores negativos en la fila Z indican que aumentar ${n} mejorará el valor de Z.`
+                    : `   En minimización, valores positivos en la fila Z indican que aumentar ${n} reducirá el valor de Z.`,
+                '\n📊 CÁLCULO DE RATIOS (para determinar variable saliente):',
+                `   Ratio = Valor en columna 'Solución' ÷ Valor en columna '${n}'`,
+                `   Solo se calculan ratios para filas donde el coeficiente de ${n} es positivo.`
+            ];
+        },
+        rat: (rhs, columna) => {
+            st.rhs = rhs; st.columna = columna;
+            return st.base.map((b, i) => {
+                const r = ratioFila(i);
+                return r === null
+                    ? `   ${nombre(b)}: No se calcula (coeficiente ≤ 0 o muy pequeño)`
+                    : `   ${nombre(b)}: ${f4(rhs[i])} ÷ ${f4(columna[i])} = ${f4(r)}`;
+            });
+        },
+        sal: fila => {
+            st.fila = fila;
+            st.entrante = nombre(st.colEntrante);
+            st.saliente = nombre(st.base[fila]);
+            const r = ratioFila(fila);
+            const lineas = [`\n📌 VARIABLE SALIENTE: ${st.saliente}`, `   Razón: Tiene el ratio mínimo (${fRatio(r)}).`];
+            if (r !== null) {
+                lineas.push(`   El ratio mínimo asegura que al hacer ${st.entrante} = ${fRatio(r)}, la variable ${st.saliente} se vuelve cero (sale de la base).`);
+            }
+            return lineas;
+        },
+        piv: () => {
+            const e = st.entrante, elemento = st.columna[st.fila];
+            const lineas = [
+                '\n🔄 OPERACIONES DE PIVOTEO:',
+                `   Elemento Pivote: ${f4(elemento)} (intersección de fila ${st.saliente} y columna ${e})`,
+                `   Paso 1: Normalizar la fila pivote (dividir toda la fila por ${f4(elemento)})`,
+                `           Esto hace que el elemento pivote sea 1 y ${e} entre a la base con coeficiente 1.`,
+                `   Paso 2: Eliminación gaussiana (hacer cero la columna ${e} en todas las demás filas)`,
+                `           Para cada fila i ≠ fila pivote: Fila[i] = Fila[i] - (coeficiente en columna ${e}) × Fila[pivote]`
+            ];
+            const filas = [['Z', st.coefZ]];
+            st.base.forEach((b, i) => { if (i !== st.fila) filas.push([nombre(b), st.columna[i]]); });
+            filas.forEach(([n, c]) => {
+                if (Math.abs(c) > TOL) lineas.push(`           - Fila ${n}: Restamos ${f4(c)} × Fila[${st.saliente}]`);
+            });
+            st.base[st.fila] = st.colEntrante;
+            return lineas;
+        },
+        res: (zAnterior, zNuevo) => {
+            const r = ratioFila(st.fila);
+            const lineas = ['\n✅ RESULTADO DE LA ITERACIÓN:', `   Valor anterior de Z: ${f4(zAnterior)}`, `   Nuevo valor de Z: ${f4(zNuevo)}`];
+            if (r !== null) {
+                const mejora = zNuevo - zAnterior;
+                const texto = mejora > 0 ? 'aumento' : mejora < 0 ? 'disminución' : 'sin cambio';
+                lineas.push(`   Mejora en Z: ${mejora >= 0 ? '+' : ''}${f4(mejora)} (${texto})`);
+            }
+            lineas.push(`   Nueva base: ${st.base.map(nombre).join(', ')}`);
+            lineas.push(r !== null
+                ? `   ${st.entrante} ahora es básica (valor = ${fRatio(r)}), ${st.saliente} sale de la base (valor = 0)`
+                : `   ${st.entrante} ahora es básica, ${st.saliente} sale de la base (valor = 0)`);
+            return lineas;
+        },
+        e: col => [`📌 VARIABLE ENTRANTE: ${nombre(col)}`],
+        s: col => [`📌 VARIABLE SALIENTE: ${nombre(col)}`],
+        w: v => [`Nuevo valor de W: ${v.toFixed(6)}`],
+        z: v => [`Nuevo valor de Z: ${f4(v)}`],
+        dsal: (col, rhs) => [`📌 VARIABLE SALIENTE: ${nombre(col)} (RHS más negativo = ${f4(rhs)})`],
+        drat: (entrante, ratio, columnas, ratios) => [
+            '📊 RATIOS DUALES |Z_j ÷ a_rj| (solo a_rj < 0):',
+            ...columnas.map((j, k) => `   ${nombre(j)}: ${f4(ratios[k])}`),
+            `📌 VARIABLE ENTRANTE: ${nombre(entrante)} (ratio dual mínimo = ${f4(ratio)})`
+        ],
+        dpiv: (elemento, z) => [`🔄 Pivote ${f4(elemento)}; nuevo valor de Z: ${f4(z)}`],
+        rlim: (k, col, superior, limite) => [
+            `Iteración ${k}: ${nombre(col)} pasa a su límite ${superior ? 'superior' : 'inferior'} (${f4(limite)}) sin cambiar la base`
+        ],
+        rpiv: (k, entra, d, sale, arriba, ratio) => [
+            `Iteración ${k}: entra ${nombre(entra)} (d = ${f4(d)}), sale ${nombre(sale)}${arriba ? ' a su límite superior' : ''} (ratio = ${f4(ratio)})`
+        ],
+        rdual: (k, sale, valor, entra, ratio) => [
+            `Iteración dual ${k}: sale ${nombre(sale)} (valor = ${f4(valor)}), entra ${nombre(entra)} (ratio dual = ${f4(ratio)})`
+        ]
+    };
+
+    const texto = [];
+    (pasos || []).forEach(paso => {
+        if (typeof paso === 'string') {
+            texto.push(paso);
+        } else {
+            texto.push(...eventos[paso[0]](...paso.slice(1)));
+        }
+    });
+    return texto;
+}
+
 // Mostrar pasos del Simplex
 function mostrarPasosSimplex(datos) {
     const logDiv = document.getElementById('log-container-simplex');
     logDiv.innerHTML = '';
     
-    datos.pasos.forEach(paso => {
+    renderizarPasos(datos.pasos).forEach(paso => {
         const pasoDiv = document.createElement('div');
         pasoDiv.className = 'step-card';
         pasoDiv.innerHTML = `<span class="step-detail">${paso}</span>`;
@@ -1632,6 +1878,14 @@ function crearResumenSimplex(datos) {
                 <p>${datos.explicacion}</p>
             </div>
         `;
+    } else if (datos.status !== 'optimal') {
+        // Corte por límite de iteraciones / tiempo o cancelación: trae la última base, no el óptimo
+        html += `
+            <div class="summary-item">
+                <strong style="color: #e67e22;">ADVERTENCIA: ${datos.tipo_solucion}</strong>
+                <p>${datos.explicacion}</p>
+            </div>
+        `;
     } else {
         html += `
             <div class="summary-item">
@@ -1786,6 +2040,21 @@ function mostrarTablasSimplex(datos) {
             tablaDiv.appendChild(ratiosDiv);
         }
         
+        // Simplex Dual: los ratios son por columna (|Z_j ÷ a_rj| en la fila saliente)
+        if (tablaInfo.ratios_duales && tablaInfo.ratios_duales.length > 0) {
+            const ratiosDiv = document.createElement('div');
+            ratiosDiv.className = 'table-info-ratios';
+            const nombresCols = tablaInfo.nombres_columnas || [];
+            let ratiosHtml = '<strong>Ratios duales (|Z ÷ fila saliente|, solo coeficientes negativos):</strong><br>';
+            tablaInfo.ratios_duales.forEach((ratio, j) => {
+                if (ratio === null || ratio === undefined) return;
+                const esEntrante = j === tablaInfo.col_entrante;
+                ratiosHtml += `• ${nombresCols[j] || `Columna ${j + 1}`}: ${formatearNumeroTabla(ratio)} ${esEntrante ? '<strong style="color: #27ae60;">(Mínimo → Variable Entrante)</strong>' : ''}<br>`;
+            });
+            ratiosDiv.innerHTML = ratiosHtml;
+            tablaDiv.appendChild(ratiosDiv);
+        }
+        
         // Crear wrapper interno para scroll
         const tableWrapper = document.createElement('div');
         tableWrapper.style.cssText = 'overflow-x: auto; overflow-y: visible; -webkit-overflow-scrolling: touch; margin-top: 15px; width: 100%;';
@@ -1949,6 +2218,12 @@ function mostrarSolucionSimplex(datos) {
         titulo.style.color = "#e67e22";
         document.getElementById('analisis-box-simplex').style.borderLeftColor = "#e67e22";
         cajaFinal.innerHTML = "Problema no acotado";
+    } else if (datos.status !== 'optimal') {
+        titulo.style.color = "#e67e22";
+        document.getElementById('analisis-box-simplex').style.borderLeftColor = "#e67e22";
+        cajaFinal.innerHTML = datos.solucion
+            ? `Z en la última base = <strong>${datos.z_actual.toFixed(4)}</strong> (no necesariamente óptimo)`
+            : "Resolución interrumpida";
     } else {
         titulo.style.color = "#27ae60";
         document.getElementById('analisis-box-simplex').style.borderLeftColor = "#27ae60";
@@ -2710,7 +2985,7 @@ async function resolverDosFases() {
     const respuesta = await fetch('/calcular-dos-fases', {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({ objetivo, z_coefs: zCoefs, restricciones })
+        body: JSON.stringify({ objetivo, z_coefs: zCoefs, restricciones, formato_pasos: 'eventos' })
     });
     
     const datos = await respuesta.json();
@@ -2722,7 +2997,7 @@ async function resolverDosFases() {
     // Log detallado
     const logDiv = document.getElementById('log-container-dos-fases');
     logDiv.innerHTML = '';
-    datos.pasos.forEach(paso => {
+    renderizarPasos(datos.pasos).forEach(paso => {
         const pasoDiv = document.createElement('div');
         pasoDiv.className = 'step-card';
         pasoDiv.innerHTML = `<span class="step-detail">${paso}</span>`;
@@ -2755,6 +3030,14 @@ function crearResumenDosFases(datos) {
                 <p>${datos.explicacion}</p>
             </div>
         `;
+    } else if (datos.status !== 'optimal') {
+        // Corte por límite de iteraciones / tiempo o cancelación: trae la última base, no el óptimo
+        html += `
+            <div class="summary-item">
+                <strong style="color: #e67e22;">ADVERTENCIA: ${datos.tipo_solucion}</strong>
+                <p>${datos.explicacion}</p>
+            </div>
+        `;
     } else {
         const iteraciones = datos.iteraciones || 0;
         html += `
@@ -3032,6 +3315,12 @@ function mostrarSolucionDosFases(datos) {
         titulo.style.color = "#e67e22";
         document.getElementById('analisis-box-dos-fases').style.borderLeftColor = "#e67e22";
         cajaFinal.innerHTML = "Problema no acotado";
+    } else if (datos.status !== 'optimal') {
+        titulo.style.color = "#e67e22";
+        document.getElementById('analisis-box-dos-fases').style.borderLeftColor = "#e67e22";
+        cajaFinal.innerHTML = datos.solucion
+            ? `Z en la última base = <strong>${datos.z_actual.toFixed(4)}</strong> (no necesariamente óptimo)`
+            : "Resolución interrumpida";
     } else {
         titulo.style.color = "#27ae60";
         document.getElementById('analisis-box-dos-fases').style.borderLeftColor = "#27ae60";
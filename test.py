@@ -13,14 +13,30 @@ Usa los solvers en proceso (no requiere servidor).
 Uso:
     python test.py              # Todos los métodos
     python test.py grafico      # Solo método gráfico
+    python test.py semiplanos   # Solo método gráfico por intersección de semiplanos
     python test.py simplex      # Solo método simplex
     python test.py dosfases     # Solo método dos fases
+    python test.py dual         # Solo Simplex Dual
+    python test.py limites      # Solo ejercicios con límites por variable
+    python test.py presolve     # Solo ejercicios de presolve
+    python test.py escalado     # Solo ejercicios mal escalados
+    python test.py precio       # Solo reglas de precio (parcial / devex / steepest_edge)
+    python test.py caliente     # Solo arranque en caliente desde la base óptima
+    python test.py retencion    # Solo retención de tablas (primera y última)
+    python test.py eventos      # Solo pasos como eventos (formato_pasos='eventos')
+    python test.py detalle      # Solo niveles de detalle (summary / none)
+    python test.py cortes       # Solo cortes (límite de iteraciones, cancelación y tiempo límite)
+    python test.py lote         # Solo resolución por lotes (resolver_lote)
+    python test.py sesion       # Solo método gráfico editado de a una fila (SesionGrafica)
+    python test.py 3d           # Solo método gráfico con 3 variables (MetodoGrafico3D)
+    python test.py enteros      # Solo mejor punto entero del método gráfico (enteros=True)
     python test.py rapido       # Una prueba por método
 """
 
+import math
 import sys
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import List, Optional, Dict, Any
 
 # Encoding UTF-8 en Windows
@@ -43,6 +59,12 @@ sys.path.insert(0, ".")
 from metodo_grafico import MetodoGrafico
 from metodo_simplex import MetodoSimplex
 from metodo_dos_fases import MetodoDosFases
+from metodo_dual_simplex import MetodoDualSimplex
+from resolucion_lote import resolver_lote
+from control_resolucion import TokenCancelacion
+from eventos_pasos import renderizar_pasos
+from sesion_grafica import SesionGrafica
+from metodo_grafico_3d import MetodoGrafico3D
 
 TOL_Z = 0.01
 TOL_X = 0.1
@@ -53,7 +75,7 @@ class Ejercicio:
     """Un ejercicio de prueba para cualquier método."""
     id: str
     nombre: str
-    metodo: str  # 'grafico', 'simplex', 'dos_fases'
+    metodo: str  # 'grafico', 'grafico_semiplanos', 'simplex', 'simplex_revisado', 'dos_fases', 'dos_fases_revisado', 'dual_simplex', 'lote', 'grafico_sesion', 'grafico_3d', 'enteros'
     objetivo: str
     c: List[float]
     A: List[List[float]]
@@ -62,10 +84,17 @@ class Ejercicio:
     tipos_validos: List[str]  # Tipos de solución aceptables
     z_esperado: Optional[float] = None
     x_esperado: Optional[List[float]] = None
+    limites: Optional[List[List[Optional[float]]]] = None  # [inferior, superior] por variable
+    detalle: str = "full"  # 'full', 'summary' o 'none'
+    max_iteraciones: Optional[int] = None  # tope de pivoteos (con "limite de iteraciones" en tipos_validos si corta)
+    base_esperada: Optional[List[str]] = None  # 'variables_basicas' en nombres del problema original
+    base_inicial: Optional[List[str]] = None  # arranque en caliente ('variables_basicas' de otra corrida)
+    opciones: Dict[str, Any] = field(default_factory=dict)  # otros argumentos del método (precio, ...)
+    tablas_esperadas: Optional[int] = None  # cuántas tablas se devuelven (con 'retencion' en opciones)
 
 
 # =============================================================================
-# EJERCICIOS MÉTODO GRÁFICO (G1-G8 + V1-V5 validación)
+# EJERCICIOS MÉTODO GRÁFICO (G1-G11 + V1-V5 validación)
 # =============================================================================
 
 EJERCICIOS_GRAFICO = [
@@ -94,6 +123,16 @@ EJERCICIOS_GRAFICO = [
     Ejercicio("G8", "Restricciones Mixtas", "grafico", "min",
               [2, 3], [[1, 1], [2, 1], [1, 0], [0, 1], [1, 0], [0, 1]], [5, 12, 1, 1, 8, 8],
               ['>=', '<=', '>=', '>=', '<=', '<='], ["unica"], None, None),
+    # G9-G11: mismas restricciones que G1 y G4 con otro objetivo (la región sale de la caché)
+    Ejercicio("G9", "Misma Región que G1 - Otro Objetivo", "grafico", "max",
+              [1, 3], [[2, 1], [1, 2], [1, 0]], [18, 16, 7], ['<=', '<=', '<='],
+              ["unica"], 24, [0, 8]),
+    Ejercicio("G10", "Misma Región que G1 - Objetivo Paralelo", "grafico", "max",
+              [2, 1], [[2, 1], [1, 2], [1, 0]], [18, 16, 7], ['<=', '<=', '<='],
+              ["multiple", "infinita"], 18, None),
+    Ejercicio("G11", "Misma Región que G4 - No Factible", "grafico", "min",
+              [1, 1], [[1, 1], [1, 1], [1, 0], [0, 1]], [5, 10, 8, 8], ['<=', '>=', '<=', '<='],
+              ["no factible", "infeasible"], None, None),
     # Validación V1-V5
     Ejercicio("V1", "Gráfico - Solución Única Básica", "grafico", "max",
               [4, 3], [[2, 1], [1, 2], [1, 0]], [20, 18, 8], ['<=', '<=', '<='],
@@ -157,6 +196,18 @@ EJERCICIOS_SIMPLEX = [
     Ejercicio("V10", "Simplex Minimización", "simplex", "min",
               [6, 8, 5], [[2, 1, 1], [1, 2, 1], [1, 1, 2]], [8, 10, 12], ['>=', '>=', '>='],
               ["multiple", "unica"], None, None),
+    # Ejemplo de Beale: con Dantzig y empates al primer índice cicla sin fin
+    Ejercicio("S9", "Simplex - Ciclado (Beale)", "simplex", "min",
+              [-0.75, 20, -0.5, 6], [[0.25, -8, -1, 9], [0.5, -12, -0.5, 3], [0, 0, 1, 0]], [0, 0, 1], ['<=', '<=', '<='],
+              ["unica", "degenerada"], -1.25, [1, 0, 1, 0]),
+]
+
+# Mismos ejercicios resueltos con el Simplex Revisado (base factorizada)
+EJERCICIOS_SIMPLEX_REVISADO = [replace(ej, metodo="simplex_revisado") for ej in EJERCICIOS_SIMPLEX] + [
+    # Base inicial con columnas de x: el núcleo de la base no es vacío y se factoriza con LU
+    Ejercicio("R1", "Revisado - Base con Núcleo (LU)", "simplex_revisado", "max",
+              [5, 4, 3], [[2, 3, 1], [4, 2, 3], [1, 1, 2]], [60, 80, 40], ['<=', '<=', '<='],
+              ["unica"], 115, [15, 10, 0], base_inicial=["x2", "x1", "s3"]),
 ]
 
 # =============================================================================
@@ -187,6 +238,10 @@ EJERCICIOS_DOS_FASES = [
     Ejercicio("D8", "Dos Fases - 4 Variables", "dos_fases", "max",
               [2, 3, 4, 1], [[1, 1, 1, 1], [2, 1, 1, 1], [1, 1, 2, 1], [1, 2, 1, 2]], [20, 15, 25, 18], ['=', '>=', '<=', '>='],
               ["unica", "multiple"], None, None),
+    # Empate en la Fase 1: una artificial queda en la base en cero y su fila no es 0=0
+    Ejercicio("D9", "Dos Fases - Artificial en Cero al Final de Fase 1", "dos_fases", "min",
+              [-1, -2], [[3, -3], [3, 3]], [6, 6], ['>=', '<='],
+              ["unica"], -2, [2, 0]),
     # Validación
     Ejercicio("V11", "Dos Fases Básico", "dos_fases", "max",
               [3, 5], [[1, 1], [2, 1], [1, 0]], [4, 6, 1], ['=', '<=', '>='],
@@ -217,6 +272,312 @@ EJERCICIOS_DOS_FASES = [
 ]
 
 
+# Mismos ejercicios con las dos fases hechas por el Simplex Revisado
+EJERCICIOS_DOS_FASES_REVISADO = [replace(ej, metodo="dos_fases_revisado") for ej in EJERCICIOS_DOS_FASES]
+
+# El Simplex Dual debe dar el mismo resultado en todos los ejercicios de Simplex y Dos Fases
+EJERCICIOS_DUAL_SIMPLEX = [replace(ej, metodo="dual_simplex") for ej in EJERCICIOS_SIMPLEX + EJERCICIOS_DOS_FASES] + [
+    # La restricción artificial Σx <= M queda activa pero sM tiene costo cero: Z no depende de M
+    Ejercicio("DS1", "Dual - Cota Artificial Activa con Óptimo Finito", "dual_simplex", "min",
+              [1, -1], [[2, -2]], [4], ['>='],
+              ["multiple", "unica"], 2, None),
+    Ejercicio("DS2", "Dual - Igualdad Paralela a Z", "dual_simplex", "max",
+              [-2, 5], [[-2, 5]], [-3], ['='],
+              ["multiple", "unica"], -3, None),
+    # Termina con sM básica: su fila (la cota artificial) no va en variables_basicas
+    Ejercicio("DS3", "Dual - Cota Artificial Básica en el Óptimo", "dual_simplex", "max",
+              [3, 5, 4], [[2, 3, 0], [0, 2, 5], [3, 2, 4]], [8, 10, 15], ['<=', '<=', '<='],
+              ["unica"], 765 / 41, [89 / 41, 50 / 41, 62 / 41], base_esperada=["x3", "x1", "x2"]),
+]
+
+# =============================================================================
+# EJERCICIOS CON LÍMITES POR VARIABLE (L1-L4): sin filas para x_j <= u_j
+# =============================================================================
+
+EJERCICIOS_LIMITES = [
+    # S-ejemplo clásico con x1 <= 4 y 2x2 <= 12 como límites: solo queda 3x1 + 2x2 <= 18
+    Ejercicio("L1", "Simplex con Límites Superiores", "simplex", "max",
+              [3, 5], [[3, 2]], [18], ['<='],
+              ["unica"], 36, [2, 6], limites=[[0, 4], [0, 6]]),
+    Ejercicio("L2", "Dos Fases con Límite Inferior", "dos_fases", "min",
+              [2, 3], [[1, 1], [1, 2]], [4, 6], ['>=', '>='],
+              ["unica"], 10, [2, 2], limites=[[1, 3], [0, None]]),
+    Ejercicio("L3", "Límites Incompatibles con Restricción", "dos_fases", "max",
+              [1, 1], [[1, 1]], [10], ['>='],
+              ["no factible", "infeasible"], None, None, limites=[[0, 3], [0, 4]]),
+    Ejercicio("L4", "Límite Inferior Negativo", "simplex", "max",
+              [4, 3], [[1, 1]], [20], ['<='],
+              ["unica"], 68, [8, 12], limites=[[2, 8], [-5, 15]]),
+]
+
+# =============================================================================
+# EJERCICIOS DE PRESOLVE (P1-P6): filas duplicadas, vacías, variables fijas, base en el original
+# =============================================================================
+
+EJERCICIOS_PRESOLVE = [
+    # R4 = 2·R3 y R5 vacía: el presolve las quita antes de armar la tabla
+    Ejercicio("P1", "Presolve - Fila Duplicada y Vacía", "simplex", "max",
+              [3, 5], [[1, 0], [0, 2], [3, 2], [6, 4], [0, 0]], [4, 12, 18, 36, 5], ['<=', '<=', '<=', '<=', '<='],
+              ["unica"], 36, [2, 6]),
+    # x1 = 2 fija la variable; con ella R1 y R2 quedan proporcionales
+    Ejercicio("P2", "Presolve - Variable Fija", "dos_fases", "min",
+              [2, 3], [[1, 1], [1, 2], [1, 0]], [4, 6, 2], ['>=', '>=', '='],
+              ["unica"], 10, [2, 2]),
+    Ejercicio("P3", "Presolve - Fila Vacía Imposible", "simplex", "max",
+              [1, 1], [[1, 1], [0, 0]], [4, 1], ['<=', '>='],
+              ["no factible", "infeasible"], None, None),
+    # R4 (y ≤ 50) no toca el borde: el gráfico no enumera sus cortes; R3 pasa justo por el óptimo
+    Ejercicio("P4", "Gráfico - Filas Redundantes", "grafico", "max",
+              [3, 2], [[2, 1], [1, 2], [1, 1], [0, 1], [1, 0]], [18, 16, 11, 50, 7], ['<=', '<=', '<=', '<=', '<='],
+              ["unica"], 29, [7, 4]),
+    # R1 redundante y R5 proporcional: la base trae sus holguras y las de R2..R4 con su número original
+    Ejercicio("P5", "Presolve - Base con Filas Quitadas", "simplex", "max",
+              [3, 5], [[2, 2], [1, 0], [0, 2], [3, 2], [1, 1]], [100, 4, 12, 18, 50], ['<=', '<=', '<=', '<=', '<='],
+              ["unica"], 36, [2, 6], base_esperada=['s1', 's2', 'x2', 'x1', 's5']),
+    # En el revisado R2 y R3 pasan a límites: x2 queda en su cota y es la básica de R3
+    Ejercicio("P6", "Presolve - Base con Singletons a Límites", "simplex_revisado", "max",
+              [3, 5], [[2, 2], [1, 0], [0, 2], [3, 2], [1, 1]], [100, 4, 12, 18, 50], ['<=', '<=', '<=', '<=', '<='],
+              ["unica"], 36, [2, 6], base_esperada=['s1', 's2', 'x2', 'x1', 's5']),
+]
+
+# =============================================================================
+# EJERCICIOS DE ESCALADO (E1-E5): coeficientes de 1e-3 a 1e6, Big M con >=
+# =============================================================================
+
+EJERCICIOS_ESCALADO = [
+    # Big M en max con >= antes de <=: la artificial se penaliza con -M
+    Ejercicio("E1", "Big M - Maximizar con >=", "simplex", "max",
+              [3, 2], [[1, 1], [1, 3]], [2, 6], ['>=', '<='],
+              ["unica"], 18, [6, 0]),
+    # El ejemplo clásico (Z = 36, x = (2, 6)) con filas y columnas en otras unidades
+    Ejercicio("E2", "Escalado - Coeficientes de 1e-3 a 1e4", "simplex", "max",
+              [3000, 5000], [[0.001, 0], [0, 2000], [0.003, 0.002]], [0.004, 12000, 0.018], ['<=', '<=', '<='],
+              ["unica"], 36000, [2, 6]),
+    # Costos de 1e5: sin escalar, M = 10000 no alcanza para sacar las artificiales
+    Ejercicio("E3", "Escalado - Costos Grandes con Big M", "simplex", "min",
+              [2e5, 3e5], [[1, 1], [1000, 2000]], [4, 6000], ['>=', '>='],
+              ["unica"], 1e6, [2, 2]),
+    Ejercicio("E4", "Escalado - Costos Grandes con Simplex Dual", "dual_simplex", "min",
+              [2e5, 3e5], [[1, 1], [1000, 2000]], [4, 6000], ['>=', '>='],
+              ["unica"], 1e6, [2, 2]),
+    # Coeficientes de 5e-6 a 5000 y una igualdad: sin escalar, Big M la da por infactible
+    Ejercicio("E5", "Escalado - Magnitudes Mezcladas con Igualdad", "simplex", "max",
+              [0.04, 70, 0.1, 80], [[-8, 0.04, 5000, 700], [0.4, 0.003, 400, 50], [0.0005, -5e-6, 0.2, 0.01]],
+              [9000, 120, 0.013], ['<=', '<=', '='],
+              ["unica"], 1096007.3029, [182.5714, 15657.1429, 0, 0]),
+]
+
+# =============================================================================
+# REGLAS DE PRECIO (PR1-PRn): el mismo óptimo con cada regla de la variable entrante
+# =============================================================================
+
+EJERCICIOS_PRECIO = [
+    replace(ej, id=f"PR{k}", nombre=f"{ej.nombre} ({precio})", opciones={"precio": precio})
+    for k, (ej, precio) in enumerate(
+        [(ej, precio) for precio in ("parcial", "devex", "steepest_edge")
+         for lista in (EJERCICIOS_SIMPLEX, EJERCICIOS_SIMPLEX_REVISADO, EJERCICIOS_DOS_FASES,
+                       EJERCICIOS_DOS_FASES_REVISADO)
+         for ej in lista if ej.z_esperado is not None],
+        start=1)
+]
+
+# =============================================================================
+# RETENCIÓN DE TABLAS (RT1-RT9): con {'primeras': 1, 'ultimas': 1} solo la tabla inicial y la final
+# =============================================================================
+
+EJERCICIOS_RETENCION = [
+    replace(ej, id=f"RT{k}", nombre=f"{ej.nombre} (primera y última tabla)",
+            opciones={"retencion": {"primeras": 1, "ultimas": 1}}, tablas_esperadas=2)
+    for k, ej in enumerate([ej for lista in (EJERCICIOS_SIMPLEX, EJERCICIOS_DOS_FASES, EJERCICIOS_DUAL_SIMPLEX)
+                            for ej in lista[:3]], start=1)
+]
+
+# =============================================================================
+# PASOS COMO EVENTOS (EV1-EV15): renderizar los eventos da el mismo log que formato_pasos='texto'
+# =============================================================================
+
+EJERCICIOS_EVENTOS = [
+    replace(ej, id=f"EV{k}", nombre=f"{ej.nombre} (eventos)", opciones={"formato_pasos": "eventos"})
+    for k, ej in enumerate([ej for lista in (EJERCICIOS_SIMPLEX, EJERCICIOS_SIMPLEX_REVISADO, EJERCICIOS_DOS_FASES,
+                                             EJERCICIOS_DOS_FASES_REVISADO, EJERCICIOS_DUAL_SIMPLEX)
+                            for ej in lista[:3]], start=1)
+]
+
+# =============================================================================
+# NIVELES DE DETALLE (D1-D8): mismos resultados sin tablas ('summary') ni pasos ('none')
+# =============================================================================
+
+EJERCICIOS_DETALLE = [
+    replace(ej, id=f"D{k}", nombre=f"{ej.nombre} ({detalle})", detalle=detalle)
+    for k, (ej, detalle) in enumerate(
+        [(lista[0], detalle) for detalle in ("summary", "none")
+         for lista in (EJERCICIOS_GRAFICO, EJERCICIOS_SIMPLEX, EJERCICIOS_DOS_FASES_REVISADO, EJERCICIOS_DUAL_SIMPLEX)],
+        start=1)
+]
+
+# =============================================================================
+# CORTES (C1-C20): con max_iteraciones=1 ya no se devuelve la tabla como óptima; lo mismo con
+# max_iteraciones=2 en problemas de 3 o más pivoteos, con un token ya cancelado ('cancelled')
+# y con un limite_tiempo que se agota antes del primer pivoteo ('time_limit')
+# =============================================================================
+
+_LISTAS_CORTES = (EJERCICIOS_SIMPLEX, EJERCICIOS_SIMPLEX_REVISADO, EJERCICIOS_DOS_FASES,
+                  EJERCICIOS_DOS_FASES_REVISADO, EJERCICIOS_DUAL_SIMPLEX)
+_TOKEN_CANCELADO = TokenCancelacion()
+_TOKEN_CANCELADO.cancelar()
+
+EJERCICIOS_CORTES = [
+    replace(lista[2], id=f"C{k}", nombre=f"{lista[2].nombre} (1 iteración)",
+            tipos_validos=["limite de iteraciones"], z_esperado=None, x_esperado=None, max_iteraciones=1)
+    for k, lista in enumerate(_LISTAS_CORTES, start=1)
+] + [
+    replace(ej, id=f"C{k}", nombre=f"{ej.nombre} (2 iteraciones)",
+            tipos_validos=["limite de iteraciones"], z_esperado=None, x_esperado=None, max_iteraciones=2)
+    for k, ej in enumerate((EJERCICIOS_SIMPLEX[2], EJERCICIOS_SIMPLEX_REVISADO[2], EJERCICIOS_DOS_FASES[0],
+                            EJERCICIOS_DOS_FASES_REVISADO[4], EJERCICIOS_DUAL_SIMPLEX[2]), start=6)
+] + [
+    replace(lista[2], id=f"C{k}", nombre=f"{lista[2].nombre} (cancelada)",
+            tipos_validos=["cancelada"], z_esperado=None, x_esperado=None, max_iteraciones=0,
+            opciones={"cancelacion": _TOKEN_CANCELADO})
+    for k, lista in enumerate(_LISTAS_CORTES, start=11)
+] + [
+    replace(lista[2], id=f"C{k}", nombre=f"{lista[2].nombre} (sin tiempo)",
+            tipos_validos=["limite de tiempo"], z_esperado=None, x_esperado=None, max_iteraciones=0,
+            opciones={"limite_tiempo": 1e-9})
+    for k, lista in enumerate(_LISTAS_CORTES, start=16)
+]
+
+# =============================================================================
+# SEMIPLANOS (H1-Hn): los del gráfico con modo='semiplanos', más casos que la enumeración no ve
+# =============================================================================
+
+EJERCICIOS_SEMIPLANOS = [
+    replace(ej, id=f"H{k}", metodo="grafico_semiplanos") for k, ej in enumerate(EJERCICIOS_GRAFICO, start=1)
+] + [
+    Ejercicio(f"H{len(EJERCICIOS_GRAFICO) + 1}", "Región No Acotada (Z crece sin límite)", "grafico_semiplanos", "max",
+              [2, 3], [[1, -1], [0, 1]], [2, 1], ['<=', '>='],
+              ["no acotada"], None, None),
+    Ejercicio(f"H{len(EJERCICIOS_GRAFICO) + 2}", "Región No Acotada con Óptimo Finito", "grafico_semiplanos", "min",
+              [2, 3], [[1, 1], [1, 0]], [4, 1], ['>=', '>='],
+              ["unica"], 8, [4, 0]),
+    Ejercicio(f"H{len(EJERCICIOS_GRAFICO) + 3}", "Óptimo en un Borde Infinito", "grafico_semiplanos", "max",
+              [1, 0], [[1, 0], [0, 1]], [4, 1], ['<=', '>='],
+              ["multiple", "infinita"], 4, None),
+    Ejercicio(f"H{len(EJERCICIOS_GRAFICO) + 4}", "Restricción de Igualdad (segmento)", "grafico_semiplanos", "max",
+              [3, 2], [[1, 1], [1, 0]], [4, 3], ['=', '<='],
+              ["unica"], 11, [3, 1]),
+]
+
+# =============================================================================
+# LOTE (L1-Ln): los ejercicios de n variables sin límites (y los de escalado), en un solo resolver_lote
+# =============================================================================
+
+EJERCICIOS_LOTE = [
+    # La fila de cada básica depende de los pivoteos hechos: la base no se compara
+    replace(ej, id=f"L{k}", metodo="lote", base_esperada=None)
+    for k, ej in enumerate([ej for lista in (EJERCICIOS_SIMPLEX, EJERCICIOS_DOS_FASES, EJERCICIOS_DUAL_SIMPLEX,
+                                             EJERCICIOS_ESCALADO)
+                            for ej in lista if ej.limites is None], start=1)
+]
+
+# =============================================================================
+# LOTE CON LÍMITE (LC1-LC5): formas distintas con max_iteraciones=3, que es por problema: los
+# que llegan al óptimo en 3 pivoteos o menos (S3 y V8 justo en 3) terminan 'optimal'
+# =============================================================================
+
+_POR_ID = {ej.id: ej for ej in EJERCICIOS_SIMPLEX + EJERCICIOS_DOS_FASES}
+EJERCICIOS_LOTE_CORTES = [
+    replace(_POR_ID[id_ej], id=f"LC{k}", metodo="lote", max_iteraciones=3)
+    for k, id_ej in enumerate(("S1", "S3", "V8"), start=1)
+] + [
+    replace(_POR_ID[id_ej], id=f"LC{k}", metodo="lote", max_iteraciones=3,
+            tipos_validos=["limite de iteraciones"], z_esperado=None, x_esperado=None)
+    for k, id_ej in enumerate(("S9", "D1"), start=4)
+]
+
+# =============================================================================
+# ARRANQUE EN CALIENTE (AC1-ACn): desde la base óptima de una corrida anterior no hace falta
+# pivotear; con max_iteraciones=0 cualquier pivoteo daría 'iteration_limit'
+# =============================================================================
+
+_BASES_OPTIMAS = {
+    "V6": ["x2", "x1", "s3"], "V8": ["s1", "x1", "x2"], "S9": ["s1", "x1", "x3"],
+    "D9": ["x2", "x1"], "2F1": ["e1", "x2"], "2F2": ["s1", "x2", "x1"], "2F3": ["x1", "x2", "s1"],
+}
+EJERCICIOS_CALIENTE = [
+    replace(_POR_ID[id_ej], id=f"AC{k}", nombre=f"{_POR_ID[id_ej].nombre} (base óptima)", metodo=metodo,
+            base_inicial=base, max_iteraciones=0)
+    for k, (id_ej, base, metodo) in enumerate(
+        [(id_ej, base, metodo) for id_ej, base in _BASES_OPTIMAS.items()
+         for metodo in ("simplex", "simplex_revisado", "dos_fases", "dos_fases_revisado")],
+        start=1)
+]
+
+# =============================================================================
+# SESIÓN (SG1-SGn): los de semiplanos armados de a una restricción en una SesionGrafica,
+# quitando y volviendo a poner la primera antes de resolver
+# =============================================================================
+
+EJERCICIOS_SESION = [
+    replace(ej, id=f"SG{k}", metodo="grafico_sesion") for k, ej in enumerate(EJERCICIOS_SEMIPLANOS, start=1)
+]
+
+# =============================================================================
+# GRÁFICO 3D (T1-Tn): los de Simplex y Dos Fases con 3 variables, más casos con la caja lejana
+# =============================================================================
+
+_EJERCICIOS_3_VARIABLES = [ej for lista in (EJERCICIOS_SIMPLEX, EJERCICIOS_DOS_FASES) for ej in lista
+                           if len(ej.c) == 3 and ej.limites is None]
+EJERCICIOS_3D = [
+    replace(ej, id=f"T{k}", metodo="grafico_3d") for k, ej in enumerate(_EJERCICIOS_3_VARIABLES, start=1)
+] + [
+    Ejercicio(f"T{len(_EJERCICIOS_3_VARIABLES) + 1}", "3D - Región No Acotada", "grafico_3d", "max",
+              [1, 1, 1], [[1, -1, 0], [0, 0, 1]], [2, 3], ['<=', '<='],
+              ["no acotada"], None, None),
+    Ejercicio(f"T{len(_EJERCICIOS_3_VARIABLES) + 2}", "3D - No Acotada con Óptimo Finito", "grafico_3d", "min",
+              [2, 3, 1], [[1, 1, 1], [1, 0, 0]], [4, 1], ['>=', '>='],
+              ["unica"], 5, [1, 0, 3]),
+    Ejercicio(f"T{len(_EJERCICIOS_3_VARIABLES) + 3}", "3D - Igualdad (poliedro aplastado)", "grafico_3d", "max",
+              [3, 2, 1], [[1, 1, 1], [1, 0, 0]], [4, 3], ['=', '<='],
+              ["unica"], 11, [3, 1, 0]),
+    Ejercicio(f"T{len(_EJERCICIOS_3_VARIABLES) + 4}", "3D - No Factible", "grafico_3d", "max",
+              [1, 1, 1], [[1, 1, 1], [1, 0, 0]], [2, 3], ['<=', '>='],
+              ["no factible", "infeasible"], None, None),
+]
+
+# =============================================================================
+# ENTEROS (N1-Nn): mejor punto con x e y enteras (MetodoGrafico con enteros=True); además
+# se comparan el óptimo y la cantidad de puntos con recorrer todo el recuadro
+# =============================================================================
+
+EJERCICIOS_ENTEROS = [
+    Ejercicio("N1", "Enteros - Óptimo Continuo Ya Entero", "enteros", "max",
+              [3, 5], [[1, 0], [0, 2], [3, 2]], [4, 12, 18], ['<=', '<=', '<='],
+              ["entera unica"], 36, [2, 6]),
+    Ejercicio("N2", "Enteros - Vértice Fraccionario", "enteros", "max",
+              [3, 2], [[2, 1], [1, 2], [1, 0]], [18, 16, 7], ['<=', '<=', '<='],
+              ["entera unica"], 29, [7, 4]),
+    Ejercicio("N3", "Enteros - Redondear No Sirve", "enteros", "max",
+              [5, 8], [[1, 1], [5, 9]], [6, 45], ['<=', '<='],
+              ["entera unica"], 40, [0, 5]),
+    Ejercicio("N4", "Enteros - Minimización con >=", "enteros", "min",
+              [2, 3], [[1, 1], [1, 0], [0, 1]], [3.5, 5, 5], ['>=', '<=', '<='],
+              ["entera unica"], 8, [4, 0]),
+    Ejercicio("N5", "Enteros - Empate en Varios Puntos", "enteros", "max",
+              [1, 1], [[2, 2]], [9], ['<='],
+              ["entera multiple"], 4, None),
+    Ejercicio("N6", "Enteros - Franja Sin Puntos Enteros", "enteros", "max",
+              [1, -1], [[1, 0], [1, 0], [0, 1]], [0.2, 0.8, 3], ['>=', '<=', '<='],
+              ["sin solucion entera"], None, None),
+    Ejercicio("N7", "Enteros - Región Angosta e Inclinada", "enteros", "max",
+              [-1, 3], [[3, -2], [-1, 4], [1, 1]], [1.5, 7.5, 9.5], ['<=', '<=', '<='],
+              ["entera unica"], 5, [1, 2]),
+    Ejercicio("N8", "Enteros - Segmento (Igualdad)", "enteros", "max",
+              [1, 2], [[1, 3], [1, 0]], [12, 10], ['=', '<='],
+              ["entera unica"], 11, [9, 1]),
+]
+
+
 def _normalizar(s: str) -> str:
     s = s.lower()
     for a, b in [('ú', 'u'), ('á', 'a'), ('é', 'e'), ('í', 'i'), ('ó', 'o')]:
@@ -247,23 +608,116 @@ def _verificar_x(x_obt: Optional[List], x_esp: List[float], n: int) -> bool:
     return all(abs(x[i] - x_esp[i]) <= TOL_X for i in range(len(x_esp)))
 
 
+def _verificar_rangos(resp: Dict[str, Any], ej: Ejercicio) -> bool:
+    """Algún vértice de rangos_optimalidad cuyo intervalo contiene el ángulo de c da z_optimo."""
+    if not any(ej.c):
+        return True
+    theta = math.atan2(ej.c[1], ej.c[0])
+    for r in resp.get("rangos_optimalidad", []):
+        t = r["desde"] + (theta - r["desde"] + 1e-9) % (2 * math.pi) - 1e-9
+        z = ej.c[0] * r["punto"][0] + ej.c[1] * r["punto"][1]
+        if t <= r["hasta"] + 1e-9 and _verificar_z(z, resp["z_optimo"]):
+            return True
+    return False
+
+
 def _ejecutar_grafico(ej: Ejercicio) -> Dict[str, Any]:
-    p = MetodoGrafico(ej.c, ej.A, ej.b, ej.operadores, objetivo=ej.objetivo)
+    p = MetodoGrafico(ej.c, ej.A, ej.b, ej.operadores, objetivo=ej.objetivo,
+                      detalle=ej.detalle)
     return p.resolver()
 
 
+def _ejecutar_grafico_semiplanos(ej: Ejercicio) -> Dict[str, Any]:
+    p = MetodoGrafico(ej.c, ej.A, ej.b, ej.operadores, objetivo=ej.objetivo,
+                      detalle=ej.detalle, modo="semiplanos")
+    return p.resolver()
+
+
+def _ejecutar_grafico_3d(ej: Ejercicio) -> Dict[str, Any]:
+    p = MetodoGrafico3D(ej.c, ej.A, ej.b, ej.operadores, objetivo=ej.objetivo, detalle=ej.detalle)
+    return p.resolver()
+
+
+def _ejecutar_enteros(ej: Ejercicio) -> Dict[str, Any]:
+    """El resultado es "entero" (o el del problema continuo si no tiene óptimo), con "solucion"."""
+    p = MetodoGrafico(ej.c, ej.A, ej.b, ej.operadores, objetivo=ej.objetivo,
+                      detalle=ej.detalle, enteros=True)
+    resp = p.resolver()
+    if "entero" not in resp:
+        return resp
+    return {**resp["entero"], "solucion": resp["entero"].get("punto_optimo"), "pasos": resp["pasos"]}
+
+
+def _verificar_enteros(resp: Dict[str, Any], ej: Ejercicio) -> bool:
+    """Mismo total de puntos enteros y mismo mejor Z que recorriendo el recuadro 0..LADO."""
+    lado = 60
+    signo = 1 if ej.objetivo == "max" else -1
+    total, mejor = 0, None
+    for x in range(lado + 1):
+        for y in range(lado + 1):
+            lhs = [a[0] * x + a[1] * y for a in ej.A]
+            if all(l <= v + 1e-9 if op == '<=' else l >= v - 1e-9 if op == '>=' else abs(l - v) <= 1e-9
+                   for l, v, op in zip(lhs, ej.b, ej.operadores)):
+                total += 1
+                z = ej.c[0] * x + ej.c[1] * y
+                mejor = z if mejor is None or signo * z > signo * mejor else mejor
+    if total != resp.get("total_puntos"):
+        return False
+    return mejor is None or _verificar_z(resp.get("z_optimo"), mejor)
+
+
 def _ejecutar_simplex(ej: Ejercicio) -> Dict[str, Any]:
-    p = MetodoSimplex(ej.c, ej.A, ej.b, ej.operadores, objetivo=ej.objetivo)
+    p = MetodoSimplex(ej.c, ej.A, ej.b, ej.operadores, objetivo=ej.objetivo, limites=ej.limites,
+                      base_inicial=ej.base_inicial, detalle=ej.detalle, max_iteraciones=ej.max_iteraciones, **ej.opciones)
+    return p.resolver()
+
+
+def _ejecutar_simplex_revisado(ej: Ejercicio) -> Dict[str, Any]:
+    p = MetodoSimplex(ej.c, ej.A, ej.b, ej.operadores, objetivo=ej.objetivo, modo="revisado",
+                      base_inicial=ej.base_inicial, detalle=ej.detalle, max_iteraciones=ej.max_iteraciones, **ej.opciones)
     return p.resolver()
 
 
 def _ejecutar_dos_fases(ej: Ejercicio) -> Dict[str, Any]:
-    p = MetodoDosFases(ej.c, ej.A, ej.b, ej.operadores, objetivo=ej.objetivo)
+    p = MetodoDosFases(ej.c, ej.A, ej.b, ej.operadores, objetivo=ej.objetivo, limites=ej.limites,
+                       base_inicial=ej.base_inicial, detalle=ej.detalle, max_iteraciones=ej.max_iteraciones, **ej.opciones)
+    return p.resolver()
+
+
+def _ejecutar_dos_fases_revisado(ej: Ejercicio) -> Dict[str, Any]:
+    p = MetodoDosFases(ej.c, ej.A, ej.b, ej.operadores, objetivo=ej.objetivo, modo="revisado",
+                       base_inicial=ej.base_inicial, detalle=ej.detalle, max_iteraciones=ej.max_iteraciones, **ej.opciones)
+    return p.resolver()
+
+
+def _ejecutar_dual_simplex(ej: Ejercicio) -> Dict[str, Any]:
+    p = MetodoDualSimplex(ej.c, ej.A, ej.b, ej.operadores, objetivo=ej.objetivo,
+                          detalle=ej.detalle, max_iteraciones=ej.max_iteraciones, **ej.opciones)
     return p.resolver()
 
 
-def ejecutar_ejercicio(ej: Ejercicio) -> Dict[str, Any]:
-    """Ejecuta un ejercicio con el solver correspondiente y verifica resultado."""
+def _resolver(ej: Ejercicio) -> Dict[str, Any]:
+    if ej.metodo == "grafico":
+        return _ejecutar_grafico(ej)
+    if ej.metodo == "grafico_semiplanos":
+        return _ejecutar_grafico_semiplanos(ej)
+    if ej.metodo == "grafico_3d":
+        return _ejecutar_grafico_3d(ej)
+    if ej.metodo == "enteros":
+        return _ejecutar_enteros(ej)
+    if ej.metodo == "simplex":
+        return _ejecutar_simplex(ej)
+    if ej.metodo == "simplex_revisado":
+        return _ejecutar_simplex_revisado(ej)
+    if ej.metodo == "dos_fases_revisado":
+        return _ejecutar_dos_fases_revisado(ej)
+    if ej.metodo == "dual_simplex":
+        return _ejecutar_dual_simplex(ej)
+    return _ejecutar_dos_fases(ej)
+
+
+def ejecutar_ejercicio(ej: Ejercicio, resp: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Ejecuta un ejercicio con el solver correspondiente (o usa `resp`, si ya está resuelto) y verifica resultado."""
     resultado = {
         "id": ej.id,
         "nombre": ej.nombre,
@@ -274,17 +728,63 @@ def ejecutar_ejercicio(ej: Ejercicio) -> Dict[str, Any]:
         "error": None,
     }
     try:
-        if ej.metodo == "grafico":
-            resp = _ejecutar_grafico(ej)
-        elif ej.metodo == "simplex":
-            resp = _ejecutar_simplex(ej)
-        else:
-            resp = _ejecutar_dos_fases(ej)
+        if resp is None:
+            resp = _resolver(ej)
 
         tipo = resp.get("tipo_solucion", resp.get("status", ""))
         resultado["tipo_obtenido"] = tipo
         resultado["z_obtenido"] = resp.get("z_optimo")
 
+        if ej.detalle != "full" and resp.get("tablas"):
+            resultado["error"] = f"Con detalle='{ej.detalle}' no debería haber tablas"
+            return resultado
+        if ej.detalle == "none" and resp.get("pasos"):
+            resultado["error"] = "Con detalle='none' no debería haber pasos"
+            return resultado
+
+        if ej.metodo == "enteros" and "total_puntos" in resp and not _verificar_enteros(resp, ej):
+            resultado["error"] = "Los puntos enteros o el óptimo no coinciden con recorrer todo el recuadro"
+            return resultado
+        if ej.metodo == "grafico_3d" and resp.get("status") == "optimal":
+            malla = resp.get("grafica", {}).get("malla", {"x": []})
+            indices = [i for nombre in "ijk" for i in malla.get(nombre, [])]
+            if not malla["x"] or not indices or max(indices) >= len(malla["x"]):
+                resultado["error"] = "La gráfica debe traer la malla del poliedro con triángulos válidos"
+                return resultado
+        elif ej.metodo.startswith("grafico") and resp.get("status") == "optimal":
+            grafica = resp.get("grafica", {})
+            poligono = grafica.get("poligono", {"x": [], "y": []})
+            if (len(grafica.get("segmentos", [])) != len(ej.b) or not poligono["x"]
+                    or [poligono["x"][0], poligono["y"][0]] != [poligono["x"][-1], poligono["y"][-1]]):
+                resultado["error"] = "La gráfica debe traer el polígono cerrado y un segmento por restricción"
+                return resultado
+            if not _verificar_rangos(resp, ej):
+                resultado["error"] = "El rango de optimalidad que contiene a Z no da el óptimo"
+                return resultado
+
+        if ej.max_iteraciones is not None and resp.get("iteraciones", 0) > ej.max_iteraciones:
+            resultado["error"] = f"Se hicieron {resp.get('iteraciones')} iteraciones (límite {ej.max_iteraciones})"
+            return resultado
+
+        if ej.opciones.get("formato_pasos") == "eventos":
+            # Mismo ejercicio con los pasos en texto: los eventos renderizados deben dar lo mismo
+            opciones = {k: v for k, v in ej.opciones.items() if k != "formato_pasos"}
+            texto = _resolver(replace(ej, opciones=opciones)).get("pasos", [])
+            if resp.get("iteraciones") and not any(isinstance(paso, list) for paso in resp.get("pasos", [])):
+                resultado["error"] = "Con formato_pasos='eventos' los pasos de las iteraciones deben ser eventos"
+                return resultado
+            if renderizar_pasos(resp["pasos"]) != texto:
+                resultado["error"] = "Los eventos renderizados no coinciden con los pasos en texto"
+                return resultado
+
+        if ej.tablas_esperadas is not None and len(resp.get("tablas", [])) != ej.tablas_esperadas:
+            resultado["error"] = f"Se devolvieron {len(resp.get('tablas', []))} tablas (esperadas {ej.tablas_esperadas})"
+            return resultado
+
+        if ej.base_esperada is not None and resp.get("variables_basicas") != ej.base_esperada:
+            resultado["error"] = f"Base incorrecta: esperada {ej.base_esperada}, obtenida {resp.get('variables_basicas')}"
+            return resultado
+
         if not _verificar_tipo(tipo, ej.tipos_validos):
             resultado["error"] = f"Tipo incorrecto: esperado alguno de {ej.tipos_validos}"
             return resultado
@@ -295,7 +795,7 @@ def ejecutar_ejercicio(ej: Ejercicio) -> Dict[str, Any]:
                 return resultado
 
         if ej.x_esperado is not None:
-            x_obt = resp.get("punto_optimo") if ej.metodo == "grafico" else resp.get("solucion")
+            x_obt = resp.get("punto_optimo") if ej.metodo.startswith("grafico") else resp.get("solucion")
             if not _verificar_x(x_obt, ej.x_esperado, len(ej.c)):
                 resultado["error"] = f"X incorrecto: esperado {ej.x_esperado}, obtenido {x_obt}"
                 return resultado
@@ -328,6 +828,48 @@ def ejecutar_seccion(ejercicios: List[Ejercicio], nombre_seccion: str, detallado
     return resultados
 
 
+def ejecutar_seccion_lote(ejercicios: List[Ejercicio], nombre_seccion: str, detallado: bool = True) -> List[Dict]:
+    """
+    Como ejecutar_seccion, pero todos los ejercicios van juntos en un solo resolver_lote (con
+    el max_iteraciones del primero: el lote tiene uno solo).
+    """
+    print(f"\n{'=' * 28} {nombre_seccion} {'=' * 28}")
+    respuestas = resolver_lote([{"c": ej.c, "A": ej.A, "b": ej.b, "operadores": ej.operadores,
+                                 "objetivo": ej.objetivo} for ej in ejercicios],
+                               max_iteraciones=ejercicios[0].max_iteraciones if ejercicios else None)
+    resultados = []
+    for ej, resp in zip(ejercicios, respuestas):
+        res = ejecutar_ejercicio(ej, resp)
+        resultados.append(res)
+        imprimir_resultado(res, detallado)
+    return resultados
+
+
+def _resolver_en_sesion(ej: Ejercicio) -> Dict[str, Any]:
+    """Arranca con la primera fila, agrega las demás, quita R1 y la vuelve a agregar (queda última)."""
+    sesion = SesionGrafica(ej.A[:1], ej.b[:1], ej.operadores[:1])
+    for a, b, op in zip(ej.A[1:], ej.b[1:], ej.operadores[1:]):
+        sesion.agregar(a, b, op)
+    sesion.eliminar(0)
+    sesion.agregar(ej.A[0], ej.b[0], ej.operadores[0])
+    return sesion.resultado(ej.c, ej.objetivo, ej.detalle)
+
+
+def ejecutar_seccion_sesion(ejercicios: List[Ejercicio], nombre_seccion: str, detallado: bool = True) -> List[Dict]:
+    """Como ejecutar_seccion, pero cada ejercicio se edita de a una fila en una SesionGrafica."""
+    print(f"\n{'=' * 28} {nombre_seccion} {'=' * 28}")
+    resultados = []
+    for ej in ejercicios:
+        try:
+            resp = _resolver_en_sesion(ej)
+        except Exception as e:
+            resp = {"status": "error", "explicacion": str(e)}
+        res = ejecutar_ejercicio(ej, resp)
+        resultados.append(res)
+        imprimir_resultado(res, detallado)
+    return resultados
+
+
 def main(filtro: Optional[str] = None) -> bool:
     print("\n" + "=" * 70)
     print("  TEST UNIFICADO - PROGRAMACIÓN LINEAL")
@@ -339,10 +881,43 @@ def main(filtro: Optional[str] = None) -> bool:
 
     if filtro == "grafico":
         todos_resultados.extend(ejecutar_seccion(EJERCICIOS_GRAFICO, "MÉTODO GRÁFICO"))
+    elif filtro == "semiplanos":
+        todos_resultados.extend(ejecutar_seccion(EJERCICIOS_SEMIPLANOS, "GRÁFICO POR SEMIPLANOS"))
     elif filtro == "simplex":
         todos_resultados.extend(ejecutar_seccion(EJERCICIOS_SIMPLEX, "MÉTODO SIMPLEX"))
+        todos_resultados.extend(ejecutar_seccion(EJERCICIOS_SIMPLEX_REVISADO, "SIMPLEX REVISADO"))
     elif filtro == "dosfases":
         todos_resultados.extend(ejecutar_seccion(EJERCICIOS_DOS_FASES, "MÉTODO DOS FASES"))
+        todos_resultados.extend(ejecutar_seccion(EJERCICIOS_DOS_FASES_REVISADO, "DOS FASES REVISADO"))
+    elif filtro == "dual":
+        todos_resultados.extend(ejecutar_seccion(EJERCICIOS_DUAL_SIMPLEX, "SIMPLEX DUAL"))
+    elif filtro == "limites":
+        todos_resultados.extend(ejecutar_seccion(EJERCICIOS_LIMITES, "LÍMITES POR VARIABLE"))
+    elif filtro == "presolve":
+        todos_resultados.extend(ejecutar_seccion(EJERCICIOS_PRESOLVE, "PRESOLVE"))
+    elif filtro == "escalado":
+        todos_resultados.extend(ejecutar_seccion(EJERCICIOS_ESCALADO, "ESCALADO"))
+    elif filtro == "precio":
+        todos_resultados.extend(ejecutar_seccion(EJERCICIOS_PRECIO, "REGLAS DE PRECIO"))
+    elif filtro == "caliente":
+        todos_resultados.extend(ejecutar_seccion(EJERCICIOS_CALIENTE, "ARRANQUE EN CALIENTE"))
+    elif filtro == "retencion":
+        todos_resultados.extend(ejecutar_seccion(EJERCICIOS_RETENCION, "RETENCIÓN DE TABLAS"))
+    elif filtro == "eventos":
+        todos_resultados.extend(ejecutar_seccion(EJERCICIOS_EVENTOS, "PASOS COMO EVENTOS"))
+    elif filtro == "detalle":
+        todos_resultados.extend(ejecutar_seccion(EJERCICIOS_DETALLE, "NIVELES DE DETALLE"))
+    elif filtro == "cortes":
+        todos_resultados.extend(ejecutar_seccion(EJERCICIOS_CORTES, "CORTES"))
+    elif filtro == "lote":
+        todos_resultados.extend(ejecutar_seccion_lote(EJERCICIOS_LOTE, "LOTE"))
+        todos_resultados.extend(ejecutar_seccion_lote(EJERCICIOS_LOTE_CORTES, "LOTE CON LÍMITE"))
+    elif filtro == "3d":
+        todos_resultados.extend(ejecutar_seccion(EJERCICIOS_3D, "GRÁFICO 3D"))
+    elif filtro == "sesion":
+        todos_resultados.extend(ejecutar_seccion_sesion(EJERCICIOS_SESION, "SESIÓN GRÁFICA"))
+    elif filtro == "enteros":
+        todos_resultados.extend(ejecutar_seccion(EJERCICIOS_ENTEROS, "SOLUCIÓN ENTERA"))
     elif filtro == "rapido":
         print("\n  Modo rápido: 1 ejercicio por método")
         todos_resultados.append(ejecutar_ejercicio(EJERCICIOS_GRAFICO[0]))
@@ -353,8 +928,26 @@ def main(filtro: Optional[str] = None) -> bool:
         imprimir_resultado(todos_resultados[-1])
     else:
         todos_resultados.extend(ejecutar_seccion(EJERCICIOS_GRAFICO, "MÉTODO GRÁFICO"))
+        todos_resultados.extend(ejecutar_seccion(EJERCICIOS_SEMIPLANOS, "GRÁFICO POR SEMIPLANOS"))
         todos_resultados.extend(ejecutar_seccion(EJERCICIOS_SIMPLEX, "MÉTODO SIMPLEX"))
+        todos_resultados.extend(ejecutar_seccion(EJERCICIOS_SIMPLEX_REVISADO, "SIMPLEX REVISADO"))
         todos_resultados.extend(ejecutar_seccion(EJERCICIOS_DOS_FASES, "MÉTODO DOS FASES"))
+        todos_resultados.extend(ejecutar_seccion(EJERCICIOS_DOS_FASES_REVISADO, "DOS FASES REVISADO"))
+        todos_resultados.extend(ejecutar_seccion(EJERCICIOS_DUAL_SIMPLEX, "SIMPLEX DUAL"))
+        todos_resultados.extend(ejecutar_seccion(EJERCICIOS_LIMITES, "LÍMITES POR VARIABLE"))
+        todos_resultados.extend(ejecutar_seccion(EJERCICIOS_PRESOLVE, "PRESOLVE"))
+        todos_resultados.extend(ejecutar_seccion(EJERCICIOS_ESCALADO, "ESCALADO"))
+        todos_resultados.extend(ejecutar_seccion(EJERCICIOS_PRECIO, "REGLAS DE PRECIO"))
+        todos_resultados.extend(ejecutar_seccion(EJERCICIOS_CALIENTE, "ARRANQUE EN CALIENTE"))
+        todos_resultados.extend(ejecutar_seccion(EJERCICIOS_RETENCION, "RETENCIÓN DE TABLAS"))
+        todos_resultados.extend(ejecutar_seccion(EJERCICIOS_EVENTOS, "PASOS COMO EVENTOS"))
+        todos_resultados.extend(ejecutar_seccion(EJERCICIOS_DETALLE, "NIVELES DE DETALLE"))
+        todos_resultados.extend(ejecutar_seccion(EJERCICIOS_CORTES, "CORTES"))
+        todos_resultados.extend(ejecutar_seccion_lote(EJERCICIOS_LOTE, "LOTE"))
+        todos_resultados.extend(ejecutar_seccion_lote(EJERCICIOS_LOTE_CORTES, "LOTE CON LÍMITE"))
+        todos_resultados.extend(ejecutar_seccion_sesion(EJERCICIOS_SESION, "SESIÓN GRÁFICA"))
+        todos_resultados.extend(ejecutar_seccion(EJERCICIOS_3D, "GRÁFICO 3D"))
+        todos_resultados.extend(ejecutar_seccion(EJERCICIOS_ENTEROS, "SOLUCIÓN ENTERA"))
 
     tiempo_total = time.time() - tiempo_inicio
 
@@ -366,7 +959,11 @@ def main(filtro: Optional[str] = None) -> bool:
     print("\n" + "=" * 70)
     print("  RESUMEN")
     print("=" * 70)
-    for metodo, nombre in [("grafico", "Gráfico"), ("simplex", "Simplex"), ("dos_fases", "Dos Fases")]:
+    for metodo, nombre in [("grafico", "Gráfico"), ("grafico_semiplanos", "Semiplanos"), ("simplex", "Simplex"),
+                           ("simplex_revisado", "S. Revisado"), ("dos_fases", "Dos Fases"),
+                           ("dos_fases_revisado", "2F Revisado"), ("dual_simplex", "S. Dual"),
+                           ("lote", "Lote"), ("grafico_sesion", "Sesión"),
+                           ("grafico_3d", "Gráfico 3D"), ("enteros", "Enteros")]:
         res_metodo = [r for r in todos_resultados if r["metodo"] == metodo]
         if res_metodo:
             ok = sum(1 for r in res_metodo if r["exito"])
@@ -395,10 +992,40 @@ if __name__ == "__main__":
         arg = sys.argv[1].lower()
         if arg in ["grafico", "g"]:
             filtro = "grafico"
+        elif arg in ["semiplanos", "h"]:
+            filtro = "semiplanos"
         elif arg in ["simplex", "s"]:
             filtro = "simplex"
         elif arg in ["dosfases", "dos_fases", "2f", "df", "d"]:
             filtro = "dosfases"
+        elif arg in ["dual", "dual_simplex"]:
+            filtro = "dual"
+        elif arg in ["limites", "l"]:
+            filtro = "limites"
+        elif arg in ["presolve", "p"]:
+            filtro = "presolve"
+        elif arg in ["escalado", "e"]:
+            filtro = "escalado"
+        elif arg in ["precio", "pr"]:
+            filtro = "precio"
+        elif arg in ["caliente", "ac"]:
+            filtro = "caliente"
+        elif arg in ["retencion", "rt"]:
+            filtro = "retencion"
+        elif arg in ["eventos", "ev"]:
+            filtro = "eventos"
+        elif arg in ["detalle"]:
+            filtro = "detalle"
+        elif arg in ["cortes", "c"]:
+            filtro = "cortes"
+        elif arg in ["lote"]:
+            filtro = "lote"
+        elif arg in ["3d", "t"]:
+            filtro = "3d"
+        elif arg in ["sesion", "sg"]:
+            filtro = "sesion"
+        elif arg in ["enteros", "n"]:
+            filtro = "enteros"
         elif arg in ["rapido", "r", "quick", "q"]:
             filtro = "rapido"
         elif arg in ["help", "-h", "--help"]: